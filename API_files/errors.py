@@ -140,6 +140,9 @@ def http_exception_handler(request: Request, exc: Exception):
     elif status_code == status.HTTP_422_UNPROCESSABLE_ENTITY:
         err = VALIDATION_ERROR
         code = "ERR_VALIDATION"
+    elif status_code == status.HTTP_429_TOO_MANY_REQUESTS:
+        err = "Too Many Requests"
+        code = "ERR_RATE_LIMITED"
     elif status_code == status.HTTP_502_BAD_GATEWAY:
         err = "Bad Gateway"
         code = "ERR_BAD_GATEWAY"
@@ -163,7 +166,7 @@ def http_exception_handler(request: Request, exc: Exception):
         exc_info=False,
     )
 
-    return _json_error_response(
+    response = _json_error_response(
         request=request,
         status_code=status_code,
         code=code,
@@ -171,6 +174,10 @@ def http_exception_handler(request: Request, exc: Exception):
         message=message,
         details=None,
     )
+    # Keep headers such as Retry-After set on the exception
+    if exc_obj.headers:
+        response.headers.update(exc_obj.headers)
+    return response
 
 
 def request_validation_exception_handler(request: Request, exc: Exception):
@@ -7,6 +7,7 @@ from contextlib import suppress
 from typing import TYPE_CHECKING
 
 from starlette import status
+from starlette.requests import Request
 from starlette.types import Receive, Scope, Send
 
 from core_router.errors import error_response as core_error_response
@@ -24,6 +25,22 @@ logger = logging.getLogger(__name__)
 ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
 
 
+def request_principal(request: Request) -> str:
+    """
+    Identity of the caller for per-caller limits and state.
+
+    This is the authenticated principal (request.state.principal), set by an
+    authentication layer that tells callers apart. Otherwise it is the client
+    address. The X-DinoAir-Auth token is shared, so it does not identify a
+    caller. Client-supplied identity headers are never used: a fresh value on
+    every request would get a fresh quota.
+    """
+    principal = getattr(request.state, "principal", None)
+    if isinstance(principal, str) and principal:
+        return f"principal:{principal}"
+    return f"client:{request.client.host}" if request.client else "client:anonymous"
+
+
 class AuthMiddleware:
     """
     ASGI middleware enforcing presence and correctness of X-DinoAir-Auth header
@@ -11,18 +11,22 @@ import logging
 from collections.abc import Mapping
 from typing import Any, cast
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from starlette import status
+from starlette.concurrency import run_in_threadpool
 
 from core_router.errors import (
     AdapterError,
     NoHealthyService,
+    RateLimitExceeded,
     ServiceNotFound,
 )
 from core_router.errors import ValidationError as CoreValidationError
 
+from ..middleware.auth import request_principal
 from ..schemas import ChatRequest, ChatResponse
-from ..services import router_client
+from ..services import conversation, router_client
+from ..services.input_pipeline import InputGuard, get_input_guard
 from ..services.tool_schema_generator import get_tool_registry
 
 logger = logging.getLogger(__name__)
@@ -103,7 +107,9 @@ def _get_tool_schemas_from_params(extra_params: Mapping | None) -> list[dict[str
         },
     },
 )
-async def ai_chat(req: ChatRequest) -> ChatResponse:
+async def ai_chat(
+    req: ChatRequest, request: Request, guard: InputGuard = Depends(get_input_guard)
+) -> ChatResponse:
     """
     POST /ai/chat
     - Router-first chat endpoint for GUI.
@@ -117,14 +123,42 @@ async def ai_chat(req: ChatRequest) -> ChatResponse:
     - Generation knobs: extra_params may include temperature/top_p/max_tokens,
       which are mapped to LM Studio's 'options' payload.
     - Function calling: Set extra_params.enable_tools=true to enable function calling.
+    - The latest user message passes through the shared input pipeline
+      (see DINOAIR_INPUT_PIPELINE_ENFORCE).
+    - Server-side history: with extra_params.conversation_id the client only
+      sends new turns; earlier turns are loaded from the chat history
+      database, truncated to DINOAIR_CHAT_CONTEXT_TOKENS. Conversations are
+      scoped to the caller, and turns of a retried request (same
+      extra_params.request_id or X-Request-ID header) are stored once.
     """
     mapping_params = req.extra_params if isinstance(req.extra_params, Mapping) else None
 
     messages: list[dict[str, str]] = [
         {"role": m.role.value, "content": m.content} for m in req.messages
     ]
+    for message in reversed(messages):
+        if message["role"] == "user":
+            message["content"] = await guard.check(message["content"], model_type="default")
+            break
 
     options: dict[str, Any] = _extract_options(mapping_params)
+    conversation_id = _pick_first_str(mapping_params, "conversation_id") if mapping_params else None
+    conversation_info: dict[str, Any] | None = None
+    owner = request_principal(request)
+    request_id = (
+        _pick_first_str(mapping_params, "request_id") if mapping_params else None
+    ) or request.headers.get("x-request-id")
+    if conversation_id:
+        reply_tokens = options.get("max_tokens")
+        messages, conversation_info = await run_in_threadpool(
+            conversation.build_window,
+            owner,
+            conversation_id,
+            messages,
+            reply_tokens if isinstance(reply_tokens, int) else 0,
+            request_id,
+        )
+
     tool_schemas = _get_tool_schemas_from_params(mapping_params)
     payload: dict[str, Any] = _build_payload(messages, options, tool_schemas)
 
@@ -173,6 +207,11 @@ async def ai_chat(req: ChatRequest) -> ChatResponse:
     metadata = {}
     if function_call_results:
         metadata["function_calls"] = function_call_results
+    if conversation_info is not None:
+        metadata["conversation"] = conversation_info
+        await run_in_threadpool(
+            conversation.record_reply, owner, conversation_info["id"], text, request_id
+        )
 
     return ChatResponse(
         success=bool(text) or bool(function_call_results),
@@ -279,6 +318,8 @@ def _execute_router_call(
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)
             ) from exc
+    except RateLimitExceeded as exc:
+        raise router_client.rate_limited(exc) from exc
     except CoreValidationError as exc:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)
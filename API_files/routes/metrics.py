@@ -18,9 +18,17 @@ async def metrics() -> dict[str, Any]:
       {
         "uptimeSeconds": number,
         "requests": { "total": number, "error": number },
-        "adapters": { [name]: { "successes": number, "failures": number } }
+        "adapters": { [name]: { "successes": number, "failures": number } },
+        "inputPipeline": { counters, "total" and per-stage latency histograms }
       }
     """
     # Ensure router/registry are initialized (no-op if already created)
     _ = get_router()
-    return core_metrics.minimal_snapshot()
+    snapshot = core_metrics.minimal_snapshot()
+    try:
+        from input_processing.shared_pipeline import get_shared_pipeline
+
+        snapshot["inputPipeline"] = get_shared_pipeline().get_metrics()
+    except Exception:  # pragma: no cover - optional component
+        pass
+    return snapshot
@@ -8,6 +8,7 @@ from starlette import status
 from core_router.errors import (
     AdapterError,
     NoHealthyService,
+    RateLimitExceeded,
     ServiceNotFound,
 )
 from core_router.errors import ValidationError as CoreValidationError
@@ -19,7 +20,7 @@ from ..schemas import (
     IngestFilesRequest,
     MonitorStartRequest,
 )
-from ..services.router_client import get_router
+from ..services.router_client import get_router, rate_limited
 
 router = APIRouter(prefix="/rag", tags=["rag"])
 
@@ -42,6 +43,8 @@ def _exec(service_name: str, payload: dict[str, Any]) -> Any:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)
         ) from exc
+    except RateLimitExceeded as exc:
+        raise rate_limited(exc) from exc
     except CoreValidationError as exc:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)
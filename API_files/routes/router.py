@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any, Literal
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel, Field
 from starlette import status
 
@@ -10,10 +10,12 @@ from core_router import metrics as core_metrics
 from core_router.errors import (
     AdapterError,
     NoHealthyService,
+    RateLimitExceeded,
     ServiceNotFound,
 )
 from core_router.errors import ValidationError as CoreValidationError
 
+from ..middleware.auth import request_principal
 from ..services import router_client
 
 router = APIRouter()
@@ -43,21 +45,25 @@ class ExecuteByRequest(BaseModel):
 
 
 @router.post("/router/execute", tags=["router"])
-async def router_execute(req: ExecuteRequest) -> Any:
+async def router_execute(req: ExecuteRequest, request: Request) -> Any:
     """
     POST /router/execute
     Body: { serviceName: str, payload: dict }
     Calls core router.execute(...) and returns the result (JSON-serializable).
+    Exhausted quotas return 429 with a Retry-After header.
     """
     r = router_client.get_router()
+    caller = request_principal(request)
     try:
-        return r.execute(req.serviceName, req.payload or {})
+        return r.execute(req.serviceName, req.payload or {}, caller=caller)
     except ServiceNotFound as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
     except NoHealthyService as exc:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)
         ) from exc
+    except RateLimitExceeded as exc:
+        raise router_client.rate_limited(exc) from exc
     except CoreValidationError as exc:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)
@@ -68,22 +74,26 @@ async def router_execute(req: ExecuteRequest) -> Any:
 
 
 @router.post("/router/executeBy", tags=["router"])
-async def router_execute_by(req: ExecuteByRequest) -> Any:
+async def router_execute_by(req: ExecuteByRequest, request: Request) -> Any:
     """
     POST /router/executeBy
     Body: { tag: str, policy?: 'first_healthy'|'round_robin'|'lowest_latency', payload: dict }
     Calls core router.execute_by(...) and returns the result (JSON-serializable).
+    Exhausted quotas return 429 with a Retry-After header.
     """
     r = router_client.get_router()
     policy = req.policy or "first_healthy"
+    caller = request_principal(request)
     try:
-        return r.execute_by(req.tag, req.payload or {}, policy)
+        return r.execute_by(req.tag, req.payload or {}, policy, caller=caller)
     except ServiceNotFound as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
     except NoHealthyService as exc:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)
         ) from exc
+    except RateLimitExceeded as exc:
+        raise router_client.rate_limited(exc) from exc
     except CoreValidationError as exc:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)
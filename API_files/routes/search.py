@@ -6,6 +6,7 @@ from starlette import status
 from core_router.errors import (
     AdapterError,
     NoHealthyService,
+    RateLimitExceeded,
     ServiceNotFound,
 )
 from core_router.errors import ValidationError as CoreValidationError
@@ -19,7 +20,7 @@ from ..schemas import (
     VectorSearchRequest,
     VectorSearchResponse,
 )
-from ..services.router_client import get_router
+from ..services.router_client import get_router, rate_limited
 from ..services.search import index_stats as svc_index_stats
 
 router = APIRouter()
@@ -43,6 +44,8 @@ def svc_keyword(body: KeywordSearchRequest) -> KeywordSearchResponse:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)
         ) from exc
+    except RateLimitExceeded as exc:
+        raise rate_limited(exc) from exc
     except CoreValidationError as exc:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)
@@ -67,6 +70,8 @@ def svc_vector(body: VectorSearchRequest) -> VectorSearchResponse:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)
         ) from exc
+    except RateLimitExceeded as exc:
+        raise rate_limited(exc) from exc
     except CoreValidationError as exc:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)
@@ -91,6 +96,8 @@ def svc_hybrid(body: HybridSearchRequest) -> HybridSearchResponse:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)
         ) from exc
+    except RateLimitExceeded as exc:
+        raise rate_limited(exc) from exc
     except CoreValidationError as exc:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)
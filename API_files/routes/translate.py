@@ -1,17 +1,23 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from starlette import status
+from starlette.concurrency import run_in_threadpool
 
 from core_router.errors import (
     AdapterError,
     NoHealthyService,
+    RateLimitExceeded,
     ServiceNotFound,
 )
 from core_router.errors import ValidationError as CoreValidationError
 
-from ..schemas import TranslateRequest, TranslateResponse
-from ..services.router_client import get_router
+from ..middleware.auth import request_principal
+from ..schemas import TranslateRequest, TranslateResponse, TranslateStreamRequest
+from ..services.input_pipeline import InputGuard, get_input_guard
+from ..services.router_client import get_router, rate_limited
+from ..services.translator import get_translator_service
 
 router = APIRouter()
 
@@ -22,14 +28,20 @@ router = APIRouter()
     response_model=TranslateResponse,
     status_code=status.HTTP_200_OK,
 )
-async def translate(req: TranslateRequest) -> TranslateResponse:
+async def translate(
+    req: TranslateRequest, request: Request, guard: InputGuard = Depends(get_input_guard)
+) -> TranslateResponse:
     """
     POST /translate
     - Safe, non-streaming pseudocode → code translation
     - Auth enforced globally by middleware
     - Input validated via DTO (size/enum)
     - Runs within app-configured timeout window
+    - Pseudocode is checked (rate limit, attack signatures in the first
+      DINOAIR_INPUT_PIPELINE_SCAN_CHARS characters) by the shared input
+      pipeline but never rewritten
     """
+    await guard.check(req.pseudocode, model_type=None, rewrite=False)
     service_router = get_router()
 
     payload = {"pseudocode": req.pseudocode}
@@ -38,6 +50,9 @@ async def translate(req: TranslateRequest) -> TranslateResponse:
             payload["target_language"] = req.target_language.value
         except AttributeError:
             payload["target_language"] = str(req.target_language)
+    if req.session_id is not None:
+        payload["session_id"] = req.session_id
+        payload["session_owner"] = request_principal(request)
 
     try:
         result = service_router.execute("translator.local.default", payload)
@@ -48,9 +63,36 @@ async def translate(req: TranslateRequest) -> TranslateResponse:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)
         ) from exc
+    except RateLimitExceeded as exc:
+        raise rate_limited(exc) from exc
     except CoreValidationError as exc:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)
         ) from exc
     except AdapterError as exc:
         raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc)) from exc
+
+
+@router.post("/translate/stream", tags=["translate"], status_code=status.HTTP_200_OK)
+async def translate_stream(
+    req: TranslateStreamRequest, guard: InputGuard = Depends(get_input_guard)
+) -> StreamingResponse:
+    """
+    POST /translate/stream
+    - Chunked translation of large pseudocode files, streamed back as
+      newline-delimited JSON (one line per chunk, in order; the last line has
+      done=true and the assembled code)
+    - Translation runs on the event loop: no thread is held per chunk, and a
+      client disconnect cancels in-flight model calls
+    - Pseudocode is checked (rate limit, size-capped attack scan) by the
+      shared input pipeline but never rewritten
+    """
+    await guard.check(req.pseudocode, model_type=None, rewrite=False)
+    try:
+        # First use loads the model; keep that off the event loop
+        service = await run_in_threadpool(get_translator_service)
+    except ImportError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)
+        ) from exc
+    return StreamingResponse(service.translate_stream(req), media_type="application/x-ndjson")
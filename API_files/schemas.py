@@ -70,6 +70,28 @@ class TranslateRequest(BaseModel):
 
     pseudocode: str = Field(..., min_length=1, max_length=100_000)
     target_language: TargetLanguageEnum | None = Field(default=TargetLanguageEnum.python)
+    session_id: str | None = Field(
+        default=None,
+        max_length=128,
+        description=(
+            "Translate as the next revision of this caller's document (incremental). "
+            "Sessions translate piece by piece, so output can differ from a request "
+            "without session_id, which first tries a whole-document model call"
+        ),
+    )
+
+    @field_validator("pseudocode")
+    @classmethod
+    def _trim_and_check(cls, v: str) -> str:
+        if v := v.strip():
+            return v
+        raise ValueError("pseudocode must not be empty")
+
+
+class TranslateStreamRequest(BaseModel):
+    """Request model for chunked (streamed) translation of large pseudocode files."""
+
+    pseudocode: str = Field(..., min_length=1, max_length=2_000_000)
 
     @field_validator("pseudocode")
     @classmethod
@@ -345,6 +367,7 @@ class ContextRequest(BaseModel):
     file_types: list[str] | None = Field(default=None)
     top_k: int = Field(default=10, ge=1, le=50)
     include_suggestions: bool = Field(default=True)
+    token_budget: int | None = Field(default=None, ge=64, le=32768)
 
     @field_validator("query")
     @classmethod
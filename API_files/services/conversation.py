@@ -0,0 +1,163 @@
+"""
+Server-side conversation history for /ai/chat.
+
+Requests carrying extra_params.conversation_id only need to send the new
+turn: earlier turns come from the chat_history database, pre-truncated to
+the configured context length (DINOAIR_CHAT_CONTEXT_TOKENS). With
+DINOAIR_CHAT_SUMMARIZE, turns falling out of the window are summarized
+through the router instead of being dropped.
+
+Conversations are stored per caller: the same conversation_id sent by
+another principal names a different, empty conversation. Turns carrying a
+request id are stored once, so a retried request does not repeat them.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from ..settings import Settings
+from . import router_client
+
+if TYPE_CHECKING:
+    from database.conversation_store import ConversationStore, Summarizer
+
+logger = logging.getLogger(__name__)
+
+_SUMMARY_INSTRUCTIONS = (
+    "Summarize the conversation below for your own later reference. Keep facts, "
+    "names, decisions and open questions; drop pleasantries. Answer with the "
+    "summary only."
+)
+
+
+def router_summarizer(
+    tag: str = "chat", policy: str = "first_healthy", max_tokens: int = 256
+) -> Summarizer:
+    """
+    Build a ConversationStore summarizer that calls the ServiceRouter.
+
+    Args:
+        tag: Router tag of the chat service
+        policy: Router selection policy
+        max_tokens: Generation limit for the summary
+
+    Returns:
+        Callable folding messages into a previous summary
+    """
+
+    def summarize(previous: str | None, messages: list[dict[str, str]]) -> str:
+        transcript = "\n".join(f"{m['role']}: {m['content']}" for m in messages)
+        if previous:
+            transcript = f"Earlier summary:\n{previous}\n\n{transcript}"
+        payload = {
+            "messages": [
+                {"role": "system", "content": _SUMMARY_INSTRUCTIONS},
+                {"role": "user", "content": transcript},
+            ],
+            "options": {"max_tokens": max_tokens, "temperature": 0.2},
+        }
+        result = router_client.get_router().execute_by(tag, payload, policy)
+        return _response_text(result)
+
+    return summarize
+
+
+def _response_text(result: Any) -> str:
+    if not isinstance(result, Mapping):
+        return ""
+    choices = result.get("choices")
+    if isinstance(choices, list) and choices and isinstance(choices[0], Mapping):
+        message = choices[0].get("message")
+        if isinstance(message, Mapping) and isinstance(message.get("content"), str):
+            return message["content"]
+    content = result.get("content")
+    return content if isinstance(content, str) else ""
+
+
+@lru_cache(maxsize=1)
+def _settings() -> Settings:
+    return Settings()
+
+
+@lru_cache(maxsize=1)
+def get_conversation_store() -> ConversationStore | None:
+    """Process-wide ConversationStore, or None when the database is unavailable."""
+    try:
+        from database.conversation_store import ConversationStore
+
+        return ConversationStore(
+            summarizer=router_summarizer() if _settings().chat_summarize else None
+        )
+    except Exception as e:  # pragma: no cover - optional component
+        logger.warning("Conversation store unavailable: %s", e)
+        return None
+
+
+def _scoped_id(owner: str, conversation_id: str) -> str:
+    """Store key of a caller's conversation."""
+    return f"{owner}/{conversation_id}"
+
+
+def build_window(
+    owner: str,
+    conversation_id: str,
+    messages: list[dict[str, str]],
+    reply_tokens: int = 0,
+    request_id: str | None = None,
+) -> tuple[list[dict[str, str]], dict[str, Any] | None]:
+    """
+    Store the newest user turn and return the prompt messages for it.
+
+    Client system messages are kept in front of the stored window; other
+    client messages are ignored in favour of the stored history. A retried
+    request (same request_id) reuses its stored turn and gets the window as
+    of that turn. Blocking (database and, when summarizing, router calls).
+
+    Args:
+        owner: Caller the conversation belongs to (see request_principal)
+        conversation_id: Conversation identifier from the client
+        messages: Messages of the request
+        reply_tokens: Tokens reserved for the model's reply
+        request_id: Client request identifier used to deduplicate retries
+
+    Returns:
+        Tuple of (prompt messages, window info); the request messages and
+        None when the store is unavailable
+    """
+    store = get_conversation_store()
+    if store is None:
+        return messages, None
+
+    session_id = _scoped_id(owner, conversation_id)
+    until_id: int | None = None
+    latest = next((m for m in reversed(messages) if m["role"] == "user"), None)
+    if latest is not None:
+        added = store.add_message(session_id, "user", latest["content"], request_id)
+        if added.get("duplicate"):
+            until_id = added["id"]
+
+    system = [m for m in messages if m["role"] == "system"]
+    budget = _settings().chat_context_tokens - max(0, reply_tokens)
+    budget -= sum(store.count_tokens(m["content"]) + store.message_overhead for m in system)
+    window = store.get_window(session_id, max(1, budget), until_id)
+    if not window["messages"]:
+        return messages, None
+    info = {
+        "id": conversation_id,
+        "window_tokens": window["token_count"],
+        "dropped": window["dropped"],
+    }
+    return system + window["messages"], info
+
+
+def record_reply(
+    owner: str, conversation_id: str, text: str, request_id: str | None = None
+) -> None:
+    """Store the assistant's reply to a caller's conversation (blocking)."""
+    store = get_conversation_store()
+    if store is not None and text:
+        store.add_message(_scoped_id(owner, conversation_id), "assistant", text, request_id)
@@ -0,0 +1,129 @@
+"""
+FastAPI dependency running user input through the shared input pipeline.
+
+The pipeline (compiled tables, per-thread stage objects, per-user state)
+is created once per process; the dependency only resolves the caller and
+returns a light InputGuard. Processing runs in the threadpool so large
+inputs do not block the event loop.
+"""
+
+from __future__ import annotations
+
+import logging
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from fastapi import HTTPException, Request
+from starlette import status
+from starlette.concurrency import run_in_threadpool
+
+from ..middleware.auth import request_principal
+from ..settings import Settings
+
+if TYPE_CHECKING:
+    from input_processing.shared_pipeline import SharedInputPipeline
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _settings() -> Settings:
+    return Settings()
+
+
+def _get_pipeline() -> SharedInputPipeline | None:
+    try:
+        from input_processing.shared_pipeline import get_shared_pipeline
+
+        return get_shared_pipeline()
+    except Exception as e:  # pragma: no cover - optional component
+        logger.warning("Input pipeline unavailable: %s", e)
+        return None
+
+
+class InputGuard:
+    """Per-request handle on the shared input pipeline."""
+
+    def __init__(
+        self,
+        pipeline: SharedInputPipeline | None,
+        user_id: str,
+        enforce: bool,
+        scan_chars: int = 16384,
+    ):
+        self.pipeline = pipeline
+        self.user_id = user_id
+        self.enforce = enforce
+        self.scan_chars = max(1, scan_chars)
+
+    async def check(
+        self,
+        text: str,
+        model_type: str | None = None,
+        rewrite: bool = True,
+        record_context: bool = False,
+    ) -> str:
+        """
+        Run text through the pipeline.
+
+        Args:
+            text: User input
+            model_type: LLM type for escaping; None skips escaping
+            rewrite: Return the sanitized text when enforcing. Without it
+                     the result is only a verdict: the text is rate limited
+                     and security-scanned up to scan_chars, and the
+                     normalize/escape/intent stages are skipped
+            record_context: Keep the processed text in the caller's context
+                            history (nothing in the API reads it, so off)
+
+        Returns:
+            The sanitized text when enforcing and rewrite is set, otherwise
+            the input unchanged
+
+        Raises:
+            HTTPException: 429 when rate limited, 400 when rejected (enforcing only)
+        """
+        if self.pipeline is None:
+            return text
+
+        from input_processing.input_sanitizer import InputPipelineError
+        from input_processing.shared_pipeline import InputRateLimitedError
+
+        scanned = text if rewrite else text[: self.scan_chars]
+        try:
+            result = await run_in_threadpool(
+                self.pipeline.process,
+                scanned,
+                self.user_id,
+                model_type,
+                record_context=record_context,
+                scan_only=not rewrite,
+            )
+        except InputRateLimitedError as exc:
+            if self.enforce:
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(exc)
+                ) from exc
+            logger.info("Input pipeline: rate limit exceeded (not enforced)")
+            return text
+        except InputPipelineError as exc:
+            if self.enforce:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+            logger.info("Input pipeline: input rejected (not enforced): %s", exc)
+            return text
+
+        if result.attacks_detected:
+            logger.info("Input pipeline: %d attack pattern(s) detected", result.attacks_detected)
+        return result.text if self.enforce and rewrite else text
+
+
+def get_input_guard(request: Request) -> InputGuard:
+    """FastAPI dependency providing the InputGuard for the calling user."""
+    settings = _settings()
+    pipeline = _get_pipeline() if settings.input_pipeline_enabled else None
+    return InputGuard(
+        pipeline,
+        request_principal(request),
+        settings.input_pipeline_enforce,
+        settings.input_pipeline_scan_chars,
+    )
@@ -46,6 +46,7 @@ class _ContextPayload(TypedDict, total=False):
     file_types: NotRequired[list[str] | None]
     top_k: NotRequired[int]
     include_suggestions: NotRequired[bool]
+    token_budget: NotRequired[int | None]
 
 
 class _IngestDirPayload(TypedDict, total=False):
@@ -254,6 +255,7 @@ class RagService:
         file_types: list[str] | None = None,
         top_k: int = 10,
         include_suggestions: bool = True,
+        token_budget: int | None = None,
     ) -> dict[str, Any]:
         """Retrieve contextual documents/snippets for a query."""
         # delegated to sub-service
@@ -262,6 +264,7 @@ class RagService:
             file_types=file_types,
             top_k=top_k,
             include_suggestions=include_suggestions,
+            token_budget=token_budget,
         )
 
     # -------------------------
@@ -311,6 +314,7 @@ class RagService:
             max_workers=getattr(self.settings, "rag_watchdog_max_workers", 2),
             cache_size=getattr(self.settings, "rag_cache_size", 100),
             enable_caching=True,
+            chunking_mode=getattr(self.settings, "rag_chunking_mode", "chars"),
         )
 
     def _process_files(
@@ -529,6 +533,7 @@ def router_context(payload: dict[str, Any]) -> dict[str, Any]:
         file_types=p.get("file_types"),
         top_k=int(p.get("top_k", 10)),
         include_suggestions=bool(p.get("include_suggestions", True)),
+        token_budget=p.get("token_budget"),
     )
 
 
@@ -29,6 +29,7 @@ class RagContextService:
         file_types: list[str] | None = None,
         top_k: int = 10,
         include_suggestions: bool = True,
+        token_budget: int | None = None,
     ) -> dict[str, Any]:
         if not getattr(self.settings, "rag_enabled", True):
             return resp(False, None, RAG_UNAVAILABLE_MSG, 501)
@@ -60,6 +61,9 @@ class RagContextService:
             return resp(False, None, str(e), 500)
 
         success_val, normalized_data, error_msg = self._normalize_context_data(data)
+        budget = token_budget or getattr(self.settings, "rag_context_token_budget", 0)
+        if success_val and budget:
+            normalized_data = self._pack_context(normalized_data, int(budget))
         return resp(success_val, normalized_data, error_msg, 200)
 
     # -------------------------
@@ -77,6 +81,29 @@ class RagContextService:
         method = getattr(prov, "get_context_for_query", None)
         return (method if callable(method) else None), False
 
+    @staticmethod
+    def _pack_context(data: dict[str, Any], token_budget: int) -> dict[str, Any]:
+        """Merge, deduplicate and budget the context items to token_budget."""
+        items = data.get("results")
+        if not isinstance(items, list) or not items:
+            return data
+        try:
+            # pylint: disable=import-outside-toplevel
+            from rag.context_packer import ContextPacker
+        except ImportError:
+            return data
+        try:
+            packed, stats = ContextPacker(token_budget).pack_items(items)
+        except (AttributeError, KeyError, TypeError, ValueError):
+            log.exception("context packing failed; returning unpacked results")
+            return data
+        packed_data = dict(data)
+        packed_data["results"] = packed
+        packed_data["packing"] = stats
+        if "result_count" in packed_data:
+            packed_data["result_count"] = len(packed)
+        return packed_data
+
     @staticmethod
     def _filtered_kwargs(method: Callable[..., Any], kwargs: dict[str, Any]) -> dict[str, Any]:
         try:
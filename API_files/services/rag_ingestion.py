@@ -69,6 +69,7 @@ class RagIngestionService:
                 max_workers=getattr(self.settings, "rag_watchdog_max_workers", 2),
                 cache_size=getattr(self.settings, "rag_cache_size", 100),
                 enable_caching=True,
+                chunking_mode=getattr(self.settings, "rag_chunking_mode", "chars"),
             )
             result = proc.process_directory(
                 directory=directory,
@@ -132,6 +133,7 @@ class RagIngestionService:
             max_workers=getattr(self.settings, "rag_watchdog_max_workers", 2),
             cache_size=getattr(self.settings, "rag_cache_size", 100),
             enable_caching=True,
+            chunking_mode=getattr(self.settings, "rag_chunking_mode", "chars"),
         )
 
     def _process_files(
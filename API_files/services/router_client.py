@@ -5,7 +5,11 @@ from collections.abc import Mapping, Sequence
 from contextlib import suppress
 from typing import Any, cast
 
+from fastapi import HTTPException
+from starlette import status
+
 from core_router.config import load_services_from_file
+from core_router.errors import RateLimitExceeded
 from core_router.registry import ServiceRegistry
 from core_router.router import ServiceRouter
 
@@ -139,5 +143,21 @@ def get_router() -> ServiceRouter:
         registry = ServiceRegistry()
         for s in services:
             registry.register(s)
-        _router_singleton = ServiceRouter(registry)
+        try:
+            settings = Settings()
+            tag_rpm, caller_rpm = settings.router_tag_rpm, settings.router_caller_rpm
+        except Exception:
+            tag_rpm, caller_rpm = {}, 0
+        _router_singleton = ServiceRouter(
+            registry, tag_rpm=tag_rpm, caller_rpm=caller_rpm or None
+        )
     return _router_singleton
+
+
+def rate_limited(exc: RateLimitExceeded) -> HTTPException:
+    """429 HTTPException carrying the quota's Retry-After hint."""
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail=str(exc),
+        headers={"Retry-After": exc.retry_after_header},
+    )
@@ -7,13 +7,20 @@ ensuring deterministic, non-streaming translation with conservative defaults.
 
 from __future__ import annotations
 
+import json
 import logging
+from collections.abc import AsyncIterator
 from contextlib import suppress
 from typing import Any, Protocol, cast
 
 from pydantic import ValidationError
 
-from ..schemas import TargetLanguageEnum, TranslateRequest, TranslateResponse
+from ..schemas import (
+    TargetLanguageEnum,
+    TranslateRequest,
+    TranslateResponse,
+    TranslateStreamRequest,
+)
 
 # Prefer the high-level API but force non-streaming behavior
 try:
@@ -32,7 +39,7 @@ class TranslatorAPIProtocol(Protocol):
     """Protocol for translator API to provide type hints."""
 
     def translate(
-        self, pseudocode: str, *, language: str, use_streaming: bool = False
+        self, pseudocode: str, *, language: str, use_streaming: bool = False, **kwargs: Any
     ) -> dict[str, Any]:
         """Translate pseudocode to target language."""
         return {}
@@ -116,9 +123,12 @@ class TranslatorService:
             metadata={"validation_error": True},
         )
 
-    def translate(self, req: TranslateRequest) -> TranslateResponse:
+    def translate(self, req: TranslateRequest, owner: str = "") -> TranslateResponse:
         """
         Translate pseudocode to the target language with non-streaming behavior.
+
+        req.session_id is scoped to owner (the caller, see request_principal),
+        so callers cannot reach each other's sessions.
         """
         # Map TargetLanguageEnum to raw string expected by TranslatorAPI
         target_lang: str = (req.target_language or TargetLanguageEnum.python).value
@@ -135,6 +145,8 @@ class TranslatorService:
                 req.pseudocode,
                 language=target_lang,
                 use_streaming=False,
+                session_id=req.session_id,
+                session_owner=owner,
             )
         except (ImportError, AttributeError, RuntimeError, ValueError) as e:
             log.exception("TranslatorAPI.translate failed")
@@ -166,6 +178,24 @@ class TranslatorService:
             # If the upstream result violates our DTO constraints, coerce to a safe failure
             return self._create_validation_error_response(language, ve)
 
+    async def translate_stream(self, req: TranslateStreamRequest) -> AsyncIterator[str]:
+        """
+        Translate large pseudocode chunk by chunk as newline-delimited JSON.
+
+        Runs on the event loop (TranslatorAPI.translate_stream_async); each
+        chunk result is one line, the last line carries done=true and the
+        assembled code. Closing the iterator cancels in-flight model calls.
+        """
+        try:
+            async for event in self._api.translate_stream_async(req.pseudocode):
+                event["errors"] = self._normalize_list(event.get("errors", []))
+                event["warnings"] = self._normalize_list(event.get("warnings", []))
+                yield json.dumps(event, default=str) + "\n"
+        except (ImportError, AttributeError, RuntimeError, ValueError) as e:
+            log.exception("TranslatorAPI.translate_stream_async failed")
+            error = self._create_error_response(e, TargetLanguageEnum.python.value)
+            yield json.dumps({"done": True, **error.model_dump()}) + "\n"
+
 
 # Module-level facade
 class _TranslatorServiceSingleton:
@@ -189,9 +219,9 @@ def get_translator_service() -> TranslatorService:
     return _singleton.get_instance()
 
 
-def translate(req: TranslateRequest) -> TranslateResponse:
+def translate(req: TranslateRequest, owner: str = "") -> TranslateResponse:
     """Translate pseudocode using the singleton translator service."""
-    return get_translator_service().translate(req)
+    return get_translator_service().translate(req, owner)
 
 
 def router_translate(input_data: dict[str, Any]) -> dict[str, Any]:
@@ -202,6 +232,8 @@ def router_translate(input_data: dict[str, Any]) -> dict[str, Any]:
         input_data: dict with keys:
           - 'pseudocode': str (required)
           - 'target_language': Optional[str]
+          - 'session_id': Optional[str]
+          - 'session_owner': Optional[str], caller the session id is scoped to
 
     Behavior:
         Wraps translate() by building TranslateRequest.
@@ -210,6 +242,7 @@ def router_translate(input_data: dict[str, Any]) -> dict[str, Any]:
     req = TranslateRequest(
         pseudocode=input_data["pseudocode"],
         target_language=input_data.get("target_language"),
+        session_id=input_data.get("session_id"),
     )
-    resp = translate(req)
+    resp = translate(req, input_data.get("session_owner") or "")
     return resp.model_dump(by_alias=False, exclude_none=True)
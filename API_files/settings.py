@@ -204,6 +204,13 @@ class Settings:
         self.rag_chunk_size: int = _parse_int(_get_env("DINOAIR_RAG_CHUNK_SIZE"), 1000)
         self.rag_chunk_overlap: int = _parse_int(_get_env("DINOAIR_RAG_CHUNK_OVERLAP"), 200)
         self.rag_min_chunk_size: int = _parse_int(_get_env("DINOAIR_RAG_MIN_CHUNK_SIZE"), 100)
+        self.rag_chunking_mode: str = (
+            _get_env("DINOAIR_RAG_CHUNKING_MODE", "chars") or "chars"
+        ).lower()
+        # Prompt token budget for packed RAG context; 0 returns chunks unpacked
+        self.rag_context_token_budget: int = _parse_int(
+            _get_env("DINOAIR_RAG_CONTEXT_TOKEN_BUDGET"), 0
+        )
         self.rag_allowed_dirs: list[str] = _parse_csv(_get_env("DINOAIR_RAG_ALLOWED_DIRS"))
         self.rag_excluded_dirs: list[str] = _parse_csv(_get_env("DINOAIR_RAG_EXCLUDED_DIRS"))
         self.rag_file_extensions: list[str] = _parse_csv(_get_env("DINOAIR_RAG_FILE_EXTENSIONS"))
@@ -214,6 +221,38 @@ class Settings:
             _get_env("DINOAIR_RAG_WATCHDOG_MAX_WORKERS"), 2
         )
 
+        # Shared input pipeline on /ai/chat and /translate. When not enforcing,
+        # inputs are only checked and measured; when enforcing, rejected or
+        # rate-limited inputs fail and chat messages are replaced by the
+        # sanitized text
+        self.input_pipeline_enabled: bool = _parse_bool(
+            _get_env("DINOAIR_INPUT_PIPELINE_ENABLED"), True
+        )
+        self.input_pipeline_enforce: bool = _parse_bool(
+            _get_env("DINOAIR_INPUT_PIPELINE_ENFORCE"), False
+        )
+        # Inputs that are checked but never rewritten (translate payloads) are
+        # rate limited and security-scanned up to this many characters
+        self.input_pipeline_scan_chars: int = _parse_int(
+            _get_env("DINOAIR_INPUT_PIPELINE_SCAN_CHARS"), 16384
+        )
+
+        # Server-side chat history for /ai/chat requests carrying
+        # extra_params.conversation_id: prompt window size in tokens and
+        # whether turns falling out of it are summarized through the router
+        self.chat_context_tokens: int = _parse_int(_get_env("DINOAIR_CHAT_CONTEXT_TOKENS"), 4096)
+        self.chat_summarize: bool = _parse_bool(_get_env("DINOAIR_CHAT_SUMMARIZE"), False)
+
+        # ServiceRouter quotas (requests per minute, token buckets).
+        # DINOAIR_ROUTER_TAG_RPM: CSV of tag=rpm, e.g. "search=600,rag=300"
+        # DINOAIR_ROUTER_CALLER_RPM: per-caller quota; 0 disables it
+        self.router_tag_rpm: dict[str, int] = {}
+        for item in _parse_csv(_get_env("DINOAIR_ROUTER_TAG_RPM")):
+            tag, _, rpm = item.partition("=")
+            if tag.strip() and (value := _parse_int(rpm.strip(), 0)) > 0:
+                self.router_tag_rpm[tag.strip()] = value
+        self.router_caller_rpm: int = _parse_int(_get_env("DINOAIR_ROUTER_CALLER_RPM"), 0)
+
         # Optional override for services config path (used by ServiceRouter)
         # Env var: DINOAIR_SERVICES_FILE
         self.services_config_path: str | None = _get_env("DINOAIR_SERVICES_FILE") or None
@@ -6,6 +6,7 @@ These are intentionally simple and typed for clear error handling paths.
 
 from __future__ import annotations
 
+import math
 from datetime import UTC, datetime
 from typing import Any
 from uuid import uuid4
@@ -40,6 +41,40 @@ class ValidationError(Exception):
         self.details: dict[str, Any] | str | None = details
 
 
+class RateLimitExceeded(ValidationError):
+    """
+    Raised when a service, tag or caller quota is exhausted.
+
+    Subclasses ValidationError so existing handlers keep working.
+
+    Attributes:
+        scope: Quota that blocked the request ("service", "tag" or "caller").
+        key: Service name, tag or caller id of that quota.
+        limit_rpm: Configured requests per minute of that quota.
+        retry_after: Seconds until the quota admits a request again.
+    """
+
+    def __init__(self, scope: str, key: str, limit_rpm: int, retry_after: float) -> None:
+        super().__init__(
+            f"rate limit exceeded: {limit_rpm} rpm",
+            details={
+                "scope": scope,
+                "key": key,
+                "limit_rpm": limit_rpm,
+                "retry_after": round(retry_after, 3),
+            },
+        )
+        self.scope = scope
+        self.key = key
+        self.limit_rpm = limit_rpm
+        self.retry_after = retry_after
+
+    @property
+    def retry_after_header(self) -> str:
+        """Retry-After header value (whole seconds, at least 1)."""
+        return str(max(1, math.ceil(self.retry_after)))
+
+
 class AdapterError(Exception):
     """
     Raised when an adapter invocation or ping encounters an error.
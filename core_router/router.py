@@ -3,7 +3,8 @@ Service router for DinoAir core_router.
 
 Synchronous router that:
 - validates input/output via schemas
-- enforces per-service rate limits (per-minute, sliding window)
+- enforces per-service, per-tag and per-caller rate limits (per-minute,
+  lock-striped token buckets)
 - selects services by tag using policies
 - records metrics and updates health
 - emits JSON-ish logs
@@ -11,11 +12,11 @@ Synchronous router that:
 
 from __future__ import annotations
 
+import itertools
 import json
 import logging
 import threading
 import time
-from collections import deque
 from collections.abc import Callable, Mapping, Sequence
 from contextlib import suppress
 from typing import TYPE_CHECKING, Any, NoReturn, cast
@@ -25,6 +26,7 @@ from .adapters.base import ServiceAdapter
 from .errors import (
     AdapterError,
     NoHealthyService,
+    RateLimitExceeded,
     ServiceNotFound,
     ValidationError,
     not_implemented,
@@ -33,6 +35,7 @@ from .errors import (
 # Import HealthState for runtime use
 from .health import HealthState
 from .metrics import record_error, record_success
+from .ratelimit import TokenBucketLimiter
 from .registry import ServiceDescriptor, ServiceRegistry
 from .schemas import validate_input, validate_output
 
@@ -64,6 +67,8 @@ def create_router(services_file: str | None = None) -> ServiceRouter:
     - Imports are intentionally local to avoid import-time cycles.
     - auto_register_from_config_and_env is used for best-effort service registration
       and may include optional LM Studio reachability hints.
+    - DINO_ROUTER_CALLER_RPM, when set to a positive number, enables the
+      per-caller quota.
     """
     # Local imports to avoid cycles
     import os  # local to keep import-time surface minimal
@@ -74,7 +79,8 @@ def create_router(services_file: str | None = None) -> ServiceRouter:
     file_path = services_file or os.getenv("DINO_SERVICES_FILE", "config/services.lmstudio.yaml")
     registry = LocalServiceRegistry()
     auto_register_from_config_and_env(registry, file_path)
-    return ServiceRouter(registry=registry)
+    caller_rpm = ServiceRouter._to_positive_int(os.getenv("DINO_ROUTER_CALLER_RPM"))
+    return ServiceRouter(registry=registry, caller_rpm=caller_rpm)
 
 
 def get_router() -> ServiceRouter:
@@ -123,8 +129,10 @@ class ServiceRouter:
     """
     Service Router.
 
-    - Keep synchronous; thread-safe internal state via a single lock.
-    - Per-service sliding-window rate limit (per-minute).
+    - Keep synchronous; thread-safe without a router-wide lock.
+    - Per-service, per-tag and per-caller token-bucket rate limits
+      (per-minute); exhausted quotas raise RateLimitExceeded with a
+      retry-after hint.
     - Policies: first_healthy, round_robin, lowest_latency.
     - JSON-ish logs with keys: service, event, duration_ms, ok.
     """
@@ -135,6 +143,8 @@ class ServiceRouter:
         adapter_factory: AdapterFactory | None = None,
         *,
         logger: logging.Logger | None = None,
+        tag_rpm: Mapping[str, int] | None = None,
+        caller_rpm: int | None = None,
     ) -> None:
         """
         Initialize the router.
@@ -145,25 +155,39 @@ class ServiceRouter:
                 a ServiceDescriptor. When provided, it is used instead of the
                 default adapters.make_adapter.
             logger: Optional logger; defaults to 'core_router.router'.
+            tag_rpm: Optional per-minute quotas by tag, shared by all services
+                carrying the tag (e.g. {"search": 600}).
+            caller_rpm: Optional per-minute quota for each caller id passed
+                to execute/execute_by.
         """
         self._registry: ServiceRegistry = registry
         self._adapter_factory = adapter_factory
         self._logger: logging.Logger = logger or logging.getLogger("core_router.router")
 
-        # Thread-safety for limiter state and RR pointers
-        self._lock = threading.Lock()
+        self._tag_rpm: dict[str, int] = {
+            tag: rpm
+            for tag, value in (tag_rpm or {}).items()
+            if (rpm := self._to_positive_int(value)) is not None
+        }
+        self._caller_rpm = self._to_positive_int(caller_rpm)
 
-        # Rate limit windows: service -> deque[timestamps (monotonic)]
-        self._rate_windows: dict[str, deque[float]] = {}
+        # Token buckets keyed "service:<name>", "tag:<tag>", "caller:<id>"
+        self._limiter = TokenBucketLimiter()
 
-        # Round-robin pointers: tag -> next index
-        self._rr_pointers: dict[str, int] = {}
+        # Round-robin counters: tag -> itertools.count (next() is atomic)
+        self._rr_counters: dict[str, itertools.count[int]] = {}
 
     # -------------------------
     # Public API
     # -------------------------
 
-    def execute(self, service_name: str, payload: Mapping[str, Any]) -> object:
+    def execute(
+        self,
+        service_name: str,
+        payload: Mapping[str, Any],
+        *,
+        caller: str | None = None,
+    ) -> object:
         """
         Execute a service with validation, rate limiting, metrics, health,
         and logging.
@@ -171,7 +195,8 @@ class ServiceRouter:
         Steps:
           a) Lookup descriptor.
           b) Resolve adapter kind; else raise ValidationError.
-          c) Enforce per-minute sliding-window rate limit if configured.
+          c) Enforce service, tag and caller quotas if configured; raise
+             RateLimitExceeded (a ValidationError) when one is exhausted.
           d) Validate input.
           e) make_adapter(kind, config) and invoke.
           f) Validate output, update health, record metrics, log, return.
@@ -189,8 +214,7 @@ class ServiceRouter:
             if not kind:
                 raise ValidationError(f"missing adapter kind for service '{desc.name}'")
 
-            if (rpm := self._resolve_rpm(desc)) is not None and rpm > 0:
-                self._enforce_rate_limit(desc.name, rpm)
+            self._enforce_rate_limit(desc, caller)
 
             in_payload = validate_input(desc, dict(payload))
 
@@ -318,6 +342,8 @@ class ServiceRouter:
         tag: str,
         payload: Mapping[str, Any],
         policy: str = "first_healthy",
+        *,
+        caller: str | None = None,
     ) -> object:
         """
         Execute a service selected by tag and policy.
@@ -356,7 +382,7 @@ class ServiceRouter:
             policy=p,
         )
 
-        return self.execute(chosen.name, payload)
+        return self.execute(chosen.name, payload, caller=caller)
 
     # -------------------------
     # Internals
@@ -424,24 +450,34 @@ class ServiceRouter:
             f = float(v)  # type: ignore[arg-type]
             if f <= 0:
                 return None
-            return int(f) if f.is_integer() else int(round(f))
+            # Rates below 1 rpm would round to 0 and a bucket divides by its rate
+            return max(1, int(f) if f.is_integer() else int(round(f)))
         except Exception:
             return None
 
-    def _enforce_rate_limit(self, service_name: str, rpm: int) -> None:
-        """Sliding-window limiter over the last 60 seconds."""
-        now = time.monotonic()
-        with self._lock:
-            dq: deque[float] = self._rate_windows.setdefault(service_name, deque())
-
-            cutoff = now - 60.0
-            while dq and dq[0] <= cutoff:
-                dq.popleft()
+    def _enforce_rate_limit(self, desc: ServiceDescriptor, caller: str | None) -> None:
+        """
+        Charge one request to every applicable quota, all or nothing.
 
-            if len(dq) >= rpm:
-                raise ValidationError(f"rate limit exceeded: {rpm} rpm")
+        Buckets hold up to rpm tokens and refill at rpm/60 per second.
+        """
+        scopes: list[tuple[str, int]] = []
+        if (rpm := self._resolve_rpm(desc)) is not None:
+            scopes.append((f"service:{desc.name}", rpm))
+        if self._tag_rpm:
+            scopes.extend(
+                (f"tag:{tag}", self._tag_rpm[tag]) for tag in desc.tags if tag in self._tag_rpm
+            )
+        if caller and self._caller_rpm is not None:
+            scopes.append((f"caller:{caller}", self._caller_rpm))
+        if not scopes:
+            return
 
-            dq.append(now)
+        if (blocked := self._limiter.acquire(scopes)) is not None:
+            key, retry_after = blocked
+            scope, _, name = key.partition(":")
+            limit = next(rpm for k, rpm in scopes if k == key)
+            raise RateLimitExceeded(scope, name, limit, retry_after)
 
     @staticmethod
     def _is_healthy(desc: ServiceDescriptor) -> bool:
@@ -460,13 +496,10 @@ class ServiceRouter:
     ) -> ServiceDescriptor:
         """Round-robin among healthy services, deterministic by name."""
         sorted_healthy = sorted(healthy, key=lambda d: d.name)
-        with self._lock:
-            idx = self._rr_pointers.get(tag, 0)
-            if idx >= len(sorted_healthy) or idx < 0:
-                idx = 0
-            choice = sorted_healthy[idx]
-            self._rr_pointers[tag] = (idx + 1) % len(sorted_healthy)
-            return choice
+        counter = self._rr_counters.get(tag)
+        if counter is None:
+            counter = self._rr_counters.setdefault(tag, itertools.count())
+        return sorted_healthy[next(counter) % len(sorted_healthy)]
 
     @staticmethod
     def _select_lowest_latency(
@@ -0,0 +1,334 @@
+"""
+ConversationStore - server-side chat history with token-aware windows.
+
+Messages are stored in the chat_history database together with their
+token count, counted once when the message is added. get_window() returns
+the newest messages that fit a model's context length without re-reading
+or re-counting older turns. Older turns can optionally be folded into a
+running summary (e.g. produced through the ServiceRouter).
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from utils.logger import Logger
+from utils.tokens import estimate_tokens
+
+from .initialize_db import DatabaseManager
+
+# Summarizer: (previous summary or None, messages to fold in) -> new summary
+Summarizer = Callable[[str | None, list[dict[str, str]]], str]
+
+
+class ConversationStore:
+    """Persists conversation turns and builds token-budgeted prompt windows.
+
+    Schema is created by DatabaseManager._setup_chat_history_schema.
+    """
+
+    # Tokens charged per message for role markers and separators
+    DEFAULT_MESSAGE_OVERHEAD = 4
+    # Token budget reserved for the running summary
+    DEFAULT_SUMMARY_TOKENS = 256
+    # Smallest amount of dropped history worth a summarization call
+    DEFAULT_SUMMARIZE_MIN_TOKENS = 256
+
+    SUMMARY_PREFIX = "Summary of the earlier conversation:\n"
+
+    # Upper bound for message ids (SQLite INTEGER PRIMARY KEY)
+    _MAX_ID = 2**63 - 1
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager | None = None,
+        count_tokens: Callable[[str], int] | None = None,
+        summarizer: Summarizer | None = None,
+        message_overhead: int = DEFAULT_MESSAGE_OVERHEAD,
+        summary_tokens: int = DEFAULT_SUMMARY_TOKENS,
+        summarize_min_tokens: int = DEFAULT_SUMMARIZE_MIN_TOKENS,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            db_manager: Database manager owning the chat_history database
+            count_tokens: Token counter for the target model (defaults to
+                          estimate_tokens)
+            summarizer: Optional callable folding dropped turns into a
+                        running summary; without it dropped turns are
+                        simply left out of the window
+            message_overhead: Tokens charged per message on top of its content
+            summary_tokens: Largest summary kept in the window
+            summarize_min_tokens: Dropped tokens collected before the
+                                  summarizer is called again
+        """
+        self.logger = Logger()
+        self.db_manager = db_manager or DatabaseManager()
+        self.count_tokens = count_tokens or estimate_tokens
+        self.summarizer = summarizer
+        self.message_overhead = max(1, int(message_overhead))
+        self.summary_tokens = max(1, int(summary_tokens))
+        self.summarize_min_tokens = max(0, int(summarize_min_tokens))
+        # sqlite3 connections are per thread; keep one per thread instead of
+        # reconnecting (and re-running schema setup) on every call
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self.db_manager.get_chat_history_connection()
+        return conn
+
+    def add_message(
+        self, session_id: str, role: str, content: str, request_id: str | None = None
+    ) -> dict[str, Any]:
+        """
+        Append a message to a conversation.
+
+        A message carrying a request_id is stored once per conversation and
+        role: adding it again (a retried request) returns the stored message.
+
+        Args:
+            session_id: Conversation identifier
+            role: Chat role ("user", "assistant", "system", ...)
+            content: Message text
+            request_id: Optional client request identifier to deduplicate on
+
+        Returns:
+            Dict with success status, message id, token count and whether
+            the message was a duplicate, or error
+        """
+        token_count = self.count_tokens(content)
+        try:
+            conn = self._connection()
+            with conn:
+                cursor = conn.execute(
+                    """
+                    INSERT OR IGNORE INTO conversation_messages
+                        (session_id, role, content, token_count, request_id)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    (session_id, role, content, token_count, request_id),
+                )
+            if cursor.rowcount == 0 and request_id is not None:
+                row = conn.execute(
+                    """
+                    SELECT id, token_count FROM conversation_messages
+                    WHERE session_id = ? AND role = ? AND request_id = ?
+                    """,
+                    (session_id, role, request_id),
+                ).fetchone()
+                if row is not None:
+                    return {
+                        "success": True,
+                        "id": row[0],
+                        "token_count": row[1],
+                        "duplicate": True,
+                    }
+            return {
+                "success": True,
+                "id": cursor.lastrowid,
+                "token_count": token_count,
+                "duplicate": False,
+            }
+        except sqlite3.Error as e:
+            self.logger.error(f"Conversation store DB error: {e}")
+            return {"success": False, "error": str(e)}
+
+    def get_window(
+        self, session_id: str, max_tokens: int, until_id: int | None = None
+    ) -> dict[str, Any]:
+        """
+        Build the prompt window for a conversation.
+
+        The newest messages are kept until max_tokens is reached; the newest
+        message is always kept. When older turns fall out of the window and a
+        summarizer is configured, they are folded into the running summary,
+        which is returned as a leading system message.
+
+        Args:
+            session_id: Conversation identifier
+            max_tokens: Token budget for the whole window
+            until_id: Newest message id to include; a retried request passes
+                      its stored turn so later replies stay out of its window
+
+        Returns:
+            Dict with messages (chronological role/content dicts),
+            token_count (estimated window size) and dropped (stored
+            messages neither in the window nor in the summary)
+        """
+        empty: dict[str, Any] = {"messages": [], "token_count": 0, "dropped": 0}
+        try:
+            conn = self._connection()
+            summary = self._load_summary(conn, session_id)
+            through_id = summary["through_id"] if summary else 0
+            reserve = summary["token_count"] + self.message_overhead if summary else 0
+            if self.summarizer is not None:
+                reserve = max(reserve, self.summary_tokens + self.message_overhead)
+
+            last_id = until_id if until_id is not None else self._MAX_ID
+            first_id, used = self._fit(
+                conn, session_id, through_id, last_id, max_tokens - reserve
+            )
+            if first_id is None:
+                return empty
+
+            dropped = self._dropped(conn, session_id, through_id, first_id)
+            if (
+                self.summarizer is not None
+                and dropped
+                and sum(row[3] for row in dropped) >= self.summarize_min_tokens
+            ):
+                summary = self._summarize(conn, session_id, summary, dropped) or summary
+                if summary and summary["through_id"] >= dropped[-1][0]:
+                    dropped = []
+
+            rows = conn.execute(
+                """
+                SELECT role, content FROM conversation_messages
+                WHERE session_id = ? AND id >= ? AND id <= ? ORDER BY id
+                """,
+                (session_id, first_id, last_id),
+            ).fetchall()
+        except sqlite3.Error as e:
+            self.logger.error(f"Conversation store DB error: {e}")
+            return empty
+
+        messages = [{"role": role, "content": content} for role, content in rows]
+        if summary:
+            messages.insert(
+                0, {"role": "system", "content": self.SUMMARY_PREFIX + summary["summary"]}
+            )
+            used += summary["token_count"] + self.message_overhead
+        return {"messages": messages, "token_count": used, "dropped": len(dropped)}
+
+    def _fit(
+        self,
+        conn: sqlite3.Connection,
+        session_id: str,
+        after_id: int,
+        last_id: int,
+        budget: int,
+    ) -> tuple[int | None, int]:
+        """Oldest message id that still fits budget (newest first) and the tokens used."""
+        # Every message costs at least the overhead, so no more rows can fit
+        limit = max(1, budget // self.message_overhead + 1)
+        rows = conn.execute(
+            """
+            SELECT id, token_count FROM conversation_messages
+            WHERE session_id = ? AND id > ? AND id <= ? ORDER BY id DESC LIMIT ?
+            """,
+            (session_id, after_id, last_id, limit),
+        ).fetchall()
+        first_id: int | None = None
+        used = 0
+        for message_id, token_count in rows:
+            cost = token_count + self.message_overhead
+            if first_id is not None and used + cost > budget:
+                break
+            first_id = message_id
+            used += cost
+        return first_id, used
+
+    @staticmethod
+    def _dropped(
+        conn: sqlite3.Connection, session_id: str, after_id: int, before_id: int
+    ) -> list[tuple[int, str, str, int]]:
+        return conn.execute(
+            """
+            SELECT id, role, content, token_count FROM conversation_messages
+            WHERE session_id = ? AND id > ? AND id < ? ORDER BY id
+            """,
+            (session_id, after_id, before_id),
+        ).fetchall()
+
+    @staticmethod
+    def _load_summary(conn: sqlite3.Connection, session_id: str) -> dict[str, Any] | None:
+        row = conn.execute(
+            """
+            SELECT summary, token_count, through_id FROM conversation_summaries
+            WHERE session_id = ?
+            """,
+            (session_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        return {"summary": row[0], "token_count": row[1], "through_id": row[2]}
+
+    def _summarize(
+        self,
+        conn: sqlite3.Connection,
+        session_id: str,
+        summary: dict[str, Any] | None,
+        dropped: list[tuple[int, str, str, int]],
+    ) -> dict[str, Any] | None:
+        """Fold dropped messages into the running summary and store it."""
+        if self.summarizer is None:
+            return None
+        previous = summary["summary"] if summary else None
+        messages = [{"role": role, "content": content} for _, role, content, _ in dropped]
+        try:
+            text = self.summarizer(previous, messages).strip()
+        except Exception as e:
+            self.logger.warning(f"Conversation summarization failed: {e}")
+            return None
+        if not text:
+            return None
+
+        text = self._clip(text, self.summary_tokens)
+        new = {"summary": text, "token_count": self.count_tokens(text), "through_id": dropped[-1][0]}
+        with conn:
+            conn.execute(
+                """
+                INSERT INTO conversation_summaries (session_id, summary, token_count, through_id)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(session_id) DO UPDATE SET
+                    summary = excluded.summary,
+                    token_count = excluded.token_count,
+                    through_id = excluded.through_id,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                (session_id, new["summary"], new["token_count"], new["through_id"]),
+            )
+        return new
+
+    def _clip(self, text: str, max_tokens: int) -> str:
+        """Longest prefix of text within max_tokens (binary search on length)."""
+        if self.count_tokens(text) <= max_tokens:
+            return text
+        low, high = 0, len(text)
+        while low < high:
+            mid = (low + high + 1) // 2
+            if self.count_tokens(text[:mid]) <= max_tokens:
+                low = mid
+            else:
+                high = mid - 1
+        return text[:low].rstrip()
+
+    def clear(self, session_id: str) -> dict[str, Any]:
+        """
+        Delete a conversation and its summary.
+
+        Args:
+            session_id: Conversation identifier
+
+        Returns:
+            Dict with success status and number of deleted messages, or error
+        """
+        try:
+            conn = self._connection()
+            with conn:
+                cursor = conn.execute(
+                    "DELETE FROM conversation_messages WHERE session_id = ?", (session_id,)
+                )
+                conn.execute(
+                    "DELETE FROM conversation_summaries WHERE session_id = ?", (session_id,)
+                )
+            return {"success": True, "deleted": cursor.rowcount}
+        except sqlite3.Error as e:
+            self.logger.error(f"Conversation store DB error: {e}")
+            return {"success": False, "error": str(e)}
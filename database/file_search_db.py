@@ -49,6 +49,10 @@ class FileSearchDB:
         """Get database connection for file search operations"""
         return self.db_manager.get_file_search_connection()
 
+    def get_connection(self):
+        """Get database connection for search engines reading the index directly"""
+        return self._get_connection()
+
     def create_tables(self) -> bool:
         """
         Create all necessary tables for the file search system.
@@ -72,11 +76,16 @@ class FileSearchDB:
                         indexed_date DATETIME DEFAULT CURRENT_TIMESTAMP,
                         file_type TEXT,
                         status TEXT DEFAULT 'active',
-                        metadata TEXT
+                        metadata TEXT,
+                        mtime_ns INTEGER,
+                        inode INTEGER
                     )
                 """
                 )
 
+                # Older databases predate the stat snapshot columns
+                self._ensure_snapshot_columns(cursor)
+
                 # Table for storing text chunks
                 cursor.execute(
                     """
@@ -164,6 +173,20 @@ class FileSearchDB:
             self.logger.error(f"Error creating file search tables: {str(e)}")
             return False
 
+    def _ensure_snapshot_columns(self, cursor) -> None:
+        """
+        Add the mtime_ns/inode snapshot columns to an existing indexed_files table.
+
+        Args:
+            cursor: Open cursor on the file search database
+        """
+        cursor.execute("PRAGMA table_info(indexed_files)")
+        columns = {row[1] for row in cursor.fetchall()}
+        for column in ("mtime_ns", "inode"):
+            if column not in columns:
+                cursor.execute(f"ALTER TABLE indexed_files ADD COLUMN {column} INTEGER")
+                self.logger.info(f"Added {column} column to indexed_files")
+
     def add_indexed_file(
         self,
         file_path: str,
@@ -172,6 +195,8 @@ class FileSearchDB:
         modified_date: datetime,
         file_type: str | None = None,
         metadata: dict[str, Any] | None = None,
+        mtime_ns: int | None = None,
+        inode: int | None = None,
     ) -> dict[str, Any]:
         """
         Add a new file to the index.
@@ -183,6 +208,8 @@ class FileSearchDB:
             modified_date: Last modification date of the file
             file_type: Type of the file (e.g., 'pdf', 'txt', 'docx')
             metadata: Additional metadata as dictionary
+            mtime_ns: Modification time in nanoseconds (stat snapshot)
+            inode: Inode number (stat snapshot)
 
         Returns:
             Dict with success status and file_id or error message
@@ -201,8 +228,8 @@ class FileSearchDB:
                     """
                     INSERT OR REPLACE INTO indexed_files
                     (id, file_path, file_hash, size, modified_date,
-                     file_type, status, metadata)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                     file_type, status, metadata, mtime_ns, inode)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                     (
                         file_id,
@@ -213,6 +240,8 @@ class FileSearchDB:
                         file_type,
                         "active",
                         metadata_json,
+                        mtime_ns,
+                        inode,
                     ),
                 )
 
@@ -246,7 +275,8 @@ class FileSearchDB:
                 cursor.execute(
                     """
                     SELECT id, file_path, file_hash, size, modified_date,
-                           indexed_date, file_type, status, metadata
+                           indexed_date, file_type, status, metadata,
+                           mtime_ns, inode
                     FROM indexed_files
                     WHERE file_path = ? AND status = 'active'
                 """,
@@ -266,6 +296,8 @@ class FileSearchDB:
                         "file_type": row[6],
                         "status": row[7],
                         "metadata": json.loads(row[8]) if row[8] else None,
+                        "mtime_ns": row[9],
+                        "inode": row[10],
                     }
 
                     self.logger.debug(f"Retrieved file info for: {file_path}")
@@ -277,6 +309,89 @@ class FileSearchDB:
             self.logger.error(f"Error retrieving file {file_path}: {str(e)}")
             return None
 
+    def get_file_snapshots(self, path_prefix: str | None = None) -> dict[str, dict[str, Any]]:
+        """
+        Retrieve stat snapshots for all active indexed files.
+
+        Args:
+            path_prefix: Optional directory prefix to restrict the snapshot set
+
+        Returns:
+            Dictionary mapping file path to its id, hash, size, mtime_ns and inode
+        """
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+
+                query = """
+                    SELECT id, file_path, file_hash, size, mtime_ns, inode
+                    FROM indexed_files
+                    WHERE status = 'active'
+                """
+                params: list[Any] = []
+                if path_prefix:
+                    # Escape LIKE wildcards so the prefix is matched literally
+                    escaped = (
+                        path_prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                    )
+                    query += " AND file_path LIKE ? ESCAPE '\\'"
+                    params.append(f"{escaped}%")
+
+                cursor.execute(query, params)
+
+                return {
+                    row[1]: {
+                        "id": row[0],
+                        "file_hash": row[2],
+                        "size": row[3],
+                        "mtime_ns": row[4],
+                        "inode": row[5],
+                    }
+                    for row in cursor.fetchall()
+                }
+
+        except Exception as e:
+            self.logger.error(f"Error retrieving file snapshots: {str(e)}")
+            return {}
+
+    def update_file_snapshot(
+        self, file_path: str, size: int, mtime_ns: int, inode: int | None = None
+    ) -> dict[str, Any]:
+        """
+        Refresh the stored stat snapshot for a file whose content is unchanged.
+
+        Args:
+            file_path: Path to the file
+            size: File size in bytes
+            mtime_ns: Modification time in nanoseconds
+            inode: Inode number
+
+        Returns:
+            Dict with success status and message
+        """
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+
+                cursor.execute(
+                    """
+                    UPDATE indexed_files
+                    SET size = ?, mtime_ns = ?, inode = ?
+                    WHERE file_path = ? AND status = 'active'
+                """,
+                    (size, mtime_ns, inode, file_path),
+                )
+
+                conn.commit()
+
+                if cursor.rowcount == 0:
+                    return {"success": False, "error": "File not found in index"}
+                return {"success": True, "message": "Snapshot updated"}
+
+        except Exception as e:
+            self.logger.error(f"Error updating snapshot for {file_path}: {str(e)}")
+            return {"success": False, "error": f"Failed to update snapshot: {str(e)}"}
+
     def add_chunk(
         self,
         file_id: str,
@@ -185,6 +185,29 @@ SCHEMA_DDLS: Final[dict[str, list[str]]] = {
         "CREATE INDEX IF NOT EXISTS idx_messages_timestamp ON chat_messages(timestamp)",
         "CREATE INDEX IF NOT EXISTS idx_schedules_session ON chat_schedules(session_id)",
         "CREATE INDEX IF NOT EXISTS idx_schedules_next_run ON chat_schedules(next_run)",
+        # Server-side conversation windows (ConversationStore); token counts are
+        # cached per message so windows are built without re-counting
+        """
+            CREATE TABLE IF NOT EXISTS conversation_messages (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                session_id TEXT NOT NULL,
+                role TEXT NOT NULL,
+                content TEXT NOT NULL,
+                token_count INTEGER NOT NULL,
+                request_id TEXT,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """,
+        """
+            CREATE TABLE IF NOT EXISTS conversation_summaries (
+                session_id TEXT PRIMARY KEY,
+                summary TEXT NOT NULL,
+                token_count INTEGER NOT NULL,
+                through_id INTEGER NOT NULL,
+                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_conversation_session ON conversation_messages(session_id, id)",
     ],
     "appointments": [
         """
@@ -351,7 +374,9 @@ SCHEMA_DDLS: Final[dict[str, list[str]]] = {
                 indexed_date DATETIME DEFAULT CURRENT_TIMESTAMP,
                 file_type TEXT,
                 status TEXT DEFAULT 'active',
-                metadata TEXT
+                metadata TEXT,
+                mtime_ns INTEGER,
+                inode INTEGER
             )
         """,
         """
@@ -718,6 +743,8 @@ class DatabaseManager:
         # Run migrations for the notes database
         if db_key == "notes":
             self._run_notes_migrations(conn)
+        elif db_key == "chat_history":
+            self._apply_conversation_request_id_migration(conn)
 
     def _run_notes_migrations(self, conn: sqlite3.Connection) -> None:
         """Run versioned migrations for the notes database."""
@@ -772,6 +799,25 @@ class DatabaseManager:
             # Log but do not fail initialization if PRAGMA queries fail
             LOGGER.warning("Notes migration check failed: %s", e)
 
+    def _apply_conversation_request_id_migration(self, conn: sqlite3.Connection) -> None:
+        """
+        Add the request_id column to conversation_messages created before it
+        existed, and the index retried requests are deduplicated on.
+        """
+        cur = conn.cursor()
+        try:
+            cur.execute("PRAGMA table_info(conversation_messages)")
+            columns = [row[1] for row in cur.fetchall()]
+            if "request_id" not in columns:
+                cur.execute("ALTER TABLE conversation_messages ADD COLUMN request_id TEXT")
+            cur.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS idx_conversation_request "
+                "ON conversation_messages(session_id, role, request_id)"
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            LOGGER.warning("Conversation request_id migration failed: %s", e)
+
     def _get_connection(self, db_key: str) -> sqlite3.Connection:
         """
         Generic connection factory using ResilientDB with schema setup callback.
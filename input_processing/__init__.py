@@ -4,6 +4,13 @@ Handles validation, escaping, profanity filtering, and intent classification
 """
 
 from .input_sanitizer import InputPipeline, InputPipelineError, InputSanitizer, Intent, IntentType
+from .shared_pipeline import (
+    InputRateLimitedError,
+    PipelineResult,
+    SharedInputPipeline,
+    UserStateStore,
+    get_shared_pipeline,
+)
 from .stages import (
     EnhancedInputSanitizer,
     InputValidator,
@@ -24,6 +31,11 @@ __all__ = [
     "Intent",
     "IntentType",
     "InputPipelineError",
+    "InputRateLimitedError",
+    "SharedInputPipeline",
+    "PipelineResult",
+    "UserStateStore",
+    "get_shared_pipeline",
     "InputValidator",
     "TextEscaper",
     "PatternNormalizer",
@@ -5,10 +5,12 @@ and classifies user input to ensure clean and safe interaction with the
 LLM model.
 """
 
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any, Protocol
 
 from utils.logger import Logger
+from utils.tokens import estimate_tokens
 
 # Import command handlers
 from .command_handlers import WatchdogCommandHandler
@@ -43,22 +45,55 @@ class GUIFeedback(Protocol):
 
 
 class ContextManager:
-    """Manage conversation context history."""
+    """Manage conversation context history.
 
-    def __init__(self, history_limit=5):
-        """Initialize context manager with history limit."""
+    Entries are token-counted once when added. With max_tokens set,
+    get_context() returns only the newest entries that fit the budget; the
+    joined string is cached until the history changes.
+    """
+
+    def __init__(
+        self,
+        history_limit=5,
+        max_tokens: int | None = None,
+        count_tokens: Callable[[str], int] | None = None,
+    ):
+        """Initialize context manager with history limit and optional token budget."""
         self.history = []  # list of past prompts or intents
         self.limit = history_limit
+        self.max_tokens = max_tokens
+        self.count_tokens = count_tokens or estimate_tokens
+        self._tokens: list[int] = []
+        self._joined: str | None = None
 
     def add_entry(self, entry: str):
         """Add entry to context history."""
         self.history.append(entry)
+        self._tokens.append(self.count_tokens(entry) if self.max_tokens is not None else 0)
         if len(self.history) > self.limit:
             self.history.pop(0)
+            self._tokens.pop(0)
+        self._joined = None
 
     def get_context(self) -> str:
         """Get context as concatenated string."""
-        return " ".join(self.history)
+        if self._joined is None or len(self._tokens) != len(self.history):
+            entries = self.history
+            if self.max_tokens is not None and len(self._tokens) == len(self.history):
+                used = 0
+                start = len(entries)
+                while start > 0 and used + self._tokens[start - 1] <= self.max_tokens:
+                    start -= 1
+                    used += self._tokens[start]
+                entries = entries[start:]
+            self._joined = " ".join(entries)
+        return self._joined
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self.history.clear()
+        self._tokens.clear()
+        self._joined = None
 
 
 class InputPipeline:
@@ -84,6 +119,7 @@ class InputPipeline:
         watchdog_ref: Any | None = None,
         main_window_ref: Any | None = None,
         enable_enhanced_security: bool = True,
+        context_tokens: int | None = None,
     ) -> None:
         """Initialize the input pipeline.
 
@@ -100,6 +136,8 @@ class InputPipeline:
                 components.
             enable_enhanced_security: Enable comprehensive XSS, SQL injection,
                 and Unicode protection.
+            context_tokens: Token budget for get_conversation_context();
+                None keeps the whole history.
         """
         self.gui_feedback = gui_feedback_hook
         self.skip_empty_feedback = skip_empty_feedback
@@ -128,7 +166,7 @@ class InputPipeline:
         self.rate_limiter = RateLimiter(rate_config)
 
         # Initialize context manager (kept from original)
-        self.context = ContextManager()
+        self.context = ContextManager(max_tokens=context_tokens)
 
         # Initialize watchdog command handler
         self.watchdog_handler = WatchdogCommandHandler(
@@ -150,149 +188,149 @@ class InputPipeline:
         # User identifier for rate limiting
         self.user_id = "default_user"  # Could use actual user ID
 
-        def _increment_counter(self, key: str, value: int = 1) -> None:
-            """Increment the security counter for the given key by the specified value.
-
-            Args:
-                key: The name of the counter to increment.
-                value: The amount to add to the counter. Default is 1.
-            """
-            try:
-                self.security_counters[key] += value
-            except KeyError:
-                self.security_counters[key] = value
-
-        def _process_enhanced_security(self, text: str) -> str:
-            """Process security enhancements on the input text, performing sanitization and updating counters.
-
-            Args:
-                text: The input text to sanitize.
-
-            Returns:
-                The sanitized text string.
-
-            Raises:
-                InputPipelineError: If sanitization fails due to a strict mode violation.
-            """
-            try:
-                sanitized = self.enhanced_sanitizer.sanitize_input(
-                    text, context="general", allow_unicode=True, strict_mode=False
-                )
-                summary = self.enhanced_sanitizer.get_security_summary()
-                attacks = summary.get("total_attacks", 0)
-                if attacks > 0:
-                    self._increment_counter("attacks_blocked", int(attacks))
-                    self.gui_feedback(f"🛡️ Security: Blocked {attacks} attack(s)")
-                return sanitized
-            except ValueError as e:
-                self._increment_counter("rejections", 1)
-                self.gui_feedback(f"🚨 Security: {str(e)}")
-                raise InputPipelineError(str(e))
-
-        def _check_rate_limit(self) -> None:
-            status = self.rate_limiter.check_rate_limit(self.user_id, action="default")
-            if not status.allowed:
-                self.gui_feedback(f"⏱️ {status.message}")
-                raise InputPipelineError(status.message)
-
-        def _validate_input(self, raw: str) -> str:
-            result = self.validator.validate(raw)
-            message = "; ".join(result.issues) if result.issues else "Invalid input"
-            icons = {
-                ThreatLevel.HIGH: "🚨",
-                ThreatLevel.MEDIUM: "⚠️",
-            }
-            icon = icons.get(result.threat_level, "ℹ️")
-            self.gui_feedback(f"{icon} {message}")
-            if result.threat_level == ThreatLevel.HIGH:
-                raise InputPipelineError(message)
-            return result.cleaned_text
-
-        def _sanitize(self, raw: str) -> str:
-            if self.enable_enhanced_security and self.enhanced_sanitizer:
-                return self._process_enhanced_security(raw)
-            return self._validate_input(raw)
-
-        def run(self, raw: str) -> tuple[str, IntentType]:
-            """Process raw input through the sanitization pipeline.
-
-            Args:
-                raw: Raw user input string.
-
-            Returns:
-                A tuple containing:
-                    - Sanitized text string ready for LLM processing
-                    - Classified intent enum value
-
-            Raises:
-                InputPipelineError: If any stage of the pipeline fails.
-            """
-            try:
-                self._check_rate_limit()
-                text = self._sanitize(raw)
-
-                if not text:
-                    if not self.skip_empty_feedback:
-                        self.gui_feedback("Empty input - please enter a message")
-                    return "", IntentType.UNCLEAR
-
-                # Continue with further processing...
-
-                # Stage 2: Pattern normalization
-                text, pattern_metadata = self.pattern_normalizer.normalize(text)
-                if pattern_metadata.get("changed"):
-                    self.gui_feedback("✨ Input normalized")
-
-                # Stage 3: LLM-specific escaping
-                text = self.escaper.escape(text)
-
-                # Stage 4: Profanity filtering
-                filter_result = self.profanity_filter.filter(text)
-                if filter_result.has_profanity:
-                    severity_emoji = {
-                        Severity.MILD: "😅",
-                        Severity.MODERATE: "⚠️",
-                        Severity.SEVERE: "🚨",
-                        Severity.HATE: "🛑",
-                    }
-                    if filter_result.max_severity:
-                        emoji = severity_emoji.get(filter_result.max_severity, "⚠️")
-                        self.gui_feedback(
-                            f"{emoji} Content filtered (severity: {filter_result.max_severity.name})"
-                        )
-                    else:
-                        self.gui_feedback("⚠️ Content filtered")
-                    text = filter_result.filtered_text
-
-                # Stage 5: Intent classification
-                intent_result = self.intent_classifier.classify(text)
-                intent = intent_result.primary_intent
-
-                # Stage 5b: Handle watchdog commands if detected
-                if intent == IntentType.COMMAND and self.watchdog_handler.can_handle(text):
-                    command_result = self.watchdog_handler.handle_command(text)
-                    if command_result.should_display_in_chat:
-                        # Return the command result as processed text
-                        return command_result.message, IntentType.COMMAND
-
-                # Stage 6: Add to context history
-                self.context.add_entry(text)
-
-                # Final feedback
-                confidence_emoji = "🎯" if intent_result.confidence > 0.8 else "🤔"
-                self.gui_feedback(
-                    f"{confidence_emoji} Intent: {intent.value} ({intent_result.confidence:.0%} confident)"
-                )
-
-                return text, intent
-
-            except InputPipelineError as e:
-                self.gui_feedback(f"Input error: {e}")
-                raise
-            except Exception as e:
-                error_msg = f"Unexpected error in input pipeline: {e}"
-                self.gui_feedback(error_msg)
-                raise InputPipelineError(error_msg) from e
+    def _increment_counter(self, key: str, value: int = 1) -> None:
+        """Increment the security counter for the given key by the specified value.
+
+        Args:
+            key: The name of the counter to increment.
+            value: The amount to add to the counter. Default is 1.
+        """
+        try:
+            self.security_counters[key] += value
+        except KeyError:
+            self.security_counters[key] = value
+
+    def _process_enhanced_security(self, text: str) -> str:
+        """Process security enhancements on the input text, performing sanitization and updating counters.
+
+        Args:
+            text: The input text to sanitize.
+
+        Returns:
+            The sanitized text string.
+
+        Raises:
+            InputPipelineError: If sanitization fails due to a strict mode violation.
+        """
+        try:
+            sanitized = self.enhanced_sanitizer.sanitize_input(
+                text, context="general", allow_unicode=True, strict_mode=False
+            )
+            summary = self.enhanced_sanitizer.get_security_summary()
+            attacks = summary.get("total_attacks", 0)
+            if attacks > 0:
+                self._increment_counter("attacks_blocked", int(attacks))
+                self.gui_feedback(f"🛡️ Security: Blocked {attacks} attack(s)")
+            return sanitized
+        except ValueError as e:
+            self._increment_counter("rejections", 1)
+            self.gui_feedback(f"🚨 Security: {str(e)}")
+            raise InputPipelineError(str(e))
+
+    def _check_rate_limit(self) -> None:
+        status = self.rate_limiter.check_rate_limit(self.user_id, action="default")
+        if not status.allowed:
+            self.gui_feedback(f"⏱️ {status.message}")
+            raise InputPipelineError(status.message)
+
+    def _validate_input(self, raw: str) -> str:
+        result = self.validator.validate(raw)
+        message = "; ".join(result.issues) if result.issues else "Invalid input"
+        icons = {
+            ThreatLevel.HIGH: "🚨",
+            ThreatLevel.MEDIUM: "⚠️",
+        }
+        icon = icons.get(result.threat_level, "ℹ️")
+        self.gui_feedback(f"{icon} {message}")
+        if result.threat_level == ThreatLevel.HIGH:
+            raise InputPipelineError(message)
+        return result.cleaned_text
+
+    def _sanitize(self, raw: str) -> str:
+        if self.enable_enhanced_security and self.enhanced_sanitizer:
+            return self._process_enhanced_security(raw)
+        return self._validate_input(raw)
+
+    def run(self, raw: str) -> tuple[str, IntentType]:
+        """Process raw input through the sanitization pipeline.
+
+        Args:
+            raw: Raw user input string.
+
+        Returns:
+            A tuple containing:
+                - Sanitized text string ready for LLM processing
+                - Classified intent enum value
+
+        Raises:
+            InputPipelineError: If any stage of the pipeline fails.
+        """
+        try:
+            self._check_rate_limit()
+            text = self._sanitize(raw)
+
+            if not text:
+                if not self.skip_empty_feedback:
+                    self.gui_feedback("Empty input - please enter a message")
+                return "", IntentType.UNCLEAR
+
+            # Continue with further processing...
+
+            # Stage 2: Pattern normalization
+            text, pattern_metadata = self.pattern_normalizer.normalize(text)
+            if pattern_metadata.get("changed"):
+                self.gui_feedback("✨ Input normalized")
+
+            # Stage 3: LLM-specific escaping
+            text = self.escaper.escape(text)
+
+            # Stage 4: Profanity filtering
+            filter_result = self.profanity_filter.filter(text)
+            if filter_result.has_profanity:
+                severity_emoji = {
+                    Severity.MILD: "😅",
+                    Severity.MODERATE: "⚠️",
+                    Severity.SEVERE: "🚨",
+                    Severity.HATE: "🛑",
+                }
+                if filter_result.max_severity:
+                    emoji = severity_emoji.get(filter_result.max_severity, "⚠️")
+                    self.gui_feedback(
+                        f"{emoji} Content filtered (severity: {filter_result.max_severity.name})"
+                    )
+                else:
+                    self.gui_feedback("⚠️ Content filtered")
+                text = filter_result.filtered_text
+
+            # Stage 5: Intent classification
+            intent_result = self.intent_classifier.classify(text)
+            intent = intent_result.primary_intent
+
+            # Stage 5b: Handle watchdog commands if detected
+            if intent == IntentType.COMMAND and self.watchdog_handler.can_handle(text):
+                command_result = self.watchdog_handler.handle_command(text)
+                if command_result.should_display_in_chat:
+                    # Return the command result as processed text
+                    return command_result.message, IntentType.COMMAND
+
+            # Stage 6: Add to context history
+            self.context.add_entry(text)
+
+            # Final feedback
+            confidence_emoji = "🎯" if intent_result.confidence > 0.8 else "🤔"
+            self.gui_feedback(
+                f"{confidence_emoji} Intent: {intent.value} ({intent_result.confidence:.0%} confident)"
+            )
+
+            return text, intent
+
+        except InputPipelineError as e:
+            self.gui_feedback(f"Input error: {e}")
+            raise
+        except Exception as e:
+            error_msg = f"Unexpected error in input pipeline: {e}"
+            self.gui_feedback(error_msg)
+            raise InputPipelineError(error_msg) from e
 
     def get_conversation_context(self) -> str:
         """Get the current conversation context."""
@@ -300,7 +338,7 @@ class InputPipeline:
 
     def clear_context(self) -> None:
         """Clear the conversation context history."""
-        self.context.history.clear()
+        self.context.clear()
         self.gui_feedback("🧹 Conversation context cleared")
 
     def update_model_type(self, model_type: str) -> None:
@@ -0,0 +1,390 @@
+"""Process-wide input pipeline for concurrent callers such as the API.
+
+InputPipeline is built for a single GUI session: it owns its stage objects,
+rate limiter and context history, and reports through a feedback callback.
+SharedInputPipeline runs the same stages for many callers at once:
+
+- Compiled tables (profanity trie, intent patterns, security signatures)
+  are module-level and shared by every stage object
+- Stage objects that keep counters are created once per worker thread, so
+  requests never construct them and threads never share their state
+- Per-user state (rate limits, conversation context) lives in a separate
+  keyed UserStateStore; rate limits use GCRA, and are shared between
+  worker processes when DINOAIR_RATE_LIMIT_DB names a SQLite file
+- Every stage records its latency in a histogram for /metrics
+"""
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from .input_sanitizer import ContextManager, InputPipelineError
+from .stages import (
+    EnhancedInputSanitizer,
+    InputValidator,
+    IntentClassifier,
+    IntentType,
+    PatternNormalizer,
+    ProfanityFilter,
+    RateLimitConfig,
+    RateLimiter,
+    RateLimitStatus,
+    RateLimitStorage,
+    RateLimitStrategy,
+    SQLiteRateLimitStorage,
+    TextEscaper,
+    ThreatLevel,
+)
+
+# Stages in execution order, as reported by get_metrics
+PIPELINE_STAGES = ("rate_limit", "sanitize", "normalize", "escape", "profanity", "intent")
+
+# Histogram bucket upper bounds in milliseconds
+LATENCY_BUCKETS_MS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 1000.0)
+
+
+class InputRateLimitedError(InputPipelineError):
+    """Raised when a user exceeds the pipeline rate limit."""
+
+
+class LatencyHistogram:
+    """Thread-safe fixed-bucket latency histogram."""
+
+    def __init__(self, buckets_ms: tuple[float, ...] = LATENCY_BUCKETS_MS):
+        self.buckets_ms = buckets_ms
+        self._counts = [0] * (len(buckets_ms) + 1)  # Last bucket is +Inf
+        self._sum_ms = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, ms: float) -> None:
+        """Record one observation in milliseconds."""
+        index = bisect_left(self.buckets_ms, ms)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum_ms += ms
+
+    def _quantile(self, counts: list[int], total: int, q: float) -> float | None:
+        """Upper bound of the bucket holding quantile q (None if unbounded)."""
+        if not total:
+            return 0.0
+        rank = q * total
+        seen = 0
+        for bound, count in zip(self.buckets_ms, counts, strict=False):
+            seen += count
+            if seen >= rank:
+                return bound
+        return None
+
+    def snapshot(self) -> dict[str, Any]:
+        """Count, sum, cumulative bucket counts and estimated p50/p99."""
+        with self._lock:
+            counts = list(self._counts)
+            sum_ms = self._sum_ms
+        total = sum(counts)
+
+        cumulative: dict[str, int] = {}
+        running = 0
+        for bound, count in zip(self.buckets_ms, counts, strict=False):
+            running += count
+            cumulative[f"le_{bound:g}"] = running
+        cumulative["le_inf"] = total
+
+        return {
+            "count": total,
+            "sum_ms": round(sum_ms, 3),
+            "avg_ms": round(sum_ms / total, 4) if total else 0.0,
+            "p50_ms": self._quantile(counts, total, 0.5),
+            "p99_ms": self._quantile(counts, total, 0.99),
+            "buckets": cumulative,
+        }
+
+
+class UserStateStore:
+    """Per-user pipeline state: rate limits and conversation context.
+
+    Contexts of users idle the longest are dropped once more than
+    max_users are tracked. Rate limit state is bounded by the limiter's
+    idle-key eviction.
+    """
+
+    def __init__(
+        self,
+        rate_config: RateLimitConfig | None = None,
+        history_limit: int = 5,
+        max_users: int = 10_000,
+        rate_storage: RateLimitStorage | None = None,
+    ):
+        self.rate_limiter = RateLimiter(
+            rate_config
+            or RateLimitConfig(
+                max_requests=60,
+                window_seconds=60,
+                burst_size=20,
+                strategy=RateLimitStrategy.GCRA,
+            ),
+            storage=rate_storage,
+        )
+        self.history_limit = history_limit
+        self.max_users = max_users
+        self._contexts: OrderedDict[str, ContextManager] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def check_rate_limit(self, user_id: str, action: str = "default") -> RateLimitStatus:
+        """Check and count one request of a user."""
+        return self.rate_limiter.check_rate_limit(user_id, action=action)
+
+    def reset_rate_limit(self, user_id: str) -> None:
+        """Reset a user's rate limit state."""
+        self.rate_limiter.reset_user(user_id)
+
+    def add_context(self, user_id: str, text: str) -> None:
+        """Append text to a user's conversation context."""
+        with self._lock:
+            context = self._contexts.get(user_id)
+            if context is None:
+                context = self._contexts[user_id] = ContextManager(self.history_limit)
+                while len(self._contexts) > self.max_users:
+                    self._contexts.popitem(last=False)
+            else:
+                self._contexts.move_to_end(user_id)
+            context.add_entry(text)
+
+    def get_context(self, user_id: str) -> str:
+        """A user's conversation context as one string."""
+        with self._lock:
+            context = self._contexts.get(user_id)
+            return context.get_context() if context else ""
+
+    def clear_context(self, user_id: str) -> None:
+        """Forget a user's conversation context."""
+        with self._lock:
+            self._contexts.pop(user_id, None)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Tracked users and rate limiter statistics."""
+        with self._lock:
+            users = len(self._contexts)
+        return {"users": users, "rate_limits": self.rate_limiter.get_stats()}
+
+
+@dataclass(frozen=True)
+class PipelineResult:
+    """Outcome of running one input through the shared pipeline."""
+
+    text: str
+    intent: IntentType
+    confidence: float
+    attacks_detected: int = 0
+    profanity_severity: str | None = None
+    normalized: bool = False
+    timings_ms: dict[str, float] = field(default_factory=dict)
+
+
+class _StageSet:
+    """Stage objects owned by one worker thread."""
+
+    def __init__(self, enable_enhanced_security: bool):
+        self.validator = InputValidator()
+        self.sanitizer = EnhancedInputSanitizer() if enable_enhanced_security else None
+        self.normalizer = PatternNormalizer()
+        self.profanity_filter = ProfanityFilter()
+        self.escapers: dict[str, TextEscaper] = {}
+
+    def escaper(self, model_type: str) -> TextEscaper:
+        escaper = self.escapers.get(model_type)
+        if escaper is None:
+            escaper = self.escapers[model_type] = TextEscaper(model_type)
+        return escaper
+
+
+class SharedInputPipeline:
+    """Thread-safe input pipeline shared by all requests of a process."""
+
+    def __init__(
+        self,
+        enable_enhanced_security: bool = True,
+        user_store: UserStateStore | None = None,
+    ):
+        """Initialize the shared pipeline.
+
+        Args:
+            enable_enhanced_security: Run EnhancedInputSanitizer instead of
+                                      plain validation
+            user_store: Store for per-user state (created if omitted)
+        """
+        self.enable_enhanced_security = enable_enhanced_security
+        self.user_store = user_store or UserStateStore()
+        # IntentClassifier is thread-safe; sharing it shares its result cache
+        self.intent_classifier = IntentClassifier()
+        self._local = threading.local()
+        self._histograms = {stage: LatencyHistogram() for stage in PIPELINE_STAGES}
+        self._total = LatencyHistogram()
+        self._counters = {"requests": 0, "rejections": 0, "rate_limited": 0}
+        self._counter_lock = threading.Lock()
+
+    def _stages(self) -> _StageSet:
+        stages = getattr(self._local, "stages", None)
+        if stages is None:
+            stages = self._local.stages = _StageSet(self.enable_enhanced_security)
+        return stages
+
+    def _count(self, key: str) -> None:
+        with self._counter_lock:
+            self._counters[key] += 1
+
+    def _sanitize(self, stages: _StageSet, raw: str) -> tuple[str, int]:
+        """Security stage; returns (text, attacks detected in this input)."""
+        if stages.sanitizer is not None:
+            monitor = stages.sanitizer.security_monitor
+            before = sum(monitor.attack_counts.values())
+            try:
+                text = stages.sanitizer.sanitize_input(
+                    raw, context="general", allow_unicode=True, strict_mode=False
+                )
+            except ValueError as e:
+                raise InputPipelineError(str(e)) from e
+            return text, sum(monitor.attack_counts.values()) - before
+
+        result = stages.validator.validate(raw)
+        if result.threat_level == ThreatLevel.HIGH:
+            raise InputPipelineError("; ".join(result.issues) or "Invalid input")
+        return result.cleaned_text, 0
+
+    def process(
+        self,
+        raw: str,
+        user_id: str = "default_user",
+        model_type: str | None = "default",
+        action: str = "default",
+        record_context: bool = True,
+        scan_only: bool = False,
+    ) -> PipelineResult:
+        """Run input through rate limiting, sanitization and classification.
+
+        Args:
+            raw: Raw user input
+            user_id: Key for per-user rate limits and context
+            model_type: LLM type for escaping; None skips escaping
+            action: Rate limit action type
+            record_context: Add the processed text to the user's context
+            scan_only: Stop after rate limiting and the security stage, for
+                       callers that only need the verdict (intent is UNCLEAR)
+
+        Returns:
+            PipelineResult with processed text, intent and stage timings
+
+        Raises:
+            InputPipelineError: If the input is rate limited or rejected
+        """
+        self._count("requests")
+        stages = self._stages()
+        timings: dict[str, float] = {}
+        started = time.perf_counter()
+        last = started
+
+        def lap(stage: str) -> None:
+            nonlocal last
+            now = time.perf_counter()
+            ms = (now - last) * 1000
+            timings[stage] = round(ms, 4)
+            self._histograms[stage].observe(ms)
+            last = now
+
+        try:
+            status = self.user_store.check_rate_limit(user_id, action)
+            lap("rate_limit")
+            if not status.allowed:
+                self._count("rate_limited")
+                raise InputRateLimitedError(status.message or "Rate limit exceeded")
+
+            text, attacks = self._sanitize(stages, raw)
+            lap("sanitize")
+        except InputPipelineError:
+            self._count("rejections")
+            raise
+
+        if scan_only:
+            self._total.observe((time.perf_counter() - started) * 1000)
+            return PipelineResult(
+                text=text,
+                intent=IntentType.UNCLEAR,
+                confidence=0.0,
+                attacks_detected=attacks,
+                timings_ms=timings,
+            )
+
+        if not text:
+            return PipelineResult(
+                text="",
+                intent=IntentType.UNCLEAR,
+                confidence=1.0,
+                attacks_detected=attacks,
+                timings_ms=timings,
+            )
+
+        text, pattern_metadata = stages.normalizer.normalize(text)
+        lap("normalize")
+
+        if model_type is not None:
+            text = stages.escaper(model_type).escape(text)
+        lap("escape")
+
+        filter_result = stages.profanity_filter.filter(text)
+        if filter_result.has_profanity:
+            text = filter_result.filtered_text
+        lap("profanity")
+
+        intent_result = self.intent_classifier.classify(text)
+        lap("intent")
+
+        if record_context:
+            self.user_store.add_context(user_id, text)
+        self._total.observe((time.perf_counter() - started) * 1000)
+
+        return PipelineResult(
+            text=text,
+            intent=intent_result.primary_intent,
+            confidence=intent_result.confidence,
+            attacks_detected=attacks,
+            profanity_severity=(
+                filter_result.max_severity.name if filter_result.max_severity else None
+            ),
+            normalized=bool(pattern_metadata.get("changed")),
+            timings_ms=timings,
+        )
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Request counters and per-stage latency histograms."""
+        with self._counter_lock:
+            counters = dict(self._counters)
+        return {
+            **counters,
+            "total": self._total.snapshot(),
+            "stages": {stage: hist.snapshot() for stage, hist in self._histograms.items()},
+        }
+
+
+_shared_pipeline: SharedInputPipeline | None = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_pipeline() -> SharedInputPipeline:
+    """Return the process-wide SharedInputPipeline, creating it on first use.
+
+    If DINOAIR_RATE_LIMIT_DB is set, rate limits are kept in that SQLite
+    file so all processes using it enforce one shared limit per user.
+    """
+    global _shared_pipeline
+    if _shared_pipeline is None:
+        with _shared_lock:
+            if _shared_pipeline is None:
+                db_path = os.getenv("DINOAIR_RATE_LIMIT_DB")
+                storage = SQLiteRateLimitStorage(db_path) if db_path else None
+                _shared_pipeline = SharedInputPipeline(
+                    user_store=UserStateStore(rate_storage=storage)
+                )
+    return _shared_pipeline
@@ -29,6 +29,7 @@ from .pattern import FuzzyMatcher, PatternNormalizer, fuzzy_match, normalize_inp
 from .profanity import FilterResult, ProfanityFilter, ProfanityMatch, Severity, filter_profanity
 
 # Rate limiting module
+from .rate_limit_storage import RateLimitStorage, ShardedMemoryStorage, SQLiteRateLimitStorage
 from .rate_limiter import (
     RateLimitConfig,
     RateLimiter,
@@ -38,6 +39,7 @@ from .rate_limiter import (
     get_rate_limiter,
     reset_rate_limit,
 )
+from .security_scanner import ScanHit, ScanResult, SecurityScanner
 from .validation import InputValidator, ThreatLevel, ValidationError, ValidationResult
 
 __all__ = [
@@ -77,7 +79,13 @@ __all__ = [
     "get_rate_limiter",
     "check_rate_limit",
     "reset_rate_limit",
+    "RateLimitStorage",
+    "ShardedMemoryStorage",
+    "SQLiteRateLimitStorage",
     # Enhanced security
     "EnhancedInputSanitizer",
     "SecurityMonitor",
+    "SecurityScanner",
+    "ScanResult",
+    "ScanHit",
 ]
@@ -12,6 +12,7 @@ import logging
 from datetime import datetime
 from typing import Any
 
+from .security_scanner import COMMAND_INJECTION, PATH_TRAVERSAL, SecurityScanner
 from .sql_protection import SQLInjectionProtection
 from .unicode_protection import UnicodeProtection
 from .xss_protection import XSSProtection
@@ -331,21 +332,7 @@ class EnhancedInputSanitizer:
 
     def _detect_path_traversal(self, text: str) -> bool:
         """Detect path traversal attempts."""
-        import re
-
-        # Path traversal patterns
-        patterns = [
-            r"\.\.[\\/]?",  # Basic ../ or ..\
-            r"\.{2,}",  # Multiple dots
-            r"[\\/]{2,}",  # Multiple slashes
-            r"%2[Ee]%2[Ee]",  # URL encoded dots
-            r"%2[Ff]",  # URL encoded forward slash
-            r"%5[Cc]",  # URL encoded backslash
-            r"etc[\\/]passwd",  # Common target
-            r"windows[\\/]system",  # Windows target
-        ]
-
-        return any(re.search(pattern, text, re.IGNORECASE) for pattern in patterns)
+        return SecurityScanner.scan(text).has(PATH_TRAVERSAL)
 
     def _sanitize_path_traversal(self, text: str) -> str:
         """Remove path traversal attempts."""
@@ -364,19 +351,7 @@ class EnhancedInputSanitizer:
 
     def _detect_command_injection(self, text: str) -> bool:
         """Detect command injection attempts."""
-        import re
-
-        # Command injection patterns
-        patterns = [
-            r"[;&|]",  # Command separators
-            r"`",  # Backticks
-            r"\$\(",  # Command substitution
-            r"\$\{",  # Variable expansion
-            r"<\(",  # Process substitution
-            r">\(",  # Process substitution
-        ]
-
-        return any(re.search(pattern, text) for pattern in patterns)
+        return SecurityScanner.scan(text).has(COMMAND_INJECTION)
 
     def _sanitize_command_injection(self, text: str) -> str:
         """Remove command injection attempts."""
@@ -5,10 +5,26 @@ appropriate handling and response strategies.
 """
 
 import re
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
+# Classification stages reported by IntentClassifier.get_timing_stats
+TIMING_STAGES = ("entities", "patterns", "keywords", "combine")
+
+# Characters an entity must contain; skips the regex scan when absent
+_ENTITY_HINTS = {
+    "filepath": ("/", "\\"),
+    "url": ("://",),
+    "email": ("@",),
+    "time": (":",),
+    "date": ("/", "-"),
+}
+
 
 class IntentType(Enum):
     """Types of user intents."""
@@ -32,6 +48,49 @@ class IntentClassification:
     reasoning: str  # Brief explanation of classification
 
 
+class _PatternSet:
+    """A list of regex patterns compiled once for repeated matching.
+
+    Patterns anchored with ``^`` are combined into one regex of optional
+    lookaheads with a named group each, so a single match call at the
+    start of the text tests all of them. Unanchored patterns keep their own
+    compiled regex, whose search can skip ahead to likely match positions.
+    """
+
+    __slots__ = ("_anchored", "_names", "_order", "_unanchored")
+
+    def __init__(self, patterns: tuple[str, ...], flags: int):
+        anchored = [(i, p) for i, p in enumerate(patterns) if p.startswith("^")]
+        self._names = [f"_p{i}" for i, _ in anchored]
+        self._anchored = re.compile(
+            "".join(f"(?=(?P<_p{i}>{p}))?" for i, p in anchored), flags
+        )
+        self._unanchored = [
+            (f"_p{i}", re.compile(p, flags)) for i, p in enumerate(patterns) if not p.startswith("^")
+        ]
+        self._order = {f"_p{i}": i for i in range(len(patterns))}
+
+    def matches(self, text: str) -> list[str]:
+        """Matched text of every pattern that matches, in pattern order."""
+        found: dict[str, str] = {}
+        match = self._anchored.match(text)
+        for name in self._names:
+            value = match.group(name)
+            if value is not None:
+                found[name] = value
+        for name, regex in self._unanchored:
+            hit = regex.search(text)
+            if hit is not None:
+                found[name] = hit.group()
+        return [found[name] for name in sorted(found, key=self._order.__getitem__)]
+
+
+@lru_cache(maxsize=32)
+def _compile_pattern_set(patterns: tuple[str, ...], flags: int) -> _PatternSet:
+    """Compile (and share between classifiers) a pattern set."""
+    return _PatternSet(patterns, flags)
+
+
 class IntentClassifier:
     """Classifies user input into intent categories.
 
@@ -39,8 +98,15 @@ class IntentClassifier:
     the most likely intent of user input, enabling appropriate handling.
     """
 
-    def __init__(self):
-        """Initialize with intent patterns and indicators."""
+    DEFAULT_CACHE_SIZE = 256
+
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE):
+        """Initialize with intent patterns and indicators.
+
+        Args:
+            cache_size: Number of recent classifications kept, keyed by the
+                        stripped input text (0 disables the cache)
+        """
         # Command patterns
         self.command_patterns = [
             # Watchdog commands
@@ -183,6 +249,36 @@ class IntentClassifier:
             },
         }
 
+        # LRU of recent results; retries often resubmit identical prompts
+        self.cache_size = max(0, int(cache_size))
+        self._cache: OrderedDict[str, IntentClassification] = OrderedDict()
+        self._lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._timings = {stage: [0, 0.0] for stage in TIMING_STAGES}  # calls, seconds
+
+        self._compile()
+
+    def _compile(self) -> None:
+        """Compile the pattern and indicator lists.
+
+        Call again after modifying the lists.
+        """
+        self._command_set = _compile_pattern_set(tuple(self.command_patterns), re.IGNORECASE)
+        self._indicator_sets = {
+            IntentType.QUERY: _compile_pattern_set(tuple(self.query_indicators), re.IGNORECASE),
+            IntentType.CODE: _compile_pattern_set(tuple(self.code_indicators), re.IGNORECASE),
+            IntentType.CONVERSATION: _compile_pattern_set(
+                tuple(self.conversation_indicators), re.IGNORECASE
+            ),
+        }
+        self._entity_regexes = {
+            entity_type: re.compile(pattern, re.IGNORECASE)
+            for entity_type, pattern in self.entity_patterns.items()
+        }
+        with self._lock:
+            self._cache.clear()
+
     def _extract_entities(self, text: str) -> dict[str, list[str]]:
         """Extract entities from text.
 
@@ -194,18 +290,16 @@ class IntentClassifier:
         """
         entities = {}
 
-        for entity_type, pattern in self.entity_patterns.items():
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for entity_type, regex in self._entity_regexes.items():
+            hints = _ENTITY_HINTS.get(entity_type)
+            if hints and not any(hint in text for hint in hints):
+                continue
+            matches = regex.findall(text)
             if matches:
                 entities[entity_type] = matches
 
         # Extract potential command names
-        command_matches = []
-        for pattern in self.command_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                command_matches.append(match.group())
-
+        command_matches = self._command_set.matches(text)
         if command_matches:
             entities["commands"] = command_matches
 
@@ -221,35 +315,11 @@ class IntentClassifier:
             Dictionary of intent types to scores
         """
         scores = dict.fromkeys(IntentType, 0.0)
-        text_lower = text.lower()
-
-        # Check command patterns
-        command_score = 0.0
-        for pattern in self.command_patterns:
-            if re.search(pattern, text_lower):
-                command_score += 1.0
-        scores[IntentType.COMMAND] = min(command_score, 1.0)
-
-        # Check query indicators
-        query_score = 0.0
-        for pattern in self.query_indicators:
-            if re.search(pattern, text_lower):
-                query_score += 0.5
-        scores[IntentType.QUERY] = min(query_score, 1.0)
-
-        # Check code indicators
-        code_score = 0.0
-        for pattern in self.code_indicators:
-            if re.search(pattern, text, re.IGNORECASE):
-                code_score += 0.5
-        scores[IntentType.CODE] = min(code_score, 1.0)
-
-        # Check conversation indicators
-        conv_score = 0.0
-        for pattern in self.conversation_indicators:
-            if re.search(pattern, text_lower):
-                conv_score += 0.5
-        scores[IntentType.CONVERSATION] = min(conv_score, 1.0)
+
+        # Each matching command pattern counts 1.0, each indicator 0.5
+        scores[IntentType.COMMAND] = min(len(self._command_set.matches(text)) * 1.0, 1.0)
+        for intent_type, indicator_set in self._indicator_sets.items():
+            scores[intent_type] = min(len(indicator_set.matches(text)) * 0.5, 1.0)
 
         return scores
 
@@ -307,13 +377,97 @@ class IntentClassifier:
     def classify(self, text: str) -> IntentClassification:
         """Classify the intent of user input.
 
+        Surrounding whitespace is ignored. Results for recently seen texts
+        come from the cache and are shared, so treat them as read-only.
+
         Args:
             text: User input text
 
         Returns:
             IntentClassification with results
         """
-        if not text or not text.strip():
+        key = text.strip() if text else ""
+        if self.cache_size and key:
+            with self._lock:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    self._cache_hits += 1
+                    return cached
+                self._cache_misses += 1
+
+        result = self._classify(key)
+
+        if self.cache_size and key:
+            with self._lock:
+                self._cache[key] = result
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return result
+
+    def classify_batch(self, texts: list[str]) -> list[IntentClassification]:
+        """Classify several inputs; identical texts are classified once.
+
+        Args:
+            texts: User input texts
+
+        Returns:
+            IntentClassification for each text, in input order
+        """
+        results: dict[str, IntentClassification] = {}
+        classified = []
+        for text in texts:
+            key = text.strip() if text else ""
+            if key not in results:
+                results[key] = self.classify(key)
+            classified.append(results[key])
+        return classified
+
+    def get_timing_stats(self) -> dict[str, Any]:
+        """Per-stage classification timing and cache statistics.
+
+        Returns:
+            Dictionary with calls, total_ms and avg_ms per stage, and cache
+            hits, misses and size
+        """
+        with self._lock:
+            stages = {
+                stage: {
+                    "calls": calls,
+                    "total_ms": round(seconds * 1000, 3),
+                    "avg_ms": round(seconds * 1000 / calls, 4) if calls else 0.0,
+                }
+                for stage, (calls, seconds) in self._timings.items()
+            }
+            return {
+                "stages": stages,
+                "cache": {
+                    "hits": self._cache_hits,
+                    "misses": self._cache_misses,
+                    "size": len(self._cache),
+                    "max_size": self.cache_size,
+                },
+            }
+
+    def reset_timing_stats(self) -> None:
+        """Reset stage timings and cache counters."""
+        with self._lock:
+            self._timings = {stage: [0, 0.0] for stage in TIMING_STAGES}
+            self._cache_hits = 0
+            self._cache_misses = 0
+
+    def _record_timing(self, stage: str, started: float) -> float:
+        """Add the time since started to a stage; returns the current time."""
+        now = time.perf_counter()
+        with self._lock:
+            timing = self._timings[stage]
+            timing[0] += 1
+            timing[1] += now - started
+        return now
+
+    def _classify(self, text: str) -> IntentClassification:
+        """Classify stripped text without the cache."""
+        if not text:
             return IntentClassification(
                 primary_intent=IntentType.UNCLEAR,
                 confidence=1.0,
@@ -322,13 +476,19 @@ class IntentClassifier:
                 reasoning="Empty or whitespace-only input",
             )
 
+        started = time.perf_counter()
+
         # Extract entities
         entities = self._extract_entities(text)
+        started = self._record_timing("entities", started)
 
         # Calculate scores
         pattern_scores = self._calculate_pattern_scores(text)
+        started = self._record_timing("patterns", started)
         keyword_scores = self._calculate_keyword_scores(text)
+        started = self._record_timing("keywords", started)
         combined_scores = self._combine_scores(pattern_scores, keyword_scores)
+        self._record_timing("combine", started)
 
         # Sort intents by score
         sorted_intents = sorted(combined_scores.items(), key=lambda x: x[1], reverse=True)
@@ -428,7 +588,10 @@ class IntentClassifier:
         return descriptions.get(intent_type, "Unknown intent type")
 
 
-# Convenience function
+# Convenience function; IntentClassifier is thread-safe, so one is shared
+_default_classifier: IntentClassifier | None = None
+
+
 def classify_intent(text: str) -> IntentType:
     """Quick intent classification.
 
@@ -438,6 +601,7 @@ def classify_intent(text: str) -> IntentType:
     Returns:
         Primary intent type
     """
-    classifier = IntentClassifier()
-    result = classifier.classify(text)
-    return result.primary_intent
+    global _default_classifier
+    if _default_classifier is None:
+        _default_classifier = IntentClassifier()
+    return _default_classifier.classify(text).primary_intent
@@ -7,9 +7,41 @@ and user experience.
 from __future__ import annotations
 
 import re
+from collections import Counter, defaultdict
+from collections.abc import Iterable
 from difflib import SequenceMatcher
 from typing import Any
 
+# Common typo fixes (all lowercase; no fix produces another typo, so one
+# combined pass equals applying them one by one)
+TYPO_FIXES: dict[str, str] = {
+    "teh": "the",
+    "taht": "that",
+    "waht": "what",
+    "wehn": "when",
+    "whcih": "which",
+    "coudl": "could",
+    "woudl": "would",
+    "shoudl": "should",
+    "tihs": "this",
+    "hte": "the",
+    "adn": "and",
+    "yuo": "you",
+    "yoru": "your",
+    "thier": "their",
+    "freind": "friend",
+    "beacuse": "because",
+    "definate": "definite",
+    "occured": "occurred",
+    "untill": "until",
+    "recieve": "receive",
+    "seperate": "separate",
+}
+_TYPO_RE = re.compile(r"\b(?:" + "|".join(TYPO_FIXES) + r")\b", re.IGNORECASE)
+
+# Similarity required for fuzzy command matches
+COMMAND_MATCH_THRESHOLD = 0.8
+
 
 class PatternNormalizer:
     """Normalizes patterns and fixes common typos.
@@ -88,6 +120,9 @@ class PatternNormalizer:
             for variant in variations:
                 self.command_lookup[variant.lower()] = canonical
 
+        # Index over variants for fuzzy command matching
+        self.command_matcher = FuzzyMatcher(list(self.command_lookup))
+
     def normalize_time_patterns(self, text: str) -> str:
         """Normalize time-related patterns.
 
@@ -194,17 +229,12 @@ class PatternNormalizer:
                 return canonical
 
         # Fuzzy matching for close matches
-        best_match = None
-        best_ratio = 0.0
-        threshold = 0.8  # 80% similarity required
-
-        for variant in self.command_lookup:
-            ratio = SequenceMatcher(None, lower_text, variant).ratio()
-            if ratio > best_ratio and ratio >= threshold:
-                best_ratio = ratio
-                best_match = self.command_lookup[variant]
-
-        return best_match
+        best = self.command_matcher.best_index(
+            lower_text, COMMAND_MATCH_THRESHOLD, substring_ratio=False
+        )
+        if best is None:
+            return None
+        return self.command_lookup[self.command_matcher.candidates[best[0]]]
 
     def fix_common_typos(self, text: str) -> str:
         """Fix common typos using fuzzy matching.
@@ -215,36 +245,7 @@ class PatternNormalizer:
         Returns:
             Text with common typos fixed
         """
-        # Common typo patterns
-        typo_fixes = {
-            r"\bteh\b": "the",
-            r"\btaht\b": "that",
-            r"\bwaht\b": "what",
-            r"\bwehn\b": "when",
-            r"\bwhcih\b": "which",
-            r"\bcoudl\b": "could",
-            r"\bwoudl\b": "would",
-            r"\bshoudl\b": "should",
-            r"\btihs\b": "this",
-            r"\bhte\b": "the",
-            r"\badn\b": "and",
-            r"\byuo\b": "you",
-            r"\byoru\b": "your",
-            r"\bthier\b": "their",
-            r"\bfreind\b": "friend",
-            r"\bbeacuse\b": "because",
-            r"\bdefinate\b": "definite",
-            r"\boccured\b": "occurred",
-            r"\buntill\b": "until",
-            r"\brecieve\b": "receive",
-            r"\bseperate\b": "separate",
-        }
-
-        result = text
-        for pattern, replacement in typo_fixes.items():
-            result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
-
-        return result
+        return _TYPO_RE.sub(lambda m: TYPO_FIXES[m.group(0).lower()], text)
 
     def normalize(self, text: str) -> tuple[str, dict[str, Any]]:
         """Normalize text through all stages.
@@ -310,6 +311,14 @@ class FuzzyMatcher:
 
     This class provides fuzzy matching capabilities to handle
     user typos and variations in commands or queries.
+
+    Candidates are indexed once: an inverted index from character to
+    (candidate, count) gives, for every candidate sharing a character with
+    the query, the size of the character multiset intersection. That is an
+    upper bound on SequenceMatcher's matching characters (difflib's
+    quick_ratio), so candidates are scored in order of decreasing bound and
+    scoring stops once no remaining candidate can beat the results so far.
+    Ratios are exactly those of SequenceMatcher.
     """
 
     def __init__(self, candidates: list[str]):
@@ -321,47 +330,93 @@ class FuzzyMatcher:
         self.candidates: list[str] = [c.lower() for c in candidates]
         self.original_candidates: list[str] = candidates
 
-    def find_best_match(self, query: str, threshold: float = 0.6) -> tuple[str, float] | None:
-        """Find best matching candidate for query.
+        # Exact lookup (first occurrence wins, as in a linear scan)
+        self._exact: dict[str, int] = {}
+        # Character -> [(candidate index, occurrences)]
+        self._postings: dict[str, list[tuple[int, int]]] = defaultdict(list)
+        for i, candidate in enumerate(self.candidates):
+            self._exact.setdefault(candidate, i)
+            for char, count in Counter(candidate).items():
+                self._postings[char].append((i, count))
+
+    def _bounds(self, query_lower: str) -> list[tuple[float, int]]:
+        """(ratio upper bound, index) of candidates sharing a character with query.
+
+        Sorted by decreasing bound, then by candidate order.
+        """
+        overlap: dict[int, int] = defaultdict(int)
+        for char, query_count in Counter(query_lower).items():
+            for i, count in self._postings.get(char, ()):
+                overlap[i] += count if count < query_count else query_count
+
+        query_len = len(query_lower)
+        candidates = self.candidates
+        bounds = [(2.0 * m / (query_len + len(candidates[i])), i) for i, m in overlap.items()]
+        bounds.sort(key=lambda b: (-b[0], b[1]))
+        return bounds
+
+    def best_index(
+        self, query_lower: str, threshold: float = 0.6, substring_ratio: bool = True
+    ) -> tuple[int, float] | None:
+        """Index and ratio of the best candidate for a lowercase query.
 
         Args:
-            query: Query string to match
+            query_lower: Lowercase query string
             threshold: Minimum similarity ratio (0-1)
+            substring_ratio: Score candidates containing the query by
+                             len(query) / len(candidate) instead of
+                             SequenceMatcher
 
         Returns:
-            Tuple of (best_match, similarity_ratio) or None
+            Tuple of (candidate index, similarity_ratio) or None
         """
-        if not query:
+        if not query_lower:
             return None
+        if substring_ratio and (exact := self._exact.get(query_lower)) is not None:
+            return (exact, 1.0)
 
-        query_lower = query.lower()
-        best_match: str | None = None
+        best_index = -1
         best_ratio = 0.0
+        for bound, i in self._bounds(query_lower):
+            if bound < threshold or bound < best_ratio:
+                break
+            if bound == best_ratio and i > best_index:
+                # Can at most tie with an earlier candidate
+                continue
 
-        for i, candidate in enumerate(self.candidates):
-            # Check exact match first
-            if query_lower == candidate:
-                return (self.original_candidates[i], 1.0)
-
-            # Check if query is substring
-            if query_lower in candidate:
+            candidate = self.candidates[i]
+            if substring_ratio and query_lower in candidate:
                 ratio = len(query_lower) / len(candidate)
-                if ratio > best_ratio:
-                    best_ratio = ratio
-                    best_match = self.original_candidates[i]
-                continue
+            else:
+                ratio = SequenceMatcher(None, query_lower, candidate).ratio()
 
-            # Fuzzy matching
-            ratio = SequenceMatcher(None, query_lower, candidate).ratio()
-            if ratio > best_ratio:
+            # Ties go to the earlier candidate, as in a linear scan
+            if ratio > best_ratio or (ratio == best_ratio and ratio > 0 and i < best_index):
                 best_ratio = ratio
-                best_match = self.original_candidates[i]
-
-        if best_ratio >= threshold and best_match is not None:
-            return (best_match, best_ratio)
+                best_index = i
 
+        if best_index >= 0 and best_ratio >= threshold:
+            return (best_index, best_ratio)
         return None
 
+    def find_best_match(self, query: str, threshold: float = 0.6) -> tuple[str, float] | None:
+        """Find best matching candidate for query.
+
+        Args:
+            query: Query string to match
+            threshold: Minimum similarity ratio (0-1)
+
+        Returns:
+            Tuple of (best_match, similarity_ratio) or None
+        """
+        if not query:
+            return None
+
+        best = self.best_index(query.lower(), threshold)
+        if best is None:
+            return None
+        return (self.original_candidates[best[0]], best[1])
+
     def find_all_matches(
         self, query: str, threshold: float = 0.6, max_results: int = 5
     ) -> list[tuple[str, float]]:
@@ -375,21 +430,50 @@ class FuzzyMatcher:
         Returns:
             List of (match, similarity_ratio) tuples, sorted by ratio
         """
-        if not query:
+        if not query or max_results <= 0:
             return []
 
         query_lower = query.lower()
-        matches: list[tuple[str, float]] = []
-
-        for i, candidate in enumerate(self.candidates):
-            ratio = SequenceMatcher(None, query_lower, candidate).ratio()
+        scored: list[tuple[float, int]] = []
+        kth_best = 0.0
+        for bound, i in self._bounds(query_lower):
+            if bound < threshold or (len(scored) >= max_results and bound < kth_best):
+                break
+            ratio = SequenceMatcher(None, query_lower, self.candidates[i]).ratio()
             if ratio >= threshold:
-                matches.append((self.original_candidates[i], ratio))
+                scored.append((ratio, i))
+                if len(scored) >= max_results:
+                    kth_best = sorted((r for r, _ in scored), reverse=True)[max_results - 1]
+
+        if threshold <= 0:
+            # Candidates sharing no character with the query score 0.0
+            seen = {i for _, i in scored}
+            scored.extend((0.0, i) for i in range(len(self.candidates)) if i not in seen)
 
-        # Sort by ratio descending
-        matches.sort(key=lambda x: x[1], reverse=True)
+        # Sort by ratio descending; ties keep candidate order
+        scored.sort(key=lambda s: (-s[0], s[1]))
+        return [(self.original_candidates[i], ratio) for ratio, i in scored[:max_results]]
 
-        return matches[:max_results]
+    def match_many(
+        self, queries: Iterable[str], threshold: float = 0.6
+    ) -> list[tuple[str, float] | None]:
+        """Find the best match for each of several queries.
+
+        Args:
+            queries: Query strings to match
+            threshold: Minimum similarity ratio (0-1)
+
+        Returns:
+            find_best_match result per query, in order
+        """
+        results: dict[str, tuple[str, float] | None] = {}
+        out: list[tuple[str, float] | None] = []
+        for query in queries:
+            key = query.lower()
+            if key not in results:
+                results[key] = self.find_best_match(query, threshold)
+            out.append(results[key])
+        return out
 
 
 # Convenience functions
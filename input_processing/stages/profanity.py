@@ -5,11 +5,37 @@ and context-aware detection to avoid false positives on technical terms.
 """
 
 import re
+import threading
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
+# Indicators that a whitelisted word is used in a technical sense
+TECH_INDICATORS = (
+    "code",
+    "function",
+    "method",
+    "class",
+    "variable",
+    "command",
+    "git",
+    "sql",
+    "api",
+    "server",
+    "database",
+    "system",
+    "process",
+    "thread",
+    "memory",
+    "cpu",
+)
+_TECH_CONTEXT_RE = re.compile("|".join(TECH_INDICATORS))
+
+# Characters of technical context looked at on each side of a match
+_CONTEXT_SIZE = 30
+
 
 class Severity(Enum):
     """Profanity severity levels."""
@@ -44,6 +70,45 @@ class FilterResult:
     score: float  # 0-1 score of how inappropriate the text is
 
 
+@lru_cache(maxsize=16)
+def _compile_matcher(phrases: frozenset[str]) -> re.Pattern[str] | None:
+    """Compile the word lists into one prefix-trie regex.
+
+    The trie alternation lets the regex engine walk all words and phrases
+    in a single left-to-right pass instead of testing each word in turn.
+    Phrases match across any run of whitespace. Compiled matchers are
+    shared by filters with the same word lists.
+
+    Args:
+        phrases: Lowercase words and multi-word phrases
+
+    Returns:
+        Compiled pattern, or None if there are no words
+    """
+    trie: dict[str, dict] = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: dict[str, dict]) -> str:
+        branches = [
+            (r"\s+" if char == " " else re.escape(char)) + emit(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        if len(branches) == 1 and "" not in node:
+            return branches[0]
+        return "(?:" + "|".join(branches) + (")?" if "" in node else ")")
+
+    if not trie:
+        return None
+    return re.compile(r"(?<!\w)" + emit(trie) + r"(?!\w)")
+
+
 class ProfanityFilter:
     """Advanced profanity filter with context awareness.
 
@@ -135,7 +200,7 @@ class ProfanityFilter:
         # Add custom words if provided
         if custom_words:
             for word, severity in custom_words.items():
-                self.word_lists[severity].add(word.lower())
+                self.word_lists[severity].add(self._normalize_phrase(word))
 
         # Build combined word set for quick lookup
         self._build_lookup_structures()
@@ -167,6 +232,14 @@ class ProfanityFilter:
                 self.all_profanity.add(word)
                 self.severity_map[word] = severity
 
+        self._fold_table = str.maketrans(self.substitutions)
+        self._matcher = _compile_matcher(frozenset(self.all_profanity))
+
+    @staticmethod
+    def _normalize_phrase(word: str) -> str:
+        """Lowercase a word or phrase and collapse its whitespace."""
+        return " ".join(word.lower().split())
+
     def set_mask_style(self, style: str):
         """Set the masking style.
 
@@ -185,13 +258,15 @@ class ProfanityFilter:
         Returns:
             Normalized text with substitutions applied
         """
-        normalized = text.lower()
+        return self._lower(text).translate(self._fold_table)
 
-        # Apply common substitutions
-        for old, new in self.substitutions.items():
-            normalized = normalized.replace(old, new)
-
-        return normalized
+    @staticmethod
+    def _lower(text: str) -> str:
+        """Lowercase text without changing its length, so positions still line up."""
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            return lowered
+        return "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
 
     def _is_technical_term(self, word: str, context: str) -> bool:
         """Check if word is likely a technical term.
@@ -203,34 +278,10 @@ class ProfanityFilter:
         Returns:
             True if likely a technical term
         """
-        # Check whitelist
-        if word.lower() in self.technical_whitelist:
-            # Look for technical indicators in context
-            tech_indicators = [
-                "code",
-                "function",
-                "method",
-                "class",
-                "variable",
-                "command",
-                "git",
-                "sql",
-                "api",
-                "server",
-                "database",
-                "system",
-                "process",
-                "thread",
-                "memory",
-                "cpu",
-            ]
-
-            context_lower = context.lower()
-            for indicator in tech_indicators:
-                if indicator in context_lower:
-                    return True
-
-        return False
+        # Look for technical indicators in context of whitelisted words
+        return word.lower() in self.technical_whitelist and bool(
+            _TECH_CONTEXT_RE.search(context.lower())
+        )
 
     def _get_context(
         self, text: str, position: int, word_length: int, context_size: int = 30
@@ -289,46 +340,43 @@ class ProfanityFilter:
         if not text:
             return []
 
-        matches = []
-        normalized = self._normalize_for_detection(text)
-
-        # Word boundary pattern
-        word_pattern = r"\b\w+\b"
-
-        for match in re.finditer(word_pattern, normalized):
-            word = match.group()
-            position = match.start()
-
-            if word in self.all_profanity:
-                # Get context from original text
-                context = self._get_context(text, position, len(word))
-
-                # Check if it's a technical term
-                if self._is_technical_term(word, context):
-                    continue
-
-                severity = self.severity_map[word]
-                masked = self._mask_word(word)
+        if self._matcher is None:
+            return []
 
-                profanity_match = ProfanityMatch(
-                    word=word,
-                    severity=severity,
-                    position=position,
-                    length=len(word),
-                    context=context,
-                    masked=masked,
-                )
+        matches = []
+        lowered = self._lower(text)
+        normalized = lowered.translate(self._fold_table)
+
+        for match in self._matcher.finditer(normalized):
+            position, end = match.span()
+            word = " ".join(match.group().split())  # Collapse phrase whitespace
+
+            # Whitelisted words are skipped in technical context
+            if word in self.technical_whitelist and _TECH_CONTEXT_RE.search(
+                lowered, max(0, position - _CONTEXT_SIZE), end + _CONTEXT_SIZE
+            ):
+                continue
+
+            severity = self.severity_map[word]
+            profanity_match = ProfanityMatch(
+                word=word,
+                severity=severity,
+                position=position,
+                length=end - position,
+                context=self._get_context(text, position, end - position, _CONTEXT_SIZE),
+                masked=self._mask_word(word),
+            )
 
-                matches.append(profanity_match)
+            matches.append(profanity_match)
 
-                # Update statistics
-                self.stats["total_filtered"] += 1
-                self.stats["by_severity"][severity] += 1
+            # Update statistics
+            self.stats["total_filtered"] += 1
+            self.stats["by_severity"][severity] += 1
 
-                if word in self.stats["most_common"]:
-                    self.stats["most_common"][word] += 1
-                else:
-                    self.stats["most_common"][word] = 1
+            if word in self.stats["most_common"]:
+                self.stats["most_common"][word] += 1
+            else:
+                self.stats["most_common"][word] = 1
 
         return matches
 
@@ -367,26 +415,20 @@ class ProfanityFilter:
                 score=0.0,
             )
 
-        # Create filtered text
-        filtered_text = text
-
-        # Sort matches by position (reverse order for replacement)
-        sorted_matches = sorted(filtered_matches, key=lambda m: m.position, reverse=True)
-
-        for match in sorted_matches:
-            start = match.position
+        # Create filtered text in one pass (matches are in text order and
+        # never overlap); spans map 1:1 onto the original text
+        parts = []
+        last = 0
+        for match in filtered_matches:
             end = match.position + match.length
-
-            # Find the corresponding position in the original text
-            # (accounting for case differences)
-            original_word = text[start:end]
-            if original_word.lower() == match.word:
-                filtered_text = (
-                    filtered_text[:start] + self._mask_word(original_word) + filtered_text[end:]
-                )
+            parts.append(text[last : match.position])
+            parts.append(self._mask_word(text[match.position : end]))
+            last = end
+        parts.append(text[last:])
+        filtered_text = "".join(parts)
 
         # Calculate severity score
-        max_severity = max((m.severity for m in filtered_matches), default=None)
+        max_severity = max((m.severity for m in filtered_matches), key=lambda s: s.value)
         score = self._calculate_score(filtered_matches, len(text))
 
         return FilterResult(
@@ -439,10 +481,9 @@ class ProfanityFilter:
             word: Word to add
             severity: Severity level
         """
-        word_lower = word.lower()
+        word_lower = self._normalize_phrase(word)
         self.word_lists[severity].add(word_lower)
-        self.all_profanity.add(word_lower)
-        self.severity_map[word_lower] = severity
+        self._build_lookup_structures()
 
     def remove_custom_word(self, word: str):
         """Remove a word from the filter.
@@ -450,12 +491,11 @@ class ProfanityFilter:
         Args:
             word: Word to remove
         """
-        word_lower = word.lower()
+        word_lower = self._normalize_phrase(word)
         if word_lower in self.severity_map:
             severity = self.severity_map[word_lower]
             self.word_lists[severity].discard(word_lower)
-            self.all_profanity.discard(word_lower)
-            del self.severity_map[word_lower]
+            self._build_lookup_structures()
 
     def get_report(self) -> dict[str, Any]:
         """Get filtering statistics report.
@@ -481,7 +521,10 @@ class ProfanityFilter:
         }
 
 
-# Convenience function
+# Convenience function; reuses one filter per thread
+_local = threading.local()
+
+
 def filter_profanity(text: str, min_severity: Severity = Severity.MILD) -> str:
     """Quick profanity filtering function.
 
@@ -492,6 +535,7 @@ def filter_profanity(text: str, min_severity: Severity = Severity.MILD) -> str:
     Returns:
         Filtered text
     """
-    filter = ProfanityFilter()
-    result = filter.filter(text, min_severity)
-    return result.filtered_text
+    profanity_filter = getattr(_local, "filter", None)
+    if profanity_filter is None:
+        profanity_filter = _local.filter = ProfanityFilter()
+    return profanity_filter.filter(text, min_severity).filtered_text
@@ -0,0 +1,209 @@
+"""Storage backends for rate limiter state.
+
+Each key holds one float of state and the time at which that state expires
+(after which the key behaves as if it had never been seen and can be
+evicted). Backends apply read-modify-write updates atomically:
+
+- ShardedMemoryStorage: in-process dict split over lock-striped shards
+- SQLiteRateLimitStorage: SQLite file shared by several processes on one
+  host, so API workers enforce a common limit
+"""
+
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from pathlib import Path
+from typing import TypeVar
+
+R = TypeVar("R")
+
+# Update callback: receives the current state (None if absent or expired)
+# and returns (new state or None to delete, expires_at, result)
+UpdateFunc = Callable[[float | None], tuple[float | None, float, R]]
+
+
+class RateLimitStorage(ABC):
+    """Interface for atomic per-key rate limit state."""
+
+    @abstractmethod
+    def update(self, key: str, func: UpdateFunc[R], now: float) -> R:
+        """Atomically read, transform and write the state of key.
+
+        Args:
+            key: State key
+            func: Callback computing the new state from the current one
+            now: Current time (seconds since the epoch)
+
+        Returns:
+            The result returned by func
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove the state of key."""
+
+    @abstractmethod
+    def evict_expired(self, now: float) -> int:
+        """Remove all expired keys; returns the number removed."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of stored keys (including expired ones not yet evicted)."""
+
+    def close(self) -> None:  # noqa: B027 - optional hook
+        """Release resources held by the backend."""
+
+
+class _Shard:
+    __slots__ = ("data", "last_sweep", "lock")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.data: dict[str, tuple[float, float]] = {}  # key -> (state, expires_at)
+        self.last_sweep = time.time()
+
+
+class ShardedMemoryStorage(RateLimitStorage):
+    """In-process storage with one lock per shard.
+
+    Keys hash to one of several shards so threads updating different keys
+    rarely contend. Each shard drops its expired keys at most once per
+    sweep_interval, during an update.
+    """
+
+    def __init__(self, shards: int = 16, sweep_interval: float = 60.0):
+        self._shards = [_Shard() for _ in range(max(1, shards))]
+        self.sweep_interval = sweep_interval
+
+    def _shard(self, key: str) -> _Shard:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def update(self, key: str, func: UpdateFunc[R], now: float) -> R:
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.data.get(key)
+            current = entry[0] if entry is not None and entry[1] > now else None
+            state, expires_at, result = func(current)
+            if state is None:
+                shard.data.pop(key, None)
+            else:
+                shard.data[key] = (state, expires_at)
+
+            if now - shard.last_sweep >= self.sweep_interval:
+                self._sweep(shard, now)
+            return result
+
+    @staticmethod
+    def _sweep(shard: _Shard, now: float) -> int:
+        expired = [key for key, (_, expires_at) in shard.data.items() if expires_at <= now]
+        for key in expired:
+            del shard.data[key]
+        shard.last_sweep = now
+        return len(expired)
+
+    def delete(self, key: str) -> None:
+        shard = self._shard(key)
+        with shard.lock:
+            shard.data.pop(key, None)
+
+    def evict_expired(self, now: float) -> int:
+        removed = 0
+        for shard in self._shards:
+            with shard.lock:
+                removed += self._sweep(shard, now)
+        return removed
+
+    def __len__(self) -> int:
+        return sum(len(shard.data) for shard in self._shards)
+
+
+class SQLiteRateLimitStorage(RateLimitStorage):
+    """SQLite-backed storage shared by processes on one host.
+
+    Updates run in BEGIN IMMEDIATE transactions, which serialize writers
+    across processes. Each thread uses its own connection. Expired rows are
+    deleted at most once per sweep_interval.
+    """
+
+    def __init__(self, path: str | Path, sweep_interval: float = 60.0, timeout: float = 5.0):
+        self.path = str(path)
+        self.sweep_interval = sweep_interval
+        self.timeout = timeout
+        self._local = threading.local()
+        self._last_sweep = time.time()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limit_state ("
+            "key TEXT PRIMARY KEY, state REAL NOT NULL, expires_at REAL NOT NULL)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_rate_limit_expires ON rate_limit_state(expires_at)"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Autocommit mode; transactions are opened explicitly
+            conn = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def update(self, key: str, func: UpdateFunc[R], now: float) -> R:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT state, expires_at FROM rate_limit_state WHERE key = ?", (key,)
+            ).fetchone()
+            current = row[0] if row is not None and row[1] > now else None
+            state, expires_at, result = func(current)
+            if state is None:
+                conn.execute("DELETE FROM rate_limit_state WHERE key = ?", (key,))
+            else:
+                conn.execute(
+                    "INSERT INTO rate_limit_state (key, state, expires_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET state = excluded.state, "
+                    "expires_at = excluded.expires_at",
+                    (key, state, expires_at),
+                )
+            if now - self._last_sweep >= self.sweep_interval:
+                self._last_sweep = now
+                conn.execute("DELETE FROM rate_limit_state WHERE expires_at <= ?", (now,))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return result
+
+    def delete(self, key: str) -> None:
+        self._connection().execute("DELETE FROM rate_limit_state WHERE key = ?", (key,))
+
+    def evict_expired(self, now: float) -> int:
+        cursor = self._connection().execute(
+            "DELETE FROM rate_limit_state WHERE expires_at <= ?", (now,)
+        )
+        self._last_sweep = now
+        return cursor.rowcount
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM rate_limit_state").fetchone()[0]
+
+    def close(self) -> None:
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
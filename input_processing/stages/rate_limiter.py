@@ -2,8 +2,15 @@
 
 Provides configurable rate limiting with different strategies
 and time windows to prevent abuse while maintaining good UX.
+
+The GCRA strategy keeps a single timestamp per key in a pluggable
+RateLimitStorage, so memory stays constant per key, idle keys expire on
+their own and several processes can share limits through
+SQLiteRateLimitStorage. The older strategies keep their state in process
+memory and are swept for idle keys periodically.
 """
 
+import threading
 import time
 from collections import defaultdict, deque
 from dataclasses import dataclass, field
@@ -11,6 +18,8 @@ from datetime import datetime, timedelta
 from enum import Enum
 from math import isfinite
 
+from .rate_limit_storage import RateLimitStorage, ShardedMemoryStorage
+
 
 class RateLimitStrategy(Enum):
     """Rate limiting strategies."""
@@ -18,6 +27,7 @@ class RateLimitStrategy(Enum):
     FIXED_WINDOW = "fixed_window"  # Traditional fixed time windows
     SLIDING_WINDOW = "sliding_window"  # More accurate sliding window
     TOKEN_BUCKET = "token_bucket"  # Allows bursts with overall limit
+    GCRA = "gcra"  # Generic cell rate algorithm, O(1) state per key
 
 
 @dataclass
@@ -26,13 +36,16 @@ class RateLimitConfig:
 
     max_requests: int = 60  # Max requests per window
     window_seconds: int = 60  # Time window in seconds
-    burst_size: int = 10  # Max burst for token bucket
+    burst_size: int = 10  # Max burst for token bucket and GCRA
     strategy: RateLimitStrategy = RateLimitStrategy.SLIDING_WINDOW
 
     # Penalties and cooldowns
     penalty_threshold: int = 3  # Violations before penalty
     penalty_duration: int = 300  # Penalty duration in seconds
 
+    # Seconds between sweeps dropping state of idle keys
+    eviction_interval: int = 60
+
     # Different limits for different actions
     action_limits: dict[str, int] = field(
         default_factory=lambda: {
@@ -62,15 +75,23 @@ class RateLimiter:
 
     This class provides flexible rate limiting with support for
     different strategies, user-specific limits, and penalties.
+    It is safe to share between threads.
     """
 
-    def __init__(self, config: RateLimitConfig | None = None):
+    def __init__(
+        self, config: RateLimitConfig | None = None, storage: RateLimitStorage | None = None
+    ):
         """Initialize with configuration.
 
         Args:
             config: Rate limit configuration
+            storage: State backend for the GCRA strategy (in-process
+                     sharded storage if omitted)
         """
         self.config = config or RateLimitConfig()
+        self.storage = storage if storage is not None else ShardedMemoryStorage()
+        self._lock = threading.RLock()
+        self._last_eviction = time.time()
 
         # Storage for different strategies
         self.fixed_windows: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
@@ -90,7 +111,6 @@ class RateLimiter:
         self.stats = {
             "total_requests": 0,
             "blocked_requests": 0,
-            "unique_users": set(),
             "violations_issued": 0,
         }
 
@@ -104,38 +124,48 @@ class RateLimiter:
         Returns:
             RateLimitStatus with result and details
         """
-        self.stats["total_requests"] += 1
-        self.stats["unique_users"].add(key)
-
-        # Check if user is in penalty
-        if key in self.penalties:
-            if datetime.now() < self.penalties[key]:
-                self.stats["blocked_requests"] += 1
-                return RateLimitStatus(
-                    allowed=False,
-                    remaining_requests=0,
-                    reset_time=self.penalties[key],
-                    violations=len(self.violations[key]),
-                    penalty_until=self.penalties[key],
-                    message=f"Rate limit penalty until {self.penalties[key].strftime('%H:%M:%S')}",
-                )
-            # Penalty expired
-            del self.penalties[key]
-            self.violations[key].clear()
+        with self._lock:
+            self.stats["total_requests"] += 1
+            if time.time() - self._last_eviction >= self.config.eviction_interval:
+                self.evict_idle()
+
+            # Check if user is in penalty
+            if key in self.penalties:
+                if datetime.now() < self.penalties[key]:
+                    self.stats["blocked_requests"] += 1
+                    return RateLimitStatus(
+                        allowed=False,
+                        remaining_requests=0,
+                        reset_time=self.penalties[key],
+                        violations=len(self.violations[key]),
+                        penalty_until=self.penalties[key],
+                        message=f"Rate limit penalty until {self.penalties[key].strftime('%H:%M:%S')}",
+                    )
+                # Penalty expired
+                del self.penalties[key]
+                self.violations.pop(key, None)
 
         # Get action-specific limit
         limit = self.config.action_limits.get(action, self.config.max_requests)
 
         # Check rate limit based on strategy
-        if self.config.strategy == RateLimitStrategy.FIXED_WINDOW:
-            status = self._check_fixed_window(key, limit)
-        elif self.config.strategy == RateLimitStrategy.SLIDING_WINDOW:
-            status = self._check_sliding_window(key, limit)
-        else:  # TOKEN_BUCKET
-            status = self._check_token_bucket(key, limit)
+        if self.config.strategy == RateLimitStrategy.GCRA:
+            # Storage updates are atomic per key; no limiter-wide lock needed
+            status = self._check_gcra(key, action, limit)
+        else:
+            with self._lock:
+                if self.config.strategy == RateLimitStrategy.FIXED_WINDOW:
+                    status = self._check_fixed_window(key, limit)
+                elif self.config.strategy == RateLimitStrategy.SLIDING_WINDOW:
+                    status = self._check_sliding_window(key, limit)
+                else:  # TOKEN_BUCKET
+                    status = self._check_token_bucket(key, limit)
+
+        if status.allowed:
+            return status
 
         # Handle violations
-        if not status.allowed:
+        with self._lock:
             self._record_violation(key)
             status.violations = len(self.violations[key])
 
@@ -147,11 +177,74 @@ class RateLimiter:
                 status.message = f"Too many violations. Penalty applied until {penalty_until.strftime('%H:%M:%S')}"
                 self.stats["violations_issued"] += 1
 
-        if not status.allowed:
             self.stats["blocked_requests"] += 1
 
         return status
 
+    def _check_gcra(self, key: str, action: str, limit: int) -> RateLimitStatus:
+        """Check rate limit using the generic cell rate algorithm.
+
+        Requests are spaced by an emission interval of window/limit seconds,
+        with up to burst_size requests allowed back to back. The only state
+        is the theoretical arrival time (TAT) of the next request, which
+        also serves as the key's expiry: once it has passed, the key is
+        indistinguishable from a new one.
+
+        Args:
+            key: User identifier
+            action: Action type (each action has its own state)
+            limit: Request limit per window
+
+        Returns:
+            RateLimitStatus
+        """
+        now = time.time()
+        if self.config.window_seconds <= 0:
+            return RateLimitStatus(
+                allowed=True, remaining_requests=limit, reset_time=datetime.fromtimestamp(now)
+            )
+        if limit <= 0:
+            reset_time = datetime.fromtimestamp(now + self.config.window_seconds)
+            return RateLimitStatus(
+                allowed=False,
+                remaining_requests=0,
+                reset_time=reset_time,
+                message="Rate limit exceeded. Action not permitted",
+            )
+
+        interval = self.config.window_seconds / limit
+        burst = max(1, self.config.burst_size)
+        tolerance = interval * (burst - 1)
+
+        def apply(tat: float | None) -> tuple[float | None, float, RateLimitStatus]:
+            tat = max(tat or now, now)
+            if tat - now > tolerance:
+                # Denied; state is left unchanged
+                reset_time = datetime.fromtimestamp(tat - tolerance)
+                return (
+                    tat,
+                    tat,
+                    RateLimitStatus(
+                        allowed=False,
+                        remaining_requests=0,
+                        reset_time=reset_time,
+                        message=f"Rate limit exceeded. Next request available at {reset_time.strftime('%H:%M:%S')}",
+                    ),
+                )
+            new_tat = tat + interval
+            remaining = int((tolerance - (new_tat - now - interval)) // interval)
+            return (
+                new_tat,
+                new_tat,
+                RateLimitStatus(
+                    allowed=True,
+                    remaining_requests=max(0, remaining),
+                    reset_time=datetime.fromtimestamp(new_tat),
+                ),
+            )
+
+        return self.storage.update(f"{key}:{action}", apply, now)
+
     def _check_fixed_window(self, key: str, limit: int) -> RateLimitStatus:
         """Check rate limit using fixed window strategy.
 
@@ -324,20 +417,87 @@ class RateLimiter:
     def reset_user(self, key: str):
         """Reset rate limits for a specific user.
 
+        GCRA state is cleared for the configured actions; state of other
+        actions expires on its own.
+
         Args:
             key: User identifier
         """
         # Clear all tracking for this user
-        if key in self.fixed_windows:
-            del self.fixed_windows[key]
-        if key in self.sliding_windows:
-            del self.sliding_windows[key]
-        if key in self.token_buckets:
-            del self.token_buckets[key]
-        if key in self.violations:
-            del self.violations[key]
-        if key in self.penalties:
-            del self.penalties[key]
+        with self._lock:
+            self.fixed_windows.pop(key, None)
+            self.sliding_windows.pop(key, None)
+            self.token_buckets.pop(key, None)
+            self.violations.pop(key, None)
+            self.penalties.pop(key, None)
+        for action in {"default", *self.config.action_limits}:
+            self.storage.delete(f"{key}:{action}")
+
+    def evict_idle(self) -> int:
+        """Drop state of keys that would behave like new keys.
+
+        Called periodically from check_rate_limit; may also be called
+        directly, e.g. from a maintenance task.
+
+        Returns:
+            Number of keys removed
+        """
+        now = time.time()
+        now_dt = datetime.fromtimestamp(now)
+        window = self.config.window_seconds
+        removed = 0
+
+        with self._lock:
+            self._last_eviction = now
+
+            if window > 0:
+                current_window = int(now / window)
+                idle = [
+                    key
+                    for key, windows in self.fixed_windows.items()
+                    if all(int(w) < current_window for w in windows)
+                ]
+            else:
+                idle = list(self.fixed_windows)
+            for key in idle:
+                del self.fixed_windows[key]
+            removed += len(idle)
+
+            window_start = now_dt - timedelta(seconds=window)
+            idle = [
+                key
+                for key, times in self.sliding_windows.items()
+                if not times or times[-1] < window_start
+            ]
+            for key in idle:
+                del self.sliding_windows[key]
+            removed += len(idle)
+
+            # A bucket idle long enough to refill completely equals a new one
+            slowest = min([self.config.max_requests, *self.config.action_limits.values()])
+            if window > 0 and slowest > 0:
+                refill_seconds = self.config.burst_size * window / slowest
+                idle = [
+                    key
+                    for key, bucket in self.token_buckets.items()
+                    if now - bucket["last_update"] >= refill_seconds
+                ]
+                for key in idle:
+                    del self.token_buckets[key]
+                removed += len(idle)
+
+            cutoff = now_dt - timedelta(seconds=self.config.penalty_duration)
+            for key in [k for k, until in self.penalties.items() if until <= now_dt]:
+                del self.penalties[key]
+                self.violations.pop(key, None)
+            for key in [
+                k
+                for k, times in self.violations.items()
+                if k not in self.penalties and all(t <= cutoff for t in times)
+            ]:
+                del self.violations[key]
+
+        return removed + self.storage.evict_expired(now)
 
     def get_stats(self) -> dict[str, any]:
         """Get rate limiter statistics.
@@ -345,19 +505,25 @@ class RateLimiter:
         Returns:
             Dictionary of statistics
         """
-        return {
-            "total_requests": self.stats["total_requests"],
-            "blocked_requests": self.stats["blocked_requests"],
-            "block_rate": (
-                self.stats["blocked_requests"] / self.stats["total_requests"]
-                if self.stats["total_requests"] > 0
-                else 0
-            ),
-            "unique_users": len(self.stats["unique_users"]),
-            "violations_issued": self.stats["violations_issued"],
-            "active_penalties": len(self.penalties),
-            "strategy": self.config.strategy.value,
-        }
+        with self._lock:
+            tracked = (
+                len(self.fixed_windows) + len(self.sliding_windows) + len(self.token_buckets)
+            )
+            stats = {
+                "total_requests": self.stats["total_requests"],
+                "blocked_requests": self.stats["blocked_requests"],
+                "block_rate": (
+                    self.stats["blocked_requests"] / self.stats["total_requests"]
+                    if self.stats["total_requests"] > 0
+                    else 0
+                ),
+                "violations_issued": self.stats["violations_issued"],
+                "active_penalties": len(self.penalties),
+                "strategy": self.config.strategy.value,
+            }
+        # Keys currently holding state (idle keys are evicted)
+        stats["unique_users"] = tracked + len(self.storage)
+        return stats
 
     def set_user_limit(self, key: str, limit: int):
         """Set a custom limit for a specific user.
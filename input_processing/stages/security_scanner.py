@@ -0,0 +1,342 @@
+"""
+Single-pass security signature scanner.
+
+All XSS, SQL injection, path traversal, command injection and Unicode attack
+signatures are compiled into one alternation of zero-width lookaheads, so a
+single finditer pass over the input reports every position where any
+signature starts. The categorized hits are cached per text and shared by
+XSSProtection, SQLInjectionProtection, UnicodeProtection and
+EnhancedInputSanitizer, keeping the cost of checking a message linear in its
+length no matter how many detectors look at it.
+"""
+
+import re
+import threading
+import unicodedata
+from functools import lru_cache
+from typing import NamedTuple
+
+# Hit categories
+UNICODE_RTL_OVERRIDE = "unicode_rtl_override"
+UNICODE_DANGEROUS = "unicode_dangerous"
+UNICODE_INVISIBLE = "unicode_invisible"
+UNICODE_COMBINING_RUN = "unicode_combining_run"
+UNICODE_MIXED_SCRIPT = "unicode_mixed_script"
+XSS_SCRIPT_TAG = "xss_script_tag"
+XSS_EVENT_HANDLER = "xss_event_handler"
+XSS_PROTOCOL = "xss_protocol"
+XSS_ENCODED_SCRIPT = "xss_encoded_script"
+SQL_COMMENT = "sql_comment"
+SQL_KEYWORD = "sql_keyword"
+SQL_OPERATOR = "sql_operator"
+SQL_PATTERN = "sql_pattern"
+SQL_ENCODED = "sql_encoded"
+SQL_CONCAT = "sql_concat"
+PATH_TRAVERSAL = "path_traversal"
+COMMAND_INJECTION = "command_injection"
+
+XSS_CATEGORIES = (XSS_SCRIPT_TAG, XSS_EVENT_HANDLER, XSS_PROTOCOL, XSS_ENCODED_SCRIPT)
+
+# Format characters (Unicode category Cf) and non-whitespace C0/C1 controls
+_INVISIBLE_CLASS = (
+    "\u00ad\u0600-\u0605\u061c\u06dd\u070f\u0890-\u0891\u08e2\u180e\u200b-\u200f"
+    "\u202a-\u202e\u2060-\u2064\u2066-\u206f\ufeff\ufff9-\ufffb\U000110bd\U000110cd"
+    "\U00013430-\U00013438\U0001bca0-\U0001bca3\U0001d173-\U0001d17a\U000e0001"
+    "\U000e0020-\U000e007f"
+    "\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f"
+)
+# Combining diacritical mark blocks used for "zalgo" stacking
+_COMBINING_CLASS = "\u0300-\u036f\u0483-\u0489\u1ab0-\u1aff\u1dc0-\u1dff\u20d0-\u20ff\ufe20-\ufe2f"
+_COMBINING_RUN = 3  # consecutive combining marks considered excessive
+_RTL_OVERRIDES = "\u202d\u202e"
+
+# Checked only once a concatenation operator was seen (words like "or" are common)
+_SQL_CONTEXT_RE = re.compile(r"SELECT|WHERE|AND|OR", re.IGNORECASE)
+_ENCODED_BYTE_RE = re.compile(r"%([0-9a-fA-F]{2})")
+
+
+class ScanHit(NamedTuple):
+    """A signature match: category and span in the scanned text."""
+
+    category: str
+    start: int
+    end: int
+    value: str
+
+
+class ScanResult:
+    """Categorized signature hits for one text."""
+
+    __slots__ = ("hits", "text")
+
+    def __init__(self, text: str, hits: dict[str, list[ScanHit]]):
+        self.text = text
+        self.hits = hits
+
+    def has(self, *categories: str) -> bool:
+        """True if any hit belongs to one of the categories."""
+        return any(category in self.hits for category in categories)
+
+    def get(self, category: str) -> list[ScanHit]:
+        """Hits for a category, in text order."""
+        return self.hits.get(category, [])
+
+    @property
+    def categories(self) -> set[str]:
+        """All categories with at least one hit."""
+        return set(self.hits)
+
+
+class _Signature(NamedTuple):
+    category: str
+    pattern: str
+    first_chars: frozenset[str] | None  # lowercased; None when any char can start it
+
+
+def _trie_pattern(literals: list[str]) -> str:
+    """
+    Case-insensitive alternation of literals factored by common prefixes.
+
+    The regex engine then tests one character per trie level instead of
+    trying every literal at every position; longer literals win over their
+    prefixes.
+    """
+    trie: dict[str, dict] = {}
+    for literal in literals:
+        node = trie
+        for char in literal.lower():
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: dict[str, dict]) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if len(branches) == 1 and "" not in node:
+            return branches[0]
+        return "(?:" + "|".join(branches) + (")?" if "" in node else ")")
+
+    return emit(trie)
+
+
+def _literal_signature(category: str, literals: list[str]) -> _Signature:
+    """Signature matching any of the literals."""
+    return _Signature(category, _trie_pattern(literals), frozenset(lit[0].lower() for lit in literals))
+
+
+def _signatures() -> list[_Signature]:
+    """Collect the signature tables of all protection modules."""
+    from .sql_protection import SQLInjectionProtection
+    from .unicode_protection import UnicodeProtection
+    from .xss_protection import XSSProtection
+
+    dangerous = "".join(sorted(UnicodeProtection.DANGEROUS_CHARS))
+    sql_keywords = list(SQLInjectionProtection.SQL_KEYWORDS)
+
+    return [
+        # Unicode signatures come first: they are rare in ordinary text
+        _Signature(UNICODE_RTL_OVERRIDE, f"[{_RTL_OVERRIDES}]", frozenset(_RTL_OVERRIDES)),
+        _Signature(UNICODE_DANGEROUS, f"[{re.escape(dangerous)}]", frozenset(dangerous)),
+        _Signature(UNICODE_INVISIBLE, f"[{_INVISIBLE_CLASS}]", None),
+        _Signature(
+            UNICODE_COMBINING_RUN,
+            f"(?<![{_COMBINING_CLASS}])[{_COMBINING_CLASS}]{{{_COMBINING_RUN},}}",
+            None,
+        ),
+        # An ASCII letter next to a non-ASCII letter; confirmed by script name
+        _Signature(
+            UNICODE_MIXED_SCRIPT,
+            r"[A-Za-z][^\W\d_A-Za-z]|[^\W\d_A-Za-z][A-Za-z]",
+            None,
+        ),
+        # XSS
+        _Signature(XSS_SCRIPT_TAG, r"<script[^>]*>", frozenset("<")),
+        _Signature(
+            XSS_EVENT_HANDLER,
+            r"\b" + _trie_pattern(list(XSSProtection.DANGEROUS_ATTRS)) + r"\s*=",
+            frozenset("o"),
+        ),
+        _literal_signature(XSS_PROTOCOL, list(XSSProtection.DANGEROUS_PROTOCOLS)),
+        _literal_signature(
+            XSS_ENCODED_SCRIPT, ["%3Cscript", "&lt;script", "\\x3cscript", "\\u003cscript"]
+        ),
+        # SQL injection
+        _literal_signature(SQL_COMMENT, ["--", "/*", "*/"]),
+        # Keywords delimited by spaces or the text edges, as whole words
+        _Signature(
+            SQL_KEYWORD,
+            r"(?<![^ ])" + _trie_pattern(sql_keywords) + r"(?![^ ])",
+            frozenset(kw[0].lower() for kw in sql_keywords),
+        ),
+        _literal_signature(SQL_OPERATOR, list(SQLInjectionProtection.SQL_OPERATORS)),
+        _Signature(
+            SQL_PATTERN,
+            "|".join(f"(?:{p})" for p in [*SQLInjectionProtection.SQL_PATTERNS, r"0x[0-9a-f]+"]),
+            frozenset("';uilsx0"),
+        ),
+        _Signature(SQL_ENCODED, r"(?<!%[0-9a-f]{2})(?:%[0-9a-f]{2}){3,}", frozenset("%")),
+        _Signature(SQL_CONCAT, r"\|\||\+|(?-i:CONCAT|CHR\()", frozenset("|+c")),
+        # Path traversal and command injection
+        _Signature(
+            PATH_TRAVERSAL,
+            r"\.\.|[\\/]{2}|%2e%2e|%2f|%5c|etc[\\/]passwd|windows[\\/]system",
+            frozenset("./\\%ew"),
+        ),
+        _Signature(COMMAND_INJECTION, r"[;&|`]|\$[({]|[<>]\(", frozenset(";&|`$<>")),
+    ]
+
+
+def _gated(signature: _Signature) -> str:
+    """Signature pattern behind a cheap first-character check, where known."""
+    if signature.first_chars is None:
+        return signature.pattern
+    chars = "".join(re.escape(c) for c in sorted(signature.first_chars))
+    return f"(?=[{chars}])(?:{signature.pattern})"
+
+
+class _Engine(NamedTuple):
+    master: re.Pattern[str]
+    order: dict[str, int]  # category -> signature index
+    scripts: frozenset[str]  # scripts that must not be mixed within a word
+    # For each signature index, the later signatures that may also start at
+    # the same position: (category, compiled pattern, first chars)
+    shadowed: list[list[tuple[str, re.Pattern[str], frozenset[str] | None]]]
+
+
+_engine_lock = threading.Lock()
+_engine: _Engine | None = None
+
+
+def _get_engine() -> _Engine:
+    """Compile the combined scanner once (thread-safe)."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                from .unicode_protection import UnicodeProtection
+
+                signatures = _signatures()
+                master = re.compile(
+                    "(?="
+                    + "|".join(f"(?P<{s.category}>{_gated(s)})" for s in signatures)
+                    + ")",
+                    re.IGNORECASE,
+                )
+                compiled = [
+                    (s.category, re.compile(s.pattern, re.IGNORECASE), s.first_chars)
+                    for s in signatures
+                ]
+                _engine = _Engine(
+                    master,
+                    {s.category: i for i, s in enumerate(signatures)},
+                    frozenset(UnicodeProtection.SCRIPT_NAMES),
+                    [compiled[i + 1 :] for i in range(len(compiled))],
+                )
+    return _engine
+
+
+class SecurityScanner:
+    """Shared single-pass scanner used by all security detectors."""
+
+    @staticmethod
+    def scan(text: str) -> ScanResult:
+        """
+        Scan text for all security signatures in one pass.
+
+        Results are cached per text, so detectors called one after another
+        on the same message share a single scan. Texts up to
+        _CACHE_MAX_CHARS go to a small LRU; of longer texts only the most
+        recent result is kept, so large inputs are never pinned in bulk.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            ScanResult with categorized hits
+        """
+        if not text:
+            return ScanResult(text, {})
+        if len(text) <= _CACHE_MAX_CHARS:
+            return _scan_cached(text)
+
+        global _last_large
+        last = _last_large
+        if last is not None and (last.text is text or last.text == text):
+            return last
+        result = _scan(text)
+        _last_large = result
+        return result
+
+    @staticmethod
+    def sql_keywords(text: str) -> set[str]:
+        """Distinct SQL keywords (upper case) used as whole words in text."""
+        return {hit.value.upper() for hit in SecurityScanner.scan(text).get(SQL_KEYWORD)}
+
+    @staticmethod
+    def has_sql_concat_context(text: str) -> bool:
+        """True if text concatenates strings next to SQL context words."""
+        return SecurityScanner.scan(text).has(SQL_CONCAT) and bool(_SQL_CONTEXT_RE.search(text))
+
+    @staticmethod
+    def decoded_runs(text: str) -> list[str]:
+        """Percent-encoded byte runs in text, decoded to strings."""
+        decoded = []
+        for hit in SecurityScanner.scan(text).get(SQL_ENCODED):
+            raw = bytes(int(b, 16) for b in _ENCODED_BYTE_RE.findall(hit.value))
+            decoded.append(raw.decode("utf-8", errors="replace"))
+        return decoded
+
+
+def _script_of(char: str) -> str:
+    try:
+        return unicodedata.name(char).split(" ", 1)[0]
+    except ValueError:
+        return ""
+
+
+# Longest text kept in the scan LRU
+_CACHE_MAX_CHARS = 4096
+# Result for the most recent longer text (replaced, never accumulated)
+_last_large: ScanResult | None = None
+
+
+@lru_cache(maxsize=32)
+def _scan_cached(text: str) -> ScanResult:
+    return _scan(text)
+
+
+def _scan(text: str) -> ScanResult:
+    engine = _get_engine()
+    hits: dict[str, list[ScanHit]] = {}
+    seen: set[tuple[str, int]] = set()
+
+    def add(category: str, start: int, end: int) -> None:
+        if (category, start) in seen:
+            return
+        if category == UNICODE_MIXED_SCRIPT:
+            # Only letters of different scripts count (e.g. Latin next to Cyrillic)
+            first, second = _script_of(text[start]), _script_of(text[start + 1])
+            if first == second or not {first, second} <= engine.scripts:
+                return
+        seen.add((category, start))
+        hits.setdefault(category, []).append(ScanHit(category, start, end, text[start:end]))
+
+    for match in engine.master.finditer(text):
+        category = match.lastgroup
+        if category is None:
+            continue
+        start, end = match.span(category)
+        add(category, start, end)
+
+        # Later signatures starting at the same position lose the alternation;
+        # check those that can start with this character directly
+        char = text[start].lower()
+        for later, pattern, first_chars in engine.shadowed[engine.order[category]]:
+            if first_chars is not None and char not in first_chars:
+                continue
+            other = pattern.match(text, start)
+            if other is not None:
+                add(later, start, other.end())
+
+    return ScanResult(text, hits)
+
@@ -7,6 +7,13 @@ Provides comprehensive protection against SQL injection attacks.
 import re
 from typing import Any, cast
 
+from .security_scanner import (
+    SQL_COMMENT,
+    SQL_OPERATOR,
+    SQL_PATTERN,
+    SecurityScanner,
+)
+
 
 class SQLInjectionProtection:
     """Enhanced SQL injection protection."""
@@ -107,42 +114,37 @@ class SQLInjectionProtection:
     @staticmethod
     def _has_sql_comments(text: str) -> bool:
         """Return True if the text contains SQL comment markers ('--', '/*', or '*/')."""
-        return "--" in text or "/*" in text or "*/" in text
+        return SecurityScanner.scan(text).has(SQL_COMMENT)
 
     @staticmethod
     def _excessive_sql_keywords(text: str) -> bool:
         """Return True if the text contains two or more SQL keywords indicating potential injection."""
-        text_upper = text.upper()
-        count = sum(
-            1 for kw in SQLInjectionProtection.SQL_KEYWORDS if f" {kw} " in f" {text_upper} "
-        )
-        return count >= 2
+        return len(SecurityScanner.sql_keywords(text)) >= 2
 
     @staticmethod
     def _contains_sql_operator(text: str) -> bool:
         """Return True if the text contains any SQL operator
         from the predefined list."""
-        text_upper = text.upper()
-        return any(op.upper() in text_upper for op in SQLInjectionProtection.SQL_OPERATORS)
+        return SecurityScanner.scan(text).has(SQL_OPERATOR, SQL_COMMENT)
 
     @staticmethod
     def _matches_sql_patterns(text: str) -> bool:
         """Return True if the text matches any common SQL injection regex pattern
         or contains hex-encoded SQL patterns (e.g., starting with 0x)."""
-        if any(
-            re.search(pattern, text, re.IGNORECASE)
-            for pattern in SQLInjectionProtection.SQL_PATTERNS
-        ):
-            return True
-        return bool(re.search(r"0x[0-9a-fA-F]+", text))
+        return SecurityScanner.scan(text).has(SQL_PATTERN)
 
     @staticmethod
     def _has_string_concat_in_sql_context(text: str) -> bool:
         """Return True if the text uses string concatenation operators in a SQL context (e.g., SELECT, WHERE)."""
-        if any(op in text for op in ["||", "CONCAT", "+", "CHR("]):
-            text_upper = text.upper()
-            return any(kw in text_upper for kw in ["SELECT", "WHERE", "AND", "OR"])
-        return False
+        return SecurityScanner.has_sql_concat_context(text)
+
+    @staticmethod
+    def _contains_hex_encoded_sql(text: str) -> bool:
+        """Return True if a percent-encoded byte run decodes to SQL injection content."""
+        return any(
+            decoded != text and SQLInjectionProtection.detect_sql_injection(decoded)
+            for decoded in SecurityScanner.decoded_runs(text)
+        )
 
     @staticmethod
     def detect_sql_injection(text: str) -> bool:
@@ -5,6 +5,18 @@ Provides comprehensive protection against Unicode-based attacks.
 """
 
 import unicodedata
+from collections.abc import Iterable, Iterator
+
+from .security_scanner import (
+    UNICODE_COMBINING_RUN,
+    UNICODE_DANGEROUS,
+    UNICODE_INVISIBLE,
+    UNICODE_MIXED_SCRIPT,
+    UNICODE_RTL_OVERRIDE,
+    ScanHit,
+    SecurityScanner,
+)
+from .windowing import DEFAULT_WINDOW_CHARS, StreamStripper, iter_windows
 
 
 class UnicodeProtection:
@@ -290,6 +302,61 @@ class UnicodeProtection:
     @staticmethod
     def normalize_unicode(text: str) -> str:
         """Normalize Unicode text to prevent attacks."""
+        if not text:
+            return text
+
+        # Compatibility-normalize (full-width forms, ligatures, math letters)
+        text = unicodedata.normalize("NFKC", text)
+
+        # Fold homographs only inside words that mix scripts, so genuine
+        # Cyrillic or Greek text is left alone
+        mixed = SecurityScanner.scan(text).get(UNICODE_MIXED_SCRIPT)
+        if mixed:
+            parts: list[str] = []
+            last = 0
+            for start, end in UnicodeProtection._word_spans(text, mixed):
+                if start < last:
+                    continue
+                parts.append(text[last:start])
+                parts.append(text[start:end].translate(_HOMOGRAPH_TABLE))
+                last = end
+            parts.append(text[last:])
+            text = "".join(parts)
+
+        return text.translate(_DANGEROUS_TABLE)
+
+    @staticmethod
+    def _word_spans(text: str, hits: list[ScanHit]) -> list[tuple[int, int]]:
+        """Expand scan hits to the spans of the words containing them."""
+        spans = []
+        for hit in hits:
+            start, end = hit.start, hit.end
+            while start > 0 and text[start - 1].isalnum():
+                start -= 1
+            while end < len(text) and text[end].isalnum():
+                end += 1
+            spans.append((start, end))
+        return spans
+
+    @staticmethod
+    def _contains_dangerous_chars(text: str) -> bool:
+        """Return True if text contains zero-width, bidi or other dangerous characters."""
+        return SecurityScanner.scan(text).has(UNICODE_DANGEROUS)
+
+    @staticmethod
+    def _detect_mixed_scripts_attack(text: str) -> bool:
+        """Return True if a word mixes Latin letters with another script (homographs)."""
+        return SecurityScanner.scan(text).has(UNICODE_MIXED_SCRIPT)
+
+    @staticmethod
+    def _excessive_combining_chars(text: str) -> bool:
+        """Return True if combining marks are stacked on a single character."""
+        return SecurityScanner.scan(text).has(UNICODE_COMBINING_RUN)
+
+    @staticmethod
+    def _contains_rtl_override(text: str) -> bool:
+        """Return True if text contains left-to-right/right-to-left override characters."""
+        return SecurityScanner.scan(text).has(UNICODE_RTL_OVERRIDE)
 
     @staticmethod
     def detect_unicode_attack(text: str) -> bool:
@@ -297,18 +364,15 @@ class UnicodeProtection:
         if not text:
             return False
 
-        if (
-            UnicodeProtection._contains_dangerous_chars(text)
-            or UnicodeProtection._detect_mixed_scripts_attack(text)
-            or UnicodeProtection._excessive_combining_chars(text)
-            or UnicodeProtection._contains_rtl_override(text)
-        ):
-            return True
-
-        # Check for invisible characters
-        invisible_count = sum(bool(unicodedata.category(c) in {"Cf", "Cc"}) for c in text)
-
-        return invisible_count > 0
+        # Dangerous, mixed-script, combining-run, override and invisible
+        # (format/control) characters all come from the shared single-pass scan
+        return SecurityScanner.scan(text).has(
+            UNICODE_DANGEROUS,
+            UNICODE_MIXED_SCRIPT,
+            UNICODE_COMBINING_RUN,
+            UNICODE_RTL_OVERRIDE,
+            UNICODE_INVISIBLE,
+        )
 
     @staticmethod
     def remove_bidi_controls(text: str) -> str:
@@ -316,21 +380,7 @@ class UnicodeProtection:
         if not text:
             return text
 
-        bidi_controls = {
-            "\u200e",  # LRM
-            "\u200f",  # RLM
-            "\u202a",  # LRE
-            "\u202b",  # RLE
-            "\u202c",  # PDF
-            "\u202d",  # LRO
-            "\u202e",  # RLO
-            "\u2066",  # LRI
-            "\u2067",  # RLI
-            "\u2068",  # FSI
-            "\u2069",  # PDI
-        }
-
-        return "".join(c for c in text if c not in bidi_controls)
+        return text.translate(_BIDI_TABLE)
 
     @staticmethod
     def to_ascii_safe(text: str) -> str:
@@ -362,11 +412,8 @@ class UnicodeProtection:
             return "".join(result)
 
     @staticmethod
-    def sanitize(text: str, allow_unicode: bool = True, max_length: int | None = None) -> str:
-        """Main sanitization method."""
-        if not text:
-            return text
-
+    def _sanitize_text(text: str, allow_unicode: bool) -> str:
+        """Normalization, bidi removal and optional ASCII conversion."""
         # Always normalize
         text = UnicodeProtection.normalize_unicode(text)
 
@@ -376,9 +423,72 @@ class UnicodeProtection:
         # Convert to ASCII if required
         if not allow_unicode:
             text = UnicodeProtection.to_ascii_safe(text)
+        return text
+
+    @staticmethod
+    def sanitize(text: str, allow_unicode: bool = True, max_length: int | None = None) -> str:
+        """Main sanitization method."""
+        if not text:
+            return text
+
+        text = UnicodeProtection._sanitize_text(text, allow_unicode)
 
         # Apply length limit if specified
         if max_length and len(text) > max_length:
             text = text[:max_length]
 
         return text.strip()
+
+    @staticmethod
+    def sanitize_stream(
+        source: str | Iterable[str],
+        allow_unicode: bool = True,
+        max_length: int | None = None,
+        window: int = DEFAULT_WINDOW_CHARS,
+    ) -> Iterator[str]:
+        """Sanitize large input window by window, yielding output progressively.
+
+        Windows end at whitespace, so word-level checks (mixed scripts,
+        combining runs) see whole words and the joined output equals
+        sanitize() of the whole input. Only a word longer than the window
+        may be split. Memory stays proportional to the window size.
+
+        Args:
+            source: Whole text or an iterable of text chunks
+            allow_unicode: Keep non-ASCII characters
+            max_length: Stop after this many sanitized characters
+            window: Window size in characters
+        """
+        stripper = StreamStripper()
+        remaining = max_length or 0
+        for chunk in iter_windows(source, window):
+            text = UnicodeProtection._sanitize_text(chunk, allow_unicode)
+            if max_length:
+                text = text[:remaining]
+                remaining -= len(text)
+            if piece := stripper.feed(text):
+                yield piece
+            if max_length and remaining <= 0:
+                break
+
+
+# Translation tables built once from the class tables
+_HOMOGRAPH_TABLE = str.maketrans(UnicodeProtection.HOMOGRAPH_MAP)
+_DANGEROUS_TABLE = str.maketrans(dict.fromkeys(UnicodeProtection.DANGEROUS_CHARS))
+_BIDI_TABLE = str.maketrans(
+    dict.fromkeys(
+        [
+            "\u200e",  # LRM
+            "\u200f",  # RLM
+            "\u202a",  # LRE
+            "\u202b",  # RLE
+            "\u202c",  # PDF
+            "\u202d",  # LRO
+            "\u202e",  # RLO
+            "\u2066",  # LRI
+            "\u2067",  # RLI
+            "\u2068",  # FSI
+            "\u2069",  # PDI
+        ]
+    )
+)
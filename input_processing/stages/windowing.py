@@ -0,0 +1,133 @@
+"""
+Bounded-window iteration for streaming sanitization.
+
+Large inputs are processed in windows of roughly window characters. Each
+window ends at a boundary where sanitizers see the same text they would
+see in the whole input: after whitespace, before a non-combining
+character, and (optionally) outside an HTML tag. Text after the boundary
+is carried over into the next window.
+"""
+
+from collections.abc import Iterable, Iterator
+from unicodedata import combining
+
+# Default window size in characters
+DEFAULT_WINDOW_CHARS = 64 * 1024
+
+
+def _safe_cut(buffer: str, start: int, end: int, outside_tags: bool) -> int:
+    """Last safe boundary in the second half of buffer[start:end] (0 if none)."""
+    floor = start + (end - start) // 2
+    cut = end
+    while cut > floor:
+        ws = max(buffer.rfind(" ", floor, cut), buffer.rfind("\n", floor, cut))
+        if ws < 0:
+            return 0
+        cut = ws + 1
+        if cut < len(buffer) and combining(buffer[cut]):
+            cut = ws
+            continue
+        if outside_tags and buffer.rfind("<", start, cut) > buffer.rfind(">", start, cut):
+            # Inside an open tag; retry before it
+            cut = buffer.rfind("<", start, cut)
+            continue
+        return cut
+    return 0
+
+
+def _hard_cut(buffer: str, start: int, end: int) -> int:
+    """Cut at end, moved back so the next window does not start with a combining mark."""
+    cut = end
+    while cut > start + 1 and cut < len(buffer) and combining(buffer[cut]):
+        cut -= 1
+    return cut
+
+
+def iter_windows(
+    source: str | Iterable[str],
+    window: int = DEFAULT_WINDOW_CHARS,
+    outside_tags: bool = False,
+) -> Iterator[str]:
+    """
+    Split source into consecutive windows cut at safe boundaries.
+
+    Args:
+        source: Whole text or an iterable of text chunks
+        window: Target window size in characters
+        outside_tags: Avoid cutting inside an HTML tag
+
+    Yields:
+        Windows whose concatenation equals the source. A window exceeds
+        window characters only while no boundary is found; it is cut hard
+        at 2 * window characters.
+    """
+    window = max(2, window)
+    if isinstance(source, str):
+        text = source
+        source = (text[i : i + window] for i in range(0, len(text), window))
+
+    buffer = ""
+    pos = 0  # Start of the unconsumed part of buffer
+    parts: list[str] = []
+    size = 0
+
+    def cuts(final: bool) -> Iterator[str]:
+        nonlocal pos
+        while len(buffer) - pos > (0 if final else window):
+            if final and len(buffer) - pos <= 2 * window:
+                yield buffer[pos:]
+                pos = len(buffer)
+                return
+            cut = _safe_cut(buffer, pos, pos + window, outside_tags)
+            if not cut:
+                if not final and len(buffer) - pos < 2 * window:
+                    return  # Wait for more input to find a boundary
+                cut = _safe_cut(buffer, pos, pos + 2 * window, outside_tags)
+                cut = cut or _hard_cut(buffer, pos, pos + 2 * window)
+            yield buffer[pos:cut]
+            pos = cut
+
+    for chunk in source:
+        if not chunk:
+            continue
+        # Collect small chunks without re-copying the carry-over each time
+        parts.append(chunk)
+        size += len(chunk)
+        if len(buffer) - pos + size <= window:
+            continue
+        buffer = buffer[pos:] + "".join(parts)
+        pos = 0
+        parts.clear()
+        size = 0
+        yield from cuts(final=False)
+
+    buffer = buffer[pos:] + "".join(parts)
+    pos = 0
+    yield from cuts(final=True)
+
+
+class StreamStripper:
+    """Applies str.strip() to a text emitted in pieces.
+
+    Leading whitespace of the stream is dropped; trailing whitespace of a
+    piece is held back until non-whitespace text follows it.
+    """
+
+    def __init__(self) -> None:
+        self.started = False
+        self.pending = ""
+
+    def feed(self, text: str) -> str:
+        """Return the part of text that can be emitted now."""
+        if not self.started:
+            text = text.lstrip()
+            if not text:
+                return ""
+            self.started = True
+        body = text.rstrip()
+        if not body:
+            self.pending += text
+            return ""
+        out = self.pending + body if self.pending else body
+        self.pending = text[len(body) :]
+        return out
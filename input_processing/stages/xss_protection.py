@@ -6,12 +6,30 @@ Provides comprehensive protection against XSS attacks.
 
 import html
 import re
+from collections.abc import Iterable, Iterator
 from urllib.parse import unquote
 
+from .security_scanner import XSS_CATEGORIES, SecurityScanner
+from .windowing import DEFAULT_WINDOW_CHARS, StreamStripper, iter_windows
+
+_DECIMAL_ENTITY_RE = re.compile(r"&#(\d+);")
+_HEX_ENTITY_RE = re.compile(r"&#x([0-9a-fA-F]+);")
+
+
+def _entity_char(match: re.Match[str], base: int) -> str:
+    """Character for a numeric entity; out-of-range entities are left as is."""
+    try:
+        return chr(int(match.group(1), base))
+    except (ValueError, OverflowError):
+        return match.group(0)
+
 
 class XSSProtection:
     """Enhanced XSS protection module."""
 
+    # Maximum URL-decoding rounds; deeper nesting is left encoded (and inert)
+    MAX_DECODE_ROUNDS: int = 8
+
     # HTML entities that must be encoded
     HTML_ENTITIES: dict[str, str] = {
         "&": "&amp;",
@@ -108,6 +126,11 @@ class XSSProtection:
         if not text:
             return text
 
+        return XSSProtection._remove_tags(text).strip()
+
+    @staticmethod
+    def _remove_tags(text: str) -> str:
+        """strip_tags without trimming surrounding whitespace."""
         # Remove all HTML comments
         text = re.sub(r"<!--.*?-->", "", text, flags=re.DOTALL)
 
@@ -124,7 +147,7 @@ class XSSProtection:
         for protocol in XSSProtection.DANGEROUS_PROTOCOLS:
             text = re.sub(rf'{re.escape(protocol)}[^"\'\s]*', "", text, flags=re.IGNORECASE)
 
-        return text.strip()
+        return text
 
     @staticmethod
     def sanitize_attributes(html_str: str) -> str:
@@ -180,29 +203,9 @@ class XSSProtection:
         if not text:
             return False
 
-        # Check for script tags
-        if re.search(r"<script[^>]*>", text, re.IGNORECASE):
-            return True
-
-        # Check for event handlers
-        for attr in XSSProtection.DANGEROUS_ATTRS:
-            if re.search(rf"\b{attr}\s*=", text, re.IGNORECASE):
-                return True
-
-        # Check for dangerous protocols
-        for protocol in XSSProtection.DANGEROUS_PROTOCOLS:
-            if protocol.lower() in text.lower():
-                return True
-
-        # Check for encoded script tags
-        encoded_patterns = [
-            r"%3Cscript",  # URL encoded
-            r"&lt;script",  # HTML encoded
-            r"\\x3cscript",  # Hex encoded
-            r"\\u003cscript",  # Unicode encoded
-        ]
-
-        return any(re.search(pattern, text, re.IGNORECASE) for pattern in encoded_patterns)
+        # Script tags, event handlers, dangerous protocols and encoded script
+        # tags all come from the shared single-pass scan
+        return SecurityScanner.scan(text).has(*XSS_CATEGORIES)
 
     @staticmethod
     def decode_all_encodings(text: str) -> str:
@@ -210,21 +213,24 @@ class XSSProtection:
         if not text:
             return text
 
-        # URL decode (handle multiple levels of encoding)
-        prev_text = ""
-        while prev_text != text:
-            prev_text = text
+        # URL decode (handle multiple levels of encoding, up to a cap)
+        for _ in range(XSSProtection.MAX_DECODE_ROUNDS):
+            if "%" not in text:
+                break
             try:
-                text = unquote(text)
+                decoded = unquote(text)
             except Exception:
                 break
+            if decoded == text:
+                break
+            text = decoded
 
         # HTML entity decode
         text = html.unescape(text)
 
         # Decode common numeric entities
-        text = re.sub(r"&#(\d+);", lambda m: chr(int(m.group(1))), text)
-        return re.sub(r"&#x([0-9a-fA-F]+);", lambda m: chr(int(m.group(1), 16)), text)
+        text = _DECIMAL_ENTITY_RE.sub(lambda m: _entity_char(m, 10), text)
+        return _HEX_ENTITY_RE.sub(lambda m: _entity_char(m, 16), text)
 
     @staticmethod
     def sanitize(text: str, allow_html: bool = False) -> str:
@@ -242,23 +248,60 @@ class XSSProtection:
             return XSSProtection.encode_html(text)
 
         if allow_html:
-            # Allow some HTML but sanitize dangerous parts
-            text = XSSProtection.sanitize_attributes(text)
-            text = XSSProtection.sanitize_css(text)
-
-            # Remove dangerous tags
-            for tag in XSSProtection.DANGEROUS_TAGS:
-                text = re.sub(
-                    rf"<{tag}[^>]*>.*?</{tag}[^>]*>",
-                    "",
-                    text,
-                    flags=re.DOTALL | re.IGNORECASE,
-                )
-                text = re.sub(rf"<{tag}[^>]*/?>", "", text, flags=re.IGNORECASE)
-        else:
-            # Strip all HTML
-            text = XSSProtection.strip_tags(text)
-            # Then encode any remaining special characters
-            text = XSSProtection.encode_html(text)
+            return XSSProtection._sanitize_html(text)
 
+        # Strip all HTML
+        text = XSSProtection.strip_tags(text)
+        # Then encode any remaining special characters
+        return XSSProtection.encode_html(text)
+
+    @staticmethod
+    def _sanitize_html(text: str) -> str:
+        """Allow some HTML but sanitize dangerous parts."""
+        text = XSSProtection.sanitize_attributes(text)
+        text = XSSProtection.sanitize_css(text)
+
+        # Remove dangerous tags
+        for tag in XSSProtection.DANGEROUS_TAGS:
+            text = re.sub(
+                rf"<{tag}[^>]*>.*?</{tag}[^>]*>",
+                "",
+                text,
+                flags=re.DOTALL | re.IGNORECASE,
+            )
+            text = re.sub(rf"<{tag}[^>]*/?>", "", text, flags=re.IGNORECASE)
         return text
+
+    @staticmethod
+    def sanitize_stream(
+        source: str | Iterable[str],
+        allow_html: bool = False,
+        window: int = DEFAULT_WINDOW_CHARS,
+    ) -> Iterator[str]:
+        """Sanitize large input window by window, yielding output progressively.
+
+        Windows end at whitespace outside HTML tags, so encoded sequences
+        and tags are never split. Each window is decoded and checked on its
+        own: a window with an XSS attempt is stripped in decoded form,
+        others are sanitized as in sanitize(). Memory stays proportional to
+        the window size.
+
+        Args:
+            source: Whole text or an iterable of text chunks
+            allow_html: Keep safe HTML instead of stripping all tags
+            window: Window size in characters
+        """
+        stripper = None if allow_html else StreamStripper()
+        for chunk in iter_windows(source, window, outside_tags=True):
+            decoded = XSSProtection.decode_all_encodings(chunk)
+            if XSSProtection.detect_xss_attempt(decoded):
+                text = XSSProtection.encode_html(XSSProtection._remove_tags(decoded))
+            elif allow_html:
+                text = XSSProtection._sanitize_html(chunk)
+            else:
+                text = XSSProtection.encode_html(XSSProtection._remove_tags(chunk))
+
+            if stripper is not None:
+                text = stripper.feed(text)
+            if text:
+                yield text
@@ -25,6 +25,10 @@ __all__ = [
     "VectorSearchEngine",
     "OptimizedVectorSearchEngine",
     "SearchResult",
+    # Reranking
+    "LexicalProximityReranker",
+    "CrossEncoderReranker",
+    "create_reranker",
     # Embeddings
     "EmbeddingGenerator",
     "get_embedding_generator",
@@ -32,6 +36,7 @@ __all__ = [
     "ContextProvider",
     "EnhancedContextProvider",
     "DefaultContextProvider",  # pylint: disable=undefined-all-variable
+    "ContextPacker",
     # Processing / Monitoring
     "FileProcessor",
     "OptimizedFileProcessor",
@@ -48,6 +53,7 @@ __all__ = [
 
 # Typing-only imports for static analyzers; do not impact runtime lazy loading
 if TYPE_CHECKING:
+    from .context_packer import ContextPacker
     from .context_provider import ContextProvider
     from .directory_validator import DirectoryValidator
     from .embedding_generator import EmbeddingGenerator, get_embedding_generator
@@ -56,6 +62,7 @@ if TYPE_CHECKING:
     from .file_processor import FileProcessor
     from .optimized_file_processor import OptimizedFileProcessor
     from .optimized_vector_search import OptimizedVectorSearchEngine
+    from .reranker import CrossEncoderReranker, LexicalProximityReranker, create_reranker
     from .secure_text_extractor import (
         SecureTextExtractor,
         create_secure_text_extractor,
@@ -72,6 +79,10 @@ _EXPORTS: dict[str, tuple[str, str]] = {
         "rag.optimized_vector_search",
         "OptimizedVectorSearchEngine",
     ),
+    # Reranking
+    "LexicalProximityReranker": ("rag.reranker", "LexicalProximityReranker"),
+    "CrossEncoderReranker": ("rag.reranker", "CrossEncoderReranker"),
+    "create_reranker": ("rag.reranker", "create_reranker"),
     # Embeddings
     "EmbeddingGenerator": ("rag.embedding_generator", "EmbeddingGenerator"),
     "get_embedding_generator": ("rag.embedding_generator", "get_embedding_generator"),
@@ -81,6 +92,7 @@ _EXPORTS: dict[str, tuple[str, str]] = {
         "rag.enhanced_context_provider",
         "EnhancedContextProvider",
     ),
+    "ContextPacker": ("rag.context_packer", "ContextPacker"),
     # Processing / Monitoring
     "FileProcessor": ("rag.file_processor", "FileProcessor"),
     "OptimizedFileProcessor": (
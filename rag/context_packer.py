@@ -0,0 +1,243 @@
+"""
+Token-budgeted context packing for RAG prompts.
+
+Turns ranked search hits into the passages that go into a chat prompt:
+adjacent or overlapping chunks from the same file are merged back into one
+passage (so the chunk overlap is sent once), near-duplicates are dropped and
+the token budget is filled greedily by score per token.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import replace
+from typing import Any
+
+from utils.tokens import estimate_tokens
+
+from .optimized_vector_search import SearchOptimizer
+from .vector_search import SearchResult
+
+_TRUNCATION_MARKER = "\n... (truncated)"
+
+
+class ContextPacker:
+    """
+    Packs search results into a fixed prompt token budget.
+    """
+
+    # Default packing parameters
+    DEFAULT_PASSAGE_OVERHEAD = 12  # tokens for the per-passage header in prompts
+    DEFAULT_MAX_GAP = 2  # chars between chunks still treated as adjacent
+    DEFAULT_SIMILARITY_THRESHOLD = 0.9
+    MIN_TRUNCATED_TOKENS = 32  # smallest useful truncated passage
+
+    def __init__(
+        self,
+        token_budget: int,
+        count_tokens: Callable[[str], int] | None = None,
+        passage_overhead: int = DEFAULT_PASSAGE_OVERHEAD,
+        max_gap: int = DEFAULT_MAX_GAP,
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    ):
+        """
+        Initialize the packer.
+
+        Args:
+            token_budget: Maximum number of prompt tokens for all passages
+            count_tokens: Token counter for the target model (defaults to
+                          estimate_tokens)
+            passage_overhead: Tokens charged per passage for its header
+            max_gap: Largest gap in characters between two chunks of one
+                     file that still merges them
+            similarity_threshold: Jaccard threshold for near-duplicates
+        """
+        if token_budget <= 0:
+            raise ValueError("token_budget must be positive")
+        self.token_budget = int(token_budget)
+        self.count_tokens = count_tokens or estimate_tokens
+        self.passage_overhead = max(0, int(passage_overhead))
+        self.max_gap = max(0, int(max_gap))
+        self.similarity_threshold = similarity_threshold
+        self.optimizer = SearchOptimizer()
+
+    def pack(self, results: list[SearchResult]) -> tuple[list[SearchResult], dict[str, Any]]:
+        """
+        Merge, deduplicate and budget search results.
+
+        Args:
+            results: Ranked search results
+
+        Returns:
+            Tuple of (packed passages ordered by score, packing statistics)
+        """
+        merged = self._merge_adjacent(results)
+        merged.sort(key=lambda r: r.score, reverse=True)
+        unique = self.optimizer.deduplicate_results(merged, self.similarity_threshold)
+
+        costs = [self.count_tokens(r.content) for r in unique]
+        selected: list[tuple[SearchResult, int]] = []
+        remaining = self.token_budget
+        order = sorted(
+            range(len(unique)),
+            key=lambda i: unique[i].score / max(1, costs[i] + self.passage_overhead),
+            reverse=True,
+        )
+        for i in order:
+            cost = costs[i] + self.passage_overhead
+            if cost <= remaining:
+                selected.append((unique[i], costs[i]))
+                remaining -= cost
+
+        # Nothing fits whole: keep the head of the best passage instead
+        if not selected and unique:
+            truncated = self._truncate(unique[0], remaining - self.passage_overhead)
+            if truncated is not None:
+                tokens = self.count_tokens(truncated.content)
+                selected.append((truncated, tokens))
+                remaining -= tokens + self.passage_overhead
+
+        selected.sort(key=lambda pair: pair[0].score, reverse=True)
+        packed = []
+        for result, tokens in selected:
+            metadata = dict(result.metadata or {})
+            metadata["token_count"] = tokens
+            packed.append(replace(result, metadata=metadata))
+
+        stats = {
+            "token_budget": self.token_budget,
+            "tokens_used": self.token_budget - remaining,
+            "input_chunks": len(results),
+            "merged_passages": len(merged),
+            "unique_passages": len(unique),
+            "packed_passages": len(packed),
+        }
+        return packed, stats
+
+    def pack_items(
+        self, items: list[dict[str, Any]]
+    ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """
+        Pack context item dictionaries as returned by the context providers.
+
+        Items need file_path, content and score; start_pos/end_pos enable
+        merging. Extra keys are kept from the first chunk of each passage.
+
+        Args:
+            items: Context items from get_context_for_query
+
+        Returns:
+            Tuple of (packed context items, packing statistics)
+        """
+        results: list[SearchResult] = []
+        for i, item in enumerate(items):
+            results.append(
+                SearchResult(
+                    chunk_id=str(item.get("chunk_id", i)),
+                    file_id=str(item.get("file_id") or item.get("file_path", "")),
+                    file_path=str(item.get("file_path", "")),
+                    content=str(item.get("content", "")),
+                    score=float(item.get("score", 0.0)),
+                    chunk_index=int(item.get("chunk_index", 0)),
+                    start_pos=int(item.get("start_pos", -1)),
+                    end_pos=int(item.get("end_pos", -1)),
+                    metadata={"item_index": i},
+                    match_type=str(item.get("match_type", "vector")),
+                )
+            )
+
+        packed, stats = self.pack(results)
+        packed_items: list[dict[str, Any]] = []
+        for result in packed:
+            metadata = result.metadata or {}
+            item = dict(items[metadata["item_index"]])
+            item.update(
+                {
+                    "content": result.content,
+                    "score": result.score,
+                    "merged_chunks": metadata.get("merged_chunks", 1),
+                    "token_count": metadata["token_count"],
+                }
+            )
+            if "end_pos" in item:
+                item["end_pos"] = result.end_pos
+            packed_items.append(item)
+        return packed_items, stats
+
+    def _merge_adjacent(self, results: list[SearchResult]) -> list[SearchResult]:
+        """Merge adjacent or overlapping chunks of the same file into passages."""
+        by_file: dict[str, list[SearchResult]] = defaultdict(list)
+        passages: list[SearchResult] = []
+        for result in results:
+            if result.start_pos < 0 or result.end_pos < result.start_pos:
+                passages.append(result)  # No position info, cannot merge
+            else:
+                by_file[result.file_id].append(result)
+
+        for chunks in by_file.values():
+            chunks.sort(key=lambda r: (r.start_pos, r.end_pos))
+            current = chunks[0]
+            merged_count = 1
+            for chunk in chunks[1:]:
+                combined = self._join(current, chunk)
+                if combined is None:
+                    passages.append(self._with_merge_count(current, merged_count))
+                    current, merged_count = chunk, 1
+                else:
+                    current = combined
+                    merged_count += 1
+            passages.append(self._with_merge_count(current, merged_count))
+        return passages
+
+    def _join(self, first: SearchResult, second: SearchResult) -> SearchResult | None:
+        """Join two position-sorted chunks of one file, or None if not adjacent."""
+        gap = second.start_pos - first.end_pos
+        if gap > self.max_gap:
+            return None
+
+        if second.end_pos <= first.end_pos:
+            content = first.content  # Fully contained
+        elif gap >= 0:
+            content = first.content + ("\n" if gap else "") + second.content
+        elif len(second.content) == second.end_pos - second.start_pos:
+            # Verbatim slice: drop the characters already in the first chunk
+            content = first.content + second.content[-gap:]
+        else:
+            return None
+
+        return replace(
+            first,
+            content=content,
+            score=max(first.score, second.score),
+            end_pos=max(first.end_pos, second.end_pos),
+        )
+
+    @staticmethod
+    def _with_merge_count(result: SearchResult, merged_count: int) -> SearchResult:
+        if merged_count == 1:
+            return result
+        metadata = dict(result.metadata or {})
+        metadata["merged_chunks"] = merged_count
+        return replace(result, metadata=metadata)
+
+    def _truncate(self, result: SearchResult, max_tokens: int) -> SearchResult | None:
+        """Cut a passage down to max_tokens at a line or word boundary."""
+        max_tokens -= self.count_tokens(_TRUNCATION_MARKER)
+        if max_tokens < self.MIN_TRUNCATED_TOKENS:
+            return None
+        tokens = max(1, self.count_tokens(result.content))
+        cut = int(len(result.content) * max_tokens / tokens)
+        content = result.content[:cut]
+        while content and self.count_tokens(content) > max_tokens:
+            content = content[: int(len(content) * 0.9)]
+        boundary = max(content.rfind("\n"), content.rfind(" "))
+        if boundary > len(content) // 2:
+            content = content[:boundary]
+        if not content:
+            return None
+        return replace(
+            result,
+            content=content + _TRUNCATION_MARKER,
+            end_pos=result.start_pos + len(content),
+        )
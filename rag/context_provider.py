@@ -9,6 +9,7 @@ from typing import Any
 from database.file_search_db import FileSearchDB
 from utils.logger import Logger
 
+from .context_packer import ContextPacker
 from .file_processor import FileProcessor
 from .vector_search import VectorSearchEngine
 
@@ -37,6 +38,7 @@ class ContextProvider:
         self.max_context_length = 2000  # Maximum characters for context
         self.max_results = 5  # Maximum number of search results to include
         self.min_score_threshold = 0.5  # Minimum relevance score
+        self.context_token_budget: int | None = None  # Pack by tokens when set
 
     def get_context_for_query(
         self,
@@ -75,6 +77,8 @@ class ContextProvider:
                     "file_name": os.path.basename(result.file_path),
                     "content": result.content,
                     "chunk_index": result.chunk_index,
+                    "start_pos": result.start_pos,
+                    "end_pos": result.end_pos,
                     "score": result.score,
                     "match_type": result.match_type,
                 }
@@ -95,14 +99,23 @@ class ContextProvider:
             return []
 
     def format_context_for_chat(
-        self, context_items: list[dict[str, Any]], include_metadata: bool = True
+        self,
+        context_items: list[dict[str, Any]],
+        include_metadata: bool = True,
+        token_budget: int | None = None,
     ) -> str:
         """
         Format context items into a string suitable for chat prompts.
 
+        With a token budget, overlapping chunks of the same file are merged,
+        near-duplicates dropped and passages chosen by score per token;
+        otherwise whole items are added up to max_context_length characters.
+
         Args:
             context_items: List of context items from get_context_for_query
             include_metadata: Whether to include file metadata
+            token_budget: Optional prompt token budget (defaults to
+                          context_token_budget)
 
         Returns:
             Formatted context string
@@ -110,6 +123,10 @@ class ContextProvider:
         if not context_items:
             return ""
 
+        token_budget = token_budget or self.context_token_budget
+        if token_budget:
+            context_items, _stats = ContextPacker(token_budget).pack_items(context_items)
+
         formatted_parts = []
         total_length = 0
 
@@ -126,8 +143,8 @@ class ContextProvider:
 
             part += f"\nContent:\n{item['content']}\n"
 
-            # Check length constraint
-            if total_length + len(part) > self.max_context_length:
+            # Check length constraint (the packer already enforced the budget)
+            if not token_budget and total_length + len(part) > self.max_context_length:
                 # Truncate if needed
                 remaining = self.max_context_length - total_length
                 if remaining > 100:  # Only add if meaningful
@@ -4,6 +4,7 @@ Provides local vector embedding generation using sentence-transformers.
 """
 
 import os
+import threading
 from functools import lru_cache
 from typing import Any
 
@@ -12,6 +13,7 @@ import torch
 
 # Import logging from DinoAir's logger
 from utils import Logger
+from utils.tokens import approx_token_offsets
 
 
 class EmbeddingGenerator:
@@ -24,6 +26,7 @@ class EmbeddingGenerator:
     DEFAULT_MODEL = "all-MiniLM-L6-v2"  # ~80MB, 384-dimensional embeddings
     DEFAULT_MAX_LENGTH = 256  # Maximum sequence length for the model
     DEFAULT_BATCH_SIZE = 32  # Default batch size for processing
+    SPECIAL_TOKENS = 2  # [CLS] and [SEP] added by the model around content
 
     # Model cache directory
     MODEL_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".dinoair", "models", "embeddings")
@@ -57,8 +60,11 @@ class EmbeddingGenerator:
             self.device = "cpu"
             self.logger.info("Using CPU for embeddings")
 
-        # Initialize model as None (lazy loading)
+        # Initialize model and tokenizer as None (lazy loading)
         self._model = None
+        self._tokenizer = None
+        self._tokenizer_unavailable = False
+        self._tokenizer_lock = threading.Lock()
 
         # Create cache directory if it doesn't exist
         os.makedirs(self.MODEL_CACHE_DIR, exist_ok=True)
@@ -108,6 +114,122 @@ class EmbeddingGenerator:
             self.logger.error("Error loading embedding model: %s", str(e))
             raise
 
+    @property
+    def tokenizer(self):
+        """
+        Lazy load the model's fast tokenizer without loading model weights.
+        Returns None when no fast tokenizer can be loaded.
+        """
+        if self._tokenizer is None and not self._tokenizer_unavailable:
+            self._load_tokenizer()
+        return self._tokenizer
+
+    def _load_tokenizer(self):
+        """
+        Load the fast tokenizer matching the embedding model.
+        Reuses the loaded model's tokenizer when available.
+        """
+        tokenizer = getattr(self._model, "tokenizer", None) if self._model is not None else None
+        if tokenizer is None:
+            try:
+                from transformers import AutoTokenizer
+
+                repo_id = (
+                    self.model_name
+                    if "/" in self.model_name
+                    else f"sentence-transformers/{self.model_name}"
+                )
+                tokenizer = AutoTokenizer.from_pretrained(
+                    repo_id, use_fast=True, cache_dir=self.MODEL_CACHE_DIR
+                )
+            except Exception as e:
+                self.logger.warning(
+                    "Fast tokenizer unavailable for %s, using approximate token counts: %s",
+                    self.model_name,
+                    str(e),
+                )
+                self._tokenizer_unavailable = True
+                return
+
+        if not getattr(tokenizer, "is_fast", False):
+            self.logger.warning(
+                "Tokenizer for %s is not a fast tokenizer; using approximate token counts",
+                self.model_name,
+            )
+            self._tokenizer_unavailable = True
+            return
+
+        self._tokenizer = tokenizer
+
+    @property
+    def max_content_tokens(self) -> int:
+        """Token budget available for content once special tokens are added."""
+        return max(1, self.max_length - self.SPECIAL_TOKENS)
+
+    def token_offsets(self, text: str) -> list[tuple[int, int]]:
+        """
+        Tokenize text in a single pass and return character spans per token.
+
+        Args:
+            text: Input text
+
+        Returns:
+            List of (start, end) character offsets, one per content token
+        """
+        if not text:
+            return []
+
+        tokenizer = self.tokenizer
+        if tokenizer is not None:
+            try:
+                # Fast tokenizers are not safe for concurrent calls on one instance
+                with self._tokenizer_lock:
+                    encoded = tokenizer(
+                        text,
+                        add_special_tokens=False,
+                        return_offsets_mapping=True,
+                        return_attention_mask=False,
+                        return_token_type_ids=False,
+                        truncation=False,
+                        verbose=False,
+                    )
+                return [(int(a), int(b)) for a, b in encoded["offset_mapping"]]
+            except Exception as e:
+                self.logger.debug("Tokenizer failed, falling back to approximation: %s", str(e))
+
+        # No fast tokenizer: the same estimate as utils.tokens.estimate_tokens
+        return approx_token_offsets(text)
+
+    def count_tokens(self, text: str) -> int:
+        """
+        Count content tokens for text (excluding special tokens).
+
+        Args:
+            text: Input text
+
+        Returns:
+            Number of tokens
+        """
+        return len(self.token_offsets(text))
+
+    def _truncate_for_model(self, text: str) -> str:
+        """
+        Truncate text to what the model will actually embed.
+
+        Texts are cut at the token boundary from token_offsets(), the same
+        spans the token-budgeted chunker sizes chunks with, so a full chunk is
+        never cut short. With a fast tokenizer, short texts skip tokenization.
+        """
+        if self.tokenizer is not None and len(text) <= self.max_length * 4:
+            return text
+
+        offsets = self.token_offsets(text)
+        budget = self.max_content_tokens
+        if len(offsets) <= budget:
+            return text
+        self.logger.debug(f"Truncating text from {len(offsets)} to {budget} tokens")
+        return text[: offsets[budget - 1][1]]
+
     def generate_embedding(self, text: str, normalize: bool = True) -> np.ndarray:
         """
         Generate embedding for a single text.
@@ -130,11 +252,7 @@ class EmbeddingGenerator:
 
         try:
             # Truncate text if needed
-            if len(text) > self.max_length * 4:  # Rough character estimate
-                self.logger.debug(
-                    f"Truncating text from {len(text)} to ~{self.max_length * 4} chars"
-                )
-                text = text[: self.max_length * 4]
+            text = self._truncate_for_model(text)
 
             # Generate embedding
             return self.model.encode(
@@ -178,9 +296,7 @@ class EmbeddingGenerator:
             for i, text in enumerate(texts):
                 if text and text.strip():
                     # Truncate if needed
-                    if len(text) > self.max_length * 4:
-                        text = text[: self.max_length * 4]
-                    valid_texts.append(text)
+                    valid_texts.append(self._truncate_for_model(text))
                     valid_indices.append(i)
 
             if not valid_texts:
@@ -360,10 +476,7 @@ class EmbeddingGenerator:
         text = " ".join(text.split())
 
         # Ensure text is not too long
-        if len(text) > self.max_length * 4:
-            text = text[: self.max_length * 4]
-
-        return text
+        return self._truncate_for_model(text)
 
 
 # Cached function for getting a singleton embedding generator
@@ -17,6 +17,7 @@ from typing import Any
 from database.file_search_db import FileSearchDB
 from utils.logger import Logger
 
+from .reranker import create_reranker
 from .vector_search import VectorSearchEngine
 
 
@@ -180,14 +181,23 @@ class EnhancedContextProvider:
     - Improved relevance scoring
     """
 
-    def __init__(self, user_name: str = "default_user"):
-        """Initialize the enhanced context provider"""
+    def __init__(self, user_name: str = "default_user", reranker: Any | None = None):
+        """
+        Initialize the enhanced context provider.
+
+        Args:
+            user_name: Username for database and search operations
+            reranker: Optional second-stage reranker; defaults to the one
+                      selected by DINOAIR_RAG_RERANKER
+        """
         self.user_name = user_name
         self.logger = Logger()
 
         # Initialize components
         try:
-            self.search_engine = VectorSearchEngine(user_name)
+            if reranker is None:
+                reranker = create_reranker()
+            self.search_engine = VectorSearchEngine(user_name, reranker=reranker)
             self.file_search_db = FileSearchDB(user_name)
             self.search_history = SearchHistory()
             self.validator = InputValidator()
@@ -337,6 +347,8 @@ class EnhancedContextProvider:
             "file_name": os.path.basename(result.file_path),
             "content": result.content,
             "chunk_index": result.chunk_index,
+            "start_pos": result.start_pos,
+            "end_pos": result.end_pos,
             "score": result.score,
             "match_type": result.match_type,
             "relevance_level": self._get_relevance_level(result.score),
@@ -48,6 +48,16 @@ def _filter_kwargs_for_callable(callable_obj: Any, kwargs: dict[str, Any]) -> di
         return kwargs
 
 
+def _reranker_from_env() -> Any | None:
+    """Build the second-stage reranker selected by DINOAIR_RAG_RERANKER, if any."""
+    try:
+        module = import_module("rag.reranker")
+        return module.create_reranker()
+    except (ImportError, ValueError) as e:
+        logger.warning("Second-stage reranker unavailable, continuing without: %s", e)
+        return None
+
+
 def get_search_engine(
     user_name: str | None = None,
     optimized: bool | None = None,
@@ -56,6 +66,7 @@ def get_search_engine(
     cache_ttl: int = 3600,
     enable_caching: bool = True,
     max_workers: int | None = None,
+    reranker: Any | None = None,
 ) -> object:
     """
     Create a RAG search engine instance.
@@ -64,10 +75,17 @@ def get_search_engine(
     - If optimized is None, read env DINOAIR_RAG_USE_OPTIMIZED_ENGINE (truthy/falsy), default True
     - Prefer OptimizedVectorSearchEngine when enabled and importable
     - Fall back to VectorSearchEngine on ImportError or init failure
+    - The optimized engine searches a sharded index unless
+      DINOAIR_RAG_SHARDED_INDEX is falsy (default True)
+    - If reranker is None, build one from env DINOAIR_RAG_RERANKER
+      ('none', 'lexical', 'cross-encoder'), default 'none'
 
     Returns:
         Engine instance
     """
+    if reranker is None:
+        reranker = _reranker_from_env()
+
     # Determine optimized setting (default True)
     if optimized is None:
         env_val = os.getenv("DINOAIR_RAG_USE_OPTIMIZED_ENGINE")
@@ -86,6 +104,8 @@ def get_search_engine(
                 "cache_ttl": cache_ttl,
                 "enable_caching": enable_caching,
                 "max_workers": max_workers,
+                "reranker": reranker,
+                "use_shards": _parse_bool_env(os.getenv("DINOAIR_RAG_SHARDED_INDEX"), True),
             }
             init_kwargs = _filter_kwargs_for_callable(
                 OptimizedVectorSearchEngine.__init__, init_kwargs
@@ -110,6 +130,7 @@ def get_search_engine(
         init_kwargs = {
             "user_name": user_name,
             "embedding_generator": embedding_generator,
+            "reranker": reranker,
         }
         init_kwargs = _filter_kwargs_for_callable(VectorSearchEngine.__init__, init_kwargs)
         logger.debug("Creating VectorSearchEngine via factory")
@@ -4,6 +4,8 @@ Provides intelligent text chunking with configurable strategies.
 """
 
 import re
+from bisect import bisect_left
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
@@ -388,6 +390,145 @@ class FileChunker:
         self.logger.info("Created %d code chunks for %s", len(chunks), language)
         return chunks
 
+    def chunk_by_tokens(
+        self,
+        text: str,
+        token_offsets: Callable[[str], list[tuple[int, int]]],
+        max_tokens: int,
+        overlap_tokens: int = 0,
+        language: str | None = None,
+    ) -> list[TextChunk]:
+        """
+        Split text into chunks whose length is measured in model tokens.
+
+        The text is tokenized once; sentence boundaries (or code boundaries when
+        a language is given) are then packed greedily into near-full token
+        windows. Units larger than the budget are split at token boundaries, so
+        every character of the input lands in some chunk.
+
+        Args:
+            text: The text to chunk
+            token_offsets: Callable returning (start, end) character spans per
+                           token, e.g. EmbeddingGenerator.token_offsets
+            max_tokens: Maximum number of tokens per chunk
+            overlap_tokens: Approximate number of tokens to repeat between chunks
+            language: Programming language for code-aware boundaries, or None
+
+        Returns:
+            List of TextChunk objects
+        """
+        if not text:
+            return []
+
+        max_tokens = max(1, int(max_tokens))
+        overlap_tokens = max(0, min(int(overlap_tokens), max_tokens // 2))
+
+        token_starts = [start for start, _ in token_offsets(text)]
+
+        def count(start: int, end: int) -> int:
+            return bisect_left(token_starts, end) - bisect_left(token_starts, start)
+
+        if language:
+            spans = [(start, end) for start, end, _ in self._find_code_boundaries(text, language)]
+            chunk_type = "code"
+        else:
+            spans = [(start, end) for _, start, end in self._split_sentences(text)]
+            chunk_type = "token"
+
+        # Contiguous units: whitespace skipped by the splitters joins the next unit
+        cuts = sorted({0, len(text)} | {start for start, _ in spans})
+        units = [(a, b, count(a, b)) for a, b in zip(cuts, cuts[1:], strict=False) if b > a]
+
+        chunks: list[TextChunk] = []
+        window: list[tuple[int, int, int]] = []
+        window_tokens = 0
+        has_new = False  # window holds more than carried-over overlap
+
+        def emit(start: int, end: int, tokens: int, overlap_prev: int) -> None:
+            chunks.append(
+                TextChunk(
+                    content=text[start:end],
+                    metadata=ChunkMetadata(
+                        chunk_index=len(chunks),
+                        start_pos=start,
+                        end_pos=end,
+                        chunk_type=chunk_type,
+                        overlap_with_previous=overlap_prev,
+                        additional_info={"token_count": tokens, "language": language},
+                    ),
+                )
+            )
+
+        def flush() -> None:
+            nonlocal window, window_tokens, has_new
+            if not has_new:
+                return
+            has_new = False
+            overlap_prev = max(0, chunks[-1].metadata.end_pos - window[0][0]) if chunks else 0
+            emit(window[0][0], window[-1][1], window_tokens, overlap_prev)
+
+            # Carry trailing units forward as overlap for the next window
+            carried: list[tuple[int, int, int]] = []
+            carried_tokens = 0
+            for unit in reversed(window):
+                if carried_tokens + unit[2] > overlap_tokens:
+                    break
+                carried.insert(0, unit)
+                carried_tokens += unit[2]
+            window, window_tokens = carried, carried_tokens
+
+        for start, end, tokens in units:
+            if tokens > max_tokens:
+                flush()
+                window, window_tokens = [], 0
+                self._split_oversized_unit(
+                    start, end, token_starts, max_tokens, overlap_tokens, chunks, emit
+                )
+                continue
+            if window_tokens + tokens > max_tokens:
+                flush()
+                # Drop carried overlap if it would not leave room for this unit
+                while window and window_tokens + tokens > max_tokens:
+                    window_tokens -= window.pop(0)[2]
+            window.append((start, end, tokens))
+            window_tokens += tokens
+            has_new = True
+
+        flush()
+
+        self.logger.info(
+            "Created %d token chunks (max %d tokens) from %d characters",
+            len(chunks),
+            max_tokens,
+            len(text),
+        )
+        return chunks
+
+    @staticmethod
+    def _split_oversized_unit(
+        start: int,
+        end: int,
+        token_starts: list[int],
+        max_tokens: int,
+        overlap_tokens: int,
+        chunks: list[TextChunk],
+        emit: Callable[[int, int, int, int], None],
+    ) -> None:
+        """Split a single unit larger than the budget at token boundaries."""
+        first = bisect_left(token_starts, start)
+        last = bisect_left(token_starts, end)
+        step = max(1, max_tokens - overlap_tokens)
+        index = first
+        while index < last:
+            stop = min(last, index + max_tokens)
+            piece_start = start if index == first else token_starts[index]
+            piece_end = end if stop == last else token_starts[stop]
+            overlap_prev = max(0, chunks[-1].metadata.end_pos - piece_start) if chunks else 0
+            emit(piece_start, piece_end, stop - index, overlap_prev)
+            if stop == last:
+                break
+            index += step
+
     def _find_boundary(self, text: str, start: int, preferred_end: int) -> int:
         """
         Find a good boundary point for chunk splitting.
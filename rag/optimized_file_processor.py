@@ -20,10 +20,28 @@ from database.file_search_db import FileSearchDB
 from utils.logger import Logger
 
 from .embedding_generator import get_embedding_generator
+from .file_chunker import FileChunker
 from .file_processor import FileProcessor
 
 # Import RAG components
 
+# Chunking modes: raw character windows, or windows measured in embedding tokens
+CHUNKING_MODES = ("chars", "tokens")
+
+# File extensions chunked along code boundaries in token mode
+_CODE_LANGUAGES = {
+    "py": "python",
+    "js": "javascript",
+    "ts": "typescript",
+    "java": "java",
+    "c": "c",
+    "cpp": "cpp",
+    "h": "c",
+    "cs": "csharp",
+    "go": "go",
+    "rs": "rust",
+}
+
 
 class LRUCache:
     """Simple LRU cache implementation for embeddings and file metadata"""
@@ -100,6 +118,7 @@ class OptimizedFileProcessor(FileProcessor):
         max_workers: int | None = None,
         cache_size: int = 1000,
         enable_caching: bool = True,
+        chunking_mode: str = "chars",
     ):
         """
         Initialize the OptimizedFileProcessor.
@@ -108,6 +127,8 @@ class OptimizedFileProcessor(FileProcessor):
             max_workers: Maximum number of parallel workers
             cache_size: Size of LRU cache for embeddings
             enable_caching: Whether to enable caching
+            chunking_mode: "chars" for character windows (chunk_size/overlap),
+                           or "tokens" to fill the embedding model's token window
         """
         super().__init__(
             user_name=user_name,
@@ -128,6 +149,13 @@ class OptimizedFileProcessor(FileProcessor):
             self.embedding_cache = LRUCache(cache_size // 2)
             self.metadata_cache = LRUCache(cache_size // 2)
 
+        if chunking_mode not in CHUNKING_MODES:
+            raise ValueError(
+                f"Unknown chunking_mode {chunking_mode!r}; expected one of {CHUNKING_MODES}"
+            )
+        self.chunking_mode = chunking_mode
+        self._chunker = FileChunker()
+
         # Performance tracking
         self.processing_times = []
         self._lock = threading.Lock()
@@ -143,6 +171,22 @@ class OptimizedFileProcessor(FileProcessor):
         file_type = (os.path.splitext(file_path)[1] or "").lstrip(".").lower() or "unknown"
         return size, modified_dt, file_type
 
+    @staticmethod
+    def _snapshot_matches(existing: dict[str, Any] | None, stat: os.stat_result) -> bool:
+        """True when the stored (size, mtime_ns, inode) snapshot equals the current stat."""
+        if not existing or existing.get("mtime_ns") is None:
+            return False
+        try:
+            if int(existing.get("size") or 0) != int(stat.st_size):
+                return False
+            if int(existing["mtime_ns"]) != int(stat.st_mtime_ns):
+                return False
+            stored_inode = existing.get("inode")
+            # Some filesystems report 0 for st_ino; treat that as "unknown"
+            return not (stored_inode and stat.st_ino and int(stored_inode) != int(stat.st_ino))
+        except (ValueError, TypeError):
+            return False
+
     def _should_skip(self, existing: dict[str, Any] | None, size: int, file_hash: str, force_reprocess: bool) -> dict[str, Any] | None:
         if existing and not force_reprocess:
             try:
@@ -168,6 +212,7 @@ class OptimizedFileProcessor(FileProcessor):
     def process_file(self, file_path: str, **kwargs) -> dict[str, Any]:
         """
         Minimal concrete file processing:
+        - Skips files whose stored stat snapshot is unchanged without hashing them
         - Reads text content (utf-8) for simple text/markdown files
         - Chunks by characters using configured chunk_size/overlap
         - Stores file, chunks, and embeddings (when enabled) in DB
@@ -177,13 +222,27 @@ class OptimizedFileProcessor(FileProcessor):
         if not os.path.isfile(file_path):
             return {"success": False, "error": f"File not found: {file_path}"}
 
+        norm_path = os.path.normpath(file_path)
+        stat = os.stat(file_path)
+        existing = self.db.get_file_by_path(norm_path)
+        if not force_reprocess and self._snapshot_matches(existing, stat):
+            return {
+                "success": True,
+                "file_id": existing.get("id"),
+                "chunks": [],
+                "stats": {"action": "skipped"},
+                "message": "Unchanged stat snapshot; skipped",
+            }
+
         size, modified_dt, file_type = self._gather_file_stats(file_path)
         file_hash = self._calculate_file_hash(
             file_path, chunk_size=getattr(self, "chunk_size", 65536)
         )
-        existing = self.db.get_file_by_path(os.path.normpath(file_path))
         skip_resp = self._should_skip(existing, size, file_hash, force_reprocess)
         if skip_resp:
+            # Content unchanged (e.g. touched); refresh the snapshot so the
+            # next reconcile does not hash it again
+            self.db.update_file_snapshot(norm_path, size, stat.st_mtime_ns, stat.st_ino or None)
             return skip_resp
 
         try:
@@ -191,31 +250,119 @@ class OptimizedFileProcessor(FileProcessor):
         except Exception as e:
             return {"success": False, "error": f"Unable to read file: {str(e)}"}
 
-        # Index file record
-        add_file_resp = self.db.add_indexed_file(
-            file_path=os.path.normpath(file_path),
-            file_hash=file_hash,
-            size=size,
-            modified_date=modified_dt,
-            file_type=file_type,
-            metadata={"source": "optimized_processor"},
-        )
-        if not add_file_resp.get("success"):
+        try:
+            # Index file record
+            add_file_resp = self.db.add_indexed_file(
+                file_path=norm_path,
+                file_hash=file_hash,
+                size=size,
+                modified_date=modified_dt,
+                file_type=file_type,
+                metadata={"source": "optimized_processor"},
+                mtime_ns=stat.st_mtime_ns,
+                inode=stat.st_ino or None,
+            )
+            if not add_file_resp.get("success"):
+                return {
+                    "success": False,
+                    "error": add_file_resp.get("error") or "Failed to index file",
+                }
+            file_id = add_file_resp.get("file_id")
+            if not file_id:
+                return {"success": False, "error": "No file_id returned from DB"}
+
+            # Chunk content
+            chunks = self._chunk_content(text, file_type)
+
+            # Store chunks
+            chunk_ids: list[str] = []
+            stored_texts: list[str] = []
+            for c in chunks:
+                add_chunk_resp = self.db.add_chunk(
+                    file_id=file_id,
+                    chunk_index=c["chunk_index"],
+                    content=c["content"],
+                    start_pos=c["start_pos"],
+                    end_pos=c["end_pos"],
+                    metadata=c.get("metadata") or {"file_type": file_type},
+                )
+                if add_chunk_resp.get("success"):
+                    cid = add_chunk_resp.get("chunk_id")
+                    if isinstance(cid, str):
+                        chunk_ids.append(cid)
+                        stored_texts.append(c["content"])
+                    else:
+                        self.logger.error(
+                            f"Chunk ID missing or invalid for file {file_path}, index {c['chunk_index']}"
+                        )
+                else:
+                    # Continue but record failure
+                    self.logger.error(
+                        f"Failed to add chunk {c['chunk_index']} for {file_path}: {add_chunk_resp.get('error')}"
+                    )
+
+            # Optionally generate embeddings immediately
+            embeddings_generated = 0
+            if self.generate_embeddings and chunk_ids:
+                # Ensure generator is available
+                self._ensure_embedding_generator()
+                if self._embedding_generator:
+                    embeddings_generated = self._generate_and_store_embeddings(
+                        chunk_ids=chunk_ids,
+                        chunk_texts=stored_texts,
+                        progress_callback=None,
+                    )
+
             return {
-                "success": False,
-                "error": add_file_resp.get("error") or "Failed to index file",
+                "success": True,
+                "file_id": file_id,
+                "chunks": [{"chunk_id": cid} for cid in chunk_ids],
+                "stats": {
+                    "action": "processed",
+                    "embeddings_generated": embeddings_generated,
+                    "chunk_count": len(chunk_ids),
+                },
             }
-        file_id = add_file_resp.get("file_id")
-        if not file_id:
-            return {"success": False, "error": "No file_id returned from DB"}
+        except Exception as e:
+            self.logger.error(f"Unexpected error in process_file for {file_path}: {str(e)}")
+            return {"success": False, "error": str(e)}
 
-        # Chunk content
+    def _chunk_content(self, text: str, file_type: str) -> list[dict[str, Any]]:
+        """Split text into chunk dicts according to the configured chunking mode."""
         cs = self.chunk_size or 1000
         ov = self.chunk_overlap or 200
         cs = max(100, int(cs))
         ov = max(0, min(int(ov), cs - 1))
 
         chunks: list[dict[str, Any]] = []
+        if self.chunking_mode == "tokens":
+            generator = self._embedding_generator or get_embedding_generator()
+            budget = generator.max_content_tokens
+            # Keep the configured overlap ratio, expressed in tokens
+            overlap_tokens = budget * ov // cs
+            for chunk in self._chunker.chunk_by_tokens(
+                text,
+                generator.token_offsets,
+                budget,
+                overlap_tokens,
+                language=_CODE_LANGUAGES.get(file_type),
+            ):
+                info = chunk.metadata.additional_info or {}
+                chunks.append(
+                    {
+                        "chunk_index": chunk.metadata.chunk_index,
+                        "content": chunk.content,
+                        "start_pos": chunk.metadata.start_pos,
+                        "end_pos": chunk.metadata.end_pos,
+                        "metadata": {
+                            "file_type": file_type,
+                            "chunk_type": chunk.metadata.chunk_type,
+                            "token_count": info.get("token_count"),
+                        },
+                    }
+                )
+            return chunks
+
         start = 0
         n = len(text)
         idx = 0
@@ -234,58 +381,137 @@ class OptimizedFileProcessor(FileProcessor):
                 break
             start = end - ov
             idx += 1
+        return chunks
 
-        # Store chunks
-        chunk_ids: list[str] = []
-        for c in chunks:
-            add_chunk_resp = self.db.add_chunk(
-                file_id=file_id,
-                chunk_index=c["chunk_index"],
-                content=c["content"],
-                start_pos=c["start_pos"],
-                end_pos=c["end_pos"],
-                metadata={"file_type": file_type},
-            )
-            if add_chunk_resp.get("success"):
-                cid = add_chunk_resp.get("chunk_id")
-                if isinstance(cid, str):
-                    chunk_ids.append(cid)
-                else:
-                    self.logger.error(
-                        f"Chunk ID missing or invalid for file {file_path}, index {c['chunk_index']}"
-                    )
-            else:
-                # Continue but record failure
-                self.logger.error(
-                    f"Failed to add chunk {c['chunk_index']} for {file_path}: {add_chunk_resp.get('error')}"
-                )
+    def reconcile_directory(
+        self,
+        directory: str,
+        recursive: bool = True,
+        file_types: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Fast startup reconciliation of a directory against the index.
 
-            # Optionally generate embeddings immediately
-            embeddings_generated = 0
-            if self.generate_embeddings and chunk_ids:
-                # Ensure generator is available
-                self._ensure_embedding_generator()
-                if self._embedding_generator:
-                    chunk_texts = [c["content"] for c in chunks]
-                    embeddings_generated = self._generate_and_store_embeddings(
-                        chunk_ids=chunk_ids,
-                        chunk_texts=chunk_texts,
-                        progress_callback=None,
-                    )
+        Stat-walks the tree with os.scandir and compares each file's
+        (size, mtime_ns, inode) tuple with the snapshot stored in indexed_files.
+        Only files whose stat tuple changed are hashed; files whose content hash
+        is unchanged just get their snapshot refreshed. No chunking or embedding
+        work is done here.
+
+        Returns:
+            Dict with "added", "changed" and "removed" path lists plus stats
+        """
+        start_time = time.time()
+        if not os.path.isdir(directory):
+            return {"success": False, "error": f"Directory not found: {directory}"}
 
+        validation_result = self.directory_validator.validate_path(directory)
+        if not validation_result.get("valid", False):
             return {
-                "success": True,
-                "file_id": file_id,
-                "chunks": [{"chunk_id": cid} for cid in chunk_ids],
-                "stats": {
-                    "action": "processed",
-                    "embeddings_generated": embeddings_generated,
-                    "chunk_count": len(chunk_ids),
-                },
+                "success": False,
+                "error": f"Directory access denied: {validation_result.get('message')}",
+            }
+
+        if not file_types:
+            file_types = self.extractor_factory.get_supported_extensions()
+        normalized_exts = {
+            ext.lower() if ext.startswith(".") else f".{ext.lower()}" for ext in file_types or []
+        }
+
+        root = os.path.normpath(directory)
+        on_disk = self._scan_stats(root, recursive, normalized_exts)
+        allowed = set(self.directory_validator.get_allowed_files(list(on_disk)))
+
+        prefix = root if root.endswith(os.sep) else root + os.sep
+        snapshots = self.db.get_file_snapshots(prefix)
+        if not recursive:
+            snapshots = {p: s for p, s in snapshots.items() if os.path.dirname(p) == root}
+        if normalized_exts:
+            snapshots = {
+                p: s
+                for p, s in snapshots.items()
+                if os.path.splitext(p)[1].lower() in normalized_exts
             }
-        except Exception as e:
-            self.logger.error(f"Unexpected error in process_file for {file_path}: {str(e)}")
-            return {"success": False, "error": str(e)}
+
+        added: list[str] = []
+        changed: list[str] = []
+        unchanged = 0
+        hashed = 0
+        for path, stat in on_disk.items():
+            if path not in allowed:
+                continue
+            existing = snapshots.get(path)
+            if existing is None:
+                added.append(path)
+            elif self._snapshot_matches(existing, stat):
+                unchanged += 1
+            else:
+                hashed += 1
+                try:
+                    file_hash = self._calculate_file_hash(path)
+                except OSError as e:
+                    self.logger.debug("Hash failed during reconcile for %s: %s", path, str(e))
+                    changed.append(path)
+                    continue
+                if int(existing.get("size") or 0) == stat.st_size and existing.get(
+                    "file_hash"
+                ) == file_hash:
+                    self.db.update_file_snapshot(
+                        path, stat.st_size, stat.st_mtime_ns, stat.st_ino or None
+                    )
+                    unchanged += 1
+                else:
+                    changed.append(path)
+
+        removed = sorted(p for p in snapshots if p not in allowed)
+        added.sort()
+        changed.sort()
+
+        return {
+            "success": True,
+            "added": added,
+            "changed": changed,
+            "removed": removed,
+            "stats": {
+                "scanned": len(on_disk),
+                "added": len(added),
+                "changed": len(changed),
+                "removed": len(removed),
+                "unchanged": unchanged,
+                "hashed": hashed,
+                "scan_time": time.time() - start_time,
+            },
+        }
+
+    def _scan_stats(
+        self, root: str, recursive: bool, normalized_exts: set[str]
+    ) -> dict[str, os.stat_result]:
+        """Collect stat results for matching files using os.scandir."""
+        found: dict[str, os.stat_result] = {}
+        stack = [root]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if recursive:
+                                    stack.append(entry.path)
+                                continue
+                            if not entry.is_file():
+                                continue
+                            if (
+                                normalized_exts
+                                and os.path.splitext(entry.name)[1].lower() not in normalized_exts
+                            ):
+                                continue
+                            found[os.path.normpath(entry.path)] = entry.stat()
+                        except OSError as e:
+                            self.logger.debug("Skipping %s: %s", entry.path, str(e))
+            except OSError as e:
+                self.logger.debug("Cannot scan %s: %s", current, str(e))
+        return found
 
     # Adapter to ensure child dispatch for single-file ingestion
     def run_single(self, file_path: str, *, force_reprocess: bool = False) -> dict[str, Any]:
@@ -306,11 +532,21 @@ class OptimizedFileProcessor(FileProcessor):
         file_types: list[str] | None = None,
         force_reprocess: bool = False,
         progress_callback: Callable[[str, int, int], None] | None = None,
+        reconcile: bool = False,
     ) -> dict[str, Any]:
         """
         Process all files in a directory with parallel processing.
+
+        When reconcile is True (and force_reprocess is False), the directory is
+        first reconciled against stored stat snapshots; only added and changed
+        files are processed and removed files are dropped from the index.
         """
         try:
+            if reconcile and not force_reprocess:
+                return self._process_reconciled(
+                    directory, recursive, file_types, progress_callback
+                )
+
             # Validate directory and get files (same as parent)
             if not os.path.isdir(directory):
                 return {
@@ -343,100 +579,144 @@ class OptimizedFileProcessor(FileProcessor):
                     },
                 }
 
-            # Initialize results
-            results = {
-                "success": True,
-                "processed_files": [],
-                "failed_files": [],
-                "skipped_files": [],
-                "stats": {
-                    "total_files": len(files_to_process),
-                    "processed": 0,
-                    "failed": 0,
-                    "skipped": 0,
-                    "total_chunks": 0,
-                    "total_embeddings": 0,
-                    "processing_time": 0,
-                    "files_per_second": 0,
-                },
-            }
+            return self._run_parallel(files_to_process, force_reprocess, progress_callback)
 
-            start_time = time.time()
+        except Exception as e:
+            self.logger.error("Error processing directory %s: %s", directory, str(e))
+            return {"success": False, "error": f"Unexpected error: {str(e)}"}
 
-            # Process files in parallel
-            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                # Submit all files for processing
-                future_to_file = {
-                    executor.submit(
-                        self._process_file_wrapper,
-                        file_path,
-                        force_reprocess,
-                        i,
-                        len(files_to_process),
-                    ): file_path
-                    for i, file_path in enumerate(files_to_process)
-                }
+    def _run_parallel(
+        self,
+        files_to_process: list[str],
+        force_reprocess: bool,
+        progress_callback: Callable[[str, int, int], None] | None,
+    ) -> dict[str, Any]:
+        """Process the given files on the worker pool and aggregate results."""
+        # Initialize results
+        results = {
+            "success": True,
+            "processed_files": [],
+            "failed_files": [],
+            "skipped_files": [],
+            "stats": {
+                "total_files": len(files_to_process),
+                "processed": 0,
+                "failed": 0,
+                "skipped": 0,
+                "total_chunks": 0,
+                "total_embeddings": 0,
+                "processing_time": 0,
+                "files_per_second": 0,
+            },
+        }
 
-                # Process completed futures
-                for future in concurrent.futures.as_completed(future_to_file):
-                    file_path = future_to_file[future]
+        start_time = time.time()
+
+        # Process files in parallel
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Submit all files for processing
+            future_to_file = {
+                executor.submit(
+                    self._process_file_wrapper,
+                    file_path,
+                    force_reprocess,
+                    i,
+                    len(files_to_process),
+                ): file_path
+                for i, file_path in enumerate(files_to_process)
+            }
 
-                    try:
-                        result = future.result()
-                        self._update_results(results, file_path, result)
+            # Process completed futures
+            for future in concurrent.futures.as_completed(future_to_file):
+                file_path = future_to_file[future]
 
-                        # Update progress
-                        if progress_callback:
-                            processed = (
-                                results["stats"]["processed"]
-                                + results["stats"]["failed"]
-                                + results["stats"]["skipped"]
+                try:
+                    result = future.result()
+                    self._update_results(results, file_path, result)
+
+                    # Update progress
+                    if progress_callback:
+                        processed = (
+                            results["stats"]["processed"]
+                            + results["stats"]["failed"]
+                            + results["stats"]["skipped"]
+                        )
+                        elapsed = time.time() - start_time
+                        if processed > 0:
+                            rate = processed / elapsed
+                            remaining = (len(files_to_process) - processed) / rate
+                            eta = datetime.now() + timedelta(seconds=remaining)
+
+                            progress_callback(
+                                f"Processing files ({processed}/{len(files_to_process)}) ETA: {eta.strftime('%H:%M:%S')}",
+                                processed,
+                                len(files_to_process),
                             )
-                            elapsed = time.time() - start_time
-                            if processed > 0:
-                                rate = processed / elapsed
-                                remaining = (len(files_to_process) - processed) / rate
-                                eta = datetime.now() + timedelta(seconds=remaining)
-
-                                progress_callback(
-                                    f"Processing files ({processed}/{len(files_to_process)}) ETA: {eta.strftime('%H:%M:%S')}",
-                                    processed,
-                                    len(files_to_process),
-                                )
-
-                    except Exception as e:
-                        self.logger.error("Error processing %s: %s", file_path, str(e))
-                        results["failed_files"].append({"file_path": file_path, "error": str(e)})
-                        results["stats"]["failed"] += 1
-
-            # Calculate final statistics
-            end_time = time.time()
-            results["stats"]["processing_time"] = end_time - start_time
-            if results["stats"]["processing_time"] > 0:
-                results["stats"]["files_per_second"] = (
-                    len(files_to_process) / results["stats"]["processing_time"]
-                )
 
-            # Update success status
-            if results["stats"]["failed"] > 0:
-                results["success"] = False
-                results["error"] = (
-                    f"Failed to process {results['stats']['failed']} out of {results['stats']['total_files']} files"
-                )
+                except Exception as e:
+                    self.logger.error("Error processing %s: %s", file_path, str(e))
+                    results["failed_files"].append({"file_path": file_path, "error": str(e)})
+                    results["stats"]["failed"] += 1
+
+        # Calculate final statistics
+        end_time = time.time()
+        results["stats"]["processing_time"] = end_time - start_time
+        if results["stats"]["processing_time"] > 0:
+            results["stats"]["files_per_second"] = (
+                len(files_to_process) / results["stats"]["processing_time"]
+            )
 
-            # Add cache statistics if enabled
-            if self.enable_caching:
-                results["cache_stats"] = {
-                    "file_hash_cache": self.file_hash_cache.get_stats(),
-                    "embedding_cache": self.embedding_cache.get_stats(),
-                    "metadata_cache": self.metadata_cache.get_stats(),
-                }
+        # Update success status
+        if results["stats"]["failed"] > 0:
+            results["success"] = False
+            results["error"] = (
+                f"Failed to process {results['stats']['failed']} out of {results['stats']['total_files']} files"
+            )
 
-            return results
+        # Add cache statistics if enabled
+        if self.enable_caching:
+            results["cache_stats"] = {
+                "file_hash_cache": self.file_hash_cache.get_stats(),
+                "embedding_cache": self.embedding_cache.get_stats(),
+                "metadata_cache": self.metadata_cache.get_stats(),
+            }
 
-        except Exception as e:
-            self.logger.error("Error processing directory %s: %s", directory, str(e))
-            return {"success": False, "error": f"Unexpected error: {str(e)}"}
+        return results
+
+    def _process_reconciled(
+        self,
+        directory: str,
+        recursive: bool,
+        file_types: list[str] | None,
+        progress_callback: Callable[[str, int, int], None] | None,
+    ) -> dict[str, Any]:
+        """Reconcile first, then process only the added and changed files."""
+        delta = self.reconcile_directory(directory, recursive, file_types)
+        if not delta.get("success"):
+            return delta
+
+        if progress_callback:
+            delta_stats = delta["stats"]
+            progress_callback(
+                f"Reconciled {delta_stats['scanned']} files: {delta_stats['added']} added, "
+                f"{delta_stats['changed']} changed, {delta_stats['removed']} removed",
+                0,
+                delta_stats["added"] + delta_stats["changed"],
+            )
+
+        for path in delta["removed"]:
+            self.db.remove_file_from_index(path)
+
+        pending = delta["added"] + delta["changed"]
+        results = self._run_parallel(pending, False, progress_callback)
+        results["reconcile"] = {
+            "added": delta["added"],
+            "changed": delta["changed"],
+            "removed": delta["removed"],
+            "stats": delta["stats"],
+        }
+        results["stats"]["skipped"] += delta["stats"]["unchanged"]
+        return results
 
     def _process_file_wrapper(
         self, file_path: str, force_reprocess: bool, index: int, total: int
@@ -628,7 +908,9 @@ class OptimizedFileProcessor(FileProcessor):
                         total_chunks,
                     )
                 texts = [text for _, _, text in batch]
-                results = self._embedding_generator.generate(texts)
+                results = self._embedding_generator.generate_embeddings_batch(
+                    texts, batch_size=batch_size, show_progress=False
+                )
                 for (i, chunk_id, _), embedding in zip(batch, results):
                     new_embeddings.append((i, chunk_id, embedding))
         return new_embeddings
@@ -639,65 +921,27 @@ class OptimizedFileProcessor(FileProcessor):
         cached_embeddings: list[tuple[int, str, Any]]
     ) -> int:
         count = 0
-        for i, chunk_id, embedding in new_embeddings + cached_embeddings:
+        for _, chunk_id, embedding in new_embeddings + cached_embeddings:
             if self.enable_caching:
                 self.embedding_cache.put(chunk_id, embedding)
-            self._save_embedding(chunk_id, embedding)
-            count += 1
+            if self._save_embedding(chunk_id, embedding):
+                count += 1
         return count
 
-                    # Generate batch embeddings
-                    batch_texts = [item[2] for item in batch]
-                    try:
-                        embeddings = self._embedding_generator.generate_embeddings_batch(
-                            batch_texts,
-                            batch_size=self.embedding_batch_size,
-                            show_progress=False,
-                        )
-
-                        for (idx, chunk_id, _), embedding in zip(batch, embeddings, strict=False):
-                            new_embeddings.append((idx, chunk_id, embedding))
-
-                            # Cache the embedding
-                            if self.enable_caching:
-                                self.embedding_cache.put(chunk_id, embedding)
-
-                    except Exception as e:
-                        self.logger.error(f"Error generating embeddings for batch: {str(e)}")
-
-            # Combine cached and new embeddings in original order
-            all_embeddings = sorted(cached_embeddings + new_embeddings, key=lambda x: x[0])
-
-            # Store all embeddings in database
-            for _, chunk_id, embedding in all_embeddings:
-                try:
-                    result = self.db.add_embedding(
-                        chunk_id=chunk_id,
-                        embedding_vector=(
-                            embedding.tolist() if hasattr(embedding, "tolist") else embedding
-                        ),
-                        model_name=self._embedding_generator.model_name,
-                    )
-
-                    if result["success"]:
-                        embeddings_stored += 1
-                    else:
-                        self.logger.error(
-                            f"Failed to store embedding for {chunk_id}: {result.get('error')}"
-                        )
-
-                except Exception as e:
-                    self.logger.error(f"Error storing embedding for {chunk_id}: {str(e)}")
-
-            self.logger.info(
-                f"Stored {embeddings_stored}/{total_chunks} embeddings ({len(cached_embeddings)} from cache)"
+    def _save_embedding(self, chunk_id: str, embedding: Any) -> bool:
+        """Persist a single embedding vector for a chunk."""
+        try:
+            result = self.db.add_embedding(
+                chunk_id=chunk_id,
+                embedding_vector=(embedding.tolist() if hasattr(embedding, "tolist") else embedding),
+                model_name=self._embedding_generator.model_name,
             )
-
-            return embeddings_stored
-
+            if not result["success"]:
+                self.logger.error(f"Failed to store embedding for {chunk_id}: {result.get('error')}")
+            return bool(result["success"])
         except Exception as e:
-            self.logger.error("Error in embedding generation: %s", str(e))
-            return 0
+            self.logger.error(f"Error storing embedding for {chunk_id}: {str(e)}")
+            return False
 
     def clear_caches(self) -> None:
         """Clear all caches"""
@@ -19,6 +19,7 @@ import numpy as np
 from utils import Logger
 
 from .search_common import compute_cosine_scores, text_similarity  # shared utilities
+from .sharded_index import ShardedEmbeddingIndex, filter_by_directories
 
 # Import RAG components
 from .vector_search import SearchResult, VectorSearchEngine
@@ -147,6 +148,7 @@ class OptimizedVectorSearchEngine(VectorSearchEngine):
     - Efficient top-k selection using heaps
     - Batch embedding loading
     - Pre-computed normalized vectors
+    - Sharded index: scoped searches only touch matching shards
     """
 
     def __init__(
@@ -157,6 +159,8 @@ class OptimizedVectorSearchEngine(VectorSearchEngine):
         cache_ttl: int = 3600,
         enable_caching: bool = True,
         max_workers: int | None = None,
+        reranker=None,
+        use_shards: bool = True,
     ):
         """
         Initialize OptimizedVectorSearchEngine.
@@ -166,8 +170,11 @@ class OptimizedVectorSearchEngine(VectorSearchEngine):
             cache_ttl: Cache time-to-live in seconds
             enable_caching: Whether to enable result caching
             max_workers: Maximum number of parallel workers
+            reranker: Optional second-stage reranker applied by hybrid_search
+            use_shards: Search a per-directory/file-type sharded index instead
+                        of scanning all embeddings
         """
-        super().__init__(user_name, embedding_generator)
+        super().__init__(user_name, embedding_generator, reranker)
 
         # Caching
         self.enable_caching = enable_caching
@@ -182,6 +189,13 @@ class OptimizedVectorSearchEngine(VectorSearchEngine):
         self._embeddings_cache_time = 0
         self._cache_refresh_interval = 300  # 5 minutes
 
+        # Sharded index (keyed by allowed directory and file type)
+        self.shard_index: ShardedEmbeddingIndex | None = None
+        if use_shards:
+            self.shard_index = ShardedEmbeddingIndex(
+                self.db, self.max_workers, self._cache_refresh_interval
+            )
+
         self.logger.info(
             f"OptimizedVectorSearchEngine initialized with caching={'enabled' if enable_caching else 'disabled'}, max_workers={self.max_workers}"
         )
@@ -193,9 +207,13 @@ class OptimizedVectorSearchEngine(VectorSearchEngine):
         similarity_threshold: float | None = None,
         file_types: list[str] | None = None,
         distance_metric: str = "cosine",
+        directories: list[str] | None = None,
     ) -> list[SearchResult]:
         """
         Perform optimized vector similarity search.
+
+        Additional Args:
+            directories: Optional list of directories to restrict results to
         """
         try:
             # Check cache first
@@ -205,6 +223,7 @@ class OptimizedVectorSearchEngine(VectorSearchEngine):
                     "threshold": similarity_threshold,
                     "file_types": file_types,
                     "metric": distance_metric,
+                    "directories": directories,
                 }
                 cached_results = self.search_cache.get(query, cache_params)
                 if cached_results is not None:
@@ -213,9 +232,29 @@ class OptimizedVectorSearchEngine(VectorSearchEngine):
 
             # Generate query embedding
             query_embedding = self.embedding_generator.generate_embedding(query, normalize=True)
+            threshold = similarity_threshold or self.DEFAULT_SIMILARITY_THRESHOLD
+
+            if self.shard_index is not None:
+                # Fan out to the relevant shards only and heap-merge their top-k
+                scored = self.shard_index.search(
+                    query_embedding,
+                    top_k,
+                    threshold,
+                    file_types=file_types,
+                    directories=directories,
+                    distance_metric=distance_metric,
+                )
+                # Hits come back merged and sorted by score descending
+                results = [self._to_search_result(score, emb_data) for score, emb_data in scored]
+                self.logger.info("Vector search found %d results", len(results))
+                if self.enable_caching:
+                    self.search_cache.put(query, cache_params, results)
+                return results
 
             # Get embeddings (with caching)
             all_embeddings = self._get_cached_embeddings(file_types)
+            if directories:
+                all_embeddings = filter_by_directories(all_embeddings, directories)
 
             if not all_embeddings:
                 self.logger.info("No embeddings found in database")
@@ -226,7 +265,7 @@ class OptimizedVectorSearchEngine(VectorSearchEngine):
                 query_embedding,
                 all_embeddings,
                 top_k,
-                similarity_threshold or self.DEFAULT_SIMILARITY_THRESHOLD,
+                threshold,
                 distance_metric,
             )
 
@@ -337,43 +376,30 @@ class OptimizedVectorSearchEngine(VectorSearchEngine):
     def _get_top_k_results(
         self, scored_results: list[tuple[float, dict[str, Any]]], top_k: int
     ) -> list[SearchResult]:
-        """Efficiently get top-k results using a heap"""
-        # Use negative scores for max heap
-        heap = []
-
-        for score, emb_data in scored_results:
-            if len(heap) < top_k:
-                heapq.heappush(heap, (-score, emb_data))
-            elif score > -heap[0][0]:
-                heapq.heapreplace(heap, (-score, emb_data))
-
-        # Extract results in descending order
-        results = []
-        while heap:
-            neg_score, emb_data = heapq.heappop(heap)
-            score = -neg_score
-
-            result = SearchResult(
-                chunk_id=emb_data["chunk_id"],
-                file_id=emb_data["file_id"],
-                file_path=emb_data["file_path"],
-                content=emb_data["content"],
-                score=score,
-                chunk_index=emb_data["chunk_index"],
-                start_pos=emb_data["start_pos"],
-                end_pos=emb_data["end_pos"],
-                file_type=emb_data.get("file_type"),
-                metadata=emb_data.get("chunk_metadata"),
-                match_type="vector",
-            )
-            results.append(result)
-
-        # Reverse to get descending order
-        results.reverse()
+        """Efficiently get top-k results, best first"""
+        # Keyed on the score alone: ties must never fall through to comparing dicts
+        top = heapq.nlargest(top_k, scored_results, key=lambda item: item[0])
+        results = [self._to_search_result(score, emb_data) for score, emb_data in top]
 
         self.logger.info("Vector search found %d results", len(results))
         return results
 
+    def _to_search_result(self, score: float, emb_data: dict[str, Any]) -> SearchResult:
+        """Build a vector SearchResult from a scored embedding row"""
+        return SearchResult(
+            chunk_id=emb_data["chunk_id"],
+            file_id=emb_data["file_id"],
+            file_path=emb_data["file_path"],
+            content=emb_data["content"],
+            score=score,
+            chunk_index=emb_data["chunk_index"],
+            start_pos=emb_data["start_pos"],
+            end_pos=emb_data["end_pos"],
+            file_type=emb_data.get("file_type"),
+            metadata=emb_data.get("chunk_metadata"),
+            match_type="vector",
+        )
+
     def hybrid_search(
         self,
         query: str,
@@ -383,9 +409,13 @@ class OptimizedVectorSearchEngine(VectorSearchEngine):
         similarity_threshold: float | None = None,
         file_types: list[str] | None = None,
         rerank: bool = True,
+        directories: list[str] | None = None,
     ) -> list[SearchResult]:
         """
         Optimized hybrid search with parallel execution.
+
+        Additional Args:
+            directories: Optional list of directories to restrict results to
         """
         try:
             # Check cache for hybrid results
@@ -397,6 +427,8 @@ class OptimizedVectorSearchEngine(VectorSearchEngine):
                     "threshold": similarity_threshold,
                     "file_types": file_types,
                     "rerank": rerank,
+                    "reranker": getattr(self.reranker, "name", None),
+                    "directories": directories,
                     "type": "hybrid",
                 }
                 cached_results = self.search_cache.get(query, cache_params)
@@ -408,23 +440,31 @@ class OptimizedVectorSearchEngine(VectorSearchEngine):
             vector_weight = vector_weight / total_weight
             keyword_weight = keyword_weight / total_weight
 
+            # Retrieve wide when a second-stage reranker will narrow the results
+            fetch_k = self._candidate_fetch_k(top_k, rerank)
+
             # Execute searches in parallel
             with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
                 # Submit both searches
                 vector_future = executor.submit(
                     self.search,
                     query,
-                    top_k * 2,  # Get more for merging
+                    fetch_k,  # Get more for merging
                     similarity_threshold,
                     file_types,
+                    "cosine",
+                    directories,
                 )
 
-                keyword_future = executor.submit(self.keyword_search, query, top_k * 2, file_types)
+                keyword_future = executor.submit(self.keyword_search, query, fetch_k, file_types)
 
                 # Get results
                 vector_results = vector_future.result()
                 keyword_results = keyword_future.result()
 
+            if directories:
+                keyword_results = filter_by_directories(keyword_results, directories)
+
             # Merge results
             merged_results = self._merge_search_results(
                 vector_results, keyword_results, vector_weight, keyword_weight
@@ -432,7 +472,7 @@ class OptimizedVectorSearchEngine(VectorSearchEngine):
 
             # Rerank if requested
             if rerank and merged_results:
-                merged_results = self.rerank_results(query, merged_results, top_k=top_k)
+                merged_results = self._rerank_stages(query, merged_results, top_k)
             else:
                 merged_results = merged_results[:top_k]
 
@@ -495,6 +535,8 @@ class OptimizedVectorSearchEngine(VectorSearchEngine):
             self.search_cache.clear()
         self._embeddings_cache = None
         self._embeddings_cache_time = 0
+        if self.shard_index is not None:
+            self.shard_index.invalidate()
         self.logger.info("Search caches cleared")
 
     def get_performance_stats(self) -> dict[str, Any]:
@@ -507,6 +549,12 @@ class OptimizedVectorSearchEngine(VectorSearchEngine):
         if self.enable_caching:
             stats["search_cache"] = self.search_cache.get_stats()
 
+        if self.reranker is not None:
+            stats["reranker"] = self.reranker.get_stats()
+
+        if self.shard_index is not None:
+            stats["shard_index"] = self.shard_index.get_stats()
+
         if self._embeddings_cache is not None:
             stats["embeddings_cache"] = {
                 "size": len(self._embeddings_cache),
@@ -531,7 +579,8 @@ class OptimizedVectorSearchEngine(VectorSearchEngine):
         self.logger.info("Warming up cache with %d queries", len(common_queries))
 
         # Load embeddings into cache
-        self._get_cached_embeddings()
+        if self.shard_index is None:
+            self._get_cached_embeddings()
 
         # Perform searches to populate cache
         for query in common_queries:
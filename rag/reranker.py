@@ -0,0 +1,411 @@
+"""
+Second-stage reranking for RAG hybrid search.
+
+Rescores the top-M fused candidates with either a small local cross-encoder
+(loaded lazily, like EmbeddingGenerator) or a cheap lexical-proximity model.
+Every call runs under a latency budget: candidates are scored in batches, and
+each batch (the first included) is sized from a running per-candidate cost
+estimate so it fits the time left, so hybrid search can retrieve wide and
+return narrow.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import re
+import threading
+import time
+from dataclasses import replace
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+# Import logging from DinoAir's logger
+from utils.logger import Logger
+
+from .search_common import STOP_WORDS
+
+if TYPE_CHECKING:
+    from .vector_search import SearchResult
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+# Reranker kinds accepted by create_reranker / DINOAIR_RAG_RERANKER
+RERANKER_KINDS = ("none", "lexical", "cross-encoder")
+
+
+class LexicalProximityReranker:
+    """
+    Cheap lexical reranker: rewards query-term coverage, exact phrase matches
+    and how tightly the matched terms cluster together in the passage.
+    """
+
+    name = "lexical"
+
+    # Default second-stage parameters
+    DEFAULT_CANDIDATE_POOL = 100  # top-M candidates rescored
+    DEFAULT_BUDGET_MS = 50.0  # per-request latency budget
+    DEFAULT_BATCH_SIZE = 32
+    DEFAULT_SCORE_WEIGHT = 0.7  # weight of rerank score vs fused score
+
+    def __init__(
+        self,
+        candidate_pool: int = DEFAULT_CANDIDATE_POOL,
+        budget_ms: float = DEFAULT_BUDGET_MS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        score_weight: float = DEFAULT_SCORE_WEIGHT,
+    ):
+        """
+        Initialize the reranker.
+
+        Args:
+            candidate_pool: Number of fused candidates to rescore (top-M)
+            budget_ms: Latency budget per rerank call in milliseconds
+            batch_size: Number of candidates scored per batch
+            score_weight: Weight of the rerank score in the final score (0-1)
+        """
+        self.logger = Logger()
+        self.candidate_pool = max(1, int(candidate_pool))
+        self.budget_ms = max(0.0, float(budget_ms))
+        self.batch_size = max(1, int(batch_size))
+        self.score_weight = min(1.0, max(0.0, float(score_weight)))
+
+        self._stats_lock = threading.Lock()
+        self._calls = 0
+        self._budget_exhausted = 0
+        self._candidates_scored = 0
+        # Running estimate of seconds per candidate for _score_batch (None = unknown)
+        self._item_seconds: float | None = None
+
+    def rerank(
+        self, query: str, results: list[SearchResult], top_k: int | None = None
+    ) -> list[SearchResult]:
+        """
+        Rescore the top candidates and return the best top_k.
+
+        Candidates are scored in fused-rank order, batch by batch. Before
+        each batch, the first included, the batch is shrunk to what the
+        per-candidate cost estimate says fits in the remaining budget;
+        scoring stops when nothing fits. Scored candidates are ordered by
+        their blended score; any left unscored follow in their fused order.
+
+        Args:
+            query: Original search query
+            results: Fused candidates, best first
+            top_k: Number of results to return (None for all)
+
+        Returns:
+            Reranked list of SearchResult objects
+        """
+        if not results:
+            return []
+
+        deadline = time.perf_counter() + self.budget_ms / 1000.0
+        candidates = results[: self.candidate_pool]
+        scored: list[SearchResult] = []
+        exhausted = False
+        fallback = False
+
+        position = 0
+        while position < len(candidates):
+            remaining = deadline - time.perf_counter()
+            size = self.batch_size if fallback else self._fitting_batch(remaining)
+            if size < 1 and not scored and self._can_fall_back():
+                # Not even one candidate fits the primary scorer: rank this
+                # call lexically rather than not at all
+                fallback = True
+                size = self.batch_size
+            if remaining <= 0 or size < 1:
+                exhausted = True
+                break
+            batch = candidates[position : position + size]
+            position += len(batch)
+            if fallback:
+                scores = self._lexical_scores(query, batch)
+            else:
+                scores = self._score_batch(query, batch)
+            for result, rerank_score in zip(batch, scores, strict=False):
+                scored.append(self._rescored(result, rerank_score))
+
+        scored.sort(key=lambda r: r.score, reverse=True)
+        reranked = scored + candidates[position:]
+
+        with self._stats_lock:
+            self._calls += 1
+            self._candidates_scored += len(scored)
+            if exhausted:
+                self._budget_exhausted += 1
+        if exhausted:
+            self.logger.debug(
+                "Rerank budget of %.0fms reached after %d/%d candidates",
+                self.budget_ms,
+                len(scored),
+                len(candidates),
+            )
+
+        return reranked[:top_k] if top_k else reranked
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get reranker statistics"""
+        with self._stats_lock:
+            return {
+                "reranker": self.name,
+                "calls": self._calls,
+                "candidates_scored": self._candidates_scored,
+                "budget_exhausted": self._budget_exhausted,
+                "budget_ms": self.budget_ms,
+                "candidate_pool": self.candidate_pool,
+                "item_ms": (
+                    round(self._item_seconds * 1000.0, 4)
+                    if self._item_seconds is not None
+                    else None
+                ),
+            }
+
+    def _fitting_batch(self, remaining: float) -> int:
+        """Largest batch (up to batch_size) the cost estimate fits into remaining seconds."""
+        estimate = self._item_seconds
+        if estimate is None or estimate <= 0.0:
+            return self.batch_size
+        return min(self.batch_size, int(remaining / estimate))
+
+    def _record_cost(self, items: int, seconds: float) -> None:
+        """Fold a measured batch into the per-candidate cost estimate."""
+        if items < 1:
+            return
+        per_item = seconds / items
+        with self._stats_lock:
+            previous = self._item_seconds
+            self._item_seconds = (
+                per_item if previous is None else 0.7 * previous + 0.3 * per_item
+            )
+
+    def _can_fall_back(self) -> bool:
+        """Whether a call can be ranked lexically when _score_batch does not fit."""
+        return False
+
+    def _rescored(self, result: SearchResult, rerank_score: float) -> SearchResult:
+        """Copy a result with its blended score, keeping the fused score in metadata."""
+        metadata = dict(result.metadata or {})
+        metadata["fused_score"] = result.score
+        metadata["rerank_score"] = rerank_score
+        blended = self.score_weight * rerank_score + (1.0 - self.score_weight) * result.score
+        return replace(result, score=min(1.0, blended), metadata=metadata)
+
+    def _score_batch(self, query: str, batch: list[SearchResult]) -> list[float]:
+        """Score a batch of candidates in [0, 1]."""
+        started = time.perf_counter()
+        scores = self._lexical_scores(query, batch)
+        self._record_cost(len(batch), time.perf_counter() - started)
+        return scores
+
+    @staticmethod
+    def _lexical_scores(query: str, batch: list[SearchResult]) -> list[float]:
+        """Coverage, phrase and proximity scores for a batch of candidates."""
+        query_lower = query.lower()
+        terms = [t for t in _WORD_PATTERN.findall(query_lower) if t not in STOP_WORDS]
+        if not terms:
+            terms = _WORD_PATTERN.findall(query_lower)
+        unique_terms = set(terms)
+        if not unique_terms:
+            return [0.0 for _ in batch]
+
+        scores: list[float] = []
+        for result in batch:
+            content_lower = result.content.lower()
+            # Last position of each matched term while scanning; proximity is
+            # the densest window (distinct terms per word) ending at a match
+            last_seen: dict[str, int] = {}
+            proximity = 0.0
+            for position, word in enumerate(_WORD_PATTERN.findall(content_lower)):
+                if word in unique_terms:
+                    last_seen[word] = position
+                    span = position - min(last_seen.values()) + 1
+                    proximity = max(proximity, len(last_seen) / (span * len(unique_terms)) ** 0.5)
+
+            coverage = len(last_seen) / len(unique_terms)
+            phrase = 1.0 if len(terms) > 1 and query_lower in content_lower else 0.0
+
+            scores.append(min(1.0, 0.6 * coverage + 0.25 * proximity + 0.15 * phrase))
+        return scores
+
+
+class CrossEncoderReranker(LexicalProximityReranker):
+    """
+    Cross-encoder reranker using a small local sentence-transformers model.
+
+    The model loads lazily in a background thread on first use; until it is
+    ready, requests are served by the lexical scorer. A probe batch measured
+    while loading seeds the per-candidate cost estimate, so the budget check
+    holds from the first model batch; a call whose budget cannot fit even one
+    model-scored candidate is ranked lexically.
+    """
+
+    name = "cross-encoder"
+
+    DEFAULT_MODEL = "cross-encoder/ms-marco-MiniLM-L-6-v2"  # ~90MB
+    DEFAULT_BUDGET_MS = 150.0
+    DEFAULT_MAX_LENGTH = 256
+
+    # Model cache directory (next to the embedding model cache)
+    MODEL_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".dinoair", "models", "rerankers")
+
+    def __init__(
+        self,
+        model_name: str | None = None,
+        device: str | None = None,
+        candidate_pool: int = LexicalProximityReranker.DEFAULT_CANDIDATE_POOL,
+        budget_ms: float = DEFAULT_BUDGET_MS,
+        batch_size: int = LexicalProximityReranker.DEFAULT_BATCH_SIZE,
+        score_weight: float = LexicalProximityReranker.DEFAULT_SCORE_WEIGHT,
+        max_length: int = DEFAULT_MAX_LENGTH,
+    ):
+        """
+        Initialize the CrossEncoderReranker.
+
+        Additional Args:
+            model_name: Name of the cross-encoder model to use
+            device: Device to use ('cuda', 'cpu', or None for auto-detect)
+            max_length: Maximum sequence length for query/passage pairs
+        """
+        super().__init__(candidate_pool, budget_ms, batch_size, score_weight)
+        self.model_name = model_name or self.DEFAULT_MODEL
+        self.device = device
+        self.max_length = max_length
+
+        # Lazy loading state
+        self._model = None
+        self._load_lock = threading.Lock()
+        self._load_thread: threading.Thread | None = None
+        self._load_failed = False
+        self._fallback_calls = 0
+
+    @property
+    def model_ready(self) -> bool:
+        """True once the cross-encoder weights are loaded."""
+        return self._model is not None
+
+    def warmup(self, wait: bool = True) -> None:
+        """
+        Start loading the model, optionally blocking until it is ready.
+
+        Args:
+            wait: Whether to block until loading finishes
+        """
+        self._ensure_loading()
+        thread = self._load_thread
+        if wait and thread is not None:
+            thread.join()
+
+    def _ensure_loading(self) -> None:
+        """Kick off a background model load exactly once."""
+        if self._model is not None or self._load_failed:
+            return
+        with self._load_lock:
+            if self._load_thread is None:
+                self._load_thread = threading.Thread(
+                    target=self._load_model, name="cross-encoder-loader", daemon=True
+                )
+                self._load_thread.start()
+
+    def _load_model(self) -> None:
+        """Load the cross-encoder model."""
+        try:
+            self.logger.info("Loading reranker model: %s", self.model_name)
+
+            # Import sentence-transformers only when needed
+            from sentence_transformers import CrossEncoder
+
+            os.makedirs(self.MODEL_CACHE_DIR, exist_ok=True)
+            model = CrossEncoder(
+                self.model_name,
+                max_length=self.max_length,
+                device=self.device,
+                cache_folder=self.MODEL_CACHE_DIR,
+            )
+
+            # Measure a full-length batch before serving requests, so the
+            # budget check knows the model's cost before its first batch
+            probe = [("warm up", " ".join(["warm up"] * self.max_length))] * self.batch_size
+            started = time.perf_counter()
+            model.predict(probe, batch_size=len(probe), show_progress_bar=False)
+            self._record_cost(len(probe), time.perf_counter() - started)
+
+            self._model = model
+            self.logger.info("Reranker model loaded: %s", self.model_name)
+        except Exception as e:
+            self._load_failed = True
+            self.logger.warning(
+                "Cross-encoder unavailable, using lexical reranking instead: %s", str(e)
+            )
+
+    def _score_batch(self, query: str, batch: list[SearchResult]) -> list[float]:
+        """Score a batch with the cross-encoder, or lexically while it loads."""
+        model = self._model
+        if model is None:
+            self._ensure_loading()
+            with self._stats_lock:
+                self._fallback_calls += 1
+            return self._lexical_scores(query, batch)
+
+        pairs = [(query, result.content) for result in batch]
+        started = time.perf_counter()
+        logits = model.predict(pairs, batch_size=len(pairs), show_progress_bar=False)
+        self._record_cost(len(pairs), time.perf_counter() - started)
+        # ms-marco cross-encoders emit logits; squash into [0, 1]
+        return [1.0 / (1.0 + math.exp(-float(logit))) for logit in logits]
+
+    def _can_fall_back(self) -> bool:
+        return self._model is not None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get reranker statistics including model state"""
+        stats = super().get_stats()
+        stats.update(
+            {
+                "model_name": self.model_name,
+                "model_loaded": self._model is not None,
+                "load_failed": self._load_failed,
+                "lexical_fallback_batches": self._fallback_calls,
+            }
+        )
+        return stats
+
+
+def create_reranker(kind: str | None = None, **kwargs: Any) -> LexicalProximityReranker | None:
+    """
+    Build a second-stage reranker by kind.
+
+    Args:
+        kind: 'none', 'lexical' or 'cross-encoder'. When None, reads
+              DINOAIR_RAG_RERANKER (default 'none').
+        **kwargs: Passed to the reranker constructor
+
+    Returns:
+        Reranker instance, or None when reranking is disabled
+    """
+    if kind is None:
+        kind = os.getenv("DINOAIR_RAG_RERANKER", "none")
+    kind = (kind or "none").strip().lower()
+    if kind == "none":
+        return None
+    if kind == "lexical":
+        return LexicalProximityReranker(**kwargs)
+    if kind == "cross-encoder":
+        return get_cross_encoder_reranker(**kwargs)
+    raise ValueError(f"Unknown reranker kind {kind!r}; expected one of {RERANKER_KINDS}")
+
+
+# Cached function for getting a shared cross-encoder reranker
+@lru_cache(maxsize=1)
+def get_cross_encoder_reranker(**kwargs: Any) -> CrossEncoderReranker:
+    """
+    Get a cached CrossEncoderReranker so the model is loaded only once.
+
+    Args:
+        **kwargs: Constructor arguments (must be identical for caching)
+
+    Returns:
+        Cached CrossEncoderReranker instance
+    """
+    return CrossEncoderReranker(**kwargs)
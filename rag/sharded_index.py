@@ -0,0 +1,429 @@
+"""
+Sharded in-memory vector index for RAG search.
+
+Embeddings are partitioned into shards keyed by (allowed directory, file
+type), using the directories registered via FileSearchDB.add_allowed_directory.
+Shards load lazily as dense matrices, and a search fans out only to the shards
+its file type / directory filters can match. Scoped searches therefore load
+and score only the part of the corpus they touch.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import heapq
+import itertools
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, cast
+
+import numpy as np
+
+# Import DinoAir components
+from utils import Logger
+
+if TYPE_CHECKING:
+    from database.file_search_db import FileSearchDB
+
+# Root used for files outside every allowed directory
+UNSCOPED_ROOT = ""
+
+# SQLite limits host parameters per statement; load shard rows in batches
+_ID_BATCH = 500
+
+
+def normalize_file_type(file_type: str | None) -> str:
+    """Normalize a file type or extension ('.PY', 'py') to the stored form ('py')."""
+    return (file_type or "").strip().lstrip(".").lower() or "unknown"
+
+
+def _normalize_dir(directory: str) -> str:
+    return os.path.normcase(os.path.abspath(directory))
+
+
+def _is_within(path: str, directory: str) -> bool:
+    """True if path equals or lies under directory (both normalized)."""
+    return path == directory or path.startswith(directory.rstrip(os.sep) + os.sep)
+
+
+def filter_by_directories(items: list[Any], directories: list[str]) -> list[Any]:
+    """
+    Keep embedding rows or SearchResults whose file lies under a directory.
+
+    Args:
+        items: Row dictionaries or objects with a file_path attribute
+        directories: Directories to keep
+
+    Returns:
+        Filtered list in the original order
+    """
+    dirs = [_normalize_dir(d) for d in directories]
+    kept = []
+    for item in items:
+        path = item["file_path"] if isinstance(item, dict) else item.file_path
+        if any(_is_within(_normalize_dir(path), d) for d in dirs):
+            kept.append(item)
+    return kept
+
+
+@dataclass
+class _Shard:
+    """One partition of the index; vectors are loaded on first search."""
+
+    root: str
+    file_type: str
+    file_ids: list[str] = field(default_factory=list)
+    # (matrix (n, dim) float32, norms (n,), rows) swapped in as one tuple
+    data: tuple[np.ndarray, np.ndarray, list[dict[str, Any]]] | None = None
+    loaded_at: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+
+class ShardedEmbeddingIndex:
+    """
+    Embedding index partitioned by allowed directory and file type.
+    """
+
+    def __init__(
+        self,
+        db: FileSearchDB,
+        max_workers: int | None = None,
+        refresh_interval: float = 300.0,
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            db: FileSearchDB to load embeddings from
+            max_workers: Maximum number of shards searched in parallel
+            refresh_interval: Seconds before the catalog and loaded shards
+                              are considered stale
+        """
+        self.logger = Logger()
+        self.db = db
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.refresh_interval = refresh_interval
+
+        self._lock = threading.RLock()
+        self._shards: dict[tuple[str, str], _Shard] = {}
+        self._roots: list[str] = []
+        self._catalog_time = 0.0
+        self._executor: concurrent.futures.ThreadPoolExecutor | None = None
+
+        # Statistics
+        self._searches = 0
+        self._shards_searched = 0
+        self._rows_scored = 0
+
+    # ------------------------------------------------------------------
+    # Catalog
+    # ------------------------------------------------------------------
+    def _allowed_roots(self) -> list[str]:
+        """Allowed directories, longest first so nested roots win."""
+        try:
+            result = self.db.get_search_settings("allowed_directories")
+        except Exception as e:
+            self.logger.debug("Could not read allowed directories: %s", str(e))
+            return []
+        dirs = result.get("setting_value") if result.get("success") else None
+        if not isinstance(dirs, list):
+            return []
+        roots = {_normalize_dir(d) for d in dirs if isinstance(d, str) and d}
+        return sorted(roots, key=len, reverse=True)
+
+    def _root_for(self, file_path: str) -> str:
+        path = _normalize_dir(file_path)
+        for root in self._roots:
+            if _is_within(path, root):
+                return root
+        return UNSCOPED_ROOT
+
+    def _ensure_catalog(self) -> None:
+        """Assign every active file to its shard (no vectors are read)."""
+        with self._lock:
+            if self._shards and time.time() - self._catalog_time <= self.refresh_interval:
+                return
+
+            self._roots = self._allowed_roots()
+            shards: dict[tuple[str, str], _Shard] = {}
+            conn_cm = cast("Any", self.db.get_connection())
+            with conn_cm as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT id, file_path, file_type FROM indexed_files WHERE status = 'active'"
+                )
+                for file_id, file_path, file_type in cursor.fetchall():
+                    key = (self._root_for(file_path), normalize_file_type(file_type))
+                    shard = shards.get(key)
+                    if shard is None:
+                        shard = shards[key] = _Shard(root=key[0], file_type=key[1])
+                    shard.file_ids.append(str(file_id))
+
+            # Keep already loaded vectors for shards whose membership is unchanged
+            for key, shard in shards.items():
+                old = self._shards.get(key)
+                if old is not None and old.data is not None and old.file_ids == shard.file_ids:
+                    shards[key] = old
+
+            self._shards = shards
+            self._catalog_time = time.time()
+            self.logger.debug(
+                "Shard catalog built: %d shards over %d roots", len(shards), len(self._roots)
+            )
+
+    def invalidate(self, directory: str | None = None) -> None:
+        """
+        Drop loaded shards so they reload on next search.
+
+        Args:
+            directory: Only drop shards for the allowed directory containing
+                       this path (None drops everything, including the catalog)
+        """
+        with self._lock:
+            if directory is None:
+                self._shards = {}
+                self._catalog_time = 0.0
+                return
+            root = self._root_for(directory)
+            for shard in self._shards.values():
+                if shard.root == root:
+                    shard.data = None
+            self._catalog_time = 0.0
+
+    # ------------------------------------------------------------------
+    # Shard loading
+    # ------------------------------------------------------------------
+    def _load_shard(self, shard: _Shard) -> None:
+        """Load a shard's vectors and row metadata from the database."""
+        rows: list[dict[str, Any]] = []
+        vectors: list[list[float]] = []
+        conn_cm = cast("Any", self.db.get_connection())
+        with conn_cm as conn:
+            cursor = conn.cursor()
+            for start in range(0, len(shard.file_ids), _ID_BATCH):
+                batch = shard.file_ids[start : start + _ID_BATCH]
+                placeholders = ",".join("?" for _ in batch)
+                cursor.execute(
+                    f"""
+                    SELECT
+                        e.chunk_id,
+                        e.embedding_vector,
+                        c.file_id,
+                        c.chunk_index,
+                        c.content,
+                        c.start_pos,
+                        c.end_pos,
+                        c.metadata as chunk_metadata,
+                        f.file_path,
+                        f.file_type
+                    FROM file_embeddings e
+                    JOIN file_chunks c ON e.chunk_id = c.id
+                    JOIN indexed_files f ON c.file_id = f.id
+                    WHERE c.file_id IN ({placeholders})
+                    """,
+                    batch,
+                )
+                columns = [desc[0] for desc in cursor.description]
+                for raw in cursor.fetchall():
+                    row = dict(zip(columns, raw, strict=False))
+                    try:
+                        vector = [float(x) for x in json.loads(row.pop("embedding_vector"))]
+                    except (ValueError, TypeError):
+                        self.logger.warning(
+                            "Skipping invalid embedding for chunk_id=%s", row.get("chunk_id")
+                        )
+                        continue
+                    if vectors and len(vector) != len(vectors[0]):
+                        self.logger.warning(
+                            "Skipping embedding with mismatched dimension for chunk_id=%s",
+                            row.get("chunk_id"),
+                        )
+                        continue
+                    if row.get("chunk_metadata"):
+                        try:
+                            row["chunk_metadata"] = json.loads(row["chunk_metadata"])
+                        except json.JSONDecodeError:
+                            row["chunk_metadata"] = None
+                    vectors.append(vector)
+                    rows.append(row)
+
+        matrix = np.asarray(vectors, dtype=np.float32).reshape(len(vectors), -1)
+        shard.data = (matrix, np.linalg.norm(matrix, axis=1), rows)
+        shard.loaded_at = time.time()
+
+    def _shard_data(self, shard: _Shard) -> tuple[np.ndarray, np.ndarray, list[dict[str, Any]]]:
+        if shard.data is None or time.time() - shard.loaded_at > self.refresh_interval:
+            # Per-shard lock: first loads of different shards proceed in parallel
+            with shard.lock:
+                if shard.data is None or time.time() - shard.loaded_at > self.refresh_interval:
+                    self._load_shard(shard)
+        return cast("tuple[np.ndarray, np.ndarray, list[dict[str, Any]]]", shard.data)
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+    def select_shards(
+        self,
+        file_types: list[str] | None = None,
+        directories: list[str] | None = None,
+    ) -> list[_Shard]:
+        """
+        Shards that may hold matches for the given filters.
+
+        Args:
+            file_types: Optional file types to restrict to
+            directories: Optional directories to restrict to
+
+        Returns:
+            List of matching shards
+        """
+        self._ensure_catalog()
+        types = {normalize_file_type(t) for t in file_types} if file_types else None
+        dirs = [_normalize_dir(d) for d in directories] if directories else None
+
+        # A directory reaches the shards rooted inside it plus the shards of the
+        # most specific root containing it (files are assigned to that root)
+        owners = {self._root_for(d) for d in dirs} if dirs is not None else set()
+
+        selected = []
+        for shard in self._shards.values():
+            if types is not None and shard.file_type not in types:
+                continue
+            if dirs is not None and shard.root not in owners:
+                if shard.root == UNSCOPED_ROOT or not any(_is_within(shard.root, d) for d in dirs):
+                    continue
+            selected.append(shard)
+        return selected
+
+    def search(
+        self,
+        query_embedding: Any,
+        top_k: int,
+        similarity_threshold: float,
+        file_types: list[str] | None = None,
+        directories: list[str] | None = None,
+        distance_metric: str = "cosine",
+    ) -> list[tuple[float, dict[str, Any]]]:
+        """
+        Fan the query out to the relevant shards and merge their top-k.
+
+        Args:
+            query_embedding: Query vector
+            top_k: Number of results to return
+            similarity_threshold: Minimum similarity score
+            file_types: Optional file type filter
+            directories: Optional directory filter
+            distance_metric: 'cosine' or 'euclidean'
+
+        Returns:
+            List of (score, row) pairs sorted by score descending
+        """
+        if top_k <= 0:
+            return []
+        shards = self.select_shards(file_types, directories)
+        if not shards:
+            return []
+
+        query = np.asarray(query_embedding, dtype=np.float32).ravel()
+        dirs = [_normalize_dir(d) for d in directories] if directories else None
+        args = (query, top_k, similarity_threshold, dirs, distance_metric)
+
+        if len(shards) == 1:
+            partials = [self._search_shard(shards[0], *args)]
+        else:
+            executor = self._get_executor()
+            futures = [executor.submit(self._search_shard, shard, *args) for shard in shards]
+            partials = []
+            for future in futures:
+                try:
+                    partials.append(future.result())
+                except Exception as e:
+                    self.logger.error("Error searching shard: %s", str(e))
+
+        with self._lock:
+            self._searches += 1
+            self._shards_searched += len(shards)
+            self._rows_scored += sum(rows for _, rows in partials)
+
+        # Each partial is already sorted; merge lazily and stop at top_k
+        merged = heapq.merge(*(hits for hits, _ in partials), key=lambda hit: -hit[0])
+        return list(itertools.islice(merged, top_k))
+
+    def _search_shard(
+        self,
+        shard: _Shard,
+        query: np.ndarray,
+        top_k: int,
+        threshold: float,
+        dirs: list[str] | None,
+        distance_metric: str,
+    ) -> tuple[list[tuple[float, dict[str, Any]]], int]:
+        """Score one shard; returns its sorted top-k and the number of rows scored."""
+        matrix, norms, rows = self._shard_data(shard)
+        if not rows or matrix.shape[1] != query.shape[0]:
+            return [], 0
+
+        dots = matrix @ query
+        query_norm = float(np.linalg.norm(query))
+        if distance_metric == "euclidean":
+            sq = np.maximum(norms**2 + query_norm**2 - 2.0 * dots, 0.0)
+            scores = 1.0 / (1.0 + np.sqrt(sq))
+        else:
+            denom = norms * query_norm
+            scores = np.divide(dots, denom, out=np.zeros_like(dots), where=denom > 0.0)
+
+        # Directory filter inside a shard only matters when the requested
+        # directory is narrower than the shard root (or the shard is unscoped)
+        if dirs is not None and not any(
+            shard.root != UNSCOPED_ROOT and _is_within(shard.root, d) for d in dirs
+        ):
+            mask = np.fromiter(
+                (
+                    any(_is_within(_normalize_dir(r["file_path"]), d) for d in dirs)
+                    for r in rows
+                ),
+                dtype=bool,
+                count=len(rows),
+            )
+            scores = np.where(mask, scores, -np.inf)
+
+        candidates = np.flatnonzero(scores >= threshold)
+        if candidates.size > top_k:
+            top = np.argpartition(scores[candidates], -top_k)[-top_k:]
+            candidates = candidates[top]
+        ordered = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(float(scores[i]), rows[i]) for i in ordered], len(rows)
+
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="rag-shard"
+                )
+            return self._executor
+
+    def close(self) -> None:
+        """Shut down the fan-out thread pool."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get shard and fan-out statistics"""
+        with self._lock:
+            loaded = [s.data for s in self._shards.values() if s.data is not None]
+            return {
+                "shards": len(self._shards),
+                "loaded_shards": len(loaded),
+                "loaded_rows": sum(len(data[2]) for data in loaded),
+                "roots": len(self._roots),
+                "searches": self._searches,
+                "avg_shards_per_search": (
+                    self._shards_searched / self._searches if self._searches else 0.0
+                ),
+                "rows_scored": self._rows_scored,
+            }
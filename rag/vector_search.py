@@ -6,7 +6,7 @@ Provides vector similarity search and hybrid search capabilities.
 import json
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 import numpy as np
 
@@ -19,6 +19,9 @@ from utils.logger import Logger
 from .embedding_generator import EmbeddingGenerator, get_embedding_generator
 from .search_common import compute_cosine_scores, extract_keywords  # shared utilities
 
+if TYPE_CHECKING:
+    from .reranker import LexicalProximityReranker
+
 
 @dataclass
 class SearchResult:
@@ -53,6 +56,7 @@ class VectorSearchEngine:
         self,
         user_name: str | None = None,
         embedding_generator: EmbeddingGenerator | None = None,
+        reranker: "LexicalProximityReranker | None" = None,
     ):
         """
         Initialize the VectorSearchEngine.
@@ -60,6 +64,7 @@ class VectorSearchEngine:
         Args:
             user_name: Username for database operations
             embedding_generator: Optional pre-configured embedding generator
+            reranker: Optional second-stage reranker applied by hybrid_search
         """
         self.logger = Logger()
         self.user_name = user_name
@@ -71,6 +76,8 @@ class VectorSearchEngine:
         else:
             self.embedding_generator = get_embedding_generator()
 
+        self.reranker = reranker
+
         self.logger.info("VectorSearchEngine initialized")
 
     @staticmethod
@@ -405,7 +412,8 @@ class VectorSearchEngine:
             keyword_weight: Weight for keyword match scores
             similarity_threshold: Minimum similarity for vector search
             file_types: Filter by file types
-            rerank: Whether to rerank results
+            rerank: Whether to rerank results (including the second-stage
+                    reranker, when one is configured)
 
         Returns:
             List of SearchResult objects with combined scores
@@ -416,16 +424,19 @@ class VectorSearchEngine:
             vector_weight = vector_weight / total_weight
             keyword_weight = keyword_weight / total_weight
 
+            # Retrieve wide when a second-stage reranker will narrow the results
+            fetch_k = self._candidate_fetch_k(top_k, rerank)
+
             # Perform vector search
             vector_results = self.search(
                 query,
-                top_k=top_k * 2,  # Get more results for merging
+                top_k=fetch_k,  # Get more results for merging
                 similarity_threshold=similarity_threshold,
                 file_types=file_types,
             )
 
             # Perform keyword search
-            keyword_results = self.keyword_search(query, top_k=top_k * 2, file_types=file_types)
+            keyword_results = self.keyword_search(query, top_k=fetch_k, file_types=file_types)
 
             # Merge results
             merged_results = self._merge_search_results(
@@ -434,7 +445,7 @@ class VectorSearchEngine:
 
             # Rerank if requested
             if rerank and merged_results:
-                merged_results = self.rerank_results(query, merged_results, top_k=top_k)
+                merged_results = self._rerank_stages(query, merged_results, top_k)
             else:
                 # Just take top k
                 merged_results = merged_results[:top_k]
@@ -447,6 +458,25 @@ class VectorSearchEngine:
             self.logger.error("Error performing hybrid search: %s", str(e))
             return []
 
+    def _candidate_fetch_k(self, top_k: int, rerank: bool) -> int:
+        """Number of candidates to fetch from each retriever before merging."""
+        if rerank and self.reranker is not None:
+            return max(top_k * 2, self.reranker.candidate_pool)
+        return top_k * 2
+
+    def _rerank_stages(
+        self, query: str, merged_results: list[SearchResult], top_k: int
+    ) -> list[SearchResult]:
+        """Apply the fused-score rerank, then the second-stage reranker if configured."""
+        if self.reranker is None:
+            return self.rerank_results(query, merged_results, top_k=top_k)
+        fused = self.rerank_results(query, merged_results, top_k=None)
+        try:
+            return self.reranker.rerank(query, fused, top_k=top_k)
+        except Exception as e:
+            self.logger.error("Second-stage rerank failed, using fused order: %s", str(e))
+            return fused[:top_k]
+
     def rerank_results(
         self,
         query: str,
@@ -8,7 +8,13 @@ This top-level package exposes minimal, lightweight conveniences.
 from __future__ import annotations
 
 from .adapters import ServiceAdapter, make_adapter
-from .errors import AdapterError, NoHealthyService, ServiceNotFound, ValidationError
+from .errors import (
+    AdapterError,
+    NoHealthyService,
+    RateLimitExceeded,
+    ServiceNotFound,
+    ValidationError,
+)
 from .health import HealthState
 from .metrics import record_error, record_success
 from .metrics import snapshot as metrics_snapshot
@@ -20,6 +26,7 @@ __all__ = [
     "ServiceNotFound",
     "NoHealthyService",
     "ValidationError",
+    "RateLimitExceeded",
     "AdapterError",
     # health
     "HealthState",
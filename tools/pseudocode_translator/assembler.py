@@ -14,7 +14,7 @@ import re
 from collections import OrderedDict
 from typing import TYPE_CHECKING, TypedDict
 
-from .ast_cache import parse_cached
+from .analysis_context import analysis_for, nodes_of_type, parse_source
 from .exceptions import AssemblyError, ErrorContext
 from .models import BlockType, CodeBlock
 
@@ -387,24 +387,8 @@ class CodeAssembler:
     # --- Incremental assembly helpers (private; used only by assemble_incremental) ---
 
     def _scan_existing_symbols(self, tree: ast.AST) -> tuple[set[str], set[str], set[str]]:
-        existing_imports: set[str] = set()
-        existing_functions: set[str] = set()
-        existing_classes: set[str] = set()
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    existing_imports.add(f"import {alias.name}")
-            elif isinstance(node, ast.ImportFrom):
-                module = node.module or ""
-                for alias in node.names:
-                    existing_imports.add(f"from {module} import {alias.name}")
-            elif isinstance(node, ast.FunctionDef):
-                existing_functions.add(node.name)
-            elif isinstance(node, ast.ClassDef):
-                existing_classes.add(node.name)
-
-        return existing_imports, existing_functions, existing_classes
+        symbols = analysis_for(tree).symbols
+        return set(symbols.imports), set(symbols.functions), set(symbols.classes)
 
     def _build_incremental_context(
         self,
@@ -436,7 +420,7 @@ class CodeAssembler:
         include by default to preserve previous behavior.
         """
         try:
-            tree = parse_cached(code)
+            tree = parse_source(code)
             name = self._first_named_node(tree, expected_node)
             return name not in existing_names if name else True
         except (SyntaxError, ValueError, TypeError):
@@ -458,7 +442,7 @@ class CodeAssembler:
             the original fallback behavior.
         """
         try:
-            tree = parse_cached(previous_code)
+            tree = parse_source(previous_code)
 
             existing_imports, existing_functions, existing_classes = self._scan_existing_symbols(
                 tree
@@ -679,9 +663,9 @@ class CodeAssembler:
             from_imports: Dictionary to accumulate from-import statements by category and module.
         """
         try:
-            tree = parse_cached(block.content)
+            tree = parse_source(block.content)
 
-            for node in ast.walk(tree):
+            for node in nodes_of_type(tree, ast.Import, ast.ImportFrom):
                 if isinstance(node, ast.Import):
                     self._accumulate_import_node(node.names, imports)
 
@@ -903,7 +887,7 @@ class CodeAssembler:
 
         for block in blocks:
             try:
-                tree = parse_cached(block.content)
+                tree = parse_source(block.content)
                 # Check for module docstring with identical semantics
                 if isinstance(tree, ast.Module):
                     self._maybe_set_module_docstring(tree, sections)
@@ -952,7 +936,7 @@ class CodeAssembler:
         for func_code in functions:
             try:
                 # Parse function to get its name
-                tree = parse_cached(func_code)
+                tree = parse_source(func_code)
                 if func_name := self._first_function_name(tree):
                     # If duplicate, keep the later definition
                     # (assumed to be more complete)
@@ -987,7 +971,7 @@ class CodeAssembler:
 
         for class_code in classes:
             try:
-                tree = parse_cached(class_code)
+                tree = parse_source(class_code)
                 if class_name := self._first_class_name(tree):
                     unique_classes[class_name] = class_code
                 else:
@@ -1444,24 +1428,8 @@ class CodeAssembler:
         if hasattr(tree, "body") and node in tree.body:
             return True
 
-        # Walk the tree to find the node's parent
-        for parent_node in ast.walk(tree):
-            # Check if node is inside a function or class
-            if isinstance(parent_node, ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef):
-                # Check if our node is within this function/class
-                for child in ast.walk(parent_node):
-                    if child is node:
-                        return False
-
-        # If we get here, it's likely top-level
-        return True
-
-    def _usage_pattern(self, name: str) -> str:
-        """
-        Build the exact regex string used to detect a callsite for a common name.
-        Equivalent to the inline construction rf"\\b{name}\\s*\\(" with identical semantics.
-        """
-        return rf"\b{name}\s*\("
+        # Follow the parent map up to the module looking for a function/class
+        return not analysis_for(tree).in_definition(node)
 
     def _already_imported_standard(
         self,
@@ -1512,11 +1480,25 @@ class CodeAssembler:
         # Combine all code for analysis
         all_code = "\n".join(block.content for block in blocks)
 
+        # Find every used name in one pass instead of one search per name. The
+        # lookahead is zero-width so each position is tried, as re.search(name)
+        # would; only one name can be followed by "(" at a given position.
+        names = sorted(
+            {name for common_names in self.common_imports.values() for name in common_names},
+            key=len,
+            reverse=True,
+        )
+        used_names: set[str] = set()
+        if names:
+            alternation = "|".join(re.escape(name) for name in names)
+            used_names = {
+                m.group(1) for m in re.finditer(rf"\b(?=({alternation})\s*\()", all_code)
+            }
+
         for module, common_names in self.common_imports.items():
             for name in common_names:
                 # Check if the name is used in the code
-                pattern = self._usage_pattern(name)
-                if re.search(pattern, all_code):
+                if name in used_names:
                     # Check if already imported
                     if self._already_imported_standard(module, name, imports, from_imports):
                         continue
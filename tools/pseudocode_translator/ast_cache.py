@@ -3,13 +3,16 @@ AST Cache module for the Pseudocode Translator
 
 Provides a thread-safe LRU cache with TTL, size limits, and persistent storage
 for AST parsing results to improve performance by avoiding redundant parsing.
+Persistent entries live in a SegmentedASTStore (see ast_store.py) and are
+loaded lazily on first use.
 """
 
 import ast
+import contextlib
 import hashlib
 
-# Use the standard library 'json' module for serialization instead of 'pickle' to avoid
-# arbitrary code execution vulnerabilities. JSON only allows safe data types.
+# The legacy single-document cache format is JSON (never pickle); it is only
+# read to migrate it into the segmented store.
 import json
 import logging
 import shutil
@@ -20,6 +23,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from .ast_store import SegmentedASTStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -147,6 +152,7 @@ class ASTCache:
         persistent_path: str | Path | None = None,
         enable_compression: bool = True,
         eviction_mode: str = "lru",
+        max_disk_entries: int = 50_000,
     ):
         """
         Initialize the AST cache.
@@ -160,6 +166,7 @@ class ASTCache:
                 (None = memory only)
             enable_compression: Enable compression for persistent storage
             eviction_mode: Eviction policy to use: "lru" (default) or "lfu_lite"
+            max_disk_entries: Maximum entries kept in persistent storage
         """
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
@@ -184,6 +191,11 @@ class ASTCache:
 
         # Persistent storage setup
         self.persistent_path = None
+        self.max_disk_entries = max(1, int(max_disk_entries))
+        self._store: SegmentedASTStore | None = None
+        # New entries not yet appended to the store
+        self._pending: dict[str, CacheEntry] = {}
+        self._flush_lock = threading.Lock()
         if persistent_path:
             self.persistent_path = Path(persistent_path)
             self._setup_persistent_storage()
@@ -230,6 +242,13 @@ class ASTCache:
                 get_recorder().record_event("cache", counters={"hit": 1})  # counters: "hit"
                 return entry.ast_obj
 
+        # Not in memory; persistent entries are loaded on first use
+        entry = self._load_persistent_entry(cache_key)
+        if entry is not None:
+            self._record_persistent_hit()
+            return entry.ast_obj
+
+        with self._lock:
             # Not in cache, parse it
             self._misses += 1
             # Telemetry: increment-only cache miss counter.
@@ -289,6 +308,12 @@ class ASTCache:
                 get_recorder().record_event("cache", counters={"hit": 1})  # counters: "hit"
                 return entry.ast_obj
 
+        entry = self._load_persistent_entry(cache_key)
+        if entry is not None:
+            self._record_persistent_hit()
+            return entry.ast_obj
+
+        with self._lock:
             self._misses += 1
             # Telemetry: increment-only cache miss counter (no-op when disabled).
             from pseudocode_translator.telemetry import (  # lazy import to avoid overhead when disabled
@@ -329,13 +354,19 @@ class ASTCache:
         """Clear all entries from the cache."""
         with self._lock:
             self._cache.clear()
+            self._pending.clear()
             self._current_memory_usage = 0
 
         # Clear persistent storage if enabled
         if self.persistent_path and self.persistent_path.exists():
             try:
-                shutil.rmtree(self.persistent_path)
-                self._setup_persistent_storage()
+                with self._flush_lock:
+                    if self._store is not None:
+                        self._store.close()
+                        self._store = None
+                    shutil.rmtree(self.persistent_path)
+                    self._setup_persistent_storage()
+                    self._open_store()
             except Exception as e:
                 logger.warning(f"Failed to clear persistent cache: {e}")
 
@@ -373,6 +404,7 @@ class ASTCache:
                 "ttl_enabled": self.ttl_seconds is not None,
                 "ttl_seconds": self.ttl_seconds,
                 "persistent_enabled": self.persistent_path is not None,
+                "persistent_entries": len(self._store) if self._store is not None else 0,
                 "eviction_mode": self.eviction_mode,
                 "hot_entries": [
                     {
@@ -395,66 +427,110 @@ class ASTCache:
 
     def save_to_disk(self) -> bool:
         """
-        Save current cache to disk.
+        Write cached entries that are not yet on disk to the persistent store.
+
+        Writes are incremental: only new entries are appended. The store is
+        compacted once superseded records make up half of it or it grows past
+        max_disk_entries.
 
         Returns:
             True if successful, False otherwise
         """
-        if not self.persistent_path:
+        if not self.persistent_path or self._store is None:
             return False
 
         try:
             with self._lock:
-                # Create temporary file
-                temp_file = self.persistent_path / "cache.tmp"
-
-                # Prepare data for serialization
-                cache_data = {
-                    "version": 1,
-                    "entries": {},
-                    "stats": {
-                        "hits": self._hits,
-                        "misses": self._misses,
-                        "evictions": self._evictions,
-                    },
-                }
-
-                # Persist AST nodes directly (format v2): store "ast" instead of legacy "code"
-                # This aligns with loader expectations and avoids mismatches.
-                for key, entry in self._cache.items():
-                    try:
-                        # Persist the AST node as JSON-serializable dict (security improvement)
-                        # Replaced unsafe pickle with secure JSON serialization
-                        cache_data["entries"][key] = {
-                            "ast": _ast_to_dict(entry.ast_obj),
-                            "timestamp": entry.timestamp,
-                            "size_bytes": entry.size_bytes,
-                            "access_count": entry.access_count,
-                        }
-                    except Exception as e:
-                        logger.debug(f"Skipping cache entry {key[:8]}...: {e}")
-
-                # Save to disk using secure JSON serialization instead of unsafe pickle
-                # Security improvement: JSON cannot execute arbitrary code during deserialization
-                if self.enable_compression:
-                    import gzip
-
-                    gz_file = temp_file.with_suffix(".json.gz")
-                    with gzip.open(gz_file, "wt", encoding="utf-8") as gz:
-                        json.dump(cache_data, gz, indent=None, separators=(",", ":"))
-                    gz_file.rename(self.persistent_path / "cache.json.gz")
-                else:
-                    with open(temp_file.with_suffix(".json"), "w", encoding="utf-8") as f:
-                        json.dump(cache_data, f, indent=None, separators=(",", ":"))
-                    temp_file.with_suffix(".json").rename(self.persistent_path / "cache.json")
-
-                logger.info(f"Saved {len(cache_data['entries'])} entries to disk")
-                return True
+                store = self._store
+                items = [
+                    (key, entry.ast_obj, entry.timestamp, entry.size_bytes)
+                    for key, entry in self._cache.items()
+                    if key in self._pending or key not in store
+                ]
+                self._pending.clear()
+            with self._flush_lock:
+                written = store.put_many(items)
+                if len(store) > self.max_disk_entries or store.garbage_ratio > 0.5:
+                    store.compact(max_entries=self.max_disk_entries, keep=self._is_store_entry_valid)
+            if written:
+                logger.debug(f"Saved {written} entries to disk")
+            return True
 
         except Exception as e:
             logger.error(f"Failed to save cache to disk: {e}")
             return False
 
+    def _flush_pending(self) -> None:
+        """Append pending entries to the store (background writer)."""
+        if self._store is None:
+            return
+        with self._lock:
+            items = [
+                (key, entry.ast_obj, entry.timestamp, entry.size_bytes)
+                for key, entry in self._pending.items()
+            ]
+            self._pending.clear()
+        if not items:
+            return
+        try:
+            with self._flush_lock:
+                store = self._store
+                if store is None:
+                    return
+                store.put_many(items)
+                if len(store) > self.max_disk_entries or store.garbage_ratio > 0.5:
+                    store.compact(max_entries=self.max_disk_entries, keep=self._is_store_entry_valid)
+        except Exception as e:
+            logger.error(f"Failed to save cache to disk: {e}")
+
+    def _open_store(self) -> None:
+        if not self.persistent_path:
+            return
+        try:
+            self._store = SegmentedASTStore(self.persistent_path, compress=self.enable_compression)
+        except Exception as e:
+            logger.error(f"Failed to open persistent cache: {e}")
+            self._store = None
+
+    def _is_store_entry_valid(self, store_entry: Any) -> bool:
+        if not self.ttl_seconds:
+            return True
+        return (time.time() - store_entry.timestamp) <= self.ttl_seconds
+
+    def _load_persistent_entry(self, cache_key: str) -> CacheEntry | None:
+        """Decode a persistent entry into the in-memory cache; None if unavailable."""
+        store = self._store
+        if store is None or cache_key not in store:
+            return None
+        loaded = store.get(cache_key)
+        if loaded is None:
+            return None
+        ast_obj, store_entry = loaded
+        if not self._is_store_entry_valid(store_entry):
+            return None
+
+        entry = CacheEntry(
+            ast_obj=ast_obj,
+            timestamp=store_entry.timestamp,
+            size_bytes=store_entry.size_bytes,
+        )
+        with self._lock:
+            existing = self._get_valid_entry(cache_key)
+            if existing is not None:
+                entry = existing
+            else:
+                self._add_entry(cache_key, entry, persist=False)
+            self._cache.move_to_end(cache_key)
+            entry.update_access()
+            self._hits += 1
+        return entry
+
+    @staticmethod
+    def _record_persistent_hit() -> None:
+        from pseudocode_translator.telemetry import get_recorder  # lazy import
+
+        get_recorder().record_event("cache", counters={"hit": 1, "disk_hit": 1})
+
     def _setup_persistent_storage(self) -> None:
         """Setup persistent storage directory"""
         if not self.persistent_path:
@@ -466,21 +542,40 @@ class ASTCache:
             self.persistent_path = None
 
     def _load_from_disk(self) -> None:
-        """Load cache from disk if available"""
+        """Open the persistent store; entries are read lazily on first use.
+
+        A legacy single-file JSON cache is loaded once and migrated into the
+        store.
+        """
         if not self.persistent_path:
             return
 
-        cache_file = self.persistent_path / "cache.json"
-        if self.enable_compression:
-            cache_file = cache_file.with_suffix(".json.gz")
+        self._open_store()
+        if self._store is None:
+            return
+
+        migrated = False
+        for name in ("cache.json.gz", "cache.json"):
+            legacy = self.persistent_path / name
+            if legacy.exists():
+                self._load_legacy_json(legacy)
+                migrated = True
+                with contextlib.suppress(OSError):
+                    legacy.unlink()
+        if migrated:
+            with self._lock:
+                self._pending.update(self._cache)
+            self._flush_pending()
 
+    def _load_legacy_json(self, cache_file: Path) -> None:
+        """Load a cache.json(.gz) file written by the previous single-document format"""
         if not cache_file.exists():
             return
 
         try:
             # Load using secure JSON deserialization instead of unsafe pickle
             # Security improvement: JSON cannot execute arbitrary code
-            if self.enable_compression:
+            if cache_file.suffix == ".gz":
                 import gzip
 
                 with gzip.open(cache_file, "rt", encoding="utf-8") as gz:
@@ -548,7 +643,7 @@ class ASTCache:
         except Exception as e:
             logger.warning(f"Failed to load cache from disk: {e}")
 
-    def _add_entry(self, cache_key: str, entry: CacheEntry) -> None:
+    def _add_entry(self, cache_key: str, entry: CacheEntry, persist: bool = True) -> None:
         """Add an entry to the cache with eviction handling"""
         # Check if we need to evict based on memory (policy-based eviction)
         while self._current_memory_usage + entry.size_bytes > self.max_memory_bytes and self._cache:
@@ -563,10 +658,11 @@ class ASTCache:
         self._cache.move_to_end(cache_key)
         self._current_memory_usage += entry.size_bytes
 
-        # Save to disk if persistent storage is enabled
-        if self.persistent_path and len(self._cache) % 10 == 0:
-            # Save every 10 entries
-            threading.Thread(target=self.save_to_disk, daemon=True).start()
+        # Append new entries to persistent storage in batches of 10
+        if persist and self._store is not None:
+            self._pending[cache_key] = entry
+            if len(self._pending) >= 10:
+                threading.Thread(target=self._flush_pending, daemon=True).start()
 
     def _select_victim(self, reason: str) -> tuple[str, CacheEntry] | None:
         """
@@ -0,0 +1,467 @@
+"""
+Segmented on-disk store for the AST cache.
+
+Layout of a store directory:
+
+- ``ast.log``: append-only data log; each record is one AST encoded as
+  nested tuples with ``marshal`` (optionally zlib-compressed)
+- ``ast.idx``: index of fixed-size entries (key digest, offset, length,
+  crc32, timestamp, size estimate, flags): a header, a section sorted by
+  key, then entries appended since the index was last rewritten
+
+Opening a store reads the index bytes but only decodes the appended tail;
+keys in the sorted section are found by binary search, so a warm start with
+tens of thousands of entries takes milliseconds. Records are read and
+decoded on first ``get``. Writes append to both files; the tail is merged
+into the sorted section once it grows, and ``compact()`` rewrites the live
+records into fresh files, dropping superseded ones.
+
+The store is a local cache: records are checked against their crc32 and
+decoded only into AST nodes and plain literals, but the directory should
+not be shared with untrusted writers.
+"""
+
+from __future__ import annotations
+
+import ast
+import logging
+import marshal
+import os
+import struct
+import sys
+import threading
+import zlib
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+# Bump when the record encoding changes; node field layouts also depend on
+# the Python version, which is part of the header
+FORMAT_VERSION = 1
+
+_MAGIC = b"PTAST"
+# magic, format version, python major/minor, sorted entries, sorted record bytes
+_HEADER = struct.Struct("<5sBBBIQ")
+# key digest, offset, length, crc32, timestamp, size_bytes, flags
+_ENTRY = struct.Struct("<32sQIIdIB")
+_FLAG_ZLIB = 1
+_KEY_SIZE = 32
+# Tail entries tolerated before the index is re-sorted
+_MIN_TAIL_MERGE = 1024
+
+_LITERAL_TYPES = (str, int, float, complex, bytes, bool, type(None), type(Ellipsis))
+_NODE_TYPES: dict[str, type] = {}
+
+
+class StoreEntry(NamedTuple):
+    """Index entry for one record in the data log."""
+
+    offset: int
+    length: int
+    crc: int
+    timestamp: float
+    size_bytes: int
+    flags: int
+
+
+def encode_ast(node: Any) -> Any:
+    """Encode an AST as nested tuples of marshal-able literals.
+
+    A node becomes ``(class name, *fields, *attributes)``; a literal tuple
+    (e.g. a folded Constant) becomes ``("", tuple)``.
+    """
+    if isinstance(node, ast.AST):
+        cls = type(node)
+        return (
+            cls.__name__,
+            *[encode_ast(getattr(node, name, None)) for name in cls._fields],
+            *[getattr(node, name, None) for name in cls._attributes],
+        )
+    if isinstance(node, list):
+        return [encode_ast(item) for item in node]
+    if isinstance(node, tuple):
+        return ("", node)
+    return node
+
+
+def _node_type(name: str) -> type:
+    cls = _NODE_TYPES.get(name)
+    if cls is None:
+        cls = getattr(ast, name, None)
+        if not (isinstance(cls, type) and issubclass(cls, ast.AST)):
+            raise ValueError(f"Unknown AST node type: {name}")
+        _NODE_TYPES[name] = cls
+    return cls
+
+
+def decode_ast(data: Any) -> Any:
+    """Inverse of encode_ast; rejects anything but AST nodes and plain literals."""
+    if isinstance(data, tuple):
+        if not data or not isinstance(data[0], str):
+            raise ValueError("Malformed AST record")
+        if data[0] == "":
+            value = data[1]
+            if not isinstance(value, tuple) or not all(
+                isinstance(item, _LITERAL_TYPES) for item in value
+            ):
+                raise ValueError("Malformed literal tuple in AST record")
+            return value
+
+        cls = _node_type(data[0])
+        fields = cls._fields
+        attributes = cls._attributes
+        if len(data) != 1 + len(fields) + len(attributes):
+            raise ValueError(f"Field count mismatch for {data[0]}")
+        node = cls()
+        for name, value in zip(fields, data[1 : 1 + len(fields)], strict=True):
+            setattr(node, name, decode_ast(value))
+        for name, value in zip(attributes, data[1 + len(fields) :], strict=True):
+            if value is not None and not isinstance(value, int):
+                raise ValueError(f"Invalid {name} in AST record")
+            setattr(node, name, value)
+        return node
+    if isinstance(data, list):
+        return [decode_ast(item) for item in data]
+    if isinstance(data, _LITERAL_TYPES):
+        return data
+    raise ValueError(f"Unexpected {type(data).__name__} in AST record")
+
+
+class SegmentedASTStore:
+    """Content-addressed AST records with a lazily read data log."""
+
+    LOG_NAME = "ast.log"
+    INDEX_NAME = "ast.idx"
+
+    def __init__(self, directory: str | Path, compress: bool = True):
+        """
+        Open (or create) a store and read its index.
+
+        Args:
+            directory: Store directory; created if missing
+            compress: zlib-compress records written from now on
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.log_path = self.directory / self.LOG_NAME
+        self.index_path = self.directory / self.INDEX_NAME
+        self.compress = compress
+
+        self._lock = threading.RLock()
+        # Sorted section of the index (raw entries) and its entry count
+        self._sorted = b""
+        self._sorted_count = 0
+        # Entries appended after the sorted section; they win over it
+        self._tail: dict[bytes, StoreEntry] = {}
+        # Sorted-section keys dropped as unreadable
+        self._dead: set[bytes] = set()
+        self._count = 0
+        self._reader: Any = None
+        self._log_size = 0
+        self._live_bytes = 0
+        self._open()
+
+    # ----- lifecycle -----
+
+    @staticmethod
+    def _header(sorted_count: int = 0, sorted_bytes: int = 0) -> bytes:
+        return _HEADER.pack(_MAGIC, FORMAT_VERSION, *sys.version_info[:2], sorted_count, sorted_bytes)
+
+    def _open(self) -> None:
+        self._log_size = self.log_path.stat().st_size if self.log_path.exists() else 0
+        data = self.index_path.read_bytes() if self.index_path.exists() else b""
+
+        expected = self._header()[:8]
+        if len(data) < _HEADER.size or data[:8] != expected:
+            if data or self._log_size:
+                logger.info("AST store format changed; starting a new store")
+            self._reset_files()
+            return
+
+        *_, sorted_count, sorted_bytes = _HEADER.unpack_from(data)
+        sorted_end = _HEADER.size + sorted_count * _ENTRY.size
+        if sorted_end > len(data) or sorted_bytes > self._log_size:
+            logger.info("AST store index is damaged; starting a new store")
+            self._reset_files()
+            return
+
+        self._sorted = data[_HEADER.size : sorted_end]
+        self._sorted_count = sorted_count
+        self._tail = {}
+        self._dead = set()
+        self._count = sorted_count
+        self._live_bytes = sorted_bytes
+
+        tail = memoryview(data)[sorted_end:]
+        # A torn trailing entry from an interrupted append is ignored
+        usable = len(tail) - len(tail) % _ENTRY.size
+        if usable != len(tail):
+            # Keep later appends aligned to entry boundaries
+            with open(self.index_path, "r+b") as f:
+                f.truncate(sorted_end + usable)
+        for digest, *meta in _ENTRY.iter_unpack(tail[:usable]):
+            entry = StoreEntry(*meta)
+            if entry.offset + entry.length <= self._log_size:
+                self._insert(digest, entry)
+
+    def _reset_files(self) -> None:
+        self._close_reader()
+        self.log_path.write_bytes(b"")
+        self.index_path.write_bytes(self._header())
+        self._sorted = b""
+        self._sorted_count = 0
+        self._tail = {}
+        self._dead = set()
+        self._count = 0
+        self._log_size = 0
+        self._live_bytes = 0
+
+    def _close_reader(self) -> None:
+        if self._reader is not None:
+            try:
+                self._reader.close()
+            except OSError:
+                pass
+            self._reader = None
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_reader()
+
+    # ----- index -----
+
+    def _find_sorted(self, digest: bytes) -> StoreEntry | None:
+        """Binary search the sorted section."""
+        data = self._sorted
+        size = _ENTRY.size
+        lo, hi = 0, self._sorted_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = mid * size
+            key = data[start : start + _KEY_SIZE]
+            if key < digest:
+                lo = mid + 1
+            elif key > digest:
+                hi = mid
+            else:
+                return StoreEntry(*_ENTRY.unpack_from(data, start)[1:])
+        return None
+
+    def _lookup(self, digest: bytes) -> StoreEntry | None:
+        entry = self._tail.get(digest)
+        if entry is not None:
+            return entry
+        if digest in self._dead:
+            return None
+        return self._find_sorted(digest)
+
+    def _insert(self, digest: bytes, entry: StoreEntry) -> None:
+        previous = self._lookup(digest)
+        if previous is None:
+            self._count += 1
+        else:
+            self._live_bytes -= previous.length
+        self._tail[digest] = entry
+        self._live_bytes += entry.length
+
+    def _drop(self, digest: bytes) -> None:
+        entry = self._lookup(digest)
+        if entry is None:
+            return
+        self._tail.pop(digest, None)
+        self._dead.add(digest)
+        self._count -= 1
+        self._live_bytes -= entry.length
+
+    def _entries(self) -> list[tuple[bytes, StoreEntry]]:
+        """All live (digest, entry) pairs."""
+        out = [
+            (digest, StoreEntry(*meta))
+            for digest, *meta in _ENTRY.iter_unpack(self._sorted)
+            if digest not in self._tail and digest not in self._dead
+        ]
+        out.extend(self._tail.items())
+        return out
+
+    def _write_index(self, entries: list[tuple[bytes, StoreEntry]]) -> None:
+        """Rewrite the index with entries as its sorted section."""
+        entries = sorted(entries, key=lambda item: item[0])
+        body = b"".join(_ENTRY.pack(digest, *entry) for digest, entry in entries)
+        live_bytes = sum(entry.length for _, entry in entries)
+        tmp_index = self.index_path.with_suffix(".idx.tmp")
+        tmp_index.write_bytes(self._header(len(entries), live_bytes) + body)
+        os.replace(tmp_index, self.index_path)
+
+        self._sorted = body
+        self._sorted_count = len(entries)
+        self._tail = {}
+        self._dead = set()
+        self._count = len(entries)
+        self._live_bytes = live_bytes
+
+    def merge_index(self) -> None:
+        """Fold appended index entries into the sorted section."""
+        with self._lock:
+            try:
+                self._write_index(self._entries())
+            except OSError as e:
+                logger.warning(f"AST store index merge failed: {e}")
+
+    @property
+    def needs_index_merge(self) -> bool:
+        return len(self._tail) + len(self._dead) > max(_MIN_TAIL_MERGE, self._sorted_count // 8)
+
+    # ----- queries -----
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, key: str) -> bool:
+        return self._lookup(bytes.fromhex(key)) is not None
+
+    def entry(self, key: str) -> StoreEntry | None:
+        return self._lookup(bytes.fromhex(key))
+
+    @property
+    def garbage_ratio(self) -> float:
+        """Share of the data log taken by superseded records."""
+        if not self._log_size:
+            return 0.0
+        return 1.0 - self._live_bytes / self._log_size
+
+    def get(self, key: str) -> tuple[Any, StoreEntry] | None:
+        """
+        Read and decode one record.
+
+        Returns:
+            (AST object, index entry), or None if absent or unreadable
+        """
+        digest = bytes.fromhex(key)
+        with self._lock:
+            entry = self._lookup(digest)
+            if entry is None:
+                return None
+            try:
+                if self._reader is None:
+                    self._reader = open(self.log_path, "rb")  # noqa: SIM115
+                self._reader.seek(entry.offset)
+                payload = self._reader.read(entry.length)
+            except OSError as e:
+                logger.debug(f"Failed to read AST record {key[:8]}...: {e}")
+                return None
+
+        try:
+            if len(payload) != entry.length or zlib.crc32(payload) != entry.crc:
+                raise ValueError("checksum mismatch")
+            if entry.flags & _FLAG_ZLIB:
+                payload = zlib.decompress(payload)
+            return decode_ast(marshal.loads(payload)), entry
+        except Exception as e:
+            logger.debug(f"Dropping unreadable AST record {key[:8]}...: {e}")
+            with self._lock:
+                if self._lookup(digest) == entry:
+                    self._drop(digest)
+            return None
+
+    # ----- writes -----
+
+    def _encode_record(self, ast_obj: Any) -> tuple[bytes, int]:
+        payload = marshal.dumps(encode_ast(ast_obj))
+        if self.compress:
+            return zlib.compress(payload, 1), _FLAG_ZLIB
+        return payload, 0
+
+    def put_many(self, items: Iterable[tuple[str, Any, float, int]]) -> int:
+        """
+        Append records for (key, ast_obj, timestamp, size_bytes) items.
+
+        Returns:
+            Number of records written
+        """
+        records = []
+        for key, ast_obj, timestamp, size_bytes in items:
+            try:
+                payload, flags = self._encode_record(ast_obj)
+            except Exception as e:
+                logger.debug(f"Skipping cache entry {key[:8]}...: {e}")
+                continue
+            records.append((bytes.fromhex(key), payload, flags, timestamp, size_bytes))
+        if not records:
+            return 0
+
+        with self._lock:
+            offset = self._log_size
+            index_chunk = bytearray()
+            with open(self.log_path, "ab") as log:
+                for digest, payload, flags, timestamp, size_bytes in records:
+                    log.write(payload)
+                    entry = StoreEntry(
+                        offset, len(payload), zlib.crc32(payload), timestamp, size_bytes, flags
+                    )
+                    index_chunk += _ENTRY.pack(digest, *entry)
+                    self._insert(digest, entry)
+                    offset += len(payload)
+            # The index is written after the data it points to
+            with open(self.index_path, "ab") as index:
+                index.write(index_chunk)
+            self._log_size = offset
+            if self.needs_index_merge:
+                self.merge_index()
+        return len(records)
+
+    def put(self, key: str, ast_obj: Any, timestamp: float, size_bytes: int) -> bool:
+        return self.put_many([(key, ast_obj, timestamp, size_bytes)]) == 1
+
+    def compact(
+        self,
+        max_entries: int | None = None,
+        keep: Callable[[StoreEntry], bool] | None = None,
+    ) -> int:
+        """
+        Rewrite the live records into fresh files, dropping superseded ones.
+
+        Args:
+            max_entries: Keep at most this many entries (newest by timestamp)
+            keep: Optional predicate; entries for which it returns False are
+                  dropped (e.g. expired by TTL)
+
+        Returns:
+            Number of entries kept
+        """
+        with self._lock:
+            entries = self._entries()
+            if keep is not None:
+                entries = [(k, e) for k, e in entries if keep(e)]
+            if max_entries is not None and len(entries) > max_entries:
+                entries.sort(key=lambda item: item[1].timestamp)
+                entries = entries[len(entries) - max_entries :]
+            # Sequential reads from the old log
+            entries.sort(key=lambda item: item[1].offset)
+
+            tmp_log = self.log_path.with_suffix(".log.tmp")
+            moved: list[tuple[bytes, StoreEntry]] = []
+            offset = 0
+            try:
+                with open(self.log_path, "rb") as src, open(tmp_log, "wb") as log:
+                    for digest, entry in entries:
+                        src.seek(entry.offset)
+                        payload = src.read(entry.length)
+                        if len(payload) != entry.length:
+                            continue
+                        log.write(payload)
+                        moved.append((digest, entry._replace(offset=offset)))
+                        offset += entry.length
+                self._close_reader()
+                os.replace(tmp_log, self.log_path)
+                self._log_size = offset
+                self._write_index(moved)
+            except OSError as e:
+                logger.warning(f"AST store compaction failed: {e}")
+                tmp_log.unlink(missing_ok=True)
+            return self._count
+
+    def clear(self) -> None:
+        with self._lock:
+            self._reset_files()
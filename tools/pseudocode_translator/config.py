@@ -124,6 +124,14 @@ class LLMConfig:
     auto_download: bool = False
     max_loaded_models: int = 1
     model_ttl_minutes: int = 60
+    # Model residency (models/residency.py): loaded in the background at startup
+    preload_models: list[str] = field(default_factory=_empty_str_list)
+    max_resident_memory_mb: int = 0  # 0 = no ceiling
+    warm_fallback_model: str | None = None
+    # Micro-batching of concurrent requests to local transformer models (1 = off);
+    # only pays off when several requests reach one model at once
+    batch_max_size: int = 1
+    batch_wait_ms: int = 10
 
     def __post_init__(self):
         """Initialize with default model if none provided"""
@@ -181,6 +189,17 @@ class LLMConfig:
         if not 0.0 <= self.temperature <= 2.0:
             errors.append(f"temperature must be between 0.0 and 2.0, got {self.temperature}")
 
+        if self.max_resident_memory_mb < 0:
+            errors.append(
+                f"max_resident_memory_mb must be >= 0, got {self.max_resident_memory_mb}"
+            )
+
+        if self.batch_max_size < 1:
+            errors.append(f"batch_max_size must be >= 1, got {self.batch_max_size}")
+
+        if self.batch_wait_ms < 0:
+            errors.append(f"batch_wait_ms must be >= 0, got {self.batch_wait_ms}")
+
         if self.timeout_seconds < 0:
             errors.append(f"timeout_seconds must be >= 0, got {self.timeout_seconds}")
         elif self.timeout_seconds == 0:
@@ -402,6 +421,10 @@ class ExecutionConfig:
     process_pool_retry_on_timeout: bool = True
     process_pool_retry_limit: int = 1
 
+    # Concurrent per-block model calls in the structured flow (1 = sequential).
+    # Raise for network-bound models; local models are not thread-safe.
+    translation_max_in_flight: int = 1
+
     def validate(self, strict: bool = False) -> dict[str, list[str]] | list[str]:
         """Validate execution configuration with strict errors and soft clamps."""
         errors: list[str] = []
@@ -429,6 +452,11 @@ class ExecutionConfig:
                 f"process_pool_retry_limit must be >= 0, got {self.process_pool_retry_limit}"
             )
 
+        if self.translation_max_in_flight < 1:
+            errors.append(
+                f"translation_max_in_flight must be >= 1, got {self.translation_max_in_flight}"
+            )
+
         # Max workers
         if self.process_pool_max_workers is not None and self.process_pool_max_workers < 1:
             errors.append(
@@ -448,15 +476,9 @@ class ExecutionConfig:
         return result if strict else errors
 
 
+# Configuration for the ASTCache used by the pseudocode translator: eviction
+# mode, size limits, TTL, memory usage and persistence.
 @dataclass
-"""
-Configuration module for ASTCache used in pseudocode translator.
-
-This module provides the CacheConfig class for configuring and validating
-cache behavior such as eviction mode, size limits, TTL, memory usage,
-and persistence.
-"""
-
 class CacheConfig:
     """Cache configuration for ASTCache"""
 
@@ -467,6 +489,12 @@ class CacheConfig:
     persistent_path: str | None = None
     enable_compression: bool = True
 
+    # Translation result cache (enabled by llm.cache_enabled, expires after
+    # llm.cache_ttl_hours); the SQLite file is optional
+    translation_max_entries: int = 2048
+    translation_persistent_path: str | None = None
+    translation_persistent_max_entries: int = 50_000
+
     def validate(
         self,
         strict: bool = False
@@ -494,6 +522,15 @@ class CacheConfig:
             errors.append(f"cache.ttl_seconds must be None or >= 1, got {self.ttl_seconds}")
         if self.max_memory_mb <= 0:
             errors.append(f"cache.max_memory_mb must be > 0, got {self.max_memory_mb}")
+        if self.translation_max_entries < 1:
+            errors.append(
+                f"cache.translation_max_entries must be >= 1, got {self.translation_max_entries}"
+            )
+        if self.translation_persistent_max_entries < 1:
+            errors.append(
+                "cache.translation_persistent_max_entries must be >= 1, got "
+                f"{self.translation_persistent_max_entries}"
+            )
 
         result = {"errors": errors, "warnings": warnings}
         return result if strict else errors
@@ -609,6 +646,7 @@ class Config:
             "PSEUDOCODE_EXEC_POOL_RETRY_ON_TIMEOUT",
             "PSEUDOCODE_EXEC_POOL_RETRY_LIMIT",
             "PSEUDOCODE_EXEC_POOL_START_METHOD",
+            "PSEUDOCODE_EXEC_TRANSLATION_MAX_IN_FLIGHT",
             # Cache overrides
             "PSEUDOCODE_CACHE_EVICTION_MODE",
             "PSEUDOCODE_CACHE_MAX_SIZE",
@@ -616,6 +654,9 @@ class Config:
             "PSEUDOCODE_CACHE_MAX_MEMORY_MB",
             "PSEUDOCODE_CACHE_PERSISTENT_PATH",
             "PSEUDOCODE_CACHE_ENABLE_COMPRESSION",
+            "PSEUDOCODE_CACHE_TRANSLATION_MAX_ENTRIES",
+            "PSEUDOCODE_CACHE_TRANSLATION_PATH",
+            "PSEUDOCODE_CACHE_TRANSLATION_PERSISTENT_MAX_ENTRIES",
         }
         overrides: dict[str, str] = {}
         for key in allowed_keys:
@@ -653,6 +694,7 @@ class Config:
             "PSEUDOCODE_EXEC_POOL_RETRY_ON_TIMEOUT": "execution.process_pool_retry_on_timeout",
             "PSEUDOCODE_EXEC_POOL_RETRY_LIMIT": "execution.process_pool_retry_limit",
             "PSEUDOCODE_EXEC_POOL_START_METHOD": "execution.process_pool_start_method",
+            "PSEUDOCODE_EXEC_TRANSLATION_MAX_IN_FLIGHT": "execution.translation_max_in_flight",
             # Cache overrides
             "PSEUDOCODE_CACHE_EVICTION_MODE": "cache.eviction_mode",
             "PSEUDOCODE_CACHE_MAX_SIZE": "cache.max_size",
@@ -660,107 +702,116 @@ class Config:
             "PSEUDOCODE_CACHE_MAX_MEMORY_MB": "cache.max_memory_mb",
             "PSEUDOCODE_CACHE_PERSISTENT_PATH": "cache.persistent_path",
             "PSEUDOCODE_CACHE_ENABLE_COMPRESSION": "cache.enable_compression",
+            "PSEUDOCODE_CACHE_TRANSLATION_MAX_ENTRIES": "cache.translation_max_entries",
+            "PSEUDOCODE_CACHE_TRANSLATION_PATH": "cache.translation_persistent_path",
+            "PSEUDOCODE_CACHE_TRANSLATION_PERSISTENT_MAX_ENTRIES": (
+                "cache.translation_persistent_max_entries"
+            ),
         }
         return mapping.get(key)
 
-    """
-    Configuration module for coercing override values.
+    def _coerce_override_value(self, path: str, raw: str) -> tuple[bool, Any]:
+        """Coerce raw env value to expected type with identical error logging."""
 
-    This module provides functionality to coerce environment variable
-    values to their expected types with consistent logging behavior.
-    """
-        def _coerce_override_value(self, path: str, raw: str) -> tuple[bool, Any]:
-            """Coerce raw env value to expected type with identical error logging."""
-
-            # Helpers to preserve original warning messages
-            def _try_float(val: str, warn_msg: str) -> tuple[bool, Any]:
-                """Try to convert a string to a float. Returns (True, float) on success; logs warning and returns (False, None) on failure."""
-                try:
-                    return True, float(val)
-                except ValueError:
-                    logger.warning(warn_msg)
-                    return False, None
+        # Helpers to preserve original warning messages
+        def _try_float(val: str, warn_msg: str) -> tuple[bool, Any]:
+            """Try to convert a string to a float. Returns (True, float) on success; logs warning and returns (False, None) on failure."""
+            try:
+                return True, float(val)
+            except ValueError:
+                logger.warning(warn_msg)
+                return False, None
 
-            def _try_int(val: str, warn_msg: str) -> tuple[bool, Any]:
-                """Try to convert a string to an integer. Returns (True, int) on success; logs warning and returns (False, None) on failure."""
-                try:
-                    return True, int(val)
-                except ValueError:
-                    logger.warning(warn_msg)
-                    return False, None
-
-            truthy = ("true", "1", "yes", "on")
-
-            coercers: dict[str, Callable[[str], tuple[bool, Any]]] = {
-                "llm.model_type": lambda v: (True, v),
-                "llm.temperature": lambda v: _try_float(v, f"Invalid temperature value from env: {v}"),
-                "llm.n_threads": lambda v: _try_int(v, f"Invalid threads value from env: {v}"),
-                "llm.n_gpu_layers": lambda v: _try_int(v, f"Invalid GPU layers value from env: {v}"),
-                "streaming.enabled": lambda v: (True, v.lower() in truthy),
-                "streaming.chunk_size": lambda v: _try_int(
-                    v, f"Invalid chunk size value from env: {v}"
-                ),
-                "validate_imports": lambda v: (True, v.lower() in truthy),
-                "check_undefined_vars": lambda v: (True, v.lower() in truthy),
-                # Adaptive streaming overrides
-                "streaming.adaptive_chunking_enabled": lambda v: (
-                    True,
-                    v.lower() in truthy,
-                ),
-                "streaming.adaptive_target_latency_ms": lambda v: _try_int(
-                    v, f"Invalid adaptive target ms from env: {v}"
-                ),
-                "streaming.adaptive_min_chunk_size": lambda v: _try_int(
-                    v, f"Invalid adaptive min size from env: {v}"
-                ),
-                "streaming.adaptive_max_chunk_size": lambda v: _try_int(
-                    v, f"Invalid adaptive max size from env: {v}"
-                ),
-                "streaming.adaptive_hysteresis_pct": lambda v: _try_float(
-                    v, f"Invalid adaptive hysteresis from env: {v}"
-                ),
-                "streaming.adaptive_cooldown_chunks": lambda v: _try_int(
-                    v, f"Invalid adaptive cooldown from env: {v}"
-                ),
-                "streaming.adaptive_smoothing_alpha": lambda v: _try_float(
-                    v, f"Invalid adaptive alpha from env: {v}"
-                ),
-                "streaming.adaptive_initial_chunk_size": lambda v: _try_int(
-                    v, f"Invalid adaptive initial size from env: {v}"
-                ),
-                # Execution/process pool coercers
-                "execution.process_pool_enabled": lambda v: (True, v.lower() in truthy),
-                "execution.process_pool_max_workers": lambda v: _try_int(
-                    v, f"Invalid pool max workers value from env: {v}"
-                ),
-                "execution.process_pool_target": lambda v: (True, v),
-                "execution.process_pool_task_timeout_ms": lambda v: _try_int(
-                    v, f"Invalid pool timeout ms value from env: {v}"
-                ),
-                "execution.process_pool_job_max_chars": lambda v: _try_int(
-                    v, f"Invalid pool job max chars value from env: {v}"
-                ),
-                "execution.process_pool_retry_on_timeout": lambda v: (
-                    True,
-                    v.lower() in truthy,
-                ),
-                "execution.process_pool_retry_limit": lambda v: _try_int(
-                    v, f"Invalid pool retry limit value from env: {v}"
-                ),
-                "execution.process_pool_start_method": lambda v: (True, v),
-                # Cache coercers
-                "cache.eviction_mode": lambda v: (True, v),
-                "cache.max_size": lambda v: _try_int(v, f"Invalid cache max size from env: {v}"),
-                "cache.ttl_seconds": lambda v: _try_int(v, f"Invalid cache ttl seconds from env: {v}"),
-                "cache.max_memory_mb": lambda v: _try_float(
-                    v, f"Invalid cache max memory MB from env: {v}"
-                ),
-                "cache.persistent_path": lambda v: (True, v),
-                "cache.enable_compression": lambda v: (True, v.lower() in truthy),
-            }
+        def _try_int(val: str, warn_msg: str) -> tuple[bool, Any]:
+            """Try to convert a string to an integer. Returns (True, int) on success; logs warning and returns (False, None) on failure."""
+            try:
+                return True, int(val)
+            except ValueError:
+                logger.warning(warn_msg)
+                return False, None
+
+        truthy = ("true", "1", "yes", "on")
+
+        coercers: dict[str, Callable[[str], tuple[bool, Any]]] = {
+            "llm.model_type": lambda v: (True, v),
+            "llm.temperature": lambda v: _try_float(v, f"Invalid temperature value from env: {v}"),
+            "llm.n_threads": lambda v: _try_int(v, f"Invalid threads value from env: {v}"),
+            "llm.n_gpu_layers": lambda v: _try_int(v, f"Invalid GPU layers value from env: {v}"),
+            "streaming.enabled": lambda v: (True, v.lower() in truthy),
+            "streaming.chunk_size": lambda v: _try_int(
+                v, f"Invalid chunk size value from env: {v}"
+            ),
+            "validate_imports": lambda v: (True, v.lower() in truthy),
+            "check_undefined_vars": lambda v: (True, v.lower() in truthy),
+            # Adaptive streaming overrides
+            "streaming.adaptive_chunking_enabled": lambda v: (
+                True,
+                v.lower() in truthy,
+            ),
+            "streaming.adaptive_target_latency_ms": lambda v: _try_int(
+                v, f"Invalid adaptive target ms from env: {v}"
+            ),
+            "streaming.adaptive_min_chunk_size": lambda v: _try_int(
+                v, f"Invalid adaptive min size from env: {v}"
+            ),
+            "streaming.adaptive_max_chunk_size": lambda v: _try_int(
+                v, f"Invalid adaptive max size from env: {v}"
+            ),
+            "streaming.adaptive_hysteresis_pct": lambda v: _try_float(
+                v, f"Invalid adaptive hysteresis from env: {v}"
+            ),
+            "streaming.adaptive_cooldown_chunks": lambda v: _try_int(
+                v, f"Invalid adaptive cooldown from env: {v}"
+            ),
+            "streaming.adaptive_smoothing_alpha": lambda v: _try_float(
+                v, f"Invalid adaptive alpha from env: {v}"
+            ),
+            "streaming.adaptive_initial_chunk_size": lambda v: _try_int(
+                v, f"Invalid adaptive initial size from env: {v}"
+            ),
+            # Execution/process pool coercers
+            "execution.process_pool_enabled": lambda v: (True, v.lower() in truthy),
+            "execution.process_pool_max_workers": lambda v: _try_int(
+                v, f"Invalid pool max workers value from env: {v}"
+            ),
+            "execution.process_pool_target": lambda v: (True, v),
+            "execution.process_pool_task_timeout_ms": lambda v: _try_int(
+                v, f"Invalid pool timeout ms value from env: {v}"
+            ),
+            "execution.process_pool_job_max_chars": lambda v: _try_int(
+                v, f"Invalid pool job max chars value from env: {v}"
+            ),
+            "execution.process_pool_retry_on_timeout": lambda v: (
+                True,
+                v.lower() in truthy,
+            ),
+            "execution.process_pool_retry_limit": lambda v: _try_int(
+                v, f"Invalid pool retry limit value from env: {v}"
+            ),
+            "execution.process_pool_start_method": lambda v: (True, v),
+            "execution.translation_max_in_flight": lambda v: _try_int(
+                v, f"Invalid translation max in flight value from env: {v}"
+            ),
+            # Cache coercers
+            "cache.eviction_mode": lambda v: (True, v),
+            "cache.max_size": lambda v: _try_int(v, f"Invalid cache max size from env: {v}"),
+            "cache.ttl_seconds": lambda v: _try_int(v, f"Invalid cache ttl seconds from env: {v}"),
+            "cache.max_memory_mb": lambda v: _try_float(
+                v, f"Invalid cache max memory MB from env: {v}"
+            ),
+            "cache.persistent_path": lambda v: (True, v),
+            "cache.enable_compression": lambda v: (True, v.lower() in truthy),
+            "cache.translation_max_entries": lambda v: _try_int(
+                v, f"Invalid translation cache max entries from env: {v}"
+            ),
+            "cache.translation_persistent_path": lambda v: (True, v),
+            "cache.translation_persistent_max_entries": lambda v: _try_int(
+                v, f"Invalid persistent translation cache max entries from env: {v}"
+            ),
+        }
 
-            fn = coercers.get(path)
-            return fn(raw) if fn else (False, None)
+        fn = coercers.get(path)
+        return fn(raw) if fn else (False, None)
 
     def _get_value_by_path(self, path: str) -> Any:
         """Read current config value by dotted path."""
@@ -990,26 +1041,21 @@ class ConfigManager:
             logger.info("No configuration file found, using defaults")
 
         # 3) Apply environment overrides last so env always wins
-    """Pseudocode translator configuration management module.
+        config.apply_env_overrides()
 
-    This module provides functionality for loading, saving, and interactively creating
-    configuration for the pseudocode translator, including utilities for prompting user input.
-    """
-            config.apply_env_overrides()
+        # Strictness gating via env flag (lenient opt-out)
+        # If PSEUDOCODE_LENIENT_CONFIG in {"1","true","yes"}, downgrade strict to False
+        strict_default = not ConfigManager._truthy_env("PSEUDOCODE_LENIENT_CONFIG")
 
-            # Strictness gating via env flag (lenient opt-out)
-            # If PSEUDOCODE_LENIENT_CONFIG in {"1","true","yes"}, downgrade strict to False
-            strict_default = not ConfigManager._truthy_env("PSEUDOCODE_LENIENT_CONFIG")
+        # Validate and fail-fast on critical invalids
+        mgr = ConfigManager()
+        result = mgr._validate_all(config, strict=strict_default)
 
-            # Validate and fail-fast on critical invalids
-            mgr = ConfigManager()
-            result = mgr._validate_all(config, strict=strict_default)
+        # Log warnings when present (do not abort on warnings)
+        for w in result.get("warnings", []):
+            logger.warning("Config warning: %s", w)
 
-            # Log warnings when present (do not abort on warnings)
-            for w in result.get("warnings", []):
-                logger.warning("Config warning: %s", w)
-
-            return config
+        return config
 
         @staticmethod
         def save(config: Config, path: str | Path | None = None):
@@ -1228,6 +1274,7 @@ class TranslatorConfig:
         self.llm = self._config.llm
         self.streaming = self._config.streaming
         self.execution = self._config.execution
+        self.cache = self._config.cache
 
     @property
     def preserve_comments(self) -> bool:
@@ -1344,11 +1391,6 @@ def validate_config(config: TranslatorConfig) -> list[str]:
 
 # Stub classes for backward compatibility
 @dataclass
-"""Module for configuring prompt templates in the pseudocode translator tool.
-
-This module defines PromptConfig, which manages the formatting of user instructions
-and code refinement prompts to ensure consistency in prompt generation."""
-
 class PromptConfig:
     """Configuration for prompt templates (backward compatibility)"""
 
@@ -73,7 +73,6 @@ class StructuredParsingController:
         """
         logger = self._logger
         logger.debug(f"Translation #{translation_id}: Using structured parsing approach")
-        errors: list[str] = []
         local_warnings = warnings.copy()
 
         try:
@@ -92,21 +91,7 @@ class StructuredParsingController:
                 )
 
                 if not parse_success:
-                    # Convert parse errors to detailed error messages
-                    for parse_error in parse_result.errors:
-                        error = ParsingError(
-                            f"Parse error: {parse_error}",
-                            block_content=input_text[:200],
-                        )
-                        errors.append(error.format_error())
-
-                    return self._result_cls(
-                        success=False,
-                        code=None,
-                        errors=errors,
-                        warnings=local_warnings,
-                        metadata=self._create_metadata(start_time, 0, 0, 0, 0, False),
-                    )
+                    return self.parse_failure(parse_result, input_text, start_time, local_warnings)
             except Exception as e:
                 error = ParsingError(
                     "Failed to parse input", block_content=input_text[:200], cause=e
@@ -128,15 +113,7 @@ class StructuredParsingController:
             logger.debug("Processing %d blocks", len(parse_result.blocks))
             processed_blocks = self._process_blocks(parse_result.blocks)
 
-            # Step 3: Handle dependencies between blocks
-            try:
-                self._dep.analyze_and_annotate(processed_blocks)
-            except Exception as e:
-                logger.warning("Error handling dependencies: %s", e)
-                local_warnings.append(f"Could not analyze dependencies: {str(e)}")
-
-            # Continue with completion logic (assembly + validation)
-            return self._complete_structured_translation(
+            return self.finish(
                 processed_blocks,
                 parse_result,
                 start_time,
@@ -160,6 +137,57 @@ class StructuredParsingController:
                 metadata=self._create_metadata(start_time, 0, 0, 0, 0, False),
             )
 
+    def parse_failure(
+        self, parse_result: Any, input_text: str, start_time: float, warnings: list[str]
+    ) -> Any:
+        """Result for input whose parse reported errors."""
+        # Convert parse errors to detailed error messages
+        errors: list[str] = []
+        for parse_error in parse_result.errors:
+            error = ParsingError(
+                f"Parse error: {parse_error}",
+                block_content=input_text[:200],
+            )
+            errors.append(error.format_error())
+
+        return self._result_cls(
+            success=False,
+            code=None,
+            errors=errors,
+            warnings=warnings,
+            metadata=self._create_metadata(start_time, 0, 0, 0, 0, False),
+        )
+
+    def finish(
+        self,
+        processed_blocks: list[CodeBlock],
+        parse_result: Any,
+        start_time: float,
+        warnings: list[str],
+        translation_id: int,
+    ) -> Any:
+        """
+        Annotate dependencies, assemble and validate already processed blocks.
+
+        Shared by run() and incremental translation sessions, which parse and
+        process blocks themselves.
+        """
+        # Step 3: Handle dependencies between blocks
+        try:
+            self._dep.analyze_and_annotate(processed_blocks)
+        except Exception as e:
+            self._logger.warning("Error handling dependencies: %s", e)
+            warnings.append(f"Could not analyze dependencies: {str(e)}")
+
+        # Continue with completion logic (assembly + validation)
+        return self._complete_structured_translation(
+            processed_blocks,
+            parse_result,
+            start_time,
+            warnings,
+            translation_id,
+        )
+
     # Mirrors TranslationManager._complete_structured_translation behavior
     def _complete_structured_translation(
         self,
@@ -220,7 +248,7 @@ class StructuredParsingController:
 
         # Metadata unchanged
         blocks_translated = sum(1 for b in processed_blocks if b.metadata.get("translated", False))
-        cache_hits = 0
+        cache_hits = sum(1 for b in processed_blocks if b.metadata.get("cache_hit", False))
         metadata = self._create_metadata(
             start_time,
             len(parse_result.blocks),
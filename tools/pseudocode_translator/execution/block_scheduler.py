@@ -0,0 +1,122 @@
+"""
+Dependency-aware scheduler for per-block translation work.
+
+BlockScheduler runs a list of tasks whose dependencies form a DAG: a task is
+dispatched once every task it depends on has finished, with at most
+``max_in_flight`` tasks running at a time on a thread pool. Results are
+returned in task order regardless of completion order, so a document's
+wall time approaches the latency of its longest dependency chain instead of
+the sum of all tasks. This pays off for network-bound models (OpenAI,
+LM Studio); CPU-bound local models should keep ``max_in_flight`` at 1.
+"""
+
+from __future__ import annotations
+
+import contextvars
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class BlockScheduler(Generic[T]):
+    """Run dependent tasks concurrently, bounded by an in-flight limit."""
+
+    def __init__(self, max_in_flight: int = 1):
+        """
+        Args:
+            max_in_flight: Maximum number of tasks running at once; 1 runs
+                           tasks sequentially on the calling thread
+        """
+        self.max_in_flight = max(1, int(max_in_flight))
+
+    def run(
+        self,
+        tasks: Sequence[Callable[[], T]],
+        dependencies: Sequence[set[int]] | None = None,
+    ) -> list[T]:
+        """
+        Run tasks and return their results in task order.
+
+        Args:
+            tasks: Zero-argument callables
+            dependencies: For each task, indices of tasks that must finish
+                          before it starts (empty or None for none)
+
+        Returns:
+            Results indexed like tasks
+
+        Raises:
+            ValueError: If dependencies reference unknown tasks or form a cycle
+            Exception: The first exception raised by a task; tasks not yet
+                       started are cancelled
+        """
+        count = len(tasks)
+        deps = [set(d) for d in dependencies] if dependencies is not None else [set()] * count
+        if len(deps) != count:
+            raise ValueError("dependencies must have one entry per task")
+
+        dependents: list[list[int]] = [[] for _ in range(count)]
+        pending = [0] * count
+        for index, required in enumerate(deps):
+            for dep in required:
+                if not 0 <= dep < count or dep == index:
+                    raise ValueError(f"Task {index} has invalid dependency {dep}")
+                dependents[dep].append(index)
+            pending[index] = len(required)
+
+        ready = [i for i in range(count) if pending[i] == 0]
+        results: list[T | None] = [None] * count
+
+        if self.max_in_flight == 1 or count <= 1:
+            done = 0
+            while ready:
+                index = ready.pop(0)
+                results[index] = tasks[index]()
+                done += 1
+                for nxt in dependents[index]:
+                    pending[nxt] -= 1
+                    if pending[nxt] == 0:
+                        ready.append(nxt)
+                ready.sort()
+            self._check_complete(done, count)
+            return results  # type: ignore[return-value]
+
+        done = 0
+        in_flight: dict[Future, int] = {}
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_in_flight, count),
+            thread_name_prefix="block-translate",
+        ) as pool:
+            try:
+                while ready or in_flight:
+                    # Lowest index first so earlier blocks are not starved
+                    ready.sort(reverse=True)
+                    while ready and len(in_flight) < self.max_in_flight:
+                        index = ready.pop()
+                        # Each task sees the caller's context (e.g. analysis scope)
+                        ctx = contextvars.copy_context()
+                        in_flight[pool.submit(ctx.run, tasks[index])] = index
+
+                    finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        index = in_flight.pop(future)
+                        results[index] = future.result()
+                        done += 1
+                        for nxt in dependents[index]:
+                            pending[nxt] -= 1
+                            if pending[nxt] == 0:
+                                ready.append(nxt)
+            except BaseException:
+                for future in in_flight:
+                    future.cancel()
+                raise
+
+        self._check_complete(done, count)
+        return results  # type: ignore[return-value]
+
+    @staticmethod
+    def _check_complete(done: int, count: int) -> None:
+        if done != count:
+            raise ValueError("Task dependencies contain a cycle")
@@ -4,6 +4,7 @@ import contextlib
 import multiprocessing as mp
 import os
 import time
+from collections import OrderedDict
 from concurrent.futures import ProcessPoolExecutor, TimeoutError
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
@@ -16,7 +17,7 @@ from pseudocode_translator.validator import ValidationResult, Validator
 
 if TYPE_CHECKING:
     import concurrent.futures as cf
-    from collections.abc import Callable
+    from collections.abc import Callable, Sequence
 
 try:
     from concurrent.futures.process import BrokenProcessPool  # type: ignore
@@ -28,24 +29,103 @@ except Exception:  # pragma: no cover
         pass
 
 
+# Results kept per worker process, keyed by (kind, text)
+WORKER_CACHE_SIZE = 256
+
+
+class _WorkerState:
+    """
+    Per-process parser, validator and result cache.
+
+    Built once per worker by the pool initializer so compiled regexes, the
+    validator's ValidationCache and the child's AST cache survive between
+    tasks. Hit/miss counters are deltas since the last report to the parent.
+    """
+
+    def __init__(self, cache_size: int = WORKER_CACHE_SIZE) -> None:
+        self.parser = ParserModule()
+        # default config; validation semantics match in-process defaults
+        self.validator = Validator(TranslatorConfig())
+        self.cache: OrderedDict[tuple[str, str], Any] = OrderedDict()
+        self.cache_size = max(0, int(cache_size))
+        self.hits = 0
+        self.misses = 0
+
+    def run(self, kind: str, text: str) -> Any:
+        key = (kind, text)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.cache.move_to_end(key)
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        if kind == "parse":
+            result = self.parser.get_parse_result(text)
+        else:
+            result = self.validator.validate_syntax(text)
+
+        if self.cache_size:
+            self.cache[key] = result
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return result
+
+    def report(self) -> tuple[int, int, int]:
+        """(pid, hits, misses) since the previous report."""
+        report = (os.getpid(), self.hits, self.misses)
+        self.hits = self.misses = 0
+        return report
+
+
+_WORKER_STATE: _WorkerState | None = None
+
+
+def _init_worker(cache_size: int = WORKER_CACHE_SIZE) -> None:
+    """Process pool initializer: build the worker-resident state once."""
+    global _WORKER_STATE
+    _WORKER_STATE = _WorkerState(cache_size)
+
+
+def _worker_state() -> _WorkerState:
+    if _WORKER_STATE is None:
+        _init_worker()
+    return _WORKER_STATE  # type: ignore[return-value]
+
+
+def _as_code(ast_obj) -> str:
+    return ast_obj if isinstance(ast_obj, str) else str(ast_obj)
+
+
 # Top-level worker functions for picklability
 
 
 def worker_parse(text: str):
-    """Parse text using ParserModule in a fresh process."""
-    parser = ParserModule()
-    return parser.get_parse_result(text)
+    """Parse text using the worker's resident ParserModule."""
+    return _worker_state().run("parse", text)
 
 
 def worker_validate(ast_obj) -> ValidationResult:
     """
-    Validate syntax of provided code (ast_obj treated as code string).
-    Creates a fresh Validator with default config to keep isolation.
+    Validate syntax of provided code (ast_obj treated as code string)
+    using the worker's resident Validator.
+    """
+    return _worker_state().run("validate", _as_code(ast_obj))
+
+
+def worker_run_batch(kind: str, payloads: tuple) -> tuple[list[Any], tuple[int, int, int]]:
+    """
+    Run several parse or validate jobs in one task.
+
+    Returns:
+        (results in payload order, (pid, cache hits, cache misses))
     """
-    code = ast_obj if isinstance(ast_obj, str) else str(ast_obj)
-    cfg = TranslatorConfig()  # use defaults; validation semantics match in-process defaults
-    validator = Validator(cfg)
-    return validator.validate_syntax(code)
+    state = _worker_state()
+    if kind == "parse":
+        results = [state.run("parse", text) for text in payloads]
+    else:
+        results = [state.run("validate", _as_code(obj)) for obj in payloads]
+    return results, state.report()
 
 
 @dataclass
@@ -55,6 +135,12 @@ class _TaskSpec:
     kind: str  # "parse" | "validate"
     func: Callable[..., Any]
     args: tuple
+    # worker_run_batch task: result is (results, worker report)
+    batched: bool = False
+    # unwrap the only result of a batched task
+    single: bool = False
+    # jobs in the task; scales the per-task timeout
+    size: int = 1
 
 
 class _ImmediateFallback:
@@ -91,6 +177,11 @@ class ParseValidateExecutor:
         # picklable submission targets (top-level functions)
         self._parse_fn = parse_fn or worker_parse
         self._validate_fn = validate_fn or worker_validate
+        # default workers go through worker_run_batch so cache stats come back
+        self._custom_fns = parse_fn is not None or validate_fn is not None
+
+        # per-worker cache stats: pid -> {"hits", "misses"}
+        self._worker_cache: dict[int, dict[str, int]] = {}
 
         # resolved runtime concurrency (lazy)
         self._resolved_workers: int | None = None
@@ -132,11 +223,14 @@ class ParseValidateExecutor:
         self._resolved_workers = max_workers
         self._resolved_start_method = start_method
 
+        kwargs: dict[str, Any] = {
+            "max_workers": max_workers,
+            "initializer": _init_worker,
+            "initargs": (WORKER_CACHE_SIZE,),
+        }
         if start_method:
-            ctx = mp.get_context(start_method)
-            self._pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=ctx)
-        else:
-            self._pool = ProcessPoolExecutor(max_workers=max_workers)
+            kwargs["mp_context"] = mp.get_context(start_method)
+        self._pool = ProcessPoolExecutor(**kwargs)
 
         # telemetry and events
         init_ms = (time.perf_counter() - t0) * 1000.0
@@ -168,6 +262,50 @@ class ParseValidateExecutor:
                 self._pool.shutdown(wait=wait, cancel_futures=True)
             self._pool = None
 
+    # ----- accessors used by _TaskHandle -----
+
+    @property
+    def config(self) -> ExecutionConfig:
+        return self._config
+
+    @property
+    def pool(self) -> ProcessPoolExecutor | None:
+        return self._pool
+
+    def emit(self, et: EventType, **data) -> None:
+        self._emit(et, **data)
+
+    def record_event(self, name: str, **kwargs) -> None:
+        self._rec.record_event(name, **kwargs)
+
+    def restart_pool(self) -> None:
+        self._restart_pool()
+
+    # ----- worker cache telemetry -----
+
+    def _record_worker_report(self, report: tuple[int, int, int]) -> None:
+        pid, hits, misses = report
+        stats = self._worker_cache.setdefault(pid, {"hits": 0, "misses": 0})
+        stats["hits"] += hits
+        stats["misses"] += misses
+        self._rec.record_event(
+            "exec_pool.worker_cache",
+            counters={
+                "hit": hits,
+                "miss": misses,
+                f"worker.{pid}.hit": hits,
+                f"worker.{pid}.miss": misses,
+            },
+        )
+
+    def get_worker_cache_stats(self) -> dict[int, dict[str, float]]:
+        """Per-worker (by pid) cache hits, misses and hit rate seen so far."""
+        out: dict[int, dict[str, float]] = {}
+        for pid, stats in self._worker_cache.items():
+            total = stats["hits"] + stats["misses"]
+            out[pid] = {**stats, "hit_rate": (stats["hits"] / total) if total else 0.0}
+        return out
+
     # ----- submission -----
 
     def submit_parse(self, text: str):
@@ -186,10 +324,7 @@ class ParseValidateExecutor:
         # submit
         self._emit(EventType.EXEC_POOL_TASK_SUBMITTED, kind="parse", size_chars=len(text))
         self._rec.record_event("exec_pool.submit", counters={"exec_pool.submit": 1})
-        spec = _TaskSpec(kind="parse", func=self._parse_fn, args=(text,))
-        # type: ignore[arg-type]
-        fut = self._pool.submit(spec.func, *spec.args)
-        return self._TaskHandle(self, spec, fut)
+        return self._submit(self._single_spec("parse", self._parse_fn, text))
 
     def submit_validate(self, ast_obj):
         # respect target
@@ -203,11 +338,73 @@ class ParseValidateExecutor:
             size_chars=(len(ast_obj) if isinstance(ast_obj, str) else 0),
         )
         self._rec.record_event("exec_pool.submit", counters={"exec_pool.submit": 1})
-        spec = _TaskSpec(kind="validate", func=self._validate_fn, args=(ast_obj,))
-        # type: ignore[arg-type]
-        fut = self._pool.submit(spec.func, *spec.args)
+        return self._submit(self._single_spec("validate", self._validate_fn, ast_obj))
+
+    def submit_parse_batch(self, texts: Sequence[str]):
+        """
+        Parse many texts with one IPC round trip per worker.
+
+        The texts are split into at most one chunk per worker; result()
+        returns the parse results in input order.
+        """
+        cap = int(self._config.process_pool_job_max_chars)
+        if cap > 0 and any(len(text) > cap for text in texts):
+            self._emit(EventType.EXEC_POOL_FALLBACK, kind="parse", reason="job_too_large")
+            self._rec.record_event("exec_pool.fallback", counters={"exec_pool.fallback": 1})
+            return _ImmediateFallback("job_too_large")
+
+        if self._config.process_pool_target not in {"parse_validate", "parse_only"}:
+            return _ImmediateFallback("target_disabled")
+
+        return self._submit_batch("parse", list(texts))
+
+    def submit_validate_batch(self, ast_objs: Sequence[Any]):
+        """Validate many code strings with one IPC round trip per worker."""
+        if self._config.process_pool_target not in {"parse_validate", "validate_only"}:
+            return _ImmediateFallback("target_disabled")
+
+        return self._submit_batch("validate", list(ast_objs))
+
+    def _single_spec(self, kind: str, fn: Callable[..., Any], payload: Any) -> _TaskSpec:
+        if self._custom_fns:
+            return _TaskSpec(kind=kind, func=fn, args=(payload,))
+        return _TaskSpec(
+            kind=kind, func=worker_run_batch, args=(kind, (payload,)), batched=True, single=True
+        )
+
+    def _submit(self, spec: _TaskSpec) -> ParseValidateExecutor._TaskHandle:
+        fut = self._pool.submit(spec.func, *spec.args)  # type: ignore[union-attr]
         return self._TaskHandle(self, spec, fut)
 
+    def _submit_batch(self, kind: str, payloads: list[Any]) -> _BatchHandle:
+        self._ensure_pool()
+        if not payloads:
+            return _BatchHandle([])
+
+        workers = self._resolved_workers or 1
+        chunk = -(-len(payloads) // workers)
+        handles = []
+        for start in range(0, len(payloads), chunk):
+            part = tuple(payloads[start : start + chunk])
+            self._emit(
+                EventType.EXEC_POOL_TASK_SUBMITTED,
+                kind=kind,
+                size_chars=sum(len(p) for p in part if isinstance(p, str)),
+            )
+            self._rec.record_event("exec_pool.submit", counters={"exec_pool.submit": 1})
+            if self._custom_fns:
+                # test seams take one payload; keep one task per payload
+                fn = self._parse_fn if kind == "parse" else self._validate_fn
+                handles.extend(
+                    (self._submit(_TaskSpec(kind=kind, func=fn, args=(p,))), False) for p in part
+                )
+                continue
+            spec = _TaskSpec(
+                kind=kind, func=worker_run_batch, args=(kind, part), batched=True, size=len(part)
+            )
+            handles.append((self._submit(spec), True))
+        return _BatchHandle(handles)
+
     # ----- internal Future-like wrapper with retry/timeout -----
 
     class _TaskHandle:
@@ -222,7 +419,14 @@ class ParseValidateExecutor:
 
         def _timeout_seconds(self) -> float:
             ms = max(1, int(self._p.config.process_pool_task_timeout_ms))
-            return ms / 1000.0
+            return ms * self._spec.size / 1000.0
+
+        def _unwrap(self, res: Any) -> Any:
+            if not self._spec.batched:
+                return res
+            results, report = res
+            self._p._record_worker_report(report)
+            return results[0] if self._spec.single else results
 
         def result(self, timeout: float | None = None):
             timeout_sec = timeout if timeout is not None else self._timeout_seconds()
@@ -237,7 +441,7 @@ class ParseValidateExecutor:
                     )
                     self._p.record_event("exec_pool.complete", counters={"exec_pool.complete": 1})
                     self._p.record_event("exec_pool.task_ms", duration_ms=dur_ms)
-                    return res
+                    return self._unwrap(res)
                 except (TimeoutError, BrokenProcessPool) as e:
                     # telemetry
                     self._p.emit(
@@ -278,3 +482,21 @@ class ParseValidateExecutor:
                     )
                     self._p.record_event("exec_pool.fallback", counters={"exec_pool.fallback": 1})
                     raise
+
+
+class _BatchHandle:
+    """Future-like result of a batch submission: concatenates its task results in order."""
+
+    def __init__(self, handles: list[tuple[Any, bool]]):
+        # (task handle, whether its result is a list of results)
+        self._handles = handles
+
+    def result(self, timeout: float | None = None) -> list[Any]:
+        results: list[Any] = []
+        for handle, many in self._handles:
+            res = handle.result(timeout=timeout)
+            if many:
+                results.extend(res)
+            else:
+                results.append(res)
+        return results
@@ -47,6 +47,7 @@ class PseudocodeTranslatorAPI(QObject):
     # Streaming signals
     streaming_started = Signal()
     streaming_chunk_processed = Signal(int, str)  # chunk_index, chunk_code
+    streaming_token = Signal(int, int, str)  # chunk_index, block_index, code so far
     streaming_progress = Signal(dict)  # Progress info with memory usage
     streaming_completed = Signal(str)  # Final assembled code
     memory_usage_updated = Signal(dict)  # Memory usage stats
@@ -173,12 +174,14 @@ class PseudocodeTranslatorAPI(QObject):
             )
 
     @Slot(str)
-    def translate_async(self, pseudocode: str):
+    def translate_async(self, pseudocode: str, session_id: str | None = None):
         """
         Asynchronous translation method using worker thread
 
         Args:
             pseudocode: Mixed English/Python pseudocode input
+            session_id: Incremental session of the edited document; only the
+                        parts changed since its previous revision are re-translated
 
         Emits:
             translation_started: When translation begins
@@ -206,7 +209,11 @@ class PseudocodeTranslatorAPI(QObject):
                 self.translation_error.emit(str(e))
                 return
         self._worker = TranslationWorker(
-            pseudocode, self._wrapped_config, self.parser, self.manager
+            pseudocode,
+            self._wrapped_config,
+            self.parser,
+            self.manager,
+            session_id=session_id,
         )
 
         # Move worker to thread
@@ -308,6 +315,7 @@ class PseudocodeTranslatorAPI(QObject):
 
         Emits:
             streaming_started: When streaming begins
+            streaming_token: As the model generates each block's code
             streaming_chunk_processed: For each processed chunk
             streaming_progress: Progress info
             streaming_completed: When done with final code
@@ -346,10 +354,18 @@ class PseudocodeTranslatorAPI(QObject):
                         progress_info = progress_obj if isinstance(progress_obj, dict) else {}
                     self.streaming_progress.emit(progress_info)
 
+                def on_token(message):
+                    with contextlib.suppress(Exception):
+                        self.streaming_token.emit(
+                            int(message.chunk_index),
+                            int(message.block_index),
+                            message.translated_content or "",
+                        )
+
                 final_code: str | None = None
 
                 for res in self.manager.translate_streaming(
-                    pseudocode, progress_callback=on_progress
+                    pseudocode, progress_callback=on_progress, token_callback=on_token
                 ):
                     # Emit chunk updates if available
                     if isinstance(res.metadata, dict) and res.metadata.get("streaming", False):
@@ -66,6 +66,7 @@ class TranslationWorker(QObject):
         parser: ParserModule,
         manager: TranslationManager | None,
         parent: QObject | None = None,
+        session_id: str | None = None,
     ):
         """
         Initialize the translation worker
@@ -76,6 +77,7 @@ class TranslationWorker(QObject):
             parser: Parser module instance
             manager: TranslationManager instance
             parent: Optional parent QObject
+            session_id: Incremental session to translate the text in, if any
         """
         super().__init__(parent)
 
@@ -83,6 +85,7 @@ class TranslationWorker(QObject):
         self.config = config
         self.parser = parser
         self.manager = manager
+        self.session_id = session_id
 
         # State tracking
         self._cancelled = False
@@ -114,7 +117,12 @@ class TranslationWorker(QObject):
                 self.manager = TranslationManager(self.config)
 
             # Delegate to TranslationManager for unified behavior
-            mgr_result = self.manager.translate_pseudocode(self.pseudocode)
+            if self.session_id is not None:
+                mgr_result = self.manager.open_session(self.session_id).translate(
+                    self.pseudocode
+                )
+            else:
+                mgr_result = self.manager.translate_pseudocode(self.pseudocode)
 
             # Build parse_result for GUI consumers
             parse_result = self.parser.get_parse_result(self.pseudocode)
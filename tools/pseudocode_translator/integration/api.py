@@ -7,7 +7,7 @@ making it easy to integrate the translator into applications.
 
 import asyncio
 import logging
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
 from pathlib import Path
 from typing import Any
 
@@ -55,7 +55,10 @@ class TranslatorAPI:
         Args:
             pseudocode: The pseudocode to translate
             language: Target language (e.g., "python", "javascript")
-            **kwargs: Additional options
+            **kwargs: Additional options (session_id translates the input as the
+                      next revision of that incremental session, scoped to
+                      session_owner when given; token_callback
+                      receives model output as it is generated when streaming)
 
         Returns:
             Dictionary with translation results
@@ -71,19 +74,29 @@ class TranslatorAPI:
         else:
             target_lang = self._default_language
 
+        session_id = kwargs.get("session_id")
+
         # Check if we should use streaming
         use_streaming = kwargs.get("use_streaming", False)
-        if not use_streaming and len(pseudocode) > self._streaming_threshold:
+        if session_id is None and not use_streaming and len(pseudocode) > self._streaming_threshold:
             use_streaming = True
             logger.info("Auto-enabling streaming for large input")
 
         # Perform translation
         try:
-            if use_streaming:
+            if session_id is not None:
+                # Incremental translation against the session's previous revision
+                session = self._translator.open_session(
+                    session_id, kwargs.get("session_owner") or ""
+                )
+                result = session.translate(pseudocode, target_lang)
+            elif use_streaming:
                 # Use streaming translation
                 results = list(
                     self._translator.translate_streaming(
-                        pseudocode, chunk_size=kwargs.get("chunk_size", 4096)
+                        pseudocode,
+                        chunk_size=kwargs.get("chunk_size", 4096),
+                        token_callback=kwargs.get("token_callback"),
                     )
                 )
                 # Return the final result
@@ -123,6 +136,67 @@ class TranslatorAPI:
                 "metadata": {"error_type": type(e).__name__},
             }
 
+    async def translate_stream_async(
+        self, pseudocode: str, **kwargs
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Translate pseudocode chunk by chunk on the running event loop
+
+        Uses streaming.async_pipeline.AsyncStreamingPipeline with this API's
+        TranslationManager, so no thread is held per chunk. Cancelling the
+        consuming task (e.g. a client disconnect) stops in-flight model calls.
+
+        Args:
+            pseudocode: The pseudocode to translate
+            **kwargs: Additional options (token_callback receives model output
+                      as it is generated)
+
+        Yields:
+            One dictionary per chunk in order (chunk_index, success, code,
+            errors, warnings), then a final dictionary with done=True and the
+            assembled result in the shape returned by translate()
+        """
+        from ..streaming.async_pipeline import AsyncStreamingPipeline
+
+        pipeline = AsyncStreamingPipeline(self._translator_config, translator=self._translator)
+        language = self._default_language.value
+        errors: list[str] = []
+        warnings: list[str] = []
+
+        async for chunk in pipeline.stream_translate(
+            pseudocode, token_callback=kwargs.get("token_callback")
+        ):
+            chunk_errors = [chunk.error] if chunk.error else []
+            errors.extend(chunk_errors)
+            warnings.extend(chunk.warnings)
+            yield {
+                "chunk_index": chunk.chunk_index,
+                "success": chunk.success,
+                "code": "\n".join(block.content for block in chunk.translated_blocks or []),
+                "errors": chunk_errors,
+                "warnings": list(chunk.warnings),
+            }
+
+        code = None
+        try:
+            code = await asyncio.to_thread(pipeline.assemble_streamed_code)
+        except Exception as e:
+            logger.error("Assembling streamed translation failed: %s", e)
+            errors.append(str(e))
+
+        yield {
+            "done": True,
+            "success": code is not None and not errors,
+            "code": code,
+            "language": language,
+            "errors": errors,
+            "warnings": warnings,
+            "metadata": {
+                "chunks": pipeline.progress.processed_chunks,
+                "streaming": True,
+            },
+        }
+
     def translate_file(
         self,
         file_path: str | Path,
@@ -46,6 +46,9 @@ class EventType(Enum):
     STREAM_STARTED = auto()
     STREAM_CHUNK_PROCESSED = auto()
     STREAM_COMPLETED = auto()
+    # Token-level model output (payload: chunk_index, block_index, delta,
+    # is_partial, sequence_number)
+    STREAM_TRANSLATION_UPDATE = auto()
     # Adaptive streaming decisions (payload: old_size, new_size, reason,
     # smoothed_latency_ms, target_latency_ms, backpressure_util, cooldown_remaining)
     STREAM_ADAPTATION_DECISION = auto()
@@ -6,8 +6,11 @@ implement, providing a standard interface for multi-language output
 capabilities.
 """
 
+import asyncio
 import logging
+import threading
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -120,6 +123,25 @@ class TranslationResult:
         return len(self.warnings) > 0
 
 
+@dataclass
+class TranslationDelta:
+    """
+    One increment of a streamed translation
+
+    translate_stream() yields deltas carrying newly generated text, then a
+    final delta whose result holds the same TranslationResult translate()
+    would have returned.
+    """
+
+    text: str = ""
+    result: TranslationResult | None = None
+
+    @property
+    def done(self) -> bool:
+        """Check if this is the final delta"""
+        return self.result is not None
+
+
 @dataclass
 class NormalizedCapabilities:
     """
@@ -197,6 +219,194 @@ class BaseTranslationModel(ABC):
             TranslationResult containing the generated code
         """
 
+    def translate_stream(
+        self,
+        instruction: str,
+        config: TranslationConfig | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> Iterator[TranslationDelta]:
+        """
+        Translate an instruction, yielding generated text as it is produced
+
+        Models that can stream tokens override this; the default runs
+        translate() and yields its code as a single delta.
+
+        Args:
+            instruction: Natural language instruction
+            config: Translation configuration
+            context: Optional context (e.g., surrounding code, variables)
+
+        Yields:
+            TranslationDelta objects; the last one carries the final result
+        """
+        result = self.translate(instruction, config, context)
+        if result.success and result.code:
+            yield TranslationDelta(text=result.code)
+        yield TranslationDelta(result=result)
+
+    def _stream_generated(
+        self,
+        pieces: Iterable[str],
+        finish: Callable[[str], TranslationResult],
+        language: OutputLanguage,
+    ) -> Iterator[TranslationDelta]:
+        """
+        Helper for translate_stream() overrides
+
+        Args:
+            pieces: Raw generated text fragments, in order
+            finish: Builds the final result from the complete generated text
+            language: Target language (used for the failure result)
+
+        Yields:
+            One delta per non-empty fragment, then the final delta
+        """
+        generated: list[str] = []
+        try:
+            for piece in pieces:
+                if piece:
+                    generated.append(piece)
+                    yield TranslationDelta(text=piece)
+            result = finish("".join(generated))
+        except Exception as e:
+            logger.error("Streaming translation failed: %s", e)
+            result = TranslationResult(
+                success=False,
+                code=None,
+                language=language,
+                errors=[f"Translation error: {str(e)}"],
+            )
+        yield TranslationDelta(result=result)
+
+    async def translate_async(
+        self,
+        instruction: str,
+        config: TranslationConfig | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> TranslationResult:
+        """
+        Asynchronous translate()
+
+        Consumes translate_stream_async(), so cancelling the awaiting task
+        also stops the model call.
+
+        Args:
+            instruction: Natural language instruction
+            config: Translation configuration
+            context: Optional context (e.g., surrounding code, variables)
+
+        Returns:
+            TranslationResult
+        """
+        stream = self.translate_stream_async(instruction, config, context)
+        try:
+            async for delta in stream:
+                if delta.done:
+                    return delta.result
+        finally:
+            await stream.aclose()
+        return TranslationResult(
+            success=False,
+            code=None,
+            language=(config or TranslationConfig()).target_language,
+            errors=["Translation stream ended without a result"],
+        )
+
+    async def translate_stream_async(
+        self,
+        instruction: str,
+        config: TranslationConfig | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> AsyncIterator[TranslationDelta]:
+        """
+        Asynchronous translate_stream()
+
+        Models with an asyncio client override this. The default drives
+        translate_stream() on one executor thread and hands the deltas to the
+        event loop; when the consumer stops iterating (or is cancelled) the
+        thread closes the stream at the next delta.
+
+        Args:
+            instruction: Natural language instruction
+            config: Translation configuration
+            context: Optional context (e.g., surrounding code, variables)
+
+        Yields:
+            TranslationDelta objects; the last one carries the final result
+        """
+        loop = asyncio.get_running_loop()
+        deltas: asyncio.Queue[TranslationDelta | BaseException | None] = asyncio.Queue()
+        stop = threading.Event()
+
+        def put(item: TranslationDelta | BaseException | None) -> None:
+            try:
+                loop.call_soon_threadsafe(deltas.put_nowait, item)
+            except RuntimeError:
+                # Event loop already closed; nobody is listening any more
+                stop.set()
+
+        def pump() -> None:
+            stream = self.translate_stream(instruction, config, context)
+            try:
+                for delta in stream:
+                    if stop.is_set():
+                        break
+                    put(delta)
+            except Exception as e:
+                put(e)
+            finally:
+                close = getattr(stream, "close", None)
+                if close is not None:
+                    close()
+                put(None)
+
+        loop.run_in_executor(None, pump)
+        try:
+            while True:
+                item = await deltas.get()
+                if item is None:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+                if item.done:
+                    return
+        finally:
+            stop.set()
+
+    async def _stream_generated_async(
+        self,
+        pieces: AsyncIterable[str],
+        finish: Callable[[str], TranslationResult],
+        language: OutputLanguage,
+    ) -> AsyncIterator[TranslationDelta]:
+        """
+        Helper for translate_stream_async() overrides; see _stream_generated()
+
+        pieces is closed when the consumer stops early, so overrides can
+        release the underlying request in their own finally blocks.
+        """
+        generated: list[str] = []
+        try:
+            async for piece in pieces:
+                if piece:
+                    generated.append(piece)
+                    yield TranslationDelta(text=piece)
+            result = finish("".join(generated))
+        except Exception as e:
+            logger.error("Streaming translation failed: %s", e)
+            result = TranslationResult(
+                success=False,
+                code=None,
+                language=language,
+                errors=[f"Translation error: {str(e)}"],
+            )
+        finally:
+            aclose = getattr(pieces, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        yield TranslationDelta(result=result)
+
     @abstractmethod
     def validate_input(self, instruction: str) -> tuple[bool, str | None]:
         """
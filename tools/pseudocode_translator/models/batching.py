@@ -0,0 +1,169 @@
+"""
+Micro-batching scheduler for local models
+
+Concurrent translate() calls against one local model each run their own
+forward pass. MicroBatcher sits in front of the model: submitted requests
+are collected on a single worker thread for up to ``max_wait_ms`` or
+``max_size`` items, handed to the model as one batch, and the results are
+scattered back to each request's future.
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import Any, Generic, TypeVar
+
+from ..telemetry import get_recorder
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_STOP = object()
+
+
+class MicroBatcher(Generic[T, R]):
+    """
+    Coalesces concurrent requests into batches run on one worker thread
+
+    ``run_batch`` receives the collected items and must return one result per
+    item, in order. If it raises, every request in the batch fails with that
+    exception.
+    """
+
+    def __init__(
+        self,
+        run_batch: Callable[[list[T]], list[R]],
+        max_size: int = 4,
+        max_wait_ms: float = 10.0,
+        name: str = "micro-batcher",
+    ):
+        """
+        Args:
+            run_batch: Runs one batch and returns the results in item order
+            max_size: Largest number of requests per batch
+            max_wait_ms: How long the first request of a batch waits for others
+            name: Worker thread name and telemetry event prefix
+        """
+        self._run_batch = run_batch
+        self.max_size = max(1, int(max_size))
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000.0
+        self.name = name
+
+        self._queue: queue.Queue[Any] = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+        self._closed = False
+
+        # Metrics
+        self._requests = 0
+        self._batches = 0
+        self._failed_batches = 0
+
+    def submit(self, item: T) -> Future[R]:
+        """
+        Queue a request for the next batch
+
+        Returns:
+            Future resolved with the request's result
+
+        Raises:
+            RuntimeError: If the batcher has been closed
+        """
+        future: Future[R] = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"{self.name} is closed")
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._worker.start()
+            self._requests += 1
+            self._queue.put((item, future))
+        return future
+
+    def close(self, wait: bool = True) -> None:
+        """Stop accepting requests; queued requests still run"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            worker = self._worker
+            self._queue.put(_STOP)
+        if wait and worker is not None and worker is not threading.current_thread():
+            worker.join()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Request and batch counts"""
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "batches": self._batches,
+                "failed_batches": self._failed_batches,
+                "avg_batch_size": (
+                    round(self._requests / self._batches, 2) if self._batches else 0.0
+                ),
+                "max_size": self.max_size,
+                "max_wait_ms": self.max_wait * 1000.0,
+            }
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is _STOP:
+                break
+            pending = [first]
+
+            # Collect more requests until the batch is full or the window closes
+            deadline = time.monotonic() + self.max_wait
+            while len(pending) < self.max_size:
+                try:
+                    entry = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if entry is _STOP:
+                    stopping = True
+                    break
+                pending.append(entry)
+
+            self._execute(pending)
+
+    def _execute(self, pending: list[tuple[T, Future[R]]]) -> None:
+        # Requests cancelled while queued are dropped from the batch
+        live = [(item, fut) for item, fut in pending if fut.set_running_or_notify_cancel()]
+        if not live:
+            return
+
+        start = time.perf_counter()
+        try:
+            results = self._run_batch([item for item, _ in live])
+            if len(results) != len(live):
+                raise RuntimeError(
+                    f"{self.name}: batch returned {len(results)} results for {len(live)} requests"
+                )
+        except Exception as e:
+            logger.error("%s: batch of %d failed: %s", self.name, len(live), e)
+            with self._lock:
+                self._batches += 1
+                self._failed_batches += 1
+            for _, fut in live:
+                fut.set_exception(e)
+            return
+
+        with self._lock:
+            self._batches += 1
+        for (_, fut), result in zip(live, results, strict=True):
+            fut.set_result(result)
+
+        try:
+            get_recorder().record_event(
+                f"{self.name}.batch",
+                (time.perf_counter() - start) * 1000.0,
+                counters={"requests": len(live)},
+            )
+        except Exception:
+            pass
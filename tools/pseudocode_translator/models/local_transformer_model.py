@@ -6,6 +6,9 @@ for local code generation using models like CodeGen, StarCoder, etc.
 """
 
 import logging
+import queue
+import threading
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -17,9 +20,11 @@ from .base_model import (
     ModelMetadata,
     OutputLanguage,
     TranslationConfig,
+    TranslationDelta,
     TranslationResult,
     validate_instruction,
 )
+from .batching import MicroBatcher
 from .model_factory import ModelPriority, register_model
 
 logger = logging.getLogger(__name__)
@@ -32,6 +37,7 @@ try:
         GenerationConfig,
         StoppingCriteria,
         StoppingCriteriaList,
+        TextIteratorStreamer,
     )
 
     TRANSFORMERS_AVAILABLE = True
@@ -42,6 +48,7 @@ except ImportError:
     GenerationConfig = None
     StoppingCriteria = None
     StoppingCriteriaList = None
+    TextIteratorStreamer = None
 
 
 class CodeStoppingCriteria:
@@ -56,6 +63,33 @@ class CodeStoppingCriteria:
         return any(input_ids[0][-1] == stop_token for stop_token in self.stop_tokens)
 
 
+class CancelledStoppingCriteria:
+    """Stops generation once the consumer of a streamed translation goes away"""
+
+    def __init__(self, cancelled: threading.Event):
+        self.cancelled = cancelled
+
+    def __call__(self, input_ids, scores, **kwargs):
+        return self.cancelled.is_set()
+
+
+class BatchStoppingCriteria:
+    """Stops a batched generate() once every row hit a stop token or its own token limit"""
+
+    def __init__(self, prompt_length: int, limits: list[int], stop_ids: list[set[int]]):
+        self.prompt_length = prompt_length
+        self.limits = limits
+        self.stop_ids = stop_ids
+        self.done = [False] * len(limits)
+
+    def __call__(self, input_ids, scores, **kwargs):
+        generated = input_ids.shape[1] - self.prompt_length
+        for row, token in enumerate(input_ids[:, -1].tolist()):
+            if token in self.stop_ids[row] or generated >= self.limits[row]:
+                self.done[row] = True
+        return all(self.done)
+
+
 @register_model(
     name="local-transformer",
     aliases=["huggingface", "hf", "transformer", "codegen", "starcoder"],
@@ -95,9 +129,15 @@ class LocalTransformerModel(BaseTranslationModel):
         self.config.setdefault("num_return_sequences", 1)
         self.config.setdefault("load_in_8bit", False)
         self.config.setdefault("trust_remote_code", False)
+        # Longest wait for the next streamed token before the stream fails
+        self.config.setdefault("stream_timeout", 120.0)
+        # Micro-batching of concurrent translate() calls (1 disables it)
+        self.config.setdefault("batch_max_size", 1)
+        self.config.setdefault("batch_wait_ms", 10)
 
         self._model = None
         self._tokenizer = None
+        self._batcher: MicroBatcher[tuple[str, TranslationConfig], str] | None = None
 
         # Language mapping for model selection
         self.language_suffixes = {
@@ -174,6 +214,8 @@ class LocalTransformerModel(BaseTranslationModel):
             # Set padding token if not present
             if self._tokenizer.pad_token is None:
                 self._tokenizer.pad_token = self._tokenizer.eos_token
+            # Batched prompts are padded on the left so generation continues each one
+            self._tokenizer.padding_side = "left"
 
             # Load model
             load_kwargs = {
@@ -194,6 +236,14 @@ class LocalTransformerModel(BaseTranslationModel):
             # Set to eval mode
             self._model.eval()
 
+            if self.config["batch_max_size"] > 1:
+                self._batcher = MicroBatcher(
+                    self._generate_batch,
+                    max_size=self.config["batch_max_size"],
+                    max_wait_ms=self.config["batch_wait_ms"],
+                    name="local_transformer",
+                )
+
             self._initialized = True
             logger.info("Transformer model loaded successfully")
 
@@ -228,64 +278,22 @@ class LocalTransformerModel(BaseTranslationModel):
             # Build prompt
             prompt = self._build_prompt(instruction, config, context)
 
-            # Tokenize
-            inputs = self._tokenizer(
-                prompt,
-                return_tensors="pt",
-                truncation=True,
-                max_length=self.config["max_length"],
-            ).to(self._model.device)
-
-            # Generate
-            with torch.no_grad():
-                generation_config = GenerationConfig(
-                    temperature=config.temperature,
-                    top_p=config.top_p,
-                    top_k=config.top_k,
-                    max_new_tokens=config.max_tokens,
-                    do_sample=self.config["do_sample"],
-                    num_return_sequences=self.config["num_return_sequences"],
-                    pad_token_id=self._tokenizer.pad_token_id,
-                    eos_token_id=self._tokenizer.eos_token_id,
-                )
+            if self._batcher is not None:
+                # Shares one generate() call with concurrent requests
+                generated_text = self._batcher.submit((prompt, config)).result()
+            else:
+                inputs, generate_kwargs = self._prepare_generation(prompt, config)
 
-                # Add stopping criteria if stop sequences provided
-                stopping_criteria = None
-                if config.stop_sequences:
-                    stop_tokens = [
-                        self._tokenizer.encode(seq, add_special_tokens=False)[0]
-                        for seq in config.stop_sequences
-                    ]
-                    stopping_criteria = StoppingCriteriaList(
-                        [CodeStoppingCriteria(self._tokenizer, stop_tokens)]
-                    )
+                # Generate
+                with torch.no_grad():
+                    outputs = self._model.generate(**inputs, **generate_kwargs)
 
-                outputs = self._model.generate(
-                    **inputs,
-                    generation_config=generation_config,
-                    stopping_criteria=stopping_criteria,
+                # Decode
+                generated_text = self._tokenizer.decode(
+                    outputs[0][inputs["input_ids"].shape[1] :], skip_special_tokens=True
                 )
 
-            # Decode
-            generated_text = self._tokenizer.decode(
-                outputs[0][inputs["input_ids"].shape[1] :], skip_special_tokens=True
-            )
-
-            # Extract code
-            code = self._extract_code(generated_text, config.target_language)
-
-            return TranslationResult(
-                success=True,
-                code=code,
-                language=config.target_language,
-                confidence=0.8,  # Fixed confidence for local models
-                metadata={
-                    "model": self.config["model_name"],
-                    "device": self.config["device"],
-                    "prompt_length": len(prompt),
-                    "generated_length": len(code),
-                },
-            )
+            return self._build_result(generated_text, prompt, config)
 
         except Exception as e:
             logger.error(f"Translation failed: {str(e)}")
@@ -296,6 +304,263 @@ class LocalTransformerModel(BaseTranslationModel):
                 errors=[f"Translation error: {str(e)}"],
             )
 
+    def batch_translate(
+        self,
+        instructions: list[str],
+        config: TranslationConfig | None = None,
+        show_progress: bool = True,
+    ) -> list[TranslationResult]:
+        """
+        Translate multiple instructions, batch_max_size per generate() call
+
+        Args:
+            instructions: List of instructions to translate
+            config: Translation configuration
+            show_progress: Whether to show progress
+
+        Returns:
+            List of TranslationResult objects
+        """
+        if self._batcher is None or not self._initialized:
+            return super().batch_translate(instructions, config, show_progress)
+
+        if config is None:
+            config = TranslationConfig()
+
+        prompts = [self._build_prompt(instruction, config, None) for instruction in instructions]
+        futures = [self._batcher.submit((prompt, config)) for prompt in prompts]
+
+        results = []
+        total = len(instructions)
+        for i, (prompt, future) in enumerate(zip(prompts, futures, strict=True)):
+            if show_progress:
+                logger.info("Processing %d/%d: %s...", i + 1, total, instructions[i][:50])
+            try:
+                results.append(self._build_result(future.result(), prompt, config))
+            except Exception as e:
+                logger.error("Failed to translate instruction %d: %s", i + 1, e)
+                results.append(
+                    TranslationResult(
+                        success=False,
+                        code=None,
+                        language=config.target_language,
+                        errors=[f"Translation error: {str(e)}"],
+                    )
+                )
+
+        return results
+
+    def translate_stream(
+        self,
+        instruction: str,
+        config: TranslationConfig | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> Iterator[TranslationDelta]:
+        """
+        Translate instruction, yielding decoded text as tokens are generated
+
+        generate() runs on a helper thread feeding a TextIteratorStreamer.
+
+        Args:
+            instruction: Natural language instruction
+            config: Translation configuration
+            context: Optional context
+
+        Yields:
+            Decoded text deltas, then the final result
+        """
+        if not self._initialized:
+            raise RuntimeError("Model not initialized")
+
+        if config is None:
+            config = TranslationConfig()
+
+        prompt = self._build_prompt(instruction, config, context)
+
+        def pieces() -> Iterator[str]:
+            inputs, generate_kwargs = self._prepare_generation(prompt, config)
+            streamer = TextIteratorStreamer(
+                self._tokenizer,
+                skip_prompt=True,
+                skip_special_tokens=True,
+                timeout=self.config["stream_timeout"],
+            )
+            cancelled = threading.Event()
+            criteria = list(generate_kwargs.pop("stopping_criteria") or [])
+            criteria.append(CancelledStoppingCriteria(cancelled))
+            failure: list[Exception] = []
+
+            def generate() -> None:
+                try:
+                    with torch.no_grad():
+                        self._model.generate(
+                            **inputs,
+                            **generate_kwargs,
+                            stopping_criteria=StoppingCriteriaList(criteria),
+                            streamer=streamer,
+                        )
+                except Exception as e:
+                    failure.append(e)
+                finally:
+                    # Unblocks the consumer when generate() raised before ending the stream
+                    streamer.end()
+
+            worker = threading.Thread(target=generate, daemon=True)
+            worker.start()
+            try:
+                try:
+                    yield from streamer
+                except queue.Empty:
+                    raise TimeoutError(
+                        f"No model output for {self.config['stream_timeout']}s"
+                    ) from None
+                if failure:
+                    # Reported as a failed result by _stream_generated()
+                    raise failure[0]
+            finally:
+                # Closed before the end (e.g. a cancelled async request)
+                cancelled.set()
+                worker.join()
+
+        return self._stream_generated(
+            pieces(),
+            lambda text: self._build_result(text, prompt, config),
+            config.target_language,
+        )
+
+    def _prepare_generation(
+        self, prompt: str, config: TranslationConfig
+    ) -> tuple[Any, dict[str, Any]]:
+        """Tokenize prompt and build the generate() keyword arguments"""
+        inputs = self._tokenizer(
+            prompt,
+            return_tensors="pt",
+            truncation=True,
+            max_length=self.config["max_length"],
+        ).to(self._model.device)
+
+        generation_config = self._generation_config(
+            config, config.max_tokens, self.config["num_return_sequences"]
+        )
+
+        # Add stopping criteria if stop sequences provided
+        stopping_criteria = None
+        if config.stop_sequences:
+            stop_tokens = self._stop_token_ids(config)
+            stopping_criteria = StoppingCriteriaList(
+                [CodeStoppingCriteria(self._tokenizer, stop_tokens)]
+            )
+
+        return inputs, {
+            "generation_config": generation_config,
+            "stopping_criteria": stopping_criteria,
+        }
+
+    def _generation_config(
+        self, config: TranslationConfig, max_new_tokens: int, num_return_sequences: int
+    ) -> Any:
+        return GenerationConfig(
+            temperature=config.temperature,
+            top_p=config.top_p,
+            top_k=config.top_k,
+            max_new_tokens=max_new_tokens,
+            do_sample=self.config["do_sample"],
+            num_return_sequences=num_return_sequences,
+            pad_token_id=self._tokenizer.pad_token_id,
+            eos_token_id=self._tokenizer.eos_token_id,
+        )
+
+    def _stop_token_ids(self, config: TranslationConfig) -> list[int]:
+        """First token of each stop sequence"""
+        return [
+            self._tokenizer.encode(seq, add_special_tokens=False)[0]
+            for seq in config.stop_sequences or []
+        ]
+
+    def _generate_batch(self, requests: list[tuple[str, TranslationConfig]]) -> list[str]:
+        """
+        Generate text for (prompt, config) requests collected by the batcher
+
+        Requests with the same sampling settings share one generate() call.
+
+        Returns:
+            Generated text per request, in request order
+        """
+        groups: dict[tuple[Any, ...], list[int]] = {}
+        for i, (_, config) in enumerate(requests):
+            key = (config.temperature, config.top_p, config.top_k)
+            groups.setdefault(key, []).append(i)
+
+        texts = [""] * len(requests)
+        for indices in groups.values():
+            group = [requests[i] for i in indices]
+            for i, text in zip(indices, self._generate_padded(group), strict=True):
+                texts[i] = text
+        return texts
+
+    def _generate_padded(self, requests: list[tuple[str, TranslationConfig]]) -> list[str]:
+        """One padded generate() call; each row is cut at its own stop token and max_tokens"""
+        inputs = self._tokenizer(
+            [prompt for prompt, _ in requests],
+            return_tensors="pt",
+            padding=True,
+            truncation=True,
+            max_length=self.config["max_length"],
+        ).to(self._model.device)
+        prompt_length = inputs["input_ids"].shape[1]
+
+        limits = [config.max_tokens for _, config in requests]
+        eos = self._tokenizer.eos_token_id
+        stop_ids = [
+            {*self._stop_token_ids(config), *([eos] if eos is not None else [])}
+            for _, config in requests
+        ]
+
+        # Sampling settings are shared by the group; the longest request sets the length
+        generation_config = self._generation_config(requests[0][1], max(limits), 1)
+        criteria = BatchStoppingCriteria(prompt_length, limits, stop_ids)
+
+        with torch.no_grad():
+            outputs = self._model.generate(
+                **inputs,
+                generation_config=generation_config,
+                stopping_criteria=StoppingCriteriaList([criteria]),
+            )
+
+        texts = []
+        for row, limit, stops in zip(outputs, limits, stop_ids, strict=True):
+            # Rows that finished early keep generating until the whole batch stops
+            generated = row[prompt_length : prompt_length + limit].tolist()
+            end = next((i + 1 for i, token in enumerate(generated) if token in stops), None)
+            texts.append(self._tokenizer.decode(generated[:end], skip_special_tokens=True))
+        return texts
+
+    def shutdown(self) -> None:
+        """Stop the batcher, then release the model"""
+        if self._batcher is not None:
+            self._batcher.close()
+            self._batcher = None
+        super().shutdown()
+
+    def _build_result(
+        self, generated_text: str, prompt: str, config: TranslationConfig
+    ) -> TranslationResult:
+        """Build the TranslationResult from generated text"""
+        code = self._extract_code(generated_text, config.target_language)
+
+        return TranslationResult(
+            success=True,
+            code=code,
+            language=config.target_language,
+            confidence=0.8,  # Fixed confidence for local models
+            metadata={
+                "model": self.config["model_name"],
+                "device": self.config["device"],
+                "prompt_length": len(prompt),
+                "generated_length": len(code),
+            },
+        )
+
     def validate_input(self, instruction: str) -> tuple[bool, str | None]:
         """Validate input instruction"""
         # Basic validation
@@ -328,6 +593,7 @@ class LocalTransformerModel(BaseTranslationModel):
                 "estimated_tokens_per_second": self._estimate_speed(),
                 "memory_usage_gb": self._estimate_memory_usage(),
             },
+            "batching": self._batcher.get_stats() if self._batcher is not None else None,
         }
 
     def _build_prompt(
@@ -8,6 +8,7 @@ translation system without requiring actual model resources.
 import logging
 import random
 import time
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -17,6 +18,7 @@ from .base_model import (
     ModelMetadata,
     OutputLanguage,
     TranslationConfig,
+    TranslationDelta,
     TranslationResult,
     validate_instruction,
 )
@@ -166,7 +168,61 @@ class MockModel(BaseTranslationModel):
 
         # Generate mock code
         code = self._generate_mock_code(instruction, config, context)
+        return self._build_result(code, instruction, config)
 
+    def translate_stream(
+        self,
+        instruction: str,
+        config: TranslationConfig | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> Iterator[TranslationDelta]:
+        """
+        Generate mock translation one line at a time
+
+        The configured delay is spread evenly over the generated lines.
+
+        Args:
+            instruction: Natural language instruction
+            config: Translation configuration
+            context: Optional context
+
+        Yields:
+            One delta per line, then the final result
+        """
+        if not self._initialized:
+            raise RuntimeError("Model not initialized")
+
+        if config is None:
+            config = TranslationConfig()
+
+        if self.config["error_rate"] > 0 and random.random() < self.config["error_rate"]:
+            failure = TranslationResult(
+                success=False,
+                code=None,
+                language=config.target_language,
+                errors=["Mock error: Simulated translation failure"],
+            )
+            return iter([TranslationDelta(result=failure)])
+
+        lines = self._generate_mock_code(instruction, config, context).splitlines(keepends=True)
+        delay = self.config["delay_ms"] / 1000 / max(1, len(lines))
+
+        def pieces() -> Iterator[str]:
+            for line in lines:
+                if delay > 0:
+                    time.sleep(delay)
+                yield line
+
+        return self._stream_generated(
+            pieces(),
+            lambda code: self._build_result(code, instruction, config),
+            config.target_language,
+        )
+
+    def _build_result(
+        self, code: str, instruction: str, config: TranslationConfig
+    ) -> TranslationResult:
+        """Wrap generated mock code in a successful TranslationResult"""
         # Calculate mock confidence
         confidence = 0.95 if self.config["deterministic"] else random.uniform(0.7, 0.99)
 
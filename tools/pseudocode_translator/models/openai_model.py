@@ -7,6 +7,7 @@ GPT-3.5 and GPT-4 models for multi-language code generation.
 
 import logging
 import os
+from collections.abc import AsyncIterator, Iterator
 from pathlib import Path
 from typing import Any
 
@@ -16,6 +17,7 @@ from .base_model import (
     ModelMetadata,
     OutputLanguage,
     TranslationConfig,
+    TranslationDelta,
     TranslationResult,
     validate_instruction,
 )
@@ -129,6 +131,7 @@ class OpenAIModel(BaseTranslationModel):
         }
 
         self._client = None
+        self._async_client = None
 
     @property
     def metadata(self) -> ModelMetadata:
@@ -195,6 +198,13 @@ class OpenAIModel(BaseTranslationModel):
             timeout=self.config["timeout"],
             max_retries=self.config["max_retries"],
         )
+        # Used by the asyncio pipeline; requests are cancelled with their task
+        self._async_client = openai.AsyncOpenAI(
+            api_key=api_key,
+            organization=self.config.get("organization"),
+            timeout=self.config["timeout"],
+            max_retries=self.config["max_retries"],
+        )
 
         self._initialized = True
         logger.info("OpenAI model initialized successfully")
@@ -237,26 +247,14 @@ class OpenAIModel(BaseTranslationModel):
                 stop=config.stop_sequences,
             )
 
-            # Extract code from response
-            generated_text = response.choices[0].message.content
-            code = self._extract_code(generated_text, config.target_language)
-
-            # Calculate confidence based on response
-            confidence = self._calculate_confidence(response)
-
-            return TranslationResult(
-                success=True,
-                code=code,
-                language=config.target_language,
-                confidence=confidence,
-                metadata={
-                    "model": self.config["model_name"],
-                    "usage": {
-                        "prompt_tokens": response.usage.prompt_tokens,
-                        "completion_tokens": response.usage.completion_tokens,
-                        "total_tokens": response.usage.total_tokens,
-                    },
-                    "finish_reason": response.choices[0].finish_reason,
+            return self._build_result(
+                response.choices[0].message.content,
+                config,
+                response.choices[0].finish_reason,
+                usage={
+                    "prompt_tokens": response.usage.prompt_tokens,
+                    "completion_tokens": response.usage.completion_tokens,
+                    "total_tokens": response.usage.total_tokens,
                 },
             )
 
@@ -269,6 +267,134 @@ class OpenAIModel(BaseTranslationModel):
                 errors=[f"API error: {str(e)}"],
             )
 
+    def translate_stream(
+        self,
+        instruction: str,
+        config: TranslationConfig | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> Iterator[TranslationDelta]:
+        """
+        Translate instruction using the OpenAI streaming API
+
+        Args:
+            instruction: Natural language instruction
+            config: Translation configuration
+            context: Optional context
+
+        Yields:
+            Content deltas as they arrive, then the final result
+        """
+        if not self._initialized:
+            raise RuntimeError("Model not initialized")
+
+        if config is None:
+            config = TranslationConfig()
+
+        finish_reason: list[str | None] = [None]
+
+        def pieces() -> Iterator[str]:
+            stream = self._client.chat.completions.create(
+                model=self.config["model_name"],
+                messages=self._build_messages(instruction, config, context),
+                temperature=config.temperature,
+                top_p=config.top_p,
+                max_tokens=config.max_tokens,
+                stop=config.stop_sequences,
+                stream=True,
+            )
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                choice = chunk.choices[0]
+                if choice.finish_reason:
+                    finish_reason[0] = choice.finish_reason
+                yield choice.delta.content or ""
+
+        return self._stream_generated(
+            pieces(),
+            lambda text: self._build_result(text, config, finish_reason[0]),
+            config.target_language,
+        )
+
+    def translate_stream_async(
+        self,
+        instruction: str,
+        config: TranslationConfig | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> AsyncIterator[TranslationDelta]:
+        """
+        Translate instruction using the asyncio OpenAI client
+
+        Holds no thread while waiting for the API; cancelling the consuming
+        task closes the HTTP stream.
+
+        Args:
+            instruction: Natural language instruction
+            config: Translation configuration
+            context: Optional context
+
+        Returns:
+            Async iterator of content deltas, then the final result
+        """
+        if not self._initialized:
+            raise RuntimeError("Model not initialized")
+
+        if config is None:
+            config = TranslationConfig()
+
+        finish_reason: list[str | None] = [None]
+
+        async def pieces() -> AsyncIterator[str]:
+            stream = await self._async_client.chat.completions.create(
+                model=self.config["model_name"],
+                messages=self._build_messages(instruction, config, context),
+                temperature=config.temperature,
+                top_p=config.top_p,
+                max_tokens=config.max_tokens,
+                stop=config.stop_sequences,
+                stream=True,
+            )
+            try:
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    choice = chunk.choices[0]
+                    if choice.finish_reason:
+                        finish_reason[0] = choice.finish_reason
+                    yield choice.delta.content or ""
+            finally:
+                await stream.close()
+
+        return self._stream_generated_async(
+            pieces(),
+            lambda text: self._build_result(text, config, finish_reason[0]),
+            config.target_language,
+        )
+
+    def _build_result(
+        self,
+        generated_text: str,
+        config: TranslationConfig,
+        finish_reason: str | None,
+        usage: dict[str, int] | None = None,
+    ) -> TranslationResult:
+        """Build the TranslationResult for a completed response"""
+        code = self._extract_code(generated_text, config.target_language)
+        metadata: dict[str, Any] = {
+            "model": self.config["model_name"],
+            "finish_reason": finish_reason,
+        }
+        if usage is not None:
+            metadata["usage"] = usage
+
+        return TranslationResult(
+            success=True,
+            code=code,
+            language=config.target_language,
+            confidence=self._calculate_confidence(finish_reason),
+            metadata=metadata,
+        )
+
     def validate_input(self, instruction: str) -> tuple[bool, str | None]:
         """
         Validate input instruction
@@ -383,15 +509,15 @@ class OpenAIModel(BaseTranslationModel):
         # Otherwise, assume entire response is code
         return response.strip()
 
-    def _calculate_confidence(self, response: Any) -> float:
-        """Calculate confidence based on API response"""
+    def _calculate_confidence(self, finish_reason: str | None) -> float:
+        """Calculate confidence based on the response finish reason"""
         # Base confidence for OpenAI models
         base_confidence = 0.85
 
         # Adjust based on finish reason
-        if response.choices[0].finish_reason == "stop":
+        if finish_reason == "stop":
             base_confidence += 0.1
-        elif response.choices[0].finish_reason == "length":
+        elif finish_reason == "length":
             base_confidence -= 0.1
 
         # Adjust based on model
@@ -6,6 +6,7 @@ BaseTranslationModel interface, supporting multi-language output.
 """
 
 import logging
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -16,6 +17,7 @@ from .base_model import (
     ModelMetadata,
     OutputLanguage,
     TranslationConfig,
+    TranslationDelta,
     TranslationResult,
     format_code_block,
     validate_instruction,
@@ -124,7 +126,7 @@ class QwenModel(BaseTranslationModel):
             model_type="transformer",
             size_gb=4.5,  # Q4_K_M quantization
             requires_gpu=False,
-            supports_streaming=False,
+            supports_streaming=True,
             max_context_length=self.config["n_ctx"],
         )
 
@@ -222,24 +224,7 @@ class QwenModel(BaseTranslationModel):
             )
 
         try:
-            # Extract code context if provided
-            code_context = context.get("code", "") if context else ""
-
-            # Build language-specific prompt
-            lang_prompt = self.language_prompts.get(
-                config.target_language, f"Generate {config.target_language.value} code:"
-            )
-
-            # Select best prompting style
-            prompt_style = self.prompt_engineer.select_best_style(instruction, code_context)
-
-            # Create prompt with language specification
-            base_prompt = self.prompt_engineer.create_prompt(
-                instruction=instruction, style=prompt_style, context=code_context
-            )
-
-            # Combine with language prompt
-            full_prompt = f"{PromptLibrary.SYSTEM_PROMPT}\n\n{lang_prompt}\n\n{base_prompt}"
+            full_prompt, prompt_style = self._build_full_prompt(instruction, config, context)
 
             # Generate code
             logger.debug(f"Translating to {config.target_language.value}: {instruction[:50]}...")
@@ -253,30 +238,7 @@ class QwenModel(BaseTranslationModel):
                 stop_sequences=(config.stop_sequences or self._get_stop_sequences()),
             )
 
-            # Extract code from response
-            code = self.prompt_engineer.extract_code_from_response(generated_text)
-
-            # Validate and clean code
-            code = self._validate_and_clean_code(code, config.target_language)
-
-            # Format code if requested
-            if config.include_comments:
-                code = format_code_block(code, config.target_language)
-
-            # Calculate confidence based on validation
-            confidence = self._calculate_confidence(code, config.target_language)
-
-            return TranslationResult(
-                success=True,
-                code=code,
-                language=config.target_language,
-                confidence=confidence,
-                metadata={
-                    "model": "qwen",
-                    "prompt_style": prompt_style,
-                    "tokens_generated": len(generated_text.split()),
-                },
-            )
+            return self._build_result(generated_text, config, prompt_style)
 
         except Exception as e:
             logger.error(f"Translation failed: {str(e)}")
@@ -287,6 +249,120 @@ class QwenModel(BaseTranslationModel):
                 errors=[f"Translation error: {str(e)}"],
             )
 
+    def translate_stream(
+        self,
+        instruction: str,
+        config: TranslationConfig | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> Iterator[TranslationDelta]:
+        """
+        Translate an instruction, yielding text as llama.cpp generates it
+
+        Args:
+            instruction: Natural language instruction
+            config: Translation configuration
+            context: Optional context (e.g., surrounding code, variables)
+
+        Yields:
+            Generated text deltas, then the final result
+        """
+        if not self._initialized:
+            raise RuntimeError("Model not initialized. Call initialize() first.")
+
+        if config is None:
+            config = TranslationConfig()
+
+        validation_issues = self.validate_config(config)
+        if validation_issues:
+            return iter(
+                [
+                    TranslationDelta(
+                        result=TranslationResult(
+                            success=False,
+                            code=None,
+                            language=config.target_language,
+                            errors=validation_issues,
+                        )
+                    )
+                ]
+            )
+
+        full_prompt, prompt_style = self._build_full_prompt(instruction, config, context)
+
+        def pieces() -> Iterator[str]:
+            stream = self._generate(
+                prompt=full_prompt,
+                max_tokens=config.max_tokens,
+                temperature=config.temperature,
+                top_p=config.top_p,
+                top_k=config.top_k,
+                stop_sequences=(config.stop_sequences or self._get_stop_sequences()),
+                stream=True,
+            )
+            for chunk in stream:
+                yield chunk["choices"][0]["text"]
+
+        return self._stream_generated(
+            pieces(),
+            lambda text: self._build_result(text, config, prompt_style),
+            config.target_language,
+        )
+
+    def _build_full_prompt(
+        self,
+        instruction: str,
+        config: TranslationConfig,
+        context: dict[str, Any] | None,
+    ) -> tuple[str, Any]:
+        """Build the complete prompt and return it with the prompting style used"""
+        # Extract code context if provided
+        code_context = context.get("code", "") if context else ""
+
+        # Build language-specific prompt
+        lang_prompt = self.language_prompts.get(
+            config.target_language, f"Generate {config.target_language.value} code:"
+        )
+
+        # Select best prompting style
+        prompt_style = self.prompt_engineer.select_best_style(instruction, code_context)
+
+        # Create prompt with language specification
+        base_prompt = self.prompt_engineer.create_prompt(
+            instruction=instruction, style=prompt_style, context=code_context
+        )
+
+        # Combine with language prompt
+        return f"{PromptLibrary.SYSTEM_PROMPT}\n\n{lang_prompt}\n\n{base_prompt}", prompt_style
+
+    def _build_result(
+        self, generated_text: str, config: TranslationConfig, prompt_style: Any
+    ) -> TranslationResult:
+        """Extract, clean and score the code in generated text"""
+        # Extract code from response
+        code = self.prompt_engineer.extract_code_from_response(generated_text)
+
+        # Validate and clean code
+        code = self._validate_and_clean_code(code, config.target_language)
+
+        # Format code if requested
+        if config.include_comments:
+            code = format_code_block(code, config.target_language)
+
+        # Calculate confidence based on validation
+        confidence = self._calculate_confidence(code, config.target_language)
+
+        return TranslationResult(
+            success=True,
+            code=code,
+            language=config.target_language,
+            confidence=confidence,
+            metadata={
+                "model": "qwen",
+                "prompt_style": prompt_style,
+                "tokens_generated": len(generated_text.split()),
+            },
+        )
+
     def validate_input(self, instruction: str) -> tuple[bool, str | None]:
         """
         Validate if the input instruction is suitable for translation
@@ -356,7 +432,8 @@ class QwenModel(BaseTranslationModel):
         top_p: float,
         top_k: int,
         stop_sequences: list[str],
-    ) -> str:
+        stream: bool = False,
+    ) -> Any:
         """
         Internal method to generate text using the model
 
@@ -367,9 +444,10 @@ class QwenModel(BaseTranslationModel):
             top_p: Top-p sampling parameter
             top_k: Top-k sampling parameter
             stop_sequences: List of sequences to stop generation
+            stream: Return llama.cpp's completion chunk iterator instead
 
         Returns:
-            Generated text
+            Generated text, or an iterator of completion chunks when streaming
         """
         generation_params = {
             "max_tokens": max_tokens,
@@ -380,6 +458,9 @@ class QwenModel(BaseTranslationModel):
             "stop": stop_sequences,
         }
 
+        if stream:
+            return self._model(prompt, stream=True, **generation_params)
+
         response = self._model(prompt, **generation_params)
         return response["choices"][0]["text"]
 
@@ -0,0 +1,497 @@
+"""
+Model residency for the Pseudocode Translator
+
+Loading a model's weights can take tens of seconds, so TranslationManager
+takes initialized models from a process-wide ModelResidencyManager instead of
+creating them on every start or switch_model():
+
+- Each acquire() gets exclusive use of a model instance until release(), since
+  llama.cpp and transformers models are not safe to call from several threads.
+  When every resident instance of the requested model is busy (for example
+  ParallelProcessor's per-worker managers), another instance is loaded.
+- Models listed in llm.preload_models, and the warm fallback, are loaded and
+  warmed up on a background thread. A request for a model that is still
+  preloading waits for that load instead of starting a second one.
+- The memory of each model is measured as the growth of the process RSS while
+  it loaded. Loads are serialized so that measurements do not overlap.
+- Models no TranslationManager is using stay loaded. They are evicted least
+  recently used first when the measured total exceeds the memory ceiling, when
+  more than max_models are resident, or after ttl_minutes without use. Models
+  in use are never evicted, so the pool can exceed its limits while they all
+  are busy; the surplus is evicted as they are released.
+- The preloaded warm fallback is never evicted. It is served when another
+  model fails to load, in the same way ModelFactory falls back when creation
+  fails.
+- get_stats() reports hits, misses, loads, load time and evictions. The same
+  counters go to telemetry as "model_residency" events.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import psutil
+
+from ..telemetry import get_recorder
+from .base_model import BaseTranslationModel
+from .model_factory import create_model
+
+logger = logging.getLogger(__name__)
+
+_MB = 1024 * 1024
+
+
+@dataclass
+class ResidentModel:
+    """An initialized model kept by ModelResidencyManager"""
+
+    slot: int
+    key: str
+    name: str
+    model: BaseTranslationModel
+    rss_bytes: int
+    load_seconds: float
+    last_used: float
+    in_use: bool = False
+    fallback: bool = False
+
+
+def make_residency_key(name: str, config: dict[str, Any], model_path: Path | None) -> str:
+    """Instances are reused only for identical (name, config, path) requests."""
+    payload = json.dumps([name, config, str(model_path)], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ModelResidencyManager:
+    """Thread-safe LRU pool of initialized translation models"""
+
+    def __init__(
+        self,
+        max_memory_mb: int = 0,
+        max_models: int = 1,
+        ttl_minutes: int = 0,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            max_memory_mb: Ceiling for the measured RSS of resident models (0 = none);
+                only idle models are evicted to meet it
+            max_models: Models kept resident, not counting the warm fallback
+            ttl_minutes: Evict idle models unused for this long (0 = never)
+        """
+        self.max_memory_mb = max_memory_mb
+        self.max_models = max(1, int(max_models))
+        self.ttl_minutes = ttl_minutes
+        # Instances by slot, least recently used first; several may share a key
+        self._resident: OrderedDict[int, ResidentModel] = OrderedDict()
+        self._slots = itertools.count(1)
+        self._loading: dict[str, Future[ResidentModel]] = {}
+        self._measured: dict[str, int] = {}
+        self._fallback_key: str | None = None
+        self._fallback_spec: tuple[str, dict[str, Any], Path | None] | None = None
+        self._lock = threading.Lock()
+        # One load at a time, so RSS growth belongs to that model
+        self._load_lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._process = psutil.Process()
+
+        self._hits = 0
+        self._misses = 0
+        self._loads = 0
+        self._load_failures = 0
+        self._load_seconds = 0.0
+        self._evictions = 0
+        self._fallbacks = 0
+
+    def configure(
+        self,
+        max_memory_mb: int | None = None,
+        max_models: int | None = None,
+        ttl_minutes: int | None = None,
+    ) -> None:
+        """Update limits (None keeps the current value) and evict what no longer fits."""
+        with self._lock:
+            if max_memory_mb is not None:
+                self.max_memory_mb = max_memory_mb
+            if max_models is not None:
+                self.max_models = max(1, int(max_models))
+            if ttl_minutes is not None:
+                self.ttl_minutes = ttl_minutes
+            victims = self._select_evictions()
+        self._shutdown_models(victims)
+
+    # ----- acquiring -----
+
+    def acquire(
+        self, name: str, config: dict[str, Any], model_path: Path | None = None
+    ) -> BaseTranslationModel:
+        """
+        Get an initialized model for exclusive use, loading one if none is idle.
+
+        The model is reserved for the caller until release() is called for it.
+
+        Args:
+            name: Model name as accepted by create_model()
+            config: Model configuration dict
+            model_path: Path passed to initialize()
+
+        Returns:
+            Initialized model
+
+        Raises:
+            Exception: Whatever loading raised, when there is no warm fallback
+        """
+        key = make_residency_key(name, config, model_path)
+        while True:
+            with self._lock:
+                entry = self._idle_entry(key)
+                if entry is not None:
+                    self._pin(entry)
+                    self._hits += 1
+                    self._record({"hit": 1})
+                    return entry.model
+                future = self._loading.get(key)
+                owner = future is None
+                if owner:
+                    future = self._start_load(key)
+                self._misses += 1
+            self._record({"miss": 1})
+
+            if owner:
+                self._load(key, name, config, model_path, future, warmup=False, pinned=True)
+            try:
+                loaded = future.result()
+            except Exception as e:
+                fallback = self._acquire_fallback(key)
+                if fallback is None:
+                    raise
+                logger.warning("Model '%s' failed to load (%s); using warm fallback", name, e)
+                return fallback
+            if owner:
+                return loaded.model
+            # Someone else's load finished: take it if still idle, else load another
+
+    def name_of(self, model: BaseTranslationModel) -> str | None:
+        """Name a pooled model was loaded under (differs from the request after a fallback)."""
+        with self._lock:
+            entry = self._entry_of(model)
+            return entry.name if entry is not None else None
+
+    def release(self, model: BaseTranslationModel | None) -> None:
+        """
+        Return a model obtained from acquire(); it stays warm until evicted.
+
+        Models that did not come from this pool are shut down.
+        """
+        if model is None:
+            return
+        with self._lock:
+            entry = self._entry_of(model)
+            if entry is not None:
+                entry.in_use = False
+                entry.last_used = time.time()
+            victims = self._select_evictions()
+        self._shutdown_models(victims)
+        if entry is None:
+            model.shutdown()
+
+    def _idle_entry(self, key: str) -> ResidentModel | None:
+        """Most recently used idle instance for key; caller holds the lock."""
+        return next(
+            (e for e in reversed(self._resident.values()) if e.key == key and not e.in_use),
+            None,
+        )
+
+    def _entry_of(self, model: BaseTranslationModel) -> ResidentModel | None:
+        return next((e for e in self._resident.values() if e.model is model), None)
+
+    def preload(
+        self,
+        name: str,
+        config: dict[str, Any],
+        model_path: Path | None = None,
+        fallback: bool = False,
+    ) -> Future[ResidentModel]:
+        """
+        Load and warm up a model on the background thread.
+
+        Args:
+            name: Model name as accepted by create_model()
+            config: Model configuration dict
+            model_path: Path passed to initialize()
+            fallback: Keep this model as the warm fallback (never evicted)
+
+        Returns:
+            Future resolving to the ResidentModel
+        """
+        key = make_residency_key(name, config, model_path)
+        with self._lock:
+            if fallback:
+                self._fallback_key = key
+                self._fallback_spec = (name, config, model_path)
+                # Exactly one instance, of the current fallback model, is kept for good
+                for other in self._resident.values():
+                    other.fallback = other.fallback and other.key == key
+            entry = next((e for e in self._resident.values() if e.key == key), None)
+            if entry is not None:
+                if fallback and not any(e.fallback for e in self._resident.values()):
+                    entry.fallback = True
+                done: Future[ResidentModel] = Future()
+                done.set_result(entry)
+                return done
+            future = self._loading.get(key)
+            if future is not None:
+                return future
+            future = self._start_load(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="model-preload"
+                )
+            executor = self._executor
+
+        executor.submit(
+            self._load, key, name, config, model_path, future, True, False, fallback
+        )
+        return future
+
+    def _start_load(self, key: str) -> Future[ResidentModel]:
+        future: Future[ResidentModel] = Future()
+        self._loading[key] = future
+        return future
+
+    def _load(
+        self,
+        key: str,
+        name: str,
+        config: dict[str, Any],
+        model_path: Path | None,
+        future: Future[ResidentModel],
+        warmup: bool,
+        pinned: bool,
+        fallback: bool = False,
+    ) -> None:
+        """Create and initialize a model, then publish it as resident."""
+        with self._lock:
+            # Make room using what this model measured last time
+            victims = self._select_evictions(self._measured.get(key, 0), 1)
+        self._shutdown_models(victims)
+
+        with self._load_lock:
+            before = self._rss()
+            start = time.perf_counter()
+            try:
+                model = create_model(name, config)
+                model.initialize(model_path)
+                if warmup:
+                    model.warmup()
+            except Exception as e:
+                logger.error("Loading model '%s' failed: %s", name, e)
+                with self._lock:
+                    self._loading.pop(key, None)
+                    self._load_failures += 1
+                self._record({"load_failure": 1})
+                future.set_exception(e)
+                return
+            seconds = time.perf_counter() - start
+            rss_bytes = max(0, self._rss() - before)
+
+        # A pinned entry cannot be evicted or taken before its requester gets it
+        with self._lock:
+            entry = ResidentModel(
+                slot=next(self._slots),
+                key=key,
+                name=name,
+                model=model,
+                rss_bytes=rss_bytes,
+                load_seconds=seconds,
+                last_used=time.time(),
+                in_use=pinned,
+                fallback=fallback,
+            )
+            self._resident[entry.slot] = entry
+            self._loading.pop(key, None)
+            self._measured[key] = rss_bytes
+            self._loads += 1
+            self._load_seconds += seconds
+            victims = self._select_evictions()
+        self._shutdown_models(victims)
+
+        logger.info(
+            "Model '%s' resident after %.1fs (+%.0f MB RSS)", name, seconds, rss_bytes / _MB
+        )
+        get_recorder().record_event(
+            "model_residency.load",
+            duration_ms=seconds * 1000.0,
+            extra={"model": name, "rss_mb": round(rss_bytes / _MB, 1)},
+            counters={"load": 1},
+        )
+        future.set_result(entry)
+
+    def _acquire_fallback(self, failed_key: str) -> BaseTranslationModel | None:
+        with self._lock:
+            key, spec = self._fallback_key, self._fallback_spec
+            future = self._loading.get(key) if key is not None else None
+        if key is None or spec is None or key == failed_key:
+            return None
+        if future is not None:
+            try:
+                future.result()
+            except Exception:
+                return None
+        try:
+            # The idle warm instance, or another one when it is busy
+            model = self.acquire(*spec)
+        except Exception:
+            return None
+        with self._lock:
+            self._fallbacks += 1
+        self._record({"fallback": 1})
+        return model
+
+    def _pin(self, entry: ResidentModel) -> None:
+        entry.in_use = True
+        entry.last_used = time.time()
+        self._resident.move_to_end(entry.slot)
+
+    # ----- eviction -----
+
+    def _over_budget(self, incoming_bytes: int, incoming_models: int) -> bool:
+        evictable = [e for e in self._resident.values() if not e.fallback]
+        if len(evictable) + incoming_models > self.max_models:
+            return True
+        if self.max_memory_mb > 0:
+            total = sum(e.rss_bytes for e in self._resident.values()) + incoming_bytes
+            return total > self.max_memory_mb * _MB
+        return False
+
+    def _select_evictions(
+        self, incoming_bytes: int = 0, incoming_models: int = 0
+    ) -> list[ResidentModel]:
+        """Remove idle models, LRU first, until within limits; caller holds the lock."""
+        victims: list[ResidentModel] = []
+        cutoff = time.time() - self.ttl_minutes * 60 if self.ttl_minutes > 0 else None
+        for slot, entry in list(self._resident.items()):
+            if entry.in_use or entry.fallback:
+                continue
+            expired = cutoff is not None and entry.last_used < cutoff
+            if not expired and not self._over_budget(incoming_bytes, incoming_models):
+                continue
+            del self._resident[slot]
+            victims.append(entry)
+            self._evictions += 1
+        return victims
+
+    def _shutdown_models(self, victims: list[ResidentModel]) -> None:
+        for entry in victims:
+            logger.info("Evicting model '%s' (%.0f MB)", entry.name, entry.rss_bytes / _MB)
+            self._record({"eviction": 1})
+            try:
+                entry.model.shutdown()
+            except Exception as e:
+                logger.warning("Error shutting down model '%s': %s", entry.name, e)
+
+    def evict(self, name: str | None = None) -> int:
+        """
+        Evict idle models now.
+
+        Args:
+            name: Only evict models with this name (None = all idle models,
+                  including the warm fallback)
+
+        Returns:
+            Number of models evicted
+        """
+        with self._lock:
+            victims = [
+                e
+                for e in self._resident.values()
+                if not e.in_use and (name is None or e.name == name)
+            ]
+            for entry in victims:
+                del self._resident[entry.slot]
+            self._evictions += len(victims)
+        self._shutdown_models(victims)
+        return len(victims)
+
+    # ----- reporting -----
+
+    def _rss(self) -> int:
+        try:
+            return int(self._process.memory_info().rss)
+        except psutil.Error:
+            return 0
+
+    @staticmethod
+    def _record(counters: dict[str, int]) -> None:
+        get_recorder().record_event("model_residency", counters=counters)
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "resident": [
+                    {
+                        "model": e.name,
+                        "rss_mb": round(e.rss_bytes / _MB, 1),
+                        "load_seconds": round(e.load_seconds, 3),
+                        "in_use": e.in_use,
+                        "fallback": e.fallback,
+                        "idle_seconds": round(time.time() - e.last_used, 1),
+                    }
+                    for e in self._resident.values()
+                ],
+                "loading": len(self._loading),
+                "resident_mb": round(sum(e.rss_bytes for e in self._resident.values()) / _MB, 1),
+                "max_memory_mb": self.max_memory_mb,
+                "max_models": self.max_models,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "loads": self._loads,
+                "load_failures": self._load_failures,
+                "load_seconds_total": round(self._load_seconds, 3),
+                "evictions": self._evictions,
+                "fallbacks_served": self._fallbacks,
+            }
+
+    def shutdown(self) -> None:
+        """Stop preloading and shut down every resident model."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        with self._lock:
+            victims = list(self._resident.values())
+            self._resident.clear()
+            self._fallback_key = None
+            self._fallback_spec = None
+        for entry in victims:
+            try:
+                entry.model.shutdown()
+            except Exception as e:
+                logger.warning("Error shutting down model '%s': %s", entry.name, e)
+
+
+# Process-wide pool shared by all TranslationManager instances
+_residency: ModelResidencyManager | None = None
+_residency_lock = threading.Lock()
+
+
+def get_residency_manager() -> ModelResidencyManager:
+    """Get or create the process-wide ModelResidencyManager"""
+    global _residency
+    with _residency_lock:
+        if _residency is None:
+            _residency = ModelResidencyManager()
+        return _residency
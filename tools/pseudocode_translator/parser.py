@@ -19,6 +19,13 @@ except ImportError:
 
     from models import BlockType, CodeBlock, ParseError, ParseResult
 
+try:
+    from .analysis_context import memoize
+except ImportError:
+    # Script mode has no translation scope to memoize in
+    def memoize(kind, key, compute):
+        return compute()
+
 
 class ParserModule:
     """Main parser class that processes mixed English/Python pseudocode"""
@@ -314,7 +321,7 @@ class ParserModule:
             None. Updates metadata in place.
         """
         # Check for docstring
-        if self._DOCSTRING_RE.search(block):
+        if self._DOCSTRING_PATTERN_RE.search(block):
             metadata["has_docstring"] = True
 
         # Determine completeness
@@ -482,6 +489,11 @@ class ParserModule:
         if line.strip().startswith("#"):
             return True
 
+        # The same line is probed by several scorers during one translation
+        return memoize("valid_python_line", line, lambda: self._parse_python_line(line))
+
+    def _parse_python_line(self, line: str) -> bool:
+        """Uncached body of _is_valid_python for a non-empty, non-comment line."""
         try:
             # Try to parse as a statement
             ast.parse(line)
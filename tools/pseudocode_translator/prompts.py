@@ -8,6 +8,9 @@ high-quality Python code from English instructions.
 from dataclasses import dataclass
 from enum import Enum
 
+# Bump whenever a template below changes; cached translations are keyed by it
+PROMPT_TEMPLATE_VERSION = "1"
+
 
 class PromptStyle(Enum):
     """Different prompting styles for various use cases"""
@@ -157,7 +157,9 @@ class DependencyAnalysisGateway:
     ) -> None:
         import ast
 
-        for node in ast.walk(tree):
+        from ..analysis_context import walk
+
+        for node in walk(tree):
             if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
                 defined_names.add(node.name)
             elif isinstance(node, ast.Assign):
@@ -6,6 +6,7 @@ large files through chunk-based processing while maintaining code quality
 and respecting code boundaries.
 """
 
+from .async_pipeline import AsyncStreamingPipeline
 from .buffer import BufferConfig, StreamBuffer
 from .chunker import ChunkConfig, CodeChunker
 from .pipeline import StreamConfig, StreamingPipeline
@@ -14,6 +15,7 @@ __all__ = [
     "CodeChunker",
     "ChunkConfig",
     "StreamingPipeline",
+    "AsyncStreamingPipeline",
     "StreamConfig",
     "StreamBuffer",
     "BufferConfig",
@@ -0,0 +1,440 @@
+"""
+Asyncio-native streaming pipeline for the Pseudocode Translator
+
+AsyncStreamingPipeline runs the stages of StreamingPipeline (read, chunk,
+translate, reassemble) as tasks of one asyncio.TaskGroup connected by bounded
+queues:
+
+    reader -> chunks -> N translate workers -> done -> reassembler -> caller
+
+- A full queue suspends the stage feeding it, so a slow consumer throttles
+  translation and a slow model throttles reading. At most
+  max_concurrent_chunks + max_queue_size chunks are between the reader and
+  the caller at any time, the same window StreamingPipeline uses for its
+  executor submissions.
+- Results are handed to the caller in chunk order; chunks finishing early
+  wait in the reassembly buffer.
+- Model calls go through TranslationManager.translate_text_block_async(), so
+  models with an asyncio client hold no thread while waiting. Parsing runs in
+  the default executor so the event loop stays responsive.
+- Cancelling the consuming task, closing the iterator or calling
+  cancel_streaming() cancels the TaskGroup and every in-flight model call.
+
+The pipeline can be consumed directly from an async web handler, e.g. as the
+body of a streaming response.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import codecs
+import contextlib
+import logging
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+from typing import TYPE_CHECKING, Any
+
+from ..integration.events import EventType
+from ..models import BlockType
+from ..telemetry import get_recorder
+from .chunker import CodeChunk
+from .pipeline import ChunkResult, StreamConfig, StreamingPipeline, StreamingProgress
+
+if TYPE_CHECKING:
+    from ..config import TranslatorConfig
+    from ..translator import TranslationManager
+
+logger = logging.getLogger(__name__)
+
+# Characters requested per read() from file-like sources
+READ_SIZE = 64 * 1024
+
+# Marks the end of a queue
+_END = object()
+
+
+class AsyncStreamingPipeline(StreamingPipeline):
+    """
+    StreamingPipeline variant whose stages are asyncio tasks
+
+    Context handling, buffering and assembly are shared with
+    StreamingPipeline; only scheduling differs.
+    """
+
+    def __init__(
+        self,
+        config: TranslatorConfig,
+        stream_config: StreamConfig | None = None,
+        translator: TranslationManager | None = None,
+    ):
+        """
+        Initialize the pipeline
+
+        Args:
+            config: Translator configuration
+            stream_config: Streaming-specific configuration
+            translator: TranslationManager to use; it is left running when the
+                stream ends. Without one a manager is created per stream and
+                shut down afterwards.
+        """
+        super().__init__(config, stream_config)
+        self.translator = translator
+        self._owns_translator = translator is None
+        self._runner: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def stream_translate(
+        self,
+        source: str | AsyncIterable[str] | Any,
+        filename: str | None = None,
+        progress_callback: Callable[[StreamingProgress], None] | None = None,
+        token_callback: Callable[[Any], None] | None = None,
+    ) -> AsyncIterator[ChunkResult]:
+        """
+        Stream translation of pseudocode
+
+        Args:
+            source: The whole text, an async iterable of text pieces, or an
+                object with an async read(size) method (e.g.
+                stream_handlers.AsyncFileStreamHandler)
+            filename: Optional filename for better error reporting
+            progress_callback: Optional callback for progress updates
+            token_callback: Optional callback receiving a
+                protocols.TranslationUpdateMessage for every piece of model
+                output (called on the event loop)
+
+        Yields:
+            ChunkResult objects in chunk order
+        """
+        if self.translator is None:
+            from ..translator import TranslationManager  # local import to avoid cycle
+
+            # Model loading may block for a long time
+            self.translator = await asyncio.to_thread(TranslationManager, self.config)
+
+        if progress_callback:
+            self.progress_callbacks.append(progress_callback)
+        if token_callback:
+            self.token_callbacks.append(token_callback)
+
+        recorder = get_recorder()
+        total_start = time.perf_counter()
+        self._stop_event.clear()
+        self._dispatch(EventType.STREAM_STARTED, reason="async_pipeline")
+
+        self._loop = asyncio.get_running_loop()
+        results: asyncio.Queue[Any] = asyncio.Queue(maxsize=self._window())
+        self._runner = asyncio.create_task(self._run(source, filename, results))
+        progress_task = (
+            asyncio.create_task(self._report_progress()) if self.progress_callbacks else None
+        )
+
+        try:
+            while True:
+                item = await results.get()
+                if item is _END:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                chunk, result = item
+                self._record_chunk_result(chunk, result)
+                yield result
+        finally:
+            # Stop the stages (and their model calls) if the caller went away early
+            self._stop_event.set()
+            for task in (self._runner, progress_task):
+                if task is not None and not task.done():
+                    task.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await task
+            self._runner = None
+
+            with contextlib.suppress(Exception):
+                recorder.record_event("stream.total", (time.perf_counter() - total_start) * 1000.0)
+            self._dispatch(EventType.STREAM_COMPLETED, chunks=self.progress.processed_chunks)
+
+            if self._owns_translator and self.translator is not None:
+                self.translator.shutdown()
+                self.translator = None
+
+    async def translate(self, source: str | AsyncIterable[str] | Any) -> str:
+        """
+        Translate the whole source and return the assembled code
+
+        Args:
+            source: As for stream_translate()
+
+        Returns:
+            Complete assembled code
+        """
+        async for _ in self.stream_translate(source):
+            pass
+        return await asyncio.to_thread(self.assemble_streamed_code)
+
+    def cancel_streaming(self):
+        """Cancel the ongoing stream; safe to call from any thread"""
+        self._stop_event.set()
+        runner, loop = self._runner, self._loop
+        if runner is not None and loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(runner.cancel)
+        logger.info("Streaming operation cancelled")
+
+    # ----- stages -----
+
+    def _window(self) -> int:
+        """Chunks allowed between the reader and the caller"""
+        workers = max(1, self.stream_config.max_concurrent_chunks)
+        if self.stream_config.enable_backpressure:
+            return workers + max(0, self.stream_config.max_queue_size)
+        return workers
+
+    async def _run(
+        self, source: Any, filename: str | None, results: asyncio.Queue[Any]
+    ) -> None:
+        """Run all stages; forwards the end marker or the first failure to results"""
+        workers = max(1, self.stream_config.max_concurrent_chunks)
+        window = self._window()
+        chunks: asyncio.Queue[Any] = asyncio.Queue(maxsize=max(1, window - workers))
+        done: asyncio.Queue[Any] = asyncio.Queue(maxsize=window)
+        # Released by the reassembler, so out-of-order results cannot pile up
+        slots = asyncio.Semaphore(window)
+
+        error: BaseException | None = None
+        try:
+            async with asyncio.TaskGroup() as group:
+                group.create_task(self._read_stage(source, filename, chunks, slots, workers))
+                for _ in range(workers):
+                    group.create_task(self._translate_stage(chunks, done))
+                group.create_task(self._reassemble_stage(done, results, slots, workers))
+        except ExceptionGroup as failures:
+            error = failures.exceptions[0] if len(failures.exceptions) == 1 else failures
+            logger.error(f"Streaming pipeline failed: {error}")
+        except asyncio.CancelledError:
+            # cancel_streaming(): wake the caller, dropping results it has not taken
+            while not results.empty():
+                results.get_nowait()
+            results.put_nowait(_END)
+            raise
+        await results.put(_END if error is None else error)
+
+    async def _read_stage(
+        self,
+        source: Any,
+        filename: str | None,
+        chunks: asyncio.Queue[Any],
+        slots: asyncio.Semaphore,
+        workers: int,
+    ) -> None:
+        """Cut the source into chunks and feed them to the translate workers"""
+        if isinstance(source, str):
+            self.progress.total_bytes = len(source.encode("utf-8"))
+            # The chunker needs the whole text (AST boundaries); keep it off the loop
+            chunk_list = await asyncio.to_thread(
+                lambda: list(self.chunker.stream_chunks(source, filename))
+            )
+            self.progress.total_chunks = len(chunk_list)
+            produced: AsyncIterator[CodeChunk] = _aiter_list(chunk_list)
+        else:
+            produced = self._cut_chunks(_read_pieces(source))
+
+        async for chunk in produced:
+            if self._stop_event.is_set():
+                break
+            await slots.acquire()
+            await chunks.put(chunk)
+
+        for _ in range(workers):
+            await chunks.put(_END)
+
+    async def _cut_chunks(self, pieces: AsyncIterator[str]) -> AsyncIterator[CodeChunk]:
+        """Line-aligned chunks of at most max_chunk_size characters from streamed text"""
+        max_size = max(1, self.chunker.config.max_chunk_size)
+        pending = ""
+        position = 0
+        line = 1
+        index = 0
+
+        def cut(text: str) -> CodeChunk:
+            nonlocal position, line, index
+            chunk = CodeChunk(
+                content=text,
+                start_line=line,
+                end_line=line + text.count("\n"),
+                start_byte=position,
+                end_byte=position + len(text),
+                chunk_index=index,
+                total_chunks=None,
+                metadata={"line_based": True},
+            )
+            position += len(text)
+            line = chunk.end_line
+            index += 1
+            # Total is only known at the end; keep it in sync for assembly
+            self.progress.total_chunks = index
+            return chunk
+
+        async for piece in pieces:
+            self.progress.total_bytes += len(piece.encode("utf-8"))
+            pending += piece
+            while len(pending) >= max_size:
+                end = pending.rfind("\n", 0, max_size) + 1 or max_size
+                yield cut(pending[:end])
+                pending = pending[end:]
+        if pending:
+            yield cut(pending)
+
+    async def _translate_stage(self, chunks: asyncio.Queue[Any], done: asyncio.Queue[Any]) -> None:
+        """Worker: translate chunks until the reader's end marker"""
+        while True:
+            chunk = await chunks.get()
+            if chunk is _END:
+                await done.put(_END)
+                return
+            self.progress.current_chunk = chunk.chunk_index
+            result = await self._process_single_chunk_async(chunk)
+            await done.put((chunk, result))
+
+    async def _reassemble_stage(
+        self,
+        done: asyncio.Queue[Any],
+        results: asyncio.Queue[Any],
+        slots: asyncio.Semaphore,
+        workers: int,
+    ) -> None:
+        """Hand results to the caller in chunk order"""
+        waiting: dict[int, tuple[CodeChunk, ChunkResult]] = {}
+        next_index = 0
+        finished = 0
+        while finished < workers:
+            item = await done.get()
+            if item is _END:
+                finished += 1
+                continue
+            chunk, _ = item
+            waiting[chunk.chunk_index] = item
+            while next_index in waiting:
+                await results.put(waiting.pop(next_index))
+                slots.release()
+                next_index += 1
+
+    # ----- per-chunk work -----
+
+    async def _process_single_chunk_async(self, chunk: CodeChunk) -> ChunkResult:
+        """
+        Asynchronous _process_single_chunk()
+
+        Args:
+            chunk: Code chunk to process
+
+        Returns:
+            ChunkResult
+        """
+        start_time = time.time()
+        result = ChunkResult(chunk_index=chunk.chunk_index, success=True)
+
+        try:
+            blocks = await asyncio.to_thread(self._parse_chunk, chunk, result)
+            if blocks is None:
+                return result
+
+            translated_blocks = []
+            for block_index, block in enumerate(blocks):
+                if block.type != BlockType.ENGLISH:
+                    translated_blocks.append(block)
+                    continue
+
+                context = self._build_translation_context(chunk.chunk_index)
+                try:
+                    res = await self._translate_english_block_async(
+                        chunk.chunk_index, block_index, block, context
+                    )
+                    translated_blocks.append(
+                        self._translated_block(chunk.chunk_index, block_index, block, res)
+                    )
+                except Exception as e:
+                    logger.error(f"Translation error in chunk {chunk.chunk_index}: {e}")
+                    result.warnings.append(f"Translation error: {str(e)}")
+                    translated_blocks.append(block)  # Keep original
+
+            self._finish_chunk(chunk, result, translated_blocks)
+
+        except Exception as e:
+            logger.error(f"Error in chunk {chunk.chunk_index}: {e}")
+            result.success = False
+            result.error = str(e)
+
+        result.processing_time = time.time() - start_time
+        return result
+
+    async def _translate_english_block_async(
+        self, chunk_index: int, block_index: int, block: Any, context: dict[str, Any]
+    ) -> Any:
+        """
+        Asynchronous _translate_english_block()
+
+        Returns:
+            The model-level TranslationResult (None if the stream ended early)
+        """
+        translator = self.translator
+        if translator is None:
+            raise RuntimeError("Translator not initialized")
+        if not self.token_callbacks:
+            return await translator.translate_text_block_async(text=block.content, context=context)
+
+        if self._token_protocol is None:
+            from .protocols import TokenStreamProtocol  # local import to avoid cycle
+
+            self._token_protocol = TokenStreamProtocol()
+
+        generated = ""
+        async for delta in translator.translate_text_block_stream_async(
+            text=block.content, context=context
+        ):
+            if delta.done:
+                return delta.result
+            generated += delta.text
+            self._emit_translation_update(
+                self._token_protocol.process_delta(
+                    chunk_index, block_index, block.content, generated, delta.text
+                )
+            )
+        return None
+
+    async def _report_progress(self) -> None:
+        """Task version of StreamingPipeline._progress_reporter()"""
+        while True:
+            for callback in self.progress_callbacks:
+                try:
+                    callback(self.progress)
+                except Exception as e:
+                    logger.error(f"Error in progress callback: {e}")
+            await asyncio.sleep(self.stream_config.progress_callback_interval)
+
+
+async def _aiter_list(items: list[CodeChunk]) -> AsyncIterator[CodeChunk]:
+    for item in items:
+        yield item
+
+
+async def _read_pieces(source: Any) -> AsyncIterator[str]:
+    """Text pieces from an async iterable or an object with an async read(size)"""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+
+    if hasattr(source, "read"):
+
+        async def raw() -> AsyncIterator[Any]:
+            while data := await source.read(READ_SIZE):
+                yield data
+
+        pieces = raw()
+    else:
+        pieces = source
+
+    async for piece in pieces:
+        # Multi-byte characters may be split across byte pieces
+        text = decoder.decode(piece) if isinstance(piece, bytes) else piece
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
@@ -120,6 +120,11 @@ class StreamingPipeline:
         # Progress tracking
         self.progress = StreamingProgress()
         self.progress_callbacks = []
+
+        # Token-level output; model calls stream only while a callback is registered
+        self.token_callbacks: list[Callable[[Any], None]] = []
+        self._token_protocol = None
+        self._emitter = None
         self._stop_event = threading.Event()
         self._progress_thread = None
 
@@ -150,6 +155,7 @@ class StreamingPipeline:
         code: str,
         filename: str | None = None,
         progress_callback: Callable[[StreamingProgress], None] | None = None,
+        token_callback: Callable[[Any], None] | None = None,
     ) -> Iterator[ChunkResult]:
         """
         Stream translation of pseudocode
@@ -158,6 +164,9 @@ class StreamingPipeline:
             code: Source code to translate
             filename: Optional filename for better error reporting
             progress_callback: Optional callback for progress updates
+            token_callback: Optional callback receiving a
+                protocols.TranslationUpdateMessage for every piece of model
+                output (may be called from worker threads)
 
         Yields:
             ChunkResult objects as chunks are processed
@@ -166,7 +175,8 @@ class StreamingPipeline:
         from ..translator import TranslationManager  # local import to avoid cycle
 
         # Reuse provided translator if already set; otherwise create a new one
-        if self.translator is None:
+        owns_translator = self.translator is None
+        if owns_translator:
             self.translator = TranslationManager(self.config)
 
         recorder = get_recorder()
@@ -175,6 +185,8 @@ class StreamingPipeline:
         # Setup progress tracking
         if progress_callback:
             self.progress_callbacks.append(progress_callback)
+        if token_callback:
+            self.token_callbacks.append(token_callback)
 
         # Emit STREAM_STARTED for direct pipeline usage
         self._dispatch(EventType.STREAM_STARTED, reason="selected_by_config")
@@ -351,8 +363,10 @@ class StreamingPipeline:
 
             # Cleanup
             self._stop_progress_reporting()
-            if self.translator:
+            # A provided translator belongs to the caller (its model is shared)
+            if owns_translator and self.translator:
                 self.translator.shutdown()
+                self.translator = None
 
     def _process_chunks_sequential(self, chunks: list[CodeChunk]) -> Iterator[ChunkResult]:
         """
@@ -375,31 +389,7 @@ class StreamingPipeline:
                 # Process chunk
                 result = self._process_single_chunk(chunk)
                 result.processing_time = time.time() - start_time
-                try:
-                    recorder = get_recorder()
-                    recorder.record_event(
-                        "stream.chunk",
-                        result.processing_time * 1000.0,
-                        extra={"chunk_index": chunk.chunk_index, "size": chunk.size},
-                    )
-                except Exception:
-                    pass
-
-                # Update progress
-                self.progress.processed_chunks += 1
-                self.progress.bytes_processed += chunk.size
-
-                if result.error:
-                    self.progress.errors.append(result.error)
-                self.progress.warnings.extend(result.warnings)
-
-                # Emit per-chunk event
-                self._dispatch(
-                    EventType.STREAM_CHUNK_PROCESSED,
-                    index=chunk.chunk_index,
-                    success=bool(result.success),
-                    duration_ms=int(result.processing_time * 1000.0),
-                )
+                self._record_chunk_result(chunk, result)
 
                 yield result
 
@@ -479,35 +469,7 @@ class StreamingPipeline:
                 chunk = futures.pop(fut)
                 try:
                     result = fut.result(timeout=self.stream_config.chunk_timeout)
-
-                    try:
-                        recorder = get_recorder()
-                        recorder.record_event(
-                            "stream.chunk",
-                            getattr(result, "processing_time", 0.0) * 1000.0,
-                            extra={
-                                "chunk_index": chunk.chunk_index,
-                                "size": chunk.size,
-                            },
-                        )
-                    except Exception:
-                        pass
-
-                    # Update progress
-                    self.progress.processed_chunks += 1
-                    self.progress.bytes_processed += chunk.size
-
-                    if result.error:
-                        self.progress.errors.append(result.error)
-                    self.progress.warnings.extend(result.warnings)
-
-                    # Emit per-chunk event
-                    self._dispatch(
-                        EventType.STREAM_CHUNK_PROCESSED,
-                        index=chunk.chunk_index,
-                        success=bool(result.success),
-                        duration_ms=int(getattr(result, "processing_time", 0.0) * 1000.0),
-                    )
+                    self._record_chunk_result(chunk, result)
 
                     yield result
                 except Exception as e:
@@ -520,6 +482,34 @@ class StreamingPipeline:
                     )
                     yield ChunkResult(chunk_index=chunk.chunk_index, success=False, error=str(e))
 
+    def _record_chunk_result(self, chunk: CodeChunk, result: ChunkResult) -> None:
+        """Update progress, telemetry and events for a chunk handed to the caller"""
+        try:
+            recorder = get_recorder()
+            recorder.record_event(
+                "stream.chunk",
+                getattr(result, "processing_time", 0.0) * 1000.0,
+                extra={"chunk_index": chunk.chunk_index, "size": chunk.size},
+            )
+        except Exception:
+            pass
+
+        # Update progress
+        self.progress.processed_chunks += 1
+        self.progress.bytes_processed += chunk.size
+
+        if result.error:
+            self.progress.errors.append(result.error)
+        self.progress.warnings.extend(result.warnings)
+
+        # Emit per-chunk event
+        self._dispatch(
+            EventType.STREAM_CHUNK_PROCESSED,
+            index=chunk.chunk_index,
+            success=bool(result.success),
+            duration_ms=int(getattr(result, "processing_time", 0.0) * 1000.0),
+        )
+
     def _process_single_chunk(self, chunk: CodeChunk) -> ChunkResult:
         """
         Process a single chunk through the pipeline
@@ -534,64 +524,24 @@ class StreamingPipeline:
         result = ChunkResult(chunk_index=chunk.chunk_index, success=True)
 
         try:
-            # Add context from previous chunks
-            chunk_with_context = self._add_context_to_chunk(chunk)
-
-            # Parse the chunk
-            parse_result = self.parser.get_parse_result(chunk_with_context)
-
-            # Be robust to different ParseResult shapes (property vs computed)
-            success_attr = getattr(parse_result, "success", None)
-            parse_success = (
-                success_attr if isinstance(success_attr, bool) else (len(parse_result.errors) == 0)
-            )
-            if not parse_success:
-                result.success = False
-                result.error = f"Parse error: {parse_result.errors}"
+            blocks = self._parse_chunk(chunk, result)
+            if blocks is None:
                 return result
 
-            result.parsed_blocks = parse_result.blocks
-            result.warnings.extend(parse_result.warnings)
-
             # Translate English blocks
             translated_blocks = []
-            for block in parse_result.blocks:
+            for block_index, block in enumerate(blocks):
                 if block.type == BlockType.ENGLISH:
                     # Build translation context
                     context = self._build_translation_context(chunk.chunk_index)
 
                     try:
-                        # Delegate via TranslationManager public wrapper
-                        translator = self.translator
-                        if translator is None:
-                            raise RuntimeError("Translator not initialized")
-                        res = translator.translate_text_block(text=block.content, context=context)
-                        # Normalize translation result to expected type with .success attribute
-                        if (
-                            not isinstance(res, ModelTranslationResult)
-                            or not getattr(res, "success", False)
-                            or getattr(res, "code", None) is None
-                        ):
-                            raise RuntimeError(
-                                "Translation failed: "
-                                + (
-                                    ", ".join(getattr(res, "errors", []))
-                                    if getattr(res, "errors", [])
-                                    else "No code returned"
-                                )
-                            )
-                        translated_code = str(res.code)
-
-                        # Create translated block
-                        translated_block = CodeBlock(
-                            type=BlockType.PYTHON,
-                            content=translated_code,
-                            line_numbers=block.line_numbers,
-                            metadata={**block.metadata, "translated": True},
-                            context=block.context,
+                        res = self._translate_english_block(
+                            chunk.chunk_index, block_index, block, context
+                        )
+                        translated_blocks.append(
+                            self._translated_block(chunk.chunk_index, block_index, block, res)
                         )
-                        translated_blocks.append(translated_block)
-
                     except Exception as e:
                         logger.error(f"Translation error in chunk {chunk.chunk_index}: {e}")
                         result.warnings.append(f"Translation error: {str(e)}")
@@ -599,13 +549,7 @@ class StreamingPipeline:
                 else:
                     translated_blocks.append(block)
 
-            result.translated_blocks = translated_blocks
-
-            # Update context window
-            self._update_context_window(chunk, translated_blocks)
-
-            # Buffer the result
-            self.buffer.add_chunk(chunk.chunk_index, result)
+            self._finish_chunk(chunk, result, translated_blocks)
 
         except Exception as e:
             logger.error(f"Error in chunk {chunk.chunk_index}: {e}")
@@ -615,6 +559,139 @@ class StreamingPipeline:
         result.processing_time = time.time() - start_time
         return result
 
+    def _parse_chunk(self, chunk: CodeChunk, result: ChunkResult) -> list[Any] | None:
+        """
+        Parse a chunk (with context from the previous one) into blocks
+
+        Returns:
+            The parsed blocks, or None after recording a parse error on result
+        """
+        # Add context from previous chunks
+        chunk_with_context = self._add_context_to_chunk(chunk)
+
+        # Parse the chunk
+        parse_result = self.parser.get_parse_result(chunk_with_context)
+
+        # Be robust to different ParseResult shapes (property vs computed)
+        success_attr = getattr(parse_result, "success", None)
+        parse_success = (
+            success_attr if isinstance(success_attr, bool) else (len(parse_result.errors) == 0)
+        )
+        if not parse_success:
+            result.success = False
+            result.error = f"Parse error: {parse_result.errors}"
+            return None
+
+        result.parsed_blocks = parse_result.blocks
+        result.warnings.extend(parse_result.warnings)
+        return parse_result.blocks
+
+    def _translated_block(
+        self, chunk_index: int, block_index: int, block: CodeBlock, res: Any
+    ) -> CodeBlock:
+        """
+        Build the PYTHON block for a translated English block
+
+        Raises:
+            RuntimeError: If res is not a successful model TranslationResult
+        """
+        # Normalize translation result to expected type with .success attribute
+        if (
+            not isinstance(res, ModelTranslationResult)
+            or not getattr(res, "success", False)
+            or getattr(res, "code", None) is None
+        ):
+            raise RuntimeError(
+                "Translation failed: "
+                + (
+                    ", ".join(getattr(res, "errors", []))
+                    if getattr(res, "errors", [])
+                    else "No code returned"
+                )
+            )
+        translated_code = str(res.code)
+        if self.token_callbacks:
+            self._emit_translation_update(
+                self._token_protocol.complete(
+                    chunk_index, block_index, block.content, translated_code
+                )
+            )
+
+        return CodeBlock(
+            type=BlockType.PYTHON,
+            content=translated_code,
+            line_numbers=block.line_numbers,
+            metadata={**block.metadata, "translated": True},
+            context=block.context,
+        )
+
+    def _finish_chunk(
+        self, chunk: CodeChunk, result: ChunkResult, translated_blocks: list[Any]
+    ) -> None:
+        """Store translated blocks on result, the context window and the buffer"""
+        result.translated_blocks = translated_blocks
+
+        # Update context window
+        self._update_context_window(chunk, translated_blocks)
+
+        # Buffer the result
+        self.buffer.add_chunk(chunk.chunk_index, result)
+
+    def _translate_english_block(
+        self, chunk_index: int, block_index: int, block: CodeBlock, context: dict[str, Any]
+    ) -> Any:
+        """
+        Translate one English block through the TranslationManager
+
+        With token callbacks registered the model is called in streaming mode
+        and every delta is forwarded as a partial TranslationUpdateMessage.
+
+        Returns:
+            The model-level TranslationResult (None if the stream ended early)
+        """
+        translator = self.translator
+        if translator is None:
+            raise RuntimeError("Translator not initialized")
+        if not self.token_callbacks:
+            return translator.translate_text_block(text=block.content, context=context)
+
+        if self._token_protocol is None:
+            from .protocols import TokenStreamProtocol  # local import to avoid cycle
+
+            self._token_protocol = TokenStreamProtocol()
+
+        generated = ""
+        for delta in translator.translate_text_block_stream(text=block.content, context=context):
+            if delta.done:
+                return delta.result
+            generated += delta.text
+            self._emit_translation_update(
+                self._token_protocol.process_delta(
+                    chunk_index, block_index, block.content, generated, delta.text
+                )
+            )
+        return None
+
+    def _emit_translation_update(self, message: Any) -> None:
+        """Forward a TranslationUpdateMessage to token callbacks and the event dispatcher"""
+        for callback in self.token_callbacks:
+            try:
+                callback(message)
+            except Exception as e:
+                logger.debug(f"Token callback failed: {e}")
+
+        if self._emitter is None and self.translator is not None:
+            try:
+                from ..translator_support.stream_emitter import StreamEmitter
+
+                self._emitter = StreamEmitter(
+                    self.translator.get_event_dispatcher(), source=self.__class__.__name__
+                )
+            except Exception:
+                return
+        if self._emitter is not None:
+            self._emitter.translation_update(message)
+
     def _add_context_to_chunk(self, chunk: CodeChunk) -> str:
         """
         Add context from previous chunks to current chunk
@@ -6,6 +6,7 @@ streaming communication in the pseudocode translator.
 """
 
 import json
+import threading
 import time
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator, Iterator
@@ -14,7 +15,7 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Protocol, TypeVar
 
-from .stream_translator import StreamingMode
+from .events import StreamingMode
 
 if TYPE_CHECKING:
     from ..models import CodeBlock
@@ -526,6 +527,58 @@ class BlockByBlockProtocol:
         )
 
 
+class TokenStreamProtocol:
+    """
+    Protocol handler for token-level streaming of model output
+
+    Partial updates carry the text generated so far for a block in
+    translated_content and the newest piece in metadata["delta"]; the
+    completing update carries the final extracted code. Safe to share
+    between chunks processed on different threads.
+    """
+
+    def __init__(self):
+        self._sequence_number = 0
+        self._lock = threading.Lock()
+
+    def _message(
+        self,
+        chunk_index: int,
+        block_index: int,
+        original: str,
+        translated: str | None,
+        is_partial: bool,
+        metadata: dict[str, Any],
+    ) -> TranslationUpdateMessage:
+        message = TranslationUpdateMessage(
+            message_type=MessageType.TRANSLATION_UPDATE,
+            chunk_index=chunk_index,
+            block_index=block_index,
+            original_content=original,
+            translated_content=translated,
+            is_partial=is_partial,
+            metadata=metadata,
+        )
+        with self._lock:
+            self._sequence_number += 1
+            message.sequence_number = self._sequence_number
+        return message
+
+    def process_delta(
+        self, chunk_index: int, block_index: int, original: str, generated: str, delta: str
+    ) -> TranslationUpdateMessage:
+        """Partial update after the model produced delta (generated includes it)"""
+        return self._message(
+            chunk_index, block_index, original, generated, True, {"delta": delta}
+        )
+
+    def complete(
+        self, chunk_index: int, block_index: int, original: str, code: str | None
+    ) -> TranslationUpdateMessage:
+        """Final update for a block once its translation is done"""
+        return self._message(chunk_index, block_index, original, code, False, {})
+
+
 class FullDocumentProtocol:
     """Protocol handler for full document streaming"""
 
@@ -212,6 +212,16 @@ class TelemetryRecorder:
                 # Never raise from telemetry logging
                 pass
 
+    def set_sample_rate(self, sample_rate: int) -> None:
+        """Record the sampling rate applied by get_recorder() (reported in snapshots/logs)."""
+        self._sample_rate = max(1, int(sample_rate))
+
+    def increment_seq(self) -> int:
+        """Return the next call sequence number used for deterministic sampling."""
+        with self._lock:
+            self._seq += 1
+            return self._seq
+
     def snapshot(self) -> dict:
         # Return safe copy to avoid concurrent mutation issues
         with self._lock:
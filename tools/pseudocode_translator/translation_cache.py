@@ -0,0 +1,305 @@
+"""
+Translation result cache for the Pseudocode Translator
+
+Caches model output for ENGLISH blocks so identical instructions are not sent
+to the model again. Two tiers:
+
+- an in-memory LRU (OrderedDict), consulted first
+- an optional SQLite database shared across processes and restarts; expired
+  rows are deleted, and the oldest beyond max_persistent_entries, when the
+  database is opened and every _PRUNE_EVERY writes
+
+Keys combine everything that changes the model's output: model name, target
+language, prompt template version, generation options, the normalized
+instruction and a hash of the surrounding context. Entries also record the
+model name so they can be invalidated when that model is (re)loaded.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from .prompts import PROMPT_TEMPLATE_VERSION
+from .telemetry import get_recorder
+
+logger = logging.getLogger(__name__)
+
+# Writes to the SQLite tier between two prunes of expired and excess rows
+_PRUNE_EVERY = 256
+
+
+class _CachedTranslation(NamedTuple):
+    model: str
+    code: str
+    timestamp: float
+
+
+def normalize_instruction(text: str) -> str:
+    """Collapse whitespace so formatting-only differences share a cache entry."""
+    return "\n".join(" ".join(line.split()) for line in text.strip().splitlines() if line.strip())
+
+
+def make_translation_key(
+    model: str,
+    target_language: str,
+    instruction: str,
+    context: dict[str, Any] | None = None,
+    options: Any = None,
+    template_version: str = PROMPT_TEMPLATE_VERSION,
+) -> str:
+    """
+    Build the cache key for one model call.
+
+    Args:
+        model: Model name
+        target_language: Output language identifier
+        instruction: English instruction (normalized here)
+        context: Context dict passed to the model
+        options: Generation options (e.g. the model TranslationConfig); its
+                 repr is part of the key
+        template_version: Prompt template version
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    context_hash = (
+        hashlib.sha256(
+            json.dumps(context, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        if context
+        else ""
+    )
+    parts = (
+        model,
+        target_language,
+        template_version,
+        repr(options),
+        normalize_instruction(instruction),
+        context_hash,
+    )
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+class TranslationResultCache:
+    """Thread-safe two-tier cache of translated code keyed by make_translation_key()."""
+
+    def __init__(
+        self,
+        max_entries: int = 2048,
+        ttl_seconds: float | None = None,
+        persistent_path: str | Path | None = None,
+        max_persistent_entries: int = 50_000,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Entries kept in memory (LRU beyond that)
+            ttl_seconds: Entry lifetime in both tiers (None = no expiry)
+            persistent_path: SQLite database file (None = memory only)
+            max_persistent_entries: Rows kept in the SQLite database (oldest
+                                    deleted beyond that)
+        """
+        self.max_entries = max(1, int(max_entries))
+        self.max_persistent_entries = max(1, int(max_persistent_entries))
+        self.ttl_seconds = ttl_seconds
+        self._writes_since_prune = 0
+        self._memory: OrderedDict[str, _CachedTranslation] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+        self.persistent_path: Path | None = None
+        self._db: sqlite3.Connection | None = None
+        if persistent_path:
+            self._open_db(Path(persistent_path))
+
+    # ----- persistence -----
+
+    def _open_db(self, path: Path) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS translations ("
+                "key TEXT PRIMARY KEY, model TEXT NOT NULL, code TEXT NOT NULL, "
+                "created REAL NOT NULL)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS idx_translations_model ON translations(model)")
+            db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_translations_created ON translations(created)"
+            )
+            self._db = db
+            self.persistent_path = path
+        except sqlite3.Error as e:
+            logger.warning(f"Translation cache persistence disabled ({path}): {e}")
+            return
+        self._prune_persistent()
+
+    def _prune_persistent(self) -> None:
+        """Delete expired rows, then the oldest rows beyond max_persistent_entries."""
+        if self._db is None:
+            return
+        self._writes_since_prune = 0
+        try:
+            expired = 0
+            if self.ttl_seconds is not None:
+                expired = self._db.execute(
+                    "DELETE FROM translations WHERE created < ?",
+                    (time.time() - self.ttl_seconds,),
+                ).rowcount
+            excess = self._db.execute(
+                "DELETE FROM translations WHERE key IN ("
+                "SELECT key FROM translations ORDER BY created DESC LIMIT -1 OFFSET ?)",
+                (self.max_persistent_entries,),
+            ).rowcount
+        except sqlite3.Error as e:
+            logger.debug(f"Translation cache prune failed: {e}")
+            return
+        if expired or excess:
+            logger.debug(
+                f"Pruned {expired} expired and {excess} excess persistent translations"
+            )
+
+    def _expired(self, timestamp: float) -> bool:
+        return self.ttl_seconds is not None and time.time() - timestamp > self.ttl_seconds
+
+    def _load_persistent(self, key: str) -> _CachedTranslation | None:
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute(
+                "SELECT model, code, created FROM translations WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"Translation cache read failed: {e}")
+            return None
+        if row is None:
+            return None
+        entry = _CachedTranslation(*row)
+        if self._expired(entry.timestamp):
+            return None
+        return entry
+
+    # ----- public API -----
+
+    def get(self, key: str) -> str | None:
+        """Cached code for key, or None on a miss."""
+        counters: dict[str, int]
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and self._expired(entry.timestamp):
+                del self._memory[key]
+                entry = None
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self._hits += 1
+                counters = {"hit": 1}
+            else:
+                entry = self._load_persistent(key)
+                if entry is not None:
+                    self._remember(key, entry)
+                    self._hits += 1
+                    self._disk_hits += 1
+                    counters = {"hit": 1, "disk_hit": 1}
+                else:
+                    self._misses += 1
+                    counters = {"miss": 1}
+
+        get_recorder().record_event("translation_cache", counters=counters)
+        return entry.code if entry is not None else None
+
+    def put(self, key: str, model: str, code: str) -> None:
+        """Store translated code for key, produced by model."""
+        entry = _CachedTranslation(model, code, time.time())
+        with self._lock:
+            self._remember(key, entry)
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO translations (key, model, code, created) "
+                        "VALUES (?, ?, ?, ?)",
+                        (key, *entry),
+                    )
+                except sqlite3.Error as e:
+                    logger.debug(f"Translation cache write failed: {e}")
+                self._writes_since_prune += 1
+                if self._writes_since_prune >= _PRUNE_EVERY:
+                    self._prune_persistent()
+
+    def _remember(self, key: str, entry: _CachedTranslation) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def invalidate(self, model: str | None = None) -> int:
+        """
+        Drop cached translations from both tiers.
+
+        Args:
+            model: Only drop entries produced by this model (None = all)
+
+        Returns:
+            Number of in-memory entries dropped
+        """
+        with self._lock:
+            if model is None:
+                removed = len(self._memory)
+                self._memory.clear()
+            else:
+                stale = [k for k, e in self._memory.items() if e.model == model]
+                for k in stale:
+                    del self._memory[k]
+                removed = len(stale)
+
+            if self._db is not None:
+                try:
+                    if model is None:
+                        self._db.execute("DELETE FROM translations")
+                    else:
+                        self._db.execute("DELETE FROM translations WHERE model = ?", (model,))
+                except sqlite3.Error as e:
+                    logger.warning(f"Failed to invalidate persistent translation cache: {e}")
+        if removed:
+            logger.debug(f"Invalidated {removed} cached translations")
+        return removed
+
+    def clear(self) -> None:
+        """Drop every entry and reset statistics."""
+        self.invalidate()
+        with self._lock:
+            self._hits = self._disk_hits = self._misses = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._memory),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "persistent_enabled": self._db is not None,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                try:
+                    self._db.close()
+                except sqlite3.Error:
+                    pass
+                self._db = None
@@ -0,0 +1,341 @@
+"""
+Incremental translation sessions for the Pseudocode Translator
+
+A TranslationSession translates successive revisions of one document (an
+editor buffer, an API client's draft) and reuses the work done for the
+previous revision:
+
+- The whole document is parsed exactly as a one-shot translation parses it
+  (TranslationManager._maybe_offload_parse); an unchanged revision reuses
+  the previous parse.
+- The unit of reuse is one model call: an ENGLISH sub-block of a MIXED
+  block (as separated by TranslationManager._separate_mixed_block), or one
+  paragraph of an ENGLISH block. Each unit is fingerprinted by its text and
+  the context the model would see (the neighbouring blocks, see
+  TranslationManager._build_context). Units whose fingerprint is unchanged
+  reuse their previous output; changed units, and neighbours whose context
+  includes a changed one, are translated again, so the work per revision
+  follows the size of the edit.
+- Processed blocks are then assembled and validated through the same
+  StructuredParsingController.finish() path as a one-shot translation. Each
+  revision's AnalysisContext is seeded with the previous one, so parses and
+  node indexes of unchanged blocks are taken over rather than rebuilt.
+
+ENGLISH blocks spanning several paragraphs are translated paragraph by
+paragraph (a one-shot translation sends such a block to the model whole), so
+their output can differ from the structured flow of translate_pseudocode();
+MIXED blocks and single-paragraph ENGLISH blocks translate identically.
+
+Sessions always use the structured flow: a whole-document LLM-first call
+cannot be updated incrementally.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from .analysis_context import AnalysisContext, translation_scope
+from .exceptions import TranslatorError
+from .execution.block_scheduler import BlockScheduler
+from .models import BlockType, CodeBlock, ParseResult
+
+if TYPE_CHECKING:
+    from .models.base_model import OutputLanguage
+    from .translator import TranslationManager, TranslationResult
+
+logger = logging.getLogger(__name__)
+
+# Sessions kept per TranslationManager before the least recently used is dropped
+MAX_SESSIONS = 64
+# Sessions kept per owner (e.g. API caller) of one TranslationManager
+MAX_SESSIONS_PER_OWNER = 8
+
+_TRANSLATED_TYPES = (BlockType.ENGLISH, BlockType.MIXED)
+
+
+def _shift_block(block: CodeBlock, offset: int) -> CodeBlock:
+    """Copy of block with line numbers moved by offset and its own metadata dict."""
+    start, end = block.line_numbers
+    return CodeBlock(
+        type=block.type,
+        content=block.content,
+        line_numbers=(start + offset, end + offset),
+        metadata=dict(block.metadata),
+        context=block.context,
+    )
+
+
+def _split_paragraphs(block: CodeBlock) -> list[CodeBlock]:
+    """ENGLISH block split at blank lines into one ENGLISH block per paragraph."""
+    if block.type != BlockType.ENGLISH:
+        return [block]
+    paragraphs: list[tuple[int, list[str]]] = []
+    for offset, line in enumerate(block.content.splitlines()):
+        if not line.strip():
+            continue
+        if paragraphs and paragraphs[-1][0] + len(paragraphs[-1][1]) == offset:
+            paragraphs[-1][1].append(line)
+        else:
+            paragraphs.append((offset, [line]))
+    if len(paragraphs) <= 1:
+        return [block]
+    start = block.line_numbers[0]
+    return [
+        CodeBlock(
+            type=BlockType.ENGLISH,
+            content="\n".join(lines),
+            line_numbers=(start + offset, start + offset + len(lines) - 1),
+            metadata=dict(block.metadata),
+            context=block.context,
+        )
+        for offset, lines in paragraphs
+    ]
+
+
+class TranslationSession:
+    """Translate revisions of one document, re-doing only what changed."""
+
+    def __init__(self, manager: TranslationManager, session_id: str):
+        self.manager = manager
+        self.session_id = session_id
+        self.revision = 0
+        self.last_result: TranslationResult | None = None
+        self.last_used = time.time()
+        self._lock = threading.Lock()
+        # Previous revision's text and its parse
+        self._parsed: tuple[str, ParseResult] | None = None
+        # Unit fingerprint -> translated block, line numbers relative to the unit start
+        self._outputs: dict[str, CodeBlock] = {}
+        self._analysis: AnalysisContext | None = None
+
+    def translate(
+        self, text: str, target_language: OutputLanguage | None = None
+    ) -> TranslationResult:
+        """
+        Translate the next revision of the document.
+
+        Args:
+            text: Full document text
+            target_language: Target language (None keeps the manager's)
+
+        Returns:
+            TranslationResult; metadata["session"] reports what was reused
+        """
+        with self._lock, translation_scope(self._analysis) as analysis:
+            self.revision += 1
+            self.last_used = time.time()
+            result = self._translate(text, target_language)
+            self.last_result = result
+            analysis.release_previous()
+            self._analysis = analysis
+            return result
+
+    def _translate(
+        self, text: str, target_language: OutputLanguage | None
+    ) -> TranslationResult:
+        manager = self.manager
+        start_time, translation_id, errors, warnings = manager._initialize_translation_context(
+            target_language
+        )
+        manager._emit_translation_started(translation_id, "incremental")
+
+        try:
+            parse_result, reparsed = self._parse(text)
+            if parse_result.errors:
+                return manager._finalize_structured_result(
+                    manager._structured.parse_failure(parse_result, text, start_time, warnings),
+                    translation_id,
+                )
+            warnings.extend(parse_result.warnings)
+
+            blocks = [p for block in parse_result.blocks for p in _split_paragraphs(block)]
+            processed, reprocessed, reused = self._process(blocks)
+            result = manager._structured.finish(
+                processed, parse_result, start_time, warnings, translation_id
+            )
+        except Exception as e:
+            from .translator import TranslationResult
+
+            logger.error("Incremental translation failed: %s", e)
+            terr = TranslatorError("Incremental translation failed", cause=e)
+            terr.add_suggestion("Check the input format")
+            terr.add_suggestion("Review any error messages above")
+            result = TranslationResult(
+                success=False,
+                code=None,
+                errors=errors + [terr.format_error()],
+                warnings=warnings,
+                metadata=manager._create_metadata(start_time, 0, 0, 0, 0, False),
+            )
+            manager._emit_translation_failed(translation_id, str(e))
+            return result
+
+        result.metadata["session"] = {
+            "session_id": self.session_id,
+            "revision": self.revision,
+            "reparsed": reparsed,
+            "units_retranslated": reprocessed,
+            "units_reused": reused,
+        }
+        return manager._finalize_structured_result(result, translation_id)
+
+    # ----- parsing -----
+
+    def _parse(self, text: str) -> tuple[ParseResult, bool]:
+        """Parse text as a one-shot translation would, reusing an unchanged revision."""
+        reparsed = self._parsed is None or self._parsed[0] != text
+        if self._parsed is None or reparsed:
+            self._parsed = (text, self.manager._maybe_offload_parse(text))
+        _, parsed = self._parsed
+        # Processing may annotate blocks; keep the stored parse pristine
+        blocks = [_shift_block(block, 0) for block in parsed.blocks]
+        return ParseResult(blocks=blocks, errors=parsed.errors, warnings=parsed.warnings), reparsed
+
+    # ----- translation -----
+
+    @staticmethod
+    def _fingerprint(unit: CodeBlock, context: dict[str, Any], sub_block: bool) -> str:
+        payload = json.dumps([sub_block, unit.content, context], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _process(self, blocks: list[CodeBlock]) -> tuple[list[CodeBlock], int, int]:
+        """
+        Translate the model inputs whose text or context changed.
+
+        The unit of reuse is one model call: an ENGLISH block, or an ENGLISH
+        sub-block of a MIXED block (TranslationManager._separate_mixed_block).
+
+        Returns:
+            (processed blocks in order, units translated now, units reused)
+        """
+        manager = self.manager
+        outputs: dict[str, CodeBlock] = {}
+        rows: list[list[CodeBlock]] = []
+        # (row, position in row, unit, context, fingerprint)
+        pending: list[tuple[int, int, CodeBlock, dict[str, Any], str]] = []
+        reused = 0
+
+        for index, block in enumerate(blocks):
+            if block.type not in _TRANSLATED_TYPES:
+                rows.append([block])
+                continue
+            mixed = block.type == BlockType.MIXED
+            units = manager._separate_mixed_block(block) if mixed else [block]
+            context = manager._build_context(blocks, index)
+            row: list[CodeBlock] = []
+            for unit in units:
+                if unit.type != BlockType.ENGLISH:
+                    row.append(unit)
+                    continue
+                fingerprint = self._fingerprint(unit, context, mixed)
+                previous = outputs.get(fingerprint) or self._outputs.get(fingerprint)
+                if previous is not None:
+                    output = _shift_block(previous, unit.line_numbers[0])
+                    if mixed:
+                        output.metadata["parent_block"] = block.metadata
+                    row.append(output)
+                    outputs[fingerprint] = previous
+                    reused += 1
+                else:
+                    pending.append((len(rows), len(row), unit, context, fingerprint))
+                    row.append(unit)
+            rows.append(row)
+
+        scheduler: BlockScheduler[tuple[str | None, dict[str, Any]]] = BlockScheduler(
+            manager._translation_max_in_flight()
+        )
+        translated = scheduler.run(
+            [
+                functools.partial(
+                    manager._translate_text_with_model, unit.content, context=context, block=unit
+                )
+                for _, _, unit, context, _ in pending
+            ]
+        )
+
+        for (row_index, position, unit, _, fingerprint), (code, meta) in zip(
+            pending, translated, strict=True
+        ):
+            if unit.metadata.get("is_sub_block"):
+                manager._finish_mixed_sub_block(unit, code, meta)
+                output = unit
+            else:
+                output = manager._finish_english_block(unit, code, meta)
+            rows[row_index][position] = output
+            # Failed translations are retried on the next revision
+            if code is not None:
+                outputs[fingerprint] = _shift_block(output, -unit.line_numbers[0])
+
+        self._outputs = outputs
+        processed = [b for row in rows for b in row]
+        return processed, len(pending), reused
+
+
+class SessionRegistry:
+    """
+    Bounded, thread-safe map of sessions (LRU), keyed by owner and session id
+
+    The owner scopes session ids (e.g. the API caller): the same id opened by
+    another owner is a different session. Each owner keeps at most
+    max_sessions_per_owner sessions, so one owner opening new sessions only
+    evicts its own.
+    """
+
+    def __init__(
+        self,
+        manager: TranslationManager,
+        max_sessions: int = MAX_SESSIONS,
+        max_sessions_per_owner: int = MAX_SESSIONS_PER_OWNER,
+    ):
+        self._manager = manager
+        self._max_sessions = max(1, int(max_sessions))
+        self._max_per_owner = max(1, int(max_sessions_per_owner))
+        self._sessions: OrderedDict[tuple[str, str], TranslationSession] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def open(self, session_id: str | None = None, owner: str = "") -> TranslationSession:
+        """Return the owner's session with this id, creating it (or a new id) if needed."""
+        with self._lock:
+            if session_id is None:
+                session_id = uuid.uuid4().hex
+            key = (owner, session_id)
+            session = self._sessions.get(key)
+            if session is None:
+                session = TranslationSession(self._manager, session_id)
+                self._sessions[key] = session
+                self._evict(owner)
+            self._sessions.move_to_end(key)
+            return session
+
+    def _evict(self, owner: str) -> None:
+        """Drop least recently used sessions beyond the owner's and the overall limit."""
+        owned = [key for key in self._sessions if key[0] == owner]
+        for key in owned[: max(0, len(owned) - self._max_per_owner)]:
+            del self._sessions[key]
+            logger.debug("Dropped idle translation session %s", key[1])
+        while len(self._sessions) > self._max_sessions:
+            (_, dropped), _ = self._sessions.popitem(last=False)
+            logger.debug("Dropped idle translation session %s", dropped)
+
+    def get(self, session_id: str, owner: str = "") -> TranslationSession | None:
+        with self._lock:
+            return self._sessions.get((owner, session_id))
+
+    def close(self, session_id: str, owner: str = "") -> bool:
+        with self._lock:
+            return self._sessions.pop((owner, session_id), None) is not None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sessions.clear()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
@@ -10,21 +10,23 @@ from __future__ import annotations
 # Standard imports group
 import ast
 import contextlib
+import functools
 import logging
 import threading
 import time
-from collections.abc import Callable, Iterator
+from collections.abc import AsyncIterator, Callable, Iterator
 from contextlib import AbstractContextManager
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Protocol, TypedDict, TypeVar, cast
 
+from .analysis_context import parse_source, translation_scope
 from .assembler import CodeAssembler
-from .ast_cache import parse_cached
 from .controllers.llm_first import LlmFirstController
 from .controllers.structured_flow import StructuredParsingController
 from .exceptions import AssemblyError, ErrorContext, TranslatorError
+from .execution.block_scheduler import BlockScheduler
 from .execution.process_pool import ParseValidateExecutor
 from .integration.events import EventDispatcher, EventType
 
@@ -35,14 +37,18 @@ from .models import BlockType, CodeBlock
 from .models.base_model import (
     BaseTranslationModel,
     OutputLanguage,
+    TranslationDelta,
 )
 from .models.base_model import TranslationConfig as ModelTranslationConfig
-from .models.model_factory import ModelFactory, create_model
+from .models.model_factory import ModelFactory
 from .models.plugin_system import get_plugin_system
+from .models.residency import get_residency_manager
 from .parser import ParserModule
 from .services.dependency_gateway import DependencyAnalysisGateway
 from .services.validation_service import ValidationService
 from .telemetry import get_recorder
+from .translation_cache import TranslationResultCache, make_translation_key
+from .translation_session import SessionRegistry, TranslationSession
 from .validator import ValidationResult, Validator
 
 if TYPE_CHECKING:
@@ -272,6 +278,12 @@ class TranslationManager:
         self._exec_pool_test_parse_fn: Callable[[str], Any] | None = None
         self._exec_pool_test_validate_fn: Callable[[Any], Any] | None = None
 
+        # Cross-request cache of model output for ENGLISH blocks
+        self._result_cache = self._create_result_cache()
+
+        # Incremental translation sessions by id (editor buffers, API drafts)
+        self._sessions = SessionRegistry(self)
+
         # Model management
         self._current_model: BaseTranslationModel | None = None
         self._model_name: str | None = None
@@ -282,6 +294,13 @@ class TranslationManager:
             plugin_system = get_plugin_system()
             plugin_system.load_all_plugins()
 
+        # Models come from a process-wide pool and stay warm between switches
+        self._residency = get_residency_manager()
+        self._configure_residency()
+        fallback = getattr(config.llm, "warm_fallback_model", None)
+        if fallback:
+            self._residency.preload(fallback, *self._model_spec(fallback), fallback=True)
+
         # Initialize model
         logger.info("Initializing Translation Manager")
         try:
@@ -293,6 +312,7 @@ class TranslationManager:
             error.add_suggestion("Verify API credentials if using external models")
             error.add_suggestion("Ensure model files are available for local models")
             raise error
+        self._preload_models()
 
     def _initialize_model(self, model_name: str | None = None):
         """Initialize or switch to a different model"""
@@ -304,32 +324,10 @@ class TranslationManager:
                 getattr(self.config.llm, "model_name", "qwen"),
             )
 
-        # Create model configuration
-        model_config: dict[str, Any] = {
-            "temperature": self.config.llm.temperature,
-            "top_p": getattr(self.config.llm, "top_p", 0.9),
-            "top_k": getattr(self.config.llm, "top_k", 40),
-            "max_tokens": self.config.llm.max_tokens,
-            "n_ctx": self.config.llm.n_ctx,
-            "n_batch": getattr(self.config.llm, "n_batch", 512),
-            "n_threads": self.config.llm.n_threads,
-            "n_gpu_layers": self.config.llm.n_gpu_layers,
-        }
-
-        # Add model path if available
-        if hasattr(self.config.llm, "model_path"):
-            model_config["model_path"] = self.config.llm.model_path
-
-        # Create model instance
-        self._current_model = create_model(model_name, model_config)
-        self._model_name = model_name
-
-        # Initialize the model
-        model_path: Path | None = None
-        if hasattr(self.config.llm, "model_path"):
-            model_path = Path(self.config.llm.model_path)
-
-        cast("Any", self._current_model).initialize(model_path)
+        # Take the model from the residency pool; preloaded models are ready at once
+        model_config, model_path = self._model_spec(model_name)
+        self._current_model = self._residency.acquire(model_name, model_config, model_path)
+        self._model_name = self._residency.name_of(self._current_model) or model_name
         logger.info("Initialized model: %s", model_name)
 
         # Instantiate extracted collaborators (Phase 1; behavior-preserving)
@@ -341,7 +339,7 @@ class TranslationManager:
             self._maybe_offload_validate,
             self._attempt_fixes,
         )
-        self._dep_gateway = DependencyAnalysisGateway(parse_cached, logger)
+        self._dep_gateway = DependencyAnalysisGateway(parse_source, logger)
 
         # Controllers
         self._llm_first = LlmFirstController(
@@ -375,6 +373,62 @@ class TranslationManager:
             result_cls=TranslationResult,
         )
 
+    def _model_spec(self, model_name: str) -> tuple[dict[str, Any], Path | None]:
+        """Configuration dict and path used to create and initialize model_name."""
+        model_config: dict[str, Any] = {
+            "temperature": self.config.llm.temperature,
+            "top_p": getattr(self.config.llm, "top_p", 0.9),
+            "top_k": getattr(self.config.llm, "top_k", 40),
+            "max_tokens": self.config.llm.max_tokens,
+            "n_ctx": self.config.llm.n_ctx,
+            "n_batch": getattr(self.config.llm, "n_batch", 512),
+            "n_threads": self.config.llm.n_threads,
+            "n_gpu_layers": self.config.llm.n_gpu_layers,
+            "batch_max_size": getattr(self.config.llm, "batch_max_size", 1),
+            "batch_wait_ms": getattr(self.config.llm, "batch_wait_ms", 10),
+        }
+
+        # Add model path if available
+        model_path: Path | None = None
+        if hasattr(self.config.llm, "model_path"):
+            model_config["model_path"] = self.config.llm.model_path
+            model_path = Path(self.config.llm.model_path)
+
+        return model_config, model_path
+
+    def _configure_residency(self) -> None:
+        """Apply the llm residency settings to the shared model pool."""
+        llm = self.config.llm
+        active = getattr(llm, "model_type", None)
+        wanted = {active, *(getattr(llm, "preload_models", None) or [])} - {None}
+        self._residency.configure(
+            max_memory_mb=int(getattr(llm, "max_resident_memory_mb", 0) or 0),
+            # Preloaded models must fit next to the active one
+            max_models=max(int(getattr(llm, "max_loaded_models", 1) or 1), len(wanted)),
+            ttl_minutes=int(getattr(llm, "model_ttl_minutes", 0) or 0),
+        )
+
+    def _preload_models(self) -> None:
+        """Start background loads of llm.preload_models not already active."""
+        for name in dict.fromkeys(getattr(self.config.llm, "preload_models", None) or []):
+            if name != self._model_name:
+                self._residency.preload(name, *self._model_spec(name))
+
+    def _create_result_cache(self) -> TranslationResultCache | None:
+        """Build the translation result cache from config; None when caching is disabled."""
+        if not getattr(self.config.llm, "cache_enabled", True):
+            return None
+        cache_cfg = getattr(self.config, "cache", None)
+        ttl_hours = getattr(self.config.llm, "cache_ttl_hours", None)
+        return TranslationResultCache(
+            max_entries=getattr(cache_cfg, "translation_max_entries", 2048),
+            ttl_seconds=ttl_hours * 3600 if ttl_hours else None,
+            persistent_path=getattr(cache_cfg, "translation_persistent_path", None),
+            max_persistent_entries=getattr(
+                cache_cfg, "translation_persistent_max_entries", 50_000
+            ),
+        )
+
     def _ensure_exec_pool(self) -> ParseValidateExecutor:
         if self._exec_pool is None:
             try:
@@ -636,6 +690,14 @@ class TranslationManager:
         """
         Main translation method that converts pseudocode to code
         """
+        # Parser, dependency analysis, assembler and validators share one
+        # parse (and node index) per source string for this translation
+        with translation_scope():
+            return self._translate_pseudocode(input_text, target_language)
+
+    def _translate_pseudocode(
+        self, input_text: str, target_language: OutputLanguage | None
+    ) -> TranslationResult:
         start_time, translation_id, errors, warnings = self._initialize_translation_context(
             target_language
         )
@@ -778,7 +840,7 @@ class TranslationManager:
     ) -> dict[str, Any]:
         """Create metadata for structured translation result."""
         blocks_translated = sum(1 for b in processed_blocks if b.metadata.get("translated", False))
-        cache_hits = 0
+        cache_hits = sum(1 for b in processed_blocks if b.metadata.get("cache_hit", False))
         metadata = self._create_metadata(
             start_time,
             _blocks_len(getattr(parse_result, "blocks", None)),
@@ -1004,9 +1066,19 @@ class TranslationManager:
                     if not is_valid:
                         raise ValueError(f"Invalid input: {error_msg}")
 
+            cache = self._result_cache
+            cache_key = ""
+            if cache is not None:
+                cache_key = self._translation_cache_key(text, context)
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    return cached, {"translated": True, "cache_hit": True}
+
             # Perform translation
             translated_code = self._perform_translation_with_model(model, text, context)
 
+            if cache is not None:
+                cache.put(cache_key, self._model_name or "", translated_code)
             return translated_code, {"translated": True}
 
         except Exception as e:
@@ -1020,6 +1092,16 @@ class TranslationManager:
             # Mixed and other cases: simpler error semantics
             return None, {"translation_failed": True, "error": str(e)}
 
+    def _translation_cache_key(self, text: str, context: dict[str, Any] | None) -> str:
+        """Result cache key for a per-block model call."""
+        return make_translation_key(
+            self._model_name or "",
+            self._target_language.value,
+            text,
+            context=context,
+            options=self._build_model_config_for_block(),
+        )
+
     def _process_english_block(
         self, block: CodeBlock, index: int, blocks: list[CodeBlock]
     ) -> CodeBlock:
@@ -1029,6 +1111,12 @@ class TranslationManager:
         """
         context = self._build_context(blocks, index)
         code, meta = self._translate_text_with_model(block.content, context=context, block=block)
+        return self._finish_english_block(block, code, meta)
+
+    def _finish_english_block(
+        self, block: CodeBlock, code: str | None, meta: dict[str, Any]
+    ) -> CodeBlock:
+        """Build the PYTHON block for a translated ENGLISH block, or mark the failure."""
         if code is not None:
             return CodeBlock(
                 type=BlockType.PYTHON,
@@ -1062,24 +1150,31 @@ class TranslationManager:
                 code, meta = self._translate_text_with_model(
                     sub_block.content, context=context, block=sub_block
                 )
-                if code is not None:
-                    sub_block.content = code
-                    sub_block.type = BlockType.PYTHON
-                    try:
-                        # includes {"translated": True}
-                        sub_block.metadata.update(meta)
-                    except Exception:
-                        sub_block.metadata["translated"] = True
-                else:
-                    try:
-                        # includes failure + error string
-                        sub_block.metadata.update(meta)
-                    except Exception:
-                        sub_block.metadata["translation_failed"] = True
-                        sub_block.metadata["error"] = meta.get("error", "unknown error")
+                self._finish_mixed_sub_block(sub_block, code, meta)
             output_blocks.append(sub_block)
         return output_blocks
 
+    @staticmethod
+    def _finish_mixed_sub_block(
+        sub_block: CodeBlock, code: str | None, meta: dict[str, Any]
+    ) -> None:
+        """Apply a translation result to an ENGLISH sub-block of a MIXED block in place."""
+        if code is not None:
+            sub_block.content = code
+            sub_block.type = BlockType.PYTHON
+            try:
+                # includes {"translated": True}
+                sub_block.metadata.update(meta)
+            except Exception:
+                sub_block.metadata["translated"] = True
+        else:
+            try:
+                # includes failure + error string
+                sub_block.metadata.update(meta)
+            except Exception:
+                sub_block.metadata["translation_failed"] = True
+                sub_block.metadata["error"] = meta.get("error", "unknown error")
+
     def _process_passthrough_block(self, block: CodeBlock) -> CodeBlock:
         """Pass through non-translated block types unchanged."""
         return block
@@ -1094,21 +1189,93 @@ class TranslationManager:
         Returns:
             List of processed code blocks
         """
-        processed_blocks: list[CodeBlock] = []
+        max_in_flight = self._translation_max_in_flight()
+        if max_in_flight == 1:
+            processed_blocks: list[CodeBlock] = []
+
+            for i, block in enumerate(blocks):
+                logger.debug("Processing block %d/%d: %s", i + 1, len(blocks), block.type)
+
+                if block.type == BlockType.ENGLISH:
+                    processed_blocks.append(self._process_english_block(block, i, blocks))
+                    continue
+
+                if block.type == BlockType.MIXED:
+                    processed_blocks.extend(self._process_mixed_block(block, i, blocks))
+                    continue
+
+                # Python and comment blocks pass through unchanged
+                processed_blocks.append(self._process_passthrough_block(block))
+
+            return processed_blocks
+
+        return self._process_blocks_concurrently(blocks, max_in_flight)
+
+    def _translation_max_in_flight(self) -> int:
+        exec_cfg = getattr(self.config, "execution", None)
+        try:
+            return max(1, int(getattr(exec_cfg, "translation_max_in_flight", 1)))
+        except (TypeError, ValueError):
+            return 1
+
+    def _process_blocks_concurrently(
+        self, blocks: list[CodeBlock], max_in_flight: int
+    ) -> list[CodeBlock]:
+        """
+        _process_blocks with model calls dispatched through a BlockScheduler.
+
+        Blocks are planned in order on this thread (MIXED blocks separated, one
+        job per ENGLISH block or sub-block, context built exactly as in the
+        sequential path), the jobs run concurrently, and results are applied in
+        the original block order.
+        """
+        # Plan: (source block, sub-blocks or None, job indices)
+        plan: list[tuple[CodeBlock, list[CodeBlock] | None, list[int]]] = []
+        jobs: list[tuple[str, dict[str, Any], CodeBlock]] = []
 
         for i, block in enumerate(blocks):
             logger.debug("Processing block %d/%d: %s", i + 1, len(blocks), block.type)
 
             if block.type == BlockType.ENGLISH:
-                processed_blocks.append(self._process_english_block(block, i, blocks))
-                continue
-
-            if block.type == BlockType.MIXED:
-                processed_blocks.extend(self._process_mixed_block(block, i, blocks))
-                continue
+                plan.append((block, None, [len(jobs)]))
+                jobs.append((block.content, self._build_context(blocks, i), block))
+            elif block.type == BlockType.MIXED:
+                sub_blocks = self._separate_mixed_block(block)
+                job_ids: list[int] = []
+                for sub_block in sub_blocks:
+                    if sub_block.type == BlockType.ENGLISH:
+                        job_ids.append(len(jobs))
+                        jobs.append((sub_block.content, self._build_context(blocks, i), sub_block))
+                plan.append((block, sub_blocks, job_ids))
+            else:
+                plan.append((block, None, []))
+
+        # Contexts are built from the parsed blocks rather than from other
+        # translations, so the jobs form a DAG without edges and all of them
+        # may run at once. A context that reads translated output must add
+        # the producing jobs as dependencies here.
+        scheduler: BlockScheduler[tuple[str | None, dict[str, Any]]] = BlockScheduler(
+            max_in_flight
+        )
+        results = scheduler.run(
+            [
+                functools.partial(self._translate_text_with_model, text, context=ctx, block=blk)
+                for text, ctx, blk in jobs
+            ]
+        )
 
-            # Python and comment blocks pass through unchanged
-            processed_blocks.append(self._process_passthrough_block(block))
+        processed_blocks: list[CodeBlock] = []
+        for block, sub_blocks, job_ids in plan:
+            if sub_blocks is not None:
+                for job_id in job_ids:
+                    code, meta = results[job_id]
+                    self._finish_mixed_sub_block(jobs[job_id][2], code, meta)
+                processed_blocks.extend(sub_blocks)
+            elif job_ids:
+                code, meta = results[job_ids[0]]
+                processed_blocks.append(self._finish_english_block(block, code, meta))
+            else:
+                processed_blocks.append(self._process_passthrough_block(block))
 
         return processed_blocks
 
@@ -1267,8 +1434,11 @@ class TranslationManager:
                 pool.shutdown(wait=True)
         except Exception:
             pass
-        if self._current_model:
-            self._current_model.shutdown()
+        # The model stays warm in the residency pool until evicted
+        self._residency.release(self._current_model)
+        self._current_model = None
+        if self._result_cache is not None:
+            self._result_cache.close()
         logger.info("Translation Manager shutdown complete")
 
     def get_event_dispatcher(self) -> EventDispatcher:
@@ -1284,12 +1454,15 @@ class TranslationManager:
         """
         logger.info("Switching from %s to %s", self._model_name, model_name)
 
-        # Shutdown current model
-        if self._current_model:
-            self._current_model.shutdown()
+        # Release the current model; it stays resident while the pool has room
+        self._residency.release(self._current_model)
+        self._current_model = None
 
-        # Initialize new model
+        # Initialize new model; output cached for an earlier load of it may be stale
         self._initialize_model(model_name)
+        self.invalidate_translation_cache(model_name)
+        # Session outputs came from the previous model
+        self._sessions.clear()
 
         # Emit MODEL_CHANGED (best-effort)
         with contextlib.suppress(Exception):
@@ -1304,6 +1477,52 @@ class TranslationManager:
         """Get the name of the current model"""
         return self._model_name
 
+    def open_session(self, session_id: str | None = None, owner: str = "") -> TranslationSession:
+        """
+        Get or create an incremental translation session.
+
+        Each session.translate(text) call translates a new revision of the
+        same document, re-parsing and re-translating only what changed since
+        the previous revision.
+
+        Args:
+            session_id: Existing or new session id (None = generate one)
+            owner: Scope of session_id (e.g. the API caller); other owners'
+                   sessions are neither visible nor evicted by this one's
+
+        Returns:
+            The TranslationSession for session_id
+        """
+        return self._sessions.open(session_id, owner)
+
+    def close_session(self, session_id: str, owner: str = "") -> bool:
+        """Drop a session and its retained state; False if it did not exist."""
+        return self._sessions.close(session_id, owner)
+
+    def get_model_residency_stats(self) -> dict[str, Any]:
+        """Resident models and load/hit/eviction counters of the shared model pool."""
+        return self._residency.get_stats()
+
+    def invalidate_translation_cache(self, model_name: str | None = None) -> int:
+        """
+        Drop cached block translations.
+
+        Args:
+            model_name: Only drop output of this model (None = all models)
+
+        Returns:
+            Number of in-memory entries dropped
+        """
+        if self._result_cache is None:
+            return 0
+        return self._result_cache.invalidate(model_name)
+
+    def get_translation_cache_stats(self) -> dict[str, Any]:
+        """Hit/miss statistics of the translation result cache ({} when disabled)."""
+        if self._result_cache is None:
+            return {}
+        return self._result_cache.get_stats()
+
     def list_available_models(self) -> list[str]:
         """List all available models"""
         return ModelFactory.list_models()
@@ -1400,11 +1619,83 @@ class TranslationManager:
         # Delegate to the active model
         return self._delegate_to_model(text, translation_config, context)
 
+    def translate_text_block_stream(
+        self,
+        text: str,
+        context: dict[str, Any] | None = None,
+        config: dict[str, Any] | ModelTranslationConfig | None = None,
+    ) -> Iterator[TranslationDelta]:
+        """
+        Streaming variant of translate_text_block().
+
+        Args:
+            text: The natural language instruction or mixed text to translate.
+            context: Optional context dictionary to pass to the model.
+            config: Optional overrides, as for translate_text_block().
+
+        Yields:
+            Model TranslationDelta objects; the last one carries the
+            model-level TranslationResult.
+        """
+        self._validate_model_for_text_block()
+        translation_config = self._build_text_block_config(config)
+        yield from self._current_model.translate_stream(
+            instruction=text, config=translation_config, context=context
+        )
+
+    async def translate_text_block_async(
+        self,
+        text: str,
+        context: dict[str, Any] | None = None,
+        config: dict[str, Any] | ModelTranslationConfig | None = None,
+    ) -> Any:
+        """
+        Asynchronous translate_text_block(); cancelling the caller stops the model call.
+
+        Args:
+            text: The natural language instruction or mixed text to translate.
+            context: Optional context dictionary to pass to the model.
+            config: Optional overrides, as for translate_text_block().
+
+        Returns:
+            The model-level TranslationResult object.
+        """
+        self._validate_model_for_text_block()
+        translation_config = self._build_text_block_config(config)
+        return await self._current_model.translate_async(
+            instruction=text, config=translation_config, context=context
+        )
+
+    async def translate_text_block_stream_async(
+        self,
+        text: str,
+        context: dict[str, Any] | None = None,
+        config: dict[str, Any] | ModelTranslationConfig | None = None,
+    ) -> AsyncIterator[TranslationDelta]:
+        """
+        Asynchronous translate_text_block_stream().
+
+        Yields:
+            Model TranslationDelta objects; the last one carries the
+            model-level TranslationResult.
+        """
+        self._validate_model_for_text_block()
+        translation_config = self._build_text_block_config(config)
+        stream = self._current_model.translate_stream_async(
+            instruction=text, config=translation_config, context=context
+        )
+        try:
+            async for delta in stream:
+                yield delta
+        finally:
+            await stream.aclose()
+
     def translate_streaming(
         self,
         input_text: str,
         chunk_size: int = 4096,
         progress_callback: Any | None = None,
+        token_callback: Any | None = None,
     ) -> Iterator[TranslationResult]:
         """
         Translate pseudocode using streaming for memory efficiency
@@ -1413,6 +1704,9 @@ class TranslationManager:
             input_text: Mixed English/Python pseudocode
             chunk_size: Size of chunks for streaming
             progress_callback: Optional callback for progress updates
+            token_callback: Optional callback receiving a
+                streaming.protocols.TranslationUpdateMessage for each piece of
+                model output as it is generated (streamed inputs only)
 
         Yields:
             TranslationResult objects for each processed chunk
@@ -1421,7 +1715,7 @@ class TranslationManager:
         start_time = time.time()
         try:
             yield from self._execute_streaming_pipeline(
-                input_text, start_time, progress_callback, emitter
+                input_text, start_time, progress_callback, emitter, token_callback
             )
         except ImportError:
             logger.warning("Streaming module not available, using regular translation")
@@ -1439,7 +1733,12 @@ class TranslationManager:
             return None
 
     def _execute_streaming_pipeline(
-        self, input_text: str, start_time: float, progress_callback: Any, emitter: Any
+        self,
+        input_text: str,
+        start_time: float,
+        progress_callback: Any,
+        emitter: Any,
+        token_callback: Any = None,
     ) -> Iterator[TranslationResult]:
         from .streaming.pipeline import StreamingPipeline
 
@@ -1454,7 +1753,9 @@ class TranslationManager:
         all_results: list[TranslationResult] = []
         logger.info("Using streaming translation")
         self._emit_stream_started(emitter)
-        for result in self._process_streaming_chunks(pipeline, input_text, progress_callback):
+        for result in self._process_streaming_chunks(
+            pipeline, input_text, progress_callback, token_callback
+        ):
             all_results.append(result)
             yield result
 
@@ -1477,11 +1778,11 @@ class TranslationManager:
                 )
 
     def _process_streaming_chunks(
-        self, pipeline: Any, input_text: str, progress_callback: Any
+        self, pipeline: Any, input_text: str, progress_callback: Any, token_callback: Any = None
     ) -> Iterator[TranslationResult]:
         """Process streaming chunks and yield results."""
         for chunk_result in pipeline.stream_translate(
-            input_text, progress_callback=progress_callback
+            input_text, progress_callback=progress_callback, token_callback=token_callback
         ):
             if chunk_result.success and chunk_result.translated_blocks:
                 chunk_code = self.assembler.assemble(chunk_result.translated_blocks)
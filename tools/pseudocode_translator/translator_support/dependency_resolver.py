@@ -8,7 +8,8 @@ isolating policy and reducing nesting in translator.py.
 
 Behavior-preservation constraints:
 - No imports from translator.py (avoids cycles).
-- Uses stdlib ast; will use parse_cached if available to preserve performance.
+- Uses stdlib ast; parses through the shared analysis context (or parse_cached)
+  when available to preserve performance.
 - On SyntaxError, analysis returns empty lists without raising.
 """
 
@@ -17,9 +18,9 @@ from typing import Any
 
 try:
     # Prefer absolute import path to avoid relative ambiguity when used externally.
-    from ..ast_cache import parse_cached  # type: ignore
+    from ..analysis_context import analysis_for, parse_source  # type: ignore
 except Exception:  # pragma: no cover
-    parse_cached = None  # type: ignore[assignment]
+    analysis_for = parse_source = None  # type: ignore[assignment]
 
 
 class DependencyResolver:
@@ -36,14 +37,14 @@ class DependencyResolver:
         Initialize the resolver.
 
         Args:
-            use_cache: When True and parse_cached is available, use it for parsing.
+            use_cache: When True, parse through analysis_context.parse_source.
         """
         self.use_cache = bool(use_cache)
 
     def _parse(self, code: str):
-        """Parse code using parse_cached if enabled, else ast.parse."""
-        if self.use_cache and parse_cached is not None:
-            return parse_cached(code)
+        """Parse code through the shared analysis context if enabled, else ast.parse."""
+        if self.use_cache and parse_source is not None:
+            return parse_source(code)
         return ast.parse(code)
 
     def analyze_block(self, code: str) -> dict[str, list[str]]:
@@ -73,8 +74,17 @@ class DependencyResolver:
                     if isinstance(target, ast.Name):
                         defined.append(target.id)
 
+        # Imports anywhere in the tree, in walk order (matches previous behavior)
+        if analysis_for is not None:
+            req_imports = list(analysis_for(tree).symbols.imports)
+        else:
+            req_imports = self._collect_imports(tree)
+
+        return {"defined_names": defined, "required_imports": req_imports}
+
+    @staticmethod
+    def _collect_imports(tree) -> list[str]:
         req_imports: list[str] = []
-        # Collect imports anywhere in the tree (matches previous behavior)
         for node in ast.walk(tree):
             if isinstance(node, ast.Import):
                 for alias in node.names:
@@ -83,8 +93,7 @@ class DependencyResolver:
                 module = node.module or ""
                 for alias in node.names:
                     req_imports.append(f"from {module} import {alias.name}")
-
-        return {"defined_names": defined, "required_imports": req_imports}
+        return req_imports
 
     def analyze_blocks(self, blocks: list[Any]) -> list[dict[str, list[str]]]:
         """
@@ -87,6 +87,20 @@ class StreamEmitter:
         except Exception:
             pass
 
+    def translation_update(self, message):
+        # STREAM_TRANSLATION_UPDATE payload keys: chunk_index, block_index, delta,
+        # is_partial, sequence_number (message is a protocols.TranslationUpdateMessage)
+        with contextlib.suppress(Exception):
+            self._d.dispatch_event(
+                EventType.STREAM_TRANSLATION_UPDATE,
+                source=self._source,
+                chunk_index=message.chunk_index,
+                block_index=message.block_index,
+                delta=message.metadata.get("delta", ""),
+                is_partial=message.is_partial,
+                sequence_number=message.sequence_number,
+            )
+
     def stream_completed(self, total_chunks: int):
         # STREAM_COMPLETED payload keys: chunks
         with contextlib.suppress(Exception):
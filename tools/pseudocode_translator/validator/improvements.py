@@ -8,7 +8,7 @@ style, performance, readability, best practices, and security improvements.
 import ast
 import re
 
-from ..ast_cache import parse_cached
+from ..analysis_context import nodes_of_type, parse_source
 from .performance_checkers import PerformanceChecker
 
 
@@ -32,7 +32,7 @@ class ImprovementAnalyzer:
         suggestions = []
 
         try:
-            tree = parse_cached(code)
+            tree = parse_source(code)
         except (SyntaxError, ValueError):
             return ["Fix syntax errors before requesting improvements"]
 
@@ -170,7 +170,7 @@ class ImprovementAnalyzer:
         """Check AST-based readability issues."""
         suggestions = []
 
-        for node in ast.walk(tree):
+        for node in nodes_of_type(tree, ast.FunctionDef, ast.ClassDef):
             if isinstance(node, ast.FunctionDef):
                 suggestions.extend(self._check_function_readability(node))
             elif isinstance(node, ast.ClassDef):
@@ -200,7 +200,7 @@ class ImprovementAnalyzer:
         suggestions = []
 
         # Check for deeply nested code
-        for node in ast.walk(tree):
+        for node in nodes_of_type(tree, ast.If):
             if isinstance(node, ast.If):
                 depth = self._calculate_nesting_depth(node)
                 if depth > 3:
@@ -231,9 +231,8 @@ class ImprovementAnalyzer:
         """Check for best practice violations."""
         suggestions = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                suggestions.extend(self._check_function_best_practices(node))
+        for node in nodes_of_type(tree, ast.FunctionDef):
+            suggestions.extend(self._check_function_best_practices(node))
 
         return suggestions
 
@@ -8,7 +8,7 @@ and validation of code semantics beyond syntax.
 import ast
 from typing import TYPE_CHECKING
 
-from ..ast_cache import parse_cached
+from ..analysis_context import parse_source
 from .constants import get_builtin_names
 from .result import ValidationResult
 from .runtime_checkers import RuntimeRiskChecker
@@ -65,7 +65,7 @@ class LogicValidator:
     ) -> tuple[ast.AST | None, ValidationResult | None]:
         """Parse tree for logic validation with error handling."""
         try:
-            tree = parse_cached(code)
+            tree = parse_source(code)
             return tree, None
         except SyntaxError:
             result = ValidationResult(is_valid=False)
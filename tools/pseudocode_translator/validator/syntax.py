@@ -10,7 +10,7 @@ import re
 import tokenize
 from io import StringIO
 
-from ..ast_cache import parse_cached
+from ..analysis_context import nodes_of_type, parse_source
 from ..exceptions import ErrorContext, ValidationError
 from .constants import UNSAFE_MODULES
 from .params import ErrorFormatContext, IndentationContext
@@ -71,7 +71,7 @@ class SyntaxValidator:
     ) -> ast.AST | None:
         """Parse code into AST with error handling."""
         try:
-            return parse_cached(code)
+            return parse_source(code)
         except SyntaxError as e:
             lines = code.splitlines()
             context = ErrorContext(
@@ -242,7 +242,7 @@ class SyntaxValidator:
         issues = []
         imported_modules = set()
 
-        for node in ast.walk(tree):
+        for node in nodes_of_type(tree, ast.Import, ast.ImportFrom):
             if isinstance(node, ast.Import):
                 issues.extend(self._check_regular_imports(node, imported_modules))
             elif isinstance(node, ast.ImportFrom):
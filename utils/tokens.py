@@ -0,0 +1,49 @@
+"""
+Approximate prompt token counting.
+
+Used where a prompt has to fit a model's context length but loading the
+model's tokenizer is not worth it (RAG context packing, chat history
+windows).
+"""
+
+from __future__ import annotations
+
+import re
+
+# Approximate BPE/WordPiece counting: every punctuation mark is a token and
+# words are split into ~4 character pieces
+_APPROX_TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+_APPROX_PIECE_CHARS = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of prompt tokens in text without loading a tokenizer.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Approximate token count
+    """
+    return sum(
+        -(-len(piece) // _APPROX_PIECE_CHARS) for piece in _APPROX_TOKEN_PATTERN.findall(text)
+    )
+
+
+def approx_token_offsets(text: str) -> list[tuple[int, int]]:
+    """
+    Character spans of the tokens estimate_tokens() counts.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        List of (start, end) character offsets, one per estimated token
+    """
+    offsets: list[tuple[int, int]] = []
+    for match in _APPROX_TOKEN_PATTERN.finditer(text):
+        start, end = match.span()
+        for piece_start in range(start, end, _APPROX_PIECE_CHARS):
+            offsets.append((piece_start, min(end, piece_start + _APPROX_PIECE_CHARS)))
+    return offsets